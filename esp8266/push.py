@@ -7,264 +7,257 @@ import time
 import gc
 
 VERSION = "11.19.25.22"
-redirect = 0
-output = ""
-ROOTDIR="/"
-STDOUT = ROOTDIR + "STDOUT"
-STDIN = "STDIN"
-FIN = 0
-
-def soread():
-    sofile = open(STDOUT, "r")
-    data = sofile.read()
-    sofile.close()
-    return data
-
-def soclear():
-   open(STDOUT, 'w').close()
-   open(STDIN, 'w').close()
-
-def EVAL(input1):
-   global FIN
-   output = ""
-   redirect = 0
-   if re.search('>', input1):
-      #print("redirect: " + input1)
-      redirect = 1
-      input1, outfile = input1.split(">")
-      input1 = input1.rstrip()
-      outfile = outfile.lstrip()
-
-   if re.search('^help', input1):
-     print("PUSH ver: " + VERSION + "\n")
-     print ("commands: exit, ls, uname, df, pwd, cat, cp, cd, mkdir,\n")
-     print ("grep, reload, rmdir, exec, rm, date,\n")
-     print ("scanwifi, connect, ifconfig, edit\n")
-   elif re.search('^ls',input1):
-     input1 = input1.replace("ls", '')
-     input1 = input1.strip()
-     if re.search('\S+',input1):
-       try:
-           output = ("\n".join(os.listdir(input1)))
-       except:
-           output = "Syntax Error\n"
-     else:
-       output = ("\n".join(os.listdir()))
-   elif re.search('^uname',input1):
-     output = ("\n".join(os.uname()))
-   elif re.search('^free',input1):
-     output = str(gc.mem_free())     
-   elif re.search('^df',input1):
-     total = float(os.statvfs('/')[2]) * float(os.statvfs('/')[0])
-     used = float(os.statvfs('/')[3]) * float(os.statvfs('/')[0])
-     free = total - used
-     output = ("Free: " + str(free) + " Used: " + 
-             str(used) + " Total: " + str(total) )
-   elif re.search('^pwd', input1):
-     output = os.getcwd()
-   elif re.search('^cat', input1):
-     input1 = input1.replace("cat ", '')
-     input1 = input1.strip('\n')
-     try:
-      file1 = open(input1, "r")
-      output = file1.read()
-      file1.close()
-     except:
-         output = "Couldn't open file\n"
-   elif re.search('^wc ', input1):
-     input1 = input1.replace("wc ", '')
-     input1 = input1.strip('\n')
+
+# Pipe stages hand their output to the next stage in memory (no /STDOUT
+# file). Commands are looked up by their first word in COMMANDS and called
+# as fn(arg, stdin): arg is the rest of the line, stdin the previous stage's
+# output (None for the first stage).
+
+def _text(arg, stdin):
+   # file named by arg, else the piped-in text
+   if arg:
+     file1 = open(arg, "r")
+     data = file1.read()
+     file1.close()
+     return data
+   return stdin or ""
+
+def c_help(arg, stdin):
+   print("PUSH ver: " + VERSION + "\n")
+   print ("commands: exit, ls, uname, df, pwd, cat, cp, cd, mkdir,\n")
+   print ("grep, reload, rmdir, exec, rm, date,\n")
+   print ("scanwifi, connect, ifconfig, edit\n")
+   return ""
+
+def c_ls(arg, stdin):
+   if arg:
      try:
-       x = 0
-       with open(input1) as f:
-         for line in f:
-          x += 1 
-       f.close()
-       output = (str(x) + "\n")
+         return ("\n".join(os.listdir(arg)))
      except:
-         output = "Couldn't open file\n"
-   elif re.search('^grep', input1):
-     input1 = input1.replace("grep ", '')
-     input1 = input1.strip('\n')
-     [rgx,fname] = input1.split()
-     try:
-      with open(fname) as f:
+         return "Syntax Error\n"
+   return ("\n".join(os.listdir()))
+
+def c_uname(arg, stdin):
+   return ("\n".join(os.uname()))
+
+def c_free(arg, stdin):
+   return str(gc.mem_free())
+
+def c_df(arg, stdin):
+   st = os.statvfs('/')
+   total = float(st[2]) * float(st[0])
+   used = float(st[3]) * float(st[0])
+   free = total - used
+   return ("Free: " + str(free) + " Used: " +
+           str(used) + " Total: " + str(total) )
+
+def c_pwd(arg, stdin):
+   return os.getcwd()
+
+def c_cat(arg, stdin):
+   try:
+     return _text(arg, stdin)
+   except:
+     return "Couldn't open file\n"
+
+def c_wc(arg, stdin):
+   try:
+     if not arg:
+       text = stdin or ""
+       x = text.count("\n")
+       if text and not text.endswith("\n"):
+         x += 1
+       return (str(x) + "\n")
+     x = 0
+     with open(arg) as f:
+       for line in f:
+        x += 1
+     return (str(x) + "\n")
+   except:
+     return "Couldn't open file\n"
+
+def c_grep(arg, stdin):
+   output = ""
+   try:
+    parts = arg.split(None, 1)
+    rgx = re.compile(parts[0])
+    if len(parts) > 1:
+      with open(parts[1].strip()) as f:
         for line in f:
-            if re.search(rgx,line):
-              output += line 
-      f.close()
-     except:
-      output = "Couldn't perform.\n"
-   elif re.search('^cp ', input1):
-     input1 = input1.strip('\n')
-     input1 = input1.replace("cp ", '')
-     [source, dest] = input1.split(' ')
-     try:
-      file1 = open(source, "r")
-      outputdata = file1.read()
-      file1.close()
-      file2 = open(dest, "w")
-      file2.write(outputdata)
-      file2.close()
-      outputdata = []
-      output = ("File " + source + " copied.")
-     except:
-        output = "Couldn't copy.\n"
-   elif re.search('^cd', input1):
-     input1 = input1.replace("cd ", '')
-     try:
-      os.chdir(input1)
-      output = input1
-     except:
-      output = ("Error. Couldn't cd\n")
-   elif re.search('^rename ', input1):
-      input1 = input1.replace("rename ", '') 
-      [source, dest] = input1.split(' ')  
-      try:
-        os.rename(source, dest)
-        output = (source + " renamed..")
-      except:
-        output = "Couldn't rename\n"
-   elif re.search('^mkdir', input1):
-     input1 = input1.replace("mkdir ", '')
-     input1 = input1.strip('\n')
-     try:
-      os.mkdir(input1)
-      output = ("Directory " + input1 + " created.\n")
-     except:
-      output = "Couldn't make directory\n"
-   elif re.search('^rmdir', input1):
-     input1 = input1.replace("rmdir ", '')
-     input1 = input1.strip('\n')
-     try:
-      os.rmdir(input1)
-      output = ("Removed " + input1 + ".\n")
-     except:
-         output = "Couldn't remove dir.\n"
-   elif re.search('^exec ', input1):
-     input1 = input1.replace("exec ", '')
-     input1 = input1.strip('\n')
-     if re.search('\.',input1):
-        module = re.search('^(.*?)\.', input1).group(1)
-        input1 = input1.replace(module + ".","")
-        func = re.search('^(.*?)\(', input1).group(1)
-        args = re.search('\((.*?)\)', input1).group(1)        
-        try:
-          script = getattr(__import__(module), func)
-          if not args:
-              output = str(script())
-          else:
-              args = args.replace('"', "")
-              output = str(script(args))
-        except:
-          output = "Error: Check Syntax\n"
-   elif re.search('^rm ', input1):
-     input1 = input1.replace("rm ", '')
-     input1 = input1.strip('\n')
-     try:
-       os.unlink(input1)
-       output = ("Removed file " + input1 + "\n")
-     except:
-      output = "Couldn't remove file\n"
-   elif re.search('^date', input1):
-     dateTimeObj = time.localtime()
-     year,month,day,hour,min,sec,wday,yday = (dateTimeObj)
-     output =  (str(month) + "/" +
-         str(day) + "/" +
-         str(year) + " " +
-         str(hour) + ":" +
-         str(min) + ":" +
-         str(sec))
-   elif re.search('^scanwifi',input1):
-       try:
-         wlan = network.WLAN(network.STA_IF)
-         wlan.active(True)
-         nets = wlan.scan()
-         for i in nets:
-           output += (str(i[0].decode()) + "\n")
-       except:
-            output = "Couldn't scan networks.\n"
-   elif re.search('^connect', input1):
-     print("Enter SSID: ")
-     ssid = input()
-     print("Enter wifi pw: ")
-     wifipw = input()
-     try:
-      print("attempting to connect..\n")
-      wlan = network.WLAN(network.STA_IF)
-      wlan.active(True)
-      wlan.connect(ssid, wifipw)
-      time.sleep(5)
-      print("Check ifconfig..\n")
-     except:
-         output = "Error: couldn't obtain address\n"
-   elif re.search('^ifconfig', input1):
-       try:
-         wlan = network.WLAN(network.STA_IF)
-         status = wlan.ifconfig()
-         output = ("\nIP........... " +
-            status[0] +
-            "\nNETMASK......." +
-            status[1] + "\n" +
-            "GATEWAY......." +
-            status[2])
-       except:
-            output = "Couldn't get interface or check syntax.\n"
-   elif re.search('^edit ', input1):
-     input1 = input1.replace("edit ", '')
-     print("EDIT MODE DETECTED...\n")
-     print ("(ENTER STOPEDIT to stop)\n")
-     try:
-      file1 = open(input1, "w")
-      flag = 0
-      while flag == 0:
-        line =input()
-        if re.search('STOPEDIT', line):
-          file1.close()
-          flag = 1
-        else:
-          file1.write(line + "\n")
-        output = ("File " + input1 + " created..\n")
-     except:
-          output = "Couldn't write file\n"
-   else:
-        print("Error: command not found\n")
+            if rgx.search(line):
+              output += line
+    else:
+      for line in (stdin or "").split("\n"):
+        if rgx.search(line):
+          output += line + "\n"
+   except:
+    output = "Couldn't perform.\n"
+   return output
+
+def c_cp(arg, stdin):
+   try:
+    [source, dest] = arg.split(' ')
+    file1 = open(source, "r")
+    outputdata = file1.read()
+    file1.close()
+    file2 = open(dest, "w")
+    file2.write(outputdata)
+    file2.close()
+    outputdata = []
+    return ("File " + source + " copied.")
+   except:
+    return "Couldn't copy.\n"
+
+def c_cd(arg, stdin):
+   try:
+    os.chdir(arg)
+    return arg
+   except:
+    return ("Error. Couldn't cd\n")
+
+def c_rename(arg, stdin):
+   try:
+     [source, dest] = arg.split(' ')
+     os.rename(source, dest)
+     return (source + " renamed..")
+   except:
+     return "Couldn't rename\n"
+
+def c_mkdir(arg, stdin):
+   try:
+    os.mkdir(arg)
+    return ("Directory " + arg + " created.\n")
+   except:
+    return "Couldn't make directory\n"
+
+def c_rmdir(arg, stdin):
+   try:
+    os.rmdir(arg)
+    return ("Removed " + arg + ".\n")
+   except:
+    return "Couldn't remove dir.\n"
+
+def c_exec(arg, stdin):
+   if not re.search('\\.', arg):
+     return ""
+   try:
+     module = re.search('^(.*?)\\.', arg).group(1)
+     arg = arg.replace(module + ".","")
+     func = re.search('^(.*?)\\(', arg).group(1)
+     args = re.search('\\((.*?)\\)', arg).group(1)
+     script = getattr(__import__(module), func)
+     if not args:
+         return str(script())
+     args = args.replace('"', "")
+     return str(script(args))
+   except:
+     return "Error: Check Syntax\n"
 
-   if not re.search('\S+', output):
-       return
-   if redirect:
+def c_rm(arg, stdin):
+   try:
+     os.unlink(arg)
+     return ("Removed file " + arg + "\n")
+   except:
+    return "Couldn't remove file\n"
+
+def c_date(arg, stdin):
+   dateTimeObj = time.localtime()
+   year,month,day,hour,min,sec,wday,yday = (dateTimeObj)
+   return  (str(month) + "/" +
+       str(day) + "/" +
+       str(year) + " " +
+       str(hour) + ":" +
+       str(min) + ":" +
+       str(sec))
+
+def c_scanwifi(arg, stdin):
+   output = ""
+   try:
+     wlan = network.WLAN(network.STA_IF)
+     wlan.active(True)
+     nets = wlan.scan()
+     for i in nets:
+       output += (str(i[0].decode()) + "\n")
+   except:
+     output = "Couldn't scan networks.\n"
+   return output
+
+def c_connect(arg, stdin):
+   print("Enter SSID: ")
+   ssid = input()
+   print("Enter wifi pw: ")
+   wifipw = input()
+   try:
+    print("attempting to connect..\n")
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    wlan.connect(ssid, wifipw)
+    time.sleep(5)
+    print("Check ifconfig..\n")
+   except:
+    return "Error: couldn't obtain address\n"
+   return ""
+
+def c_ifconfig(arg, stdin):
+   try:
+     wlan = network.WLAN(network.STA_IF)
+     status = wlan.ifconfig()
+     return ("\nIP........... " +
+        status[0] +
+        "\nNETMASK......." +
+        status[1] + "\n" +
+        "GATEWAY......." +
+        status[2])
+   except:
+     return "Couldn't get interface or check syntax.\n"
+
+def c_edit(arg, stdin):
+   print("EDIT MODE DETECTED...\n")
+   print ("(ENTER STOPEDIT to stop)\n")
+   try:
+    file1 = open(arg, "w")
+    while True:
+      line =input()
+      if 'STOPEDIT' in line:
+        file1.close()
+        break
+      file1.write(line + "\n")
+    return ("File " + arg + " created..\n")
+   except:
+    return "Couldn't write file\n"
+
+COMMANDS = {
+   "help": c_help, "ls": c_ls, "uname": c_uname, "free": c_free,
+   "df": c_df, "pwd": c_pwd, "cat": c_cat, "wc": c_wc, "grep": c_grep,
+   "cp": c_cp, "cd": c_cd, "rename": c_rename, "mkdir": c_mkdir,
+   "rmdir": c_rmdir, "exec": c_exec, "rm": c_rm, "date": c_date,
+   "scanwifi": c_scanwifi, "connect": c_connect, "ifconfig": c_ifconfig,
+   "edit": c_edit,
+}
+
+def EVAL(input1, stdin=None):
+   # Run one pipe stage; returns its output for the next stage.
+   outfile = None
+   if '>' in input1:
+      input1, outfile = input1.split(">", 1)
+      outfile = outfile.strip()
+   parts = input1.strip().split(None, 1)
+   if not parts:
+      return ""
+   fn = COMMANDS.get(parts[0])
+   if fn is None:
+      print("Error: command not found\n")
+      return ""
+   output = fn(parts[1].strip() if len(parts) > 1 else "", stdin) or ""
+   if outfile:
      fileh = open(outfile, "w")
      fileh.write(output)
      fileh.close()
-     result = soread()
-     if re.search(STDOUT, outfile) and FIN:
-      FIN=0
-      print(result)
-   else:
-    FIN=0
-    print(output)
-
-
-def tokenize(expr):
-  tokens = expr.split('|')
-  x = 0
-  l = []
-  for i in tokens:
-    i = re.sub('\s+$',"",i)
-    i = re.sub('^\s+',"",i)
-    if x == 0:
-     l.append(i + ">" + STDOUT)
-    elif re.search(">", i):
-     i = i.replace(">", "STDOUT >")
-     l.append(i)
-    else:
-     l.append (i + " " + STDOUT + " >" + STDOUT)
-    x += 1
-  return l
+     return ""
+   return output
 
 
 def shell():
- global FIN
  print ("******************************")
  print ("* PUSH - Python Micro SHELL  *")
  print ("* ls,pwd,cd,uname,df,cat     *")
@@ -272,34 +265,23 @@ def shell():
  print ("* ifconfig,connect,grep      *")
  print ("******************************")
 
- soclear()
  while True:
-   soclear()
    print("$", end="")
    input1 = input()
 
-   if re.search('\|',input1):
-      tokens = tokenize(input1)
-      tlen = len(tokens)
-      x = 0
-      for i in tokens:
-        if x == (tlen - 1):
-            FIN = 1
-        EVAL(i)
-        x += 1
-      continue
-
    # if nothing then just re loop
-   if not re.search('^[A-Za-z]', input1):
+   if not input1[:1].isalpha():
        continue
    # if exit.. or do some commands
-   elif re.search('^exit', input1):
+   elif input1.split(None, 1)[0] == "exit":
      print("bye..")
-     os.unlink(STDOUT)
-     os.unlink(STDIN)
      sys.exit()
-   else:
-       EVAL(input1)
-       
+
+   output = None
+   for stage in input1.split('|'):
+      output = EVAL(stage, output)
+   if output.strip():
+      print(output)
+
 
 shell()
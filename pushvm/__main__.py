@@ -0,0 +1,5 @@
+# python -m pushvm  (from the repository root)
+import sys
+from pushvm.pushvm import main
+
+sys.exit(main(sys.argv[1:]))
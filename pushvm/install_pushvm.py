@@ -5,6 +5,34 @@ import gc
 
 import uos, ubinascii, gc
 
+try:
+    import io
+    _IOBase = io.IOBase
+except (ImportError, AttributeError):
+    _IOBase = object
+
+try:
+    import deflate  # MicroPython >= 1.21
+except ImportError:
+    deflate = None
+
+try:
+    import zlib
+except ImportError:
+    zlib = None
+
+try:
+    import hashlib
+except ImportError:
+    import uhashlib as hashlib
+
+# Payloads below are zlib-compressed, then base64 encoded in 800-char chunks
+# (each chunk decodes on its own). They are generated by make_installer.py,
+# together with a manifest: size, sha256 and per-HASH_CHUNK sha256 (prefix)
+# of each file.
+_BLOCK = 512
+HASH_CHUNK = 4096  # must match make_installer.py
+
 def mkdir_p(path):
     parts = path.split("/")
     cur = ""
@@ -20,25 +48,133 @@ def mkdir_p(path):
             except OSError:
                 pass
 
-def write_b64_chunks_to_file(path, b64_chunks, gc_every=32):
+class B64Reader(_IOBase):
+    # Stream over base64 chunks; only one decoded chunk is held at a time.
+    def __init__(self, b64_chunks):
+        self._it = iter(b64_chunks)
+        self._buf = b""
+        self._pos = 0
+
+    def readinto(self, buf):
+        while self._pos >= len(self._buf):
+            try:
+                ch = next(self._it)
+            except StopIteration:
+                return 0
+            if isinstance(ch, str):
+                ch = ch.encode()
+            self._buf = ubinascii.a2b_base64(ch)
+            self._pos = 0
+        n = min(len(buf), len(self._buf) - self._pos)
+        buf[:n] = self._buf[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def read(self, n=_BLOCK):
+        buf = bytearray(n)
+        got = self.readinto(buf)
+        return bytes(buf[:got])
+
+def iter_payload(b64_chunks):
+    # Yield the decompressed payload in blocks (never the whole file).
+    src = B64Reader(b64_chunks)
+    if deflate is not None:
+        f = deflate.DeflateIO(src, deflate.ZLIB)
+    elif hasattr(zlib, "DecompIO"):
+        f = zlib.DecompIO(src, 15)
+    else:
+        # CPython (or a port without stream decompression)
+        d = zlib.decompressobj()
+        while True:
+            b = src.read(_BLOCK)
+            if not b:
+                break
+            out = d.decompress(b)
+            if out:
+                yield out
+        out = d.flush()
+        if out:
+            yield out
+        return
+    while True:
+        b = f.read(_BLOCK)
+        if not b:
+            break
+        yield b
+
+def _hex(digest):
+    return ubinascii.hexlify(digest).decode()
+
+def file_digest(path):
+    # (size, sha256 hex) of a file on the device, None if it doesn't exist
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return None
+    h = hashlib.sha256()
+    n = 0
+    buf = bytearray(_BLOCK)
+    mv = memoryview(buf)
+    with f:
+        while True:
+            got = f.readinto(buf)
+            if not got:
+                break
+            h.update(mv[:got])
+            n += got
+    return n, _hex(h.digest())
+
+def valid_prefix(tmp, size, chunk_hashes):
+    # Bytes at the start of an interrupted .tmp that match the manifest.
+    try:
+        have = uos.stat(tmp)[6]
+    except OSError:
+        return 0
+    if have > size:
+        return 0  # not ours (older payload): start over
+    keep = 0
+    with open(tmp, "rb") as f:
+        for ch in chunk_hashes:
+            want = min(HASH_CHUNK, size - keep)
+            b = f.read(want)
+            if len(b) != want or not _hex(hashlib.sha256(b).digest()).startswith(ch):
+                break
+            keep += want
+    return keep
+
+def write_b64_chunks_to_file(path, b64_chunks, gc_every=32, keep=0, expect=None):
+    # keep: bytes already valid in path.tmp (resume); expect: (size, sha256)
+    # checked before the .tmp replaces path.
     parent = path.rsplit("/", 1)[0]
     if parent:
         mkdir_p(parent)
 
     tmp = path + ".tmp"
-    try:
-        uos.remove(tmp)
-    except OSError:
-        pass
+    if not keep:
+        try:
+            uos.remove(tmp)
+        except OSError:
+            pass
 
-    with open(tmp, "wb") as f:
-        for i, ch in enumerate(b64_chunks, 1):
-            if isinstance(ch, str):
-                ch = ch.encode()
-            f.write(ubinascii.a2b_base64(ch))
+    # r+b: overwrite from keep on; the payload is never shorter than the .tmp
+    with open(tmp, "r+b" if keep else "wb") as f:
+        f.seek(keep)
+        skip = keep
+        for i, b in enumerate(iter_payload(b64_chunks), 1):
+            if skip:
+                if len(b) <= skip:
+                    skip -= len(b)
+                    continue
+                b = b[skip:]
+                skip = 0
+            f.write(b)
             if i % gc_every == 0:
                 gc.collect()
 
+    if expect is not None and file_digest(tmp) != expect:
+        uos.remove(tmp)
+        raise OSError("%s: checksum mismatch after write" % path)
+
     try:
         uos.remove(path)
     except OSError:
@@ -46,16 +182,26 @@ def write_b64_chunks_to_file(path, b64_chunks, gc_every=32):
     uos.rename(tmp, path)
     gc.collect()
 
+def install_file(path, b64_chunks, size, digest, chunk_hashes):
+    # Returns "skip" (already identical), "resume" or "write".
+    if file_digest(path) == (size, digest):
+        try:
+            uos.remove(path + ".tmp")  # leftover of an older run
+        except OSError:
+            pass
+        return "skip"
+    keep = valid_prefix(path + ".tmp", size, chunk_hashes)
+    write_b64_chunks_to_file(path, b64_chunks, keep=keep, expect=(size, digest))
+    return "resume" if keep else "write"
+
 
 
 
 def decode_b64_to_text(b64_chunks):
-    if isinstance(b64_chunks, (tuple, list)):
-        b64 = "".join(b64_chunks)
-    else:
-        b64 = b64_chunks
-    raw = ubinascii.a2b_base64(b64.encode() if isinstance(b64, str) else b64)
-    return raw.decode("utf-8")
+    # small payloads only (e.g. the dhcp.py template)
+    if not isinstance(b64_chunks, (tuple, list)):
+        b64_chunks = (b64_chunks,)
+    return b"".join(iter_payload(b64_chunks)).decode("utf-8")
 
 def write_text_file(path, text):
     parent = path.rsplit("/", 1)[0]
@@ -86,106 +232,207 @@ print("Installing pushvm /lib and xpkg...")
 mkdir_p("/lib")
 
 
+# --- payloads: generated by make_installer.py, do not edit ---
+
 PUSHB64 = (
-    "IyBwdXNodm0ucHkKIyBQVVNIIFZNIChFU1AzMi1maXJzdCBjb21wbGV0ZSB2ZXJzaW9uKQojIEZlYXR1cmVzOgojIC0gQ29tbWFuZHM6IGhlbHAsIGxzLCB1bmFtZSwgZnJlZSwgZGYsIHB3ZCwgY2F0LCB3YywgZ3JlcCwgY3AsIGNkLCByZW5hbWUsCiMgICAgICAgICAgICBta2Rpciwgcm1kaXIsIGV4ZWMsIHJtLCBkYXRlLCBzY2Fud2lmaSwgY29ubmVjdCwgaWZjb25maWcsIGVkaXQsCiMgICAgICAgICAgICBlY2hvLCB1cHBlciwgdGVzdCAoWyksIHdyaXRlICg+KSwgYXBwZW5kICg+PiksIHNsZWVwCiMgLSBQaXBlbGluZXM6IHwKIyAtIFJlZGlyZWN0aW9uOiA+IGFuZCA+PiAoY29tcGlsZWQgdG8gfCB3cml0ZSAvIHwgYXBwZW5kKQojIC0gVmFyaWFibGVzOiB4PTMgYW5kICR4IGV4cGFuc2lvbgojIC0gQ29udHJvbCBmbG93OgojICAgICBpZiA8cGlwZWxpbmU+IHRoZW4gPHN0bXRzPiBbZWxzZSA8c3RtdHM+XSBmaQojICAgICB3aGlsZSA8cGlwZWxpbmU+IGRvIDxzdG10cz4gZG9uZQojICAgICBmb3IgaSAxIDEwIFtzdGVwXSBkbyA8c3RtdHM+IGRvbmUKIyAgICAgZm9yZWFjaCB2IGluIGEgYiBjIGRvIDxzdG10cz4gZG9uZQojICAgICBmb3JlYWNo",
-    "IHYgaW4gPHBpcGVsaW5lPiBkbyA8c3RtdHM+IGRvbmUgICAoc3BsaXRzIG91dHB1dCBieSBsaW5lcykKIyAgICAgYnJlYWsgLyBjb250aW51ZQojIC0gU2hvcnQtY2lyY3VpdDogJiYgYW5kIHx8CiMgLSBCYWNrZ3JvdW5kIGpvYnM6IHRyYWlsaW5nICYgKGpvYnMva2lsbC9mZykKIyAtIEh5YnJpZCBwaXBlIHNwb29saW5nOiBSQU0gdW50aWwgdGhyZXNob2xkIHRoZW4gc3BpbGwgdG8gU1RET1VUIGZpbGUKIyAtIFJFUEw6IGF1dG8gc2VsZWN0cyBsaXZlIG1vZGUgKG5vbi1ibG9ja2luZykgb24gTWljcm9QeXRob24gd2hlbiBwb2xsYWJsZSwKIyAgICAgICAgIG90aGVyd2lzZSB1c2VzIGJhc2ljIGlucHV0KCkgKGJldHRlciBmb3IgZGVza3RvcCB0ZXN0aW5nKQojCiMgTm90ZXM6CiMgLSBEZXNpZ25lZCBmb3IgRVNQMzIvV2ViUkVQTCArIFRob25ueTsgYWxzbyBydW5zIG9uIENQeXRob24gZm9yIGRldmVsb3BtZW50LgojIC0gc2xlZXAgd29ya3MgY29ycmVjdGx5IGluIGJhY2tncm91bmQgam9icyAobm8gZ2VuZXJhdG9yIHJlLWVudHJhbmN5KS4KCmltcG9ydCBvcwppbXBvcnQgdGltZQppbXBvcnQgc3lzCgp0cnk6CiAgICBpbXBvcnQgZ2MKZXhjZXB0",
-    "IEV4Y2VwdGlvbjoKICAgIGdjID0gTm9uZQoKdHJ5OgogICAgaW1wb3J0IG5ldHdvcmsKZXhjZXB0IEV4Y2VwdGlvbjoKICAgIG5ldHdvcmsgPSBOb25lCgp0cnk6CiAgICBpbXBvcnQgdXNlbGVjdCBhcyBzZWxlY3QgICMgTWljcm9QeXRob24KZXhjZXB0IEV4Y2VwdGlvbjoKICAgIHRyeToKICAgICAgICBpbXBvcnQgc2VsZWN0ICAjIENQeXRob24gZmFsbGJhY2sKICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgc2VsZWN0ID0gTm9uZQoKVkVSU0lPTiA9ICJwdXNodm0tY29tcGxldGUtMC4xIgoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQojIEdsb2JhbCAiY3VycmVudCBWTSIgcG9pbnRlciBzbyBjb21tYW5kcyBjYW4gYWZmZWN0IHRoZSBWTSB0aGF0IGlzIGFjdHVhbGx5IGV4ZWN1dGluZy4KIyBUaGlzIGtlZXBzIGNvbW1hbmRzIGRpY3Qgc2hhcmVkIGFjcm9zcyBiYWNrZ3JvdW5kIGpvYiBjbG9uZXMgd2l0aG91dCBjbG9zdXJlcyBib3VuZCB0byB0aGUgd3JvbmcgVk0uCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KX0NVUlJFTlRfVk0gPSBOb25lCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgVGltZSBoZWxwZXJzCiMgLS0tLS0tLS0t",
-    "LS0tLS0tLS0tLS0tLS0KZGVmIF9zbGVlcF9tcyhtcyk6CiAgICBpZiBoYXNhdHRyKHRpbWUsICJzbGVlcF9tcyIpOgogICAgICAgIHRpbWUuc2xlZXBfbXMobXMpCiAgICBlbHNlOgogICAgICAgIHRpbWUuc2xlZXAobXMgLyAxMDAwLjApCgpkZWYgX3RpY2tzX21zKCk6CiAgICBpZiBoYXNhdHRyKHRpbWUsICJ0aWNrc19tcyIpOgogICAgICAgIHJldHVybiB0aW1lLnRpY2tzX21zKCkKICAgIHJldHVybiBpbnQodGltZS50aW1lKCkgKiAxMDAwKQoKZGVmIF90aWNrc19hZGQoYSwgbXMpOgogICAgaWYgaGFzYXR0cih0aW1lLCAidGlja3NfYWRkIik6CiAgICAgICAgcmV0dXJuIHRpbWUudGlja3NfYWRkKGEsIG1zKQogICAgcmV0dXJuIGEgKyBtcwoKZGVmIF90aWNrc19kaWZmKGEsIGIpOgogICAgaWYgaGFzYXR0cih0aW1lLCAidGlja3NfZGlmZiIpOgogICAgICAgIHJldHVybiB0aW1lLnRpY2tzX2RpZmYoYSwgYikKICAgIHJldHVybiBhIC0gYgoKZGVmIGlzX21pY3JvcHl0aG9uKCk6CiAgICB0cnk6CiAgICAgICAgcmV0dXJuIHN5cy5pbXBsZW1lbnRhdGlvbi5uYW1lID09ICJtaWNyb3B5dGhvbiIKICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAg",
-    "cmV0dXJuIEZhbHNlCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgT3Bjb2RlcwojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCk9QX0xPQUQgICAgICA9IDEKT1BfQVJHICAgICAgID0gMgpPUF9QSVBFICAgICAgPSAzCk9QX0VYRUMgICAgICA9IDQgICAgICAjIGV4ZWN1dGUgKyBwcmludApPUF9TRVQgICAgICAgPSA1Ck9QX0dFVCAgICAgICA9IDYKT1BfSk1QICAgICAgID0gNwpPUF9KWiAgICAgICAgPSA4Ck9QX0VYRUNRICAgICA9IDkgICAgICAjIGV4ZWN1dGUgcXVpZXRseQpPUF9TRVRMSVNUICAgPSAxMCAgICAgIyB2YXJzW25hbWVdID0gbGlzdChpdGVtcykKT1BfU1BMSVRMICAgID0gMTEgICAgICMgdmFyc1tuYW1lXSA9IGxhc3Rfb3V0cHV0LnNwbGl0bGluZXMoKQpPUF9GT1JFX0lOSVQgPSAxMiAgICAgIyBpbml0IGZvcmVhY2ggaXRlcmF0b3IKT1BfRk9SRV9ORVhUID0gMTMgICAgICMgYWR2YW5jZSBmb3JlYWNoOyBpZiBkb25lIGp1bXAKT1BfRU5EICAgICAgID0gMjU1CgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgSHlicmlkIFBpcGVEYXRhIChSQU0gb3Igc3Bvb2wgZmlsZSkKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQpjbGFz",
-    "cyBQaXBlRGF0YToKICAgIF9fc2xvdHNfXyA9ICgidGV4dCIsICJwYXRoIiwgImlzX2ZpbGUiKQoKICAgIGRlZiBfX2luaXRfXyhzZWxmLCB0ZXh0PU5vbmUsIHBhdGg9Tm9uZSwgaXNfZmlsZT1GYWxzZSk6CiAgICAgICAgc2VsZi50ZXh0ID0gdGV4dAogICAgICAgIHNlbGYucGF0aCA9IHBhdGgKICAgICAgICBzZWxmLmlzX2ZpbGUgPSBpc19maWxlCgogICAgZGVmIGFzX3RleHQoc2VsZik6CiAgICAgICAgaWYgc2VsZi5pc19maWxlOgogICAgICAgICAgICB3aXRoIG9wZW4oc2VsZi5wYXRoLCAiciIpIGFzIGY6CiAgICAgICAgICAgICAgICByZXR1cm4gZi5yZWFkKCkKICAgICAgICByZXR1cm4gIiIgaWYgc2VsZi50ZXh0IGlzIE5vbmUgZWxzZSBzdHIoc2VsZi50ZXh0KQoKICAgIGRlZiBvcGVuX3JlYWRlcihzZWxmKToKICAgICAgICBpZiBzZWxmLmlzX2ZpbGU6CiAgICAgICAgICAgIHJldHVybiBvcGVuKHNlbGYucGF0aCwgInIiKQogICAgICAgIHJldHVybiBfU3RyaW5nTGluZVJlYWRlcihzZWxmLmFzX3RleHQoKSkKCmNsYXNzIF9TdHJpbmdMaW5lUmVhZGVyOgogICAgX19zbG90c19fID0gKCJfcyIsICJfaSIsICJfbiIpCiAgICBkZWYgX19pbml0",
-    "X18oc2VsZiwgcyk6CiAgICAgICAgc2VsZi5fcyA9IHMKICAgICAgICBzZWxmLl9pID0gMAogICAgICAgIHNlbGYuX24gPSBsZW4ocykKCiAgICBkZWYgX19pdGVyX18oc2VsZik6CiAgICAgICAgcmV0dXJuIHNlbGYKCiAgICBkZWYgX19uZXh0X18oc2VsZik6CiAgICAgICAgaWYgc2VsZi5faSA+PSBzZWxmLl9uOgogICAgICAgICAgICByYWlzZSBTdG9wSXRlcmF0aW9uCiAgICAgICAgcyA9IHNlbGYuX3MKICAgICAgICBqID0gcy5maW5kKCJcbiIsIHNlbGYuX2kpCiAgICAgICAgaWYgaiA9PSAtMToKICAgICAgICAgICAgbGluZSA9IHNbc2VsZi5faTpdCiAgICAgICAgICAgIHNlbGYuX2kgPSBzZWxmLl9uCiAgICAgICAgICAgIHJldHVybiBsaW5lCiAgICAgICAgbGluZSA9IHNbc2VsZi5faTpqKzFdCiAgICAgICAgc2VsZi5faSA9IGogKyAxCiAgICAgICAgcmV0dXJuIGxpbmUKCiAgICBkZWYgY2xvc2Uoc2VsZik6CiAgICAgICAgcGFzcwoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQojIFRva2VuaXplciAocXVvdGVzICsgc3BlY2lhbHM6IHwgOyA+ID4+ICYmIHx8ICYpCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KZGVmIHRva2VuaXplKHMpOgog",
-    "ICAgb3V0ID0gW10KICAgIGJ1ZiA9ICIiCiAgICBpbl9xID0gRmFsc2UKICAgIGkgPSAwCiAgICBuID0gbGVuKHMpCgogICAgZGVmIGZsdXNoKCk6CiAgICAgICAgbm9ubG9jYWwgYnVmCiAgICAgICAgaWYgYnVmICE9ICIiOgogICAgICAgICAgICBvdXQuYXBwZW5kKGJ1ZikKICAgICAgICAgICAgYnVmID0gIiIKCiAgICB3aGlsZSBpIDwgbjoKICAgICAgICBjaCA9IHNbaV0KCiAgICAgICAgaWYgY2ggPT0gJyInOgogICAgICAgICAgICBpbl9xID0gbm90IGluX3EKICAgICAgICAgICAgaSArPSAxCiAgICAgICAgICAgIGNvbnRpbnVlCgogICAgICAgIGlmIG5vdCBpbl9xOgogICAgICAgICAgICBpZiBjaC5pc3NwYWNlKCk6CiAgICAgICAgICAgICAgICBmbHVzaCgpCiAgICAgICAgICAgICAgICBpICs9IDEKICAgICAgICAgICAgICAgIGNvbnRpbnVlCgogICAgICAgICAgICAjIHR3by1jaGFyIG9wcwogICAgICAgICAgICBpZiBjaCA9PSAiJiIgYW5kIGkgKyAxIDwgbiBhbmQgc1tpKzFdID09ICImIjoKICAgICAgICAgICAgICAgIGZsdXNoKCk7IG91dC5hcHBlbmQoIiYmIik7IGkgKz0gMjsgY29udGludWUKICAgICAgICAgICAgaWYgY2ggPT0gInwiIGFu",
-    "ZCBpICsgMSA8IG4gYW5kIHNbaSsxXSA9PSAifCI6CiAgICAgICAgICAgICAgICBmbHVzaCgpOyBvdXQuYXBwZW5kKCJ8fCIpOyBpICs9IDI7IGNvbnRpbnVlCiAgICAgICAgICAgIGlmIGNoID09ICI+IiBhbmQgaSArIDEgPCBuIGFuZCBzW2krMV0gPT0gIj4iOgogICAgICAgICAgICAgICAgZmx1c2goKTsgb3V0LmFwcGVuZCgiPj4iKTsgaSArPSAyOyBjb250aW51ZQoKICAgICAgICAgICAgIyBvbmUtY2hhciBzcGVjaWFscwogICAgICAgICAgICBpZiBjaCBpbiAoInwiLCAiOyIsICI+IiwgIiYiKToKICAgICAgICAgICAgICAgIGZsdXNoKCk7IG91dC5hcHBlbmQoY2gpOyBpICs9IDE7IGNvbnRpbnVlCgogICAgICAgIGJ1ZiArPSBjaAogICAgICAgIGkgKz0gMQoKICAgIGZsdXNoKCkKICAgIHJldHVybiBvdXQKCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KIyBDb21waWxlciB3aXRoIGxvb3BzICsgaWYgKyBjaGFpbnMgJiYvfHwgKyByZWRpcmVjdGlvbgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCmNsYXNzIENvbXBpbGVFcnJvcihFeGNlcHRpb24pOgogICAgcGFzcwoKY2xhc3MgQ29tcGlsZXI6CiAgICBkZWYgX19pbml0X18oc2VsZiwgdG9rZW5z",
-    "KToKICAgICAgICBzZWxmLnRva3MgPSB0b2tlbnMKICAgICAgICBzZWxmLmkgPSAwCiAgICAgICAgc2VsZi5jb2RlID0gW10KICAgICAgICBzZWxmLmxvb3Bfc3RhY2sgPSBbXSAgICMgeyJzdGFydCI6IHBjLCAiYnJlYWtfam1wcyI6Wy4uLl19CiAgICAgICAgc2VsZi5fdG1wX2NvdW50ZXIgPSAwCgogICAgZGVmIHBlZWsoc2VsZik6CiAgICAgICAgcmV0dXJuIHNlbGYudG9rc1tzZWxmLmldIGlmIHNlbGYuaSA8IGxlbihzZWxmLnRva3MpIGVsc2UgTm9uZQoKICAgIGRlZiBwb3Aoc2VsZik6CiAgICAgICAgdCA9IHNlbGYucGVlaygpCiAgICAgICAgaWYgdCBpcyBOb25lOgogICAgICAgICAgICByZXR1cm4gTm9uZQogICAgICAgIHNlbGYuaSArPSAxCiAgICAgICAgcmV0dXJuIHQKCiAgICBkZWYgZXhwZWN0KHNlbGYsIHMpOgogICAgICAgIHQgPSBzZWxmLnBvcCgpCiAgICAgICAgaWYgdCAhPSBzOgogICAgICAgICAgICByYWlzZSBDb21waWxlRXJyb3IoIkV4cGVjdGVkICclcycgYnV0IGdvdCAnJXMnIiAlIChzLCB0KSkKCiAgICBkZWYgZW1pdChzZWxmLCBvcCwgYXJnPU5vbmUpOgogICAgICAgIHNlbGYuY29kZS5hcHBlbmQoKG9wLCBhcmcpKQogICAg",
-    "ICAgIHJldHVybiBsZW4oc2VsZi5jb2RlKSAtIDEKCiAgICBkZWYgcGF0Y2goc2VsZiwgaWR4LCBuZXdfYXJnKToKICAgICAgICBvcCwgXyA9IHNlbGYuY29kZVtpZHhdCiAgICAgICAgc2VsZi5jb2RlW2lkeF0gPSAob3AsIG5ld19hcmcpCgogICAgZGVmIG5ld190bXAoc2VsZiwgcHJlZml4PSJfX3RtcCIpOgogICAgICAgIHNlbGYuX3RtcF9jb3VudGVyICs9IDEKICAgICAgICByZXR1cm4gIiVzJWQiICUgKHByZWZpeCwgc2VsZi5fdG1wX2NvdW50ZXIpCgogICAgZGVmIGNvbXBpbGUoc2VsZik6CiAgICAgICAgc2VsZi5jb21waWxlX3N0bXRzKHRlcm1pbmF0b3JzPXNldCgpKQogICAgICAgIHNlbGYuZW1pdChPUF9FTkQsIE5vbmUpCiAgICAgICAgcmV0dXJuIHNlbGYuY29kZQoKICAgIGRlZiBjb21waWxlX3N0bXRzKHNlbGYsIHRlcm1pbmF0b3JzKToKICAgICAgICB3aGlsZSBUcnVlOgogICAgICAgICAgICB0ID0gc2VsZi5wZWVrKCkKICAgICAgICAgICAgaWYgdCBpcyBOb25lIG9yIHQgaW4gdGVybWluYXRvcnM6CiAgICAgICAgICAgICAgICByZXR1cm4KCiAgICAgICAgICAgIGlmIHQgPT0gIjsiOgogICAgICAgICAgICAgICAgc2VsZi5wb3AoKQog",
-    "ICAgICAgICAgICAgICAgY29udGludWUKCiAgICAgICAgICAgIGlmIHQgPT0gImlmIjoKICAgICAgICAgICAgICAgIHNlbGYuY29tcGlsZV9pZigpCiAgICAgICAgICAgIGVsaWYgdCA9PSAid2hpbGUiOgogICAgICAgICAgICAgICAgc2VsZi5jb21waWxlX3doaWxlKCkKICAgICAgICAgICAgZWxpZiB0ID09ICJmb3IiOgogICAgICAgICAgICAgICAgc2VsZi5jb21waWxlX2ZvcigpCiAgICAgICAgICAgIGVsaWYgdCA9PSAiZm9yZWFjaCI6CiAgICAgICAgICAgICAgICBzZWxmLmNvbXBpbGVfZm9yZWFjaCgpCiAgICAgICAgICAgIGVsaWYgdCA9PSAiYnJlYWsiOgogICAgICAgICAgICAgICAgc2VsZi5jb21waWxlX2JyZWFrKCkKICAgICAgICAgICAgICAgIHNlbGYuZW1pdChPUF9FWEVDUSwgTm9uZSkgICMgYm91bmRhcnkKICAgICAgICAgICAgZWxpZiB0ID09ICJjb250aW51ZSI6CiAgICAgICAgICAgICAgICBzZWxmLmNvbXBpbGVfY29udGludWUoKQogICAgICAgICAgICAgICAgc2VsZi5lbWl0KE9QX0VYRUNRLCBOb25lKQogICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgc2VsZi5jb21waWxlX2NoYWluKHN0b3BfdG9rZW5zPXRlcm1pbmF0",
-    "b3JzKQoKICAgICAgICAgICAgaWYgc2VsZi5wZWVrKCkgPT0gIjsiOgogICAgICAgICAgICAgICAgc2VsZi5wb3AoKQoKICAgICMgLS0tLSBpZiAvIHdoaWxlIC8gZm9yIC8gZm9yZWFjaCAtLS0tCiAgICBkZWYgY29tcGlsZV9pZihzZWxmKToKICAgICAgICBzZWxmLmV4cGVjdCgiaWYiKQogICAgICAgIHNlbGYuY29tcGlsZV9waXBlbGluZShzdG9wX3Rva2Vucz17InRoZW4ifSkKICAgICAgICBzZWxmLmVtaXQoT1BfRVhFQ1EsIE5vbmUpCiAgICAgICAganpfaWR4ID0gc2VsZi5lbWl0KE9QX0paLCBOb25lKQoKICAgICAgICBzZWxmLmV4cGVjdCgidGhlbiIpCiAgICAgICAgc2VsZi5jb21waWxlX3N0bXRzKHRlcm1pbmF0b3JzPXsiZWxzZSIsICJmaSJ9KQoKICAgICAgICBpZiBzZWxmLnBlZWsoKSA9PSAiZWxzZSI6CiAgICAgICAgICAgIGptcF9lbmQgPSBzZWxmLmVtaXQoT1BfSk1QLCBOb25lKQogICAgICAgICAgICBzZWxmLmV4cGVjdCgiZWxzZSIpCiAgICAgICAgICAgIHNlbGYucGF0Y2goanpfaWR4LCBsZW4oc2VsZi5jb2RlKSkKICAgICAgICAgICAgc2VsZi5jb21waWxlX3N0bXRzKHRlcm1pbmF0b3JzPXsiZmkifSkKICAgICAgICAgICAgc2Vs",
-    "Zi5leHBlY3QoImZpIikKICAgICAgICAgICAgc2VsZi5wYXRjaChqbXBfZW5kLCBsZW4oc2VsZi5jb2RlKSkKICAgICAgICBlbHNlOgogICAgICAgICAgICBzZWxmLmV4cGVjdCgiZmkiKQogICAgICAgICAgICBzZWxmLnBhdGNoKGp6X2lkeCwgbGVuKHNlbGYuY29kZSkpCgogICAgZGVmIGNvbXBpbGVfd2hpbGUoc2VsZik6CiAgICAgICAgc2VsZi5leHBlY3QoIndoaWxlIikKICAgICAgICBsb29wX3N0YXJ0ID0gbGVuKHNlbGYuY29kZSkKCiAgICAgICAgc2VsZi5jb21waWxlX3BpcGVsaW5lKHN0b3BfdG9rZW5zPXsiZG8ifSkKICAgICAgICBzZWxmLmVtaXQoT1BfRVhFQ1EsIE5vbmUpCiAgICAgICAganpfZXhpdCA9IHNlbGYuZW1pdChPUF9KWiwgTm9uZSkKCiAgICAgICAgc2VsZi5leHBlY3QoImRvIikKICAgICAgICBjdHggPSB7InN0YXJ0IjogbG9vcF9zdGFydCwgImJyZWFrX2ptcHMiOiBbXX0KICAgICAgICBzZWxmLmxvb3Bfc3RhY2suYXBwZW5kKGN0eCkKCiAgICAgICAgc2VsZi5jb21waWxlX3N0bXRzKHRlcm1pbmF0b3JzPXsiZG9uZSJ9KQogICAgICAgIHNlbGYuZXhwZWN0KCJkb25lIikKCiAgICAgICAgc2VsZi5lbWl0KE9QX0pNUCwgbG9v",
-    "cF9zdGFydCkKCiAgICAgICAgZXhpdF90YXJnZXQgPSBsZW4oc2VsZi5jb2RlKQogICAgICAgIHNlbGYucGF0Y2goanpfZXhpdCwgZXhpdF90YXJnZXQpCiAgICAgICAgZm9yIGppZHggaW4gY3R4WyJicmVha19qbXBzIl06CiAgICAgICAgICAgIHNlbGYucGF0Y2goamlkeCwgZXhpdF90YXJnZXQpCiAgICAgICAgc2VsZi5sb29wX3N0YWNrLnBvcCgpCgogICAgZGVmIGNvbXBpbGVfZm9yKHNlbGYpOgogICAgICAgICMgZm9yIGkgMSAxMCBbc3RlcF0gZG8gLi4uIGRvbmUKICAgICAgICBzZWxmLmV4cGVjdCgiZm9yIikKICAgICAgICB2YXIgPSBzZWxmLnBvcCgpCiAgICAgICAgaWYgbm90IHZhcjoKICAgICAgICAgICAgcmFpc2UgQ29tcGlsZUVycm9yKCJmb3I6IG1pc3NpbmcgdmFyaWFibGUgbmFtZSIpCgogICAgICAgIHN0YXJ0ID0gc2VsZi5wb3AoKQogICAgICAgIGVuZCA9IHNlbGYucG9wKCkKICAgICAgICBpZiBzdGFydCBpcyBOb25lIG9yIGVuZCBpcyBOb25lOgogICAgICAgICAgICByYWlzZSBDb21waWxlRXJyb3IoImZvcjogbmVlZHMgc3RhcnQgYW5kIGVuZCIpCgogICAgICAgIHN0ZXAgPSBOb25lCiAgICAgICAgaWYgc2VsZi5wZWVrKCkgIT0g",
-    "ImRvIjoKICAgICAgICAgICAgc3RlcCA9IHNlbGYucG9wKCkKICAgICAgICBpZiBzZWxmLnBlZWsoKSAhPSAiZG8iOgogICAgICAgICAgICByYWlzZSBDb21waWxlRXJyb3IoImZvcjogZXhwZWN0ZWQgJ2RvJyIpCgogICAgICAgICMgaW5pdCB2YXI9c3RhcnQKICAgICAgICBzZWxmLmVtaXQoT1BfQVJHLCBzdGFydCkKICAgICAgICBzZWxmLmVtaXQoT1BfU0VULCB2YXIpCgogICAgICAgIGxvb3Bfc3RhcnQgPSBsZW4oc2VsZi5jb2RlKQoKICAgICAgICAjIGNvbmRpdGlvbiB1c2luZyB0ZXN0OgogICAgICAgIGNtcG9wID0gIi1sZSIKICAgICAgICBpZiBzdGVwIGlzIG5vdCBOb25lOgogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICBpZiBpbnQoc3RyKHN0ZXApLnN0cmlwKCkpIDwgMDoKICAgICAgICAgICAgICAgICAgICBjbXBvcCA9ICItZ2UiCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgICAgICBjbXBvcCA9ICItbGUiCgogICAgICAgIHNlbGYuZW1pdChPUF9MT0FELCAidGVzdCIpCiAgICAgICAgc2VsZi5lbWl0KE9QX0dFVCwgdmFyKQogICAgICAgIHNlbGYuZW1pdChPUF9BUkcsIGNtcG9wKQogICAgICAgIHNl",
-    "bGYuZW1pdChPUF9BUkcsIGVuZCkKICAgICAgICBzZWxmLmVtaXQoT1BfRVhFQ1EsIE5vbmUpCiAgICAgICAganpfZXhpdCA9IHNlbGYuZW1pdChPUF9KWiwgTm9uZSkKCiAgICAgICAgc2VsZi5leHBlY3QoImRvIikKCiAgICAgICAgY3R4ID0geyJzdGFydCI6IGxvb3Bfc3RhcnQsICJicmVha19qbXBzIjogW119CiAgICAgICAgc2VsZi5sb29wX3N0YWNrLmFwcGVuZChjdHgpCgogICAgICAgIHNlbGYuY29tcGlsZV9zdG10cyh0ZXJtaW5hdG9ycz17ImRvbmUifSkKICAgICAgICBzZWxmLmV4cGVjdCgiZG9uZSIpCgogICAgICAgIGlmIHN0ZXAgaXMgTm9uZToKICAgICAgICAgICAgc3RlcCA9ICIxIgogICAgICAgICMgaW5jcmVtZW50IHZhciBieSBzdGVwIChxdWlldCkKICAgICAgICBzZWxmLmVtaXQoT1BfTE9BRCwgImFkZHYiKQogICAgICAgIHNlbGYuZW1pdChPUF9BUkcsIHZhcikKICAgICAgICBzZWxmLmVtaXQoT1BfQVJHLCBzdGVwKQogICAgICAgIHNlbGYuZW1pdChPUF9FWEVDUSwgTm9uZSkKCiAgICAgICAgc2VsZi5lbWl0KE9QX0pNUCwgbG9vcF9zdGFydCkKCiAgICAgICAgZXhpdF90YXJnZXQgPSBsZW4oc2VsZi5jb2RlKQogICAgICAgIHNl",
-    "bGYucGF0Y2goanpfZXhpdCwgZXhpdF90YXJnZXQpCiAgICAgICAgZm9yIGppZHggaW4gY3R4WyJicmVha19qbXBzIl06CiAgICAgICAgICAgIHNlbGYucGF0Y2goamlkeCwgZXhpdF90YXJnZXQpCiAgICAgICAgc2VsZi5sb29wX3N0YWNrLnBvcCgpCgogICAgZGVmIGNvbXBpbGVfZm9yZWFjaChzZWxmKToKICAgICAgICAjIGZvcmVhY2ggdiBpbiBhIGIgYyBkbyAuLi4gZG9uZQogICAgICAgICMgZm9yZWFjaCB2IGluIDxwaXBlbGluZT4gZG8gLi4uIGRvbmUgICAoc3BsaXQgcGlwZWxpbmUgb3V0cHV0IGJ5IGxpbmVzKQogICAgICAgIHNlbGYuZXhwZWN0KCJmb3JlYWNoIikKICAgICAgICB2YXIgPSBzZWxmLnBvcCgpCiAgICAgICAgaWYgbm90IHZhcjoKICAgICAgICAgICAgcmFpc2UgQ29tcGlsZUVycm9yKCJmb3JlYWNoOiBtaXNzaW5nIHZhcmlhYmxlIG5hbWUiKQogICAgICAgIHNlbGYuZXhwZWN0KCJpbiIpCgogICAgICAgIGxpc3RfdmFyID0gc2VsZi5uZXdfdG1wKCJfX2ZvcmVhY2hfbGlzdF8iKQoKICAgICAgICBjb2xsZWN0ZWQgPSBbXQogICAgICAgIHdoaWxlIFRydWU6CiAgICAgICAgICAgIHQgPSBzZWxmLnBlZWsoKQogICAgICAgICAgICBp",
-    "ZiB0IGlzIE5vbmU6CiAgICAgICAgICAgICAgICByYWlzZSBDb21waWxlRXJyb3IoImZvcmVhY2g6IG1pc3NpbmcgJ2RvJyIpCiAgICAgICAgICAgIGlmIHQgPT0gImRvIjoKICAgICAgICAgICAgICAgIGJyZWFrCiAgICAgICAgICAgIGNvbGxlY3RlZC5hcHBlbmQoc2VsZi5wb3AoKSkKCiAgICAgICAgaWYgInwiIGluIGNvbGxlY3RlZDoKICAgICAgICAgICAgc3ViID0gQ29tcGlsZXIoY29sbGVjdGVkKQogICAgICAgICAgICBzdWIuY29tcGlsZV9waXBlbGluZShzdG9wX3Rva2Vucz1zZXQoKSkKICAgICAgICAgICAgc2VsZi5jb2RlLmV4dGVuZChzdWIuY29kZSkKICAgICAgICAgICAgc2VsZi5lbWl0KE9QX0VYRUNRLCBOb25lKQogICAgICAgICAgICBzZWxmLmVtaXQoT1BfU1BMSVRMLCBsaXN0X3ZhcikKICAgICAgICBlbHNlOgogICAgICAgICAgICBzZWxmLmVtaXQoT1BfU0VUTElTVCwgKGxpc3RfdmFyLCBjb2xsZWN0ZWQpKQoKICAgICAgICBzZWxmLmV4cGVjdCgiZG8iKQoKICAgICAgICBzZWxmLmVtaXQoT1BfRk9SRV9JTklULCAodmFyLCBsaXN0X3ZhcikpCiAgICAgICAgbG9vcF9zdGFydCA9IGxlbihzZWxmLmNvZGUpCiAgICAgICAgZm9yZV9u",
-    "ZXh0ID0gc2VsZi5lbWl0KE9QX0ZPUkVfTkVYVCwgTm9uZSkgICMgcGF0Y2hlZCB0byBleGl0CgogICAgICAgIGN0eCA9IHsic3RhcnQiOiBsb29wX3N0YXJ0LCAiYnJlYWtfam1wcyI6IFtdfQogICAgICAgIHNlbGYubG9vcF9zdGFjay5hcHBlbmQoY3R4KQoKICAgICAgICBzZWxmLmNvbXBpbGVfc3RtdHModGVybWluYXRvcnM9eyJkb25lIn0pCiAgICAgICAgc2VsZi5leHBlY3QoImRvbmUiKQoKICAgICAgICBzZWxmLmVtaXQoT1BfSk1QLCBsb29wX3N0YXJ0KQoKICAgICAgICBleGl0X3RhcmdldCA9IGxlbihzZWxmLmNvZGUpCiAgICAgICAgc2VsZi5wYXRjaChmb3JlX25leHQsIGV4aXRfdGFyZ2V0KQogICAgICAgIGZvciBqaWR4IGluIGN0eFsiYnJlYWtfam1wcyJdOgogICAgICAgICAgICBzZWxmLnBhdGNoKGppZHgsIGV4aXRfdGFyZ2V0KQogICAgICAgIHNlbGYubG9vcF9zdGFjay5wb3AoKQoKICAgIGRlZiBjb21waWxlX2JyZWFrKHNlbGYpOgogICAgICAgIHNlbGYuZXhwZWN0KCJicmVhayIpCiAgICAgICAgaWYgbm90IHNlbGYubG9vcF9zdGFjazoKICAgICAgICAgICAgcmFpc2UgQ29tcGlsZUVycm9yKCJicmVhayB1c2VkIG91dHNpZGUgb2Yg",
-    "YSBsb29wIikKICAgICAgICBqaWR4ID0gc2VsZi5lbWl0KE9QX0pNUCwgTm9uZSkKICAgICAgICBzZWxmLmxvb3Bfc3RhY2tbLTFdWyJicmVha19qbXBzIl0uYXBwZW5kKGppZHgpCgogICAgZGVmIGNvbXBpbGVfY29udGludWUoc2VsZik6CiAgICAgICAgc2VsZi5leHBlY3QoImNvbnRpbnVlIikKICAgICAgICBpZiBub3Qgc2VsZi5sb29wX3N0YWNrOgogICAgICAgICAgICByYWlzZSBDb21waWxlRXJyb3IoImNvbnRpbnVlIHVzZWQgb3V0c2lkZSBvZiBhIGxvb3AiKQogICAgICAgIHNlbGYuZW1pdChPUF9KTVAsIHNlbGYubG9vcF9zdGFja1stMV1bInN0YXJ0Il0pCgogICAgIyAtLS0tICYmIC8gfHwgY2hhaW5zICsgcmVkaXJlY3Rpb24gLS0tLQogICAgZGVmIGNvbXBpbGVfY2hhaW4oc2VsZiwgc3RvcF90b2tlbnMpOgogICAgICAgICMgYXNzaWdubWVudCBsaWtlIHg9MwogICAgICAgIHQgPSBzZWxmLnBlZWsoKQogICAgICAgIGlmIHQgaXMgbm90IE5vbmUgYW5kICgiPSIgaW4gdCkgYW5kIChub3QgdC5zdGFydHN3aXRoKCIkIikpIGFuZCAodCAhPSAifCIpOgogICAgICAgICAgICBuYW1lLCB2YWwgPSB0LnNwbGl0KCI9IiwgMSkKICAgICAgICAgICAg",
-    "c2VsZi5wb3AoKQogICAgICAgICAgICBzZWxmLmVtaXQoT1BfQVJHLCB2YWwpCiAgICAgICAgICAgIHNlbGYuZW1pdChPUF9TRVQsIG5hbWUpCiAgICAgICAgICAgICMgdXBkYXRlIGxhc3RfdHJ1dGggcXVpZXRseSBiYXNlZCBvbiB2YWx1ZQogICAgICAgICAgICBzZWxmLmVtaXQoT1BfTE9BRCwgImVjaG8iKQogICAgICAgICAgICBzZWxmLmVtaXQoT1BfR0VULCBuYW1lKQogICAgICAgICAgICBzZWxmLmVtaXQoT1BfRVhFQ1EsIE5vbmUpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgc2VsZi5jb21waWxlX3BpcGVsaW5lKHN0b3BfdG9rZW5zPXN0b3BfdG9rZW5zLnVuaW9uKHsiJiYiLCAifHwiLCAiPiIsICI+PiJ9KSkKICAgICAgICAgICAgc2VsZi5jb21waWxlX3JlZGlyZWN0aW9uX2lmX3ByZXNlbnQoKQogICAgICAgICAgICBzZWxmLmVtaXQoT1BfRVhFQywgTm9uZSkKCiAgICAgICAgd2hpbGUgVHJ1ZToKICAgICAgICAgICAgb3AgPSBzZWxmLnBlZWsoKQogICAgICAgICAgICBpZiBvcCBub3QgaW4gKCImJiIsICJ8fCIpOgogICAgICAgICAgICAgICAgcmV0dXJuCiAgICAgICAgICAgIHNlbGYucG9wKCkKCiAgICAgICAgICAgIGlmIG9wID09ICIm",
-    "JiI6CiAgICAgICAgICAgICAgICBza2lwX3JocyA9IHNlbGYuZW1pdChPUF9KWiwgTm9uZSkKICAgICAgICAgICAgICAgIHNlbGYuY29tcGlsZV9waXBlbGluZShzdG9wX3Rva2Vucz1zdG9wX3Rva2Vucy51bmlvbih7IiYmIiwgInx8IiwgIj4iLCAiPj4ifSkpCiAgICAgICAgICAgICAgICBzZWxmLmNvbXBpbGVfcmVkaXJlY3Rpb25faWZfcHJlc2VudCgpCiAgICAgICAgICAgICAgICBzZWxmLmVtaXQoT1BfRVhFQywgTm9uZSkKICAgICAgICAgICAgICAgIHNlbGYucGF0Y2goc2tpcF9yaHMsIGxlbihzZWxmLmNvZGUpKQogICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgcnVuX3JocyA9IHNlbGYuZW1pdChPUF9KWiwgTm9uZSkKICAgICAgICAgICAgICAgIHNraXBfcmhzID0gc2VsZi5lbWl0KE9QX0pNUCwgTm9uZSkKICAgICAgICAgICAgICAgIHNlbGYucGF0Y2gocnVuX3JocywgbGVuKHNlbGYuY29kZSkpCiAgICAgICAgICAgICAgICBzZWxmLmNvbXBpbGVfcGlwZWxpbmUoc3RvcF90b2tlbnM9c3RvcF90b2tlbnMudW5pb24oeyImJiIsICJ8fCIsICI+IiwgIj4+In0pKQogICAgICAgICAgICAgICAgc2VsZi5jb21waWxlX3JlZGlyZWN0aW9u",
-    "X2lmX3ByZXNlbnQoKQogICAgICAgICAgICAgICAgc2VsZi5lbWl0KE9QX0VYRUMsIE5vbmUpCiAgICAgICAgICAgICAgICBzZWxmLnBhdGNoKHNraXBfcmhzLCBsZW4oc2VsZi5jb2RlKSkKCiAgICBkZWYgY29tcGlsZV9yZWRpcmVjdGlvbl9pZl9wcmVzZW50KHNlbGYpOgogICAgICAgIHQgPSBzZWxmLnBlZWsoKQogICAgICAgIGlmIHQgbm90IGluICgiPiIsICI+PiIpOgogICAgICAgICAgICByZXR1cm4KICAgICAgICBvcCA9IHNlbGYucG9wKCkKICAgICAgICBmbmFtZSA9IHNlbGYucG9wKCkKICAgICAgICBpZiBmbmFtZSBpcyBOb25lOgogICAgICAgICAgICByYWlzZSBDb21waWxlRXJyb3IoInJlZGlyZWN0aW9uIG1pc3NpbmcgZmlsZW5hbWUiKQogICAgICAgIHNlbGYuZW1pdChPUF9QSVBFLCBOb25lKQogICAgICAgIHNlbGYuZW1pdChPUF9MT0FELCAiYXBwZW5kIiBpZiBvcCA9PSAiPj4iIGVsc2UgIndyaXRlIikKICAgICAgICBzZWxmLmVtaXQoT1BfQVJHLCBmbmFtZSkKCiAgICAjIC0tLS0gcGlwZWxpbmVzIC0tLS0KICAgIGRlZiBjb21waWxlX3BpcGVsaW5lKHNlbGYsIHN0b3BfdG9rZW5zKToKICAgICAgICBleHBlY3RpbmdfY21kID0gVHJ1",
-    "ZQogICAgICAgIHdoaWxlIFRydWU6CiAgICAgICAgICAgIHQgPSBzZWxmLnBlZWsoKQogICAgICAgICAgICBpZiB0IGlzIE5vbmUgb3IgdCBpbiBzdG9wX3Rva2VucyBvciB0ID09ICI7IjoKICAgICAgICAgICAgICAgIHJldHVybgoKICAgICAgICAgICAgaWYgdCA9PSAifCI6CiAgICAgICAgICAgICAgICBzZWxmLnBvcCgpCiAgICAgICAgICAgICAgICBzZWxmLmVtaXQoT1BfUElQRSwgTm9uZSkKICAgICAgICAgICAgICAgIGV4cGVjdGluZ19jbWQgPSBUcnVlCiAgICAgICAgICAgICAgICBjb250aW51ZQoKICAgICAgICAgICAgc2VsZi5wb3AoKQoKICAgICAgICAgICAgaWYgdC5zdGFydHN3aXRoKCIkIikgYW5kIGxlbih0KSA+IDE6CiAgICAgICAgICAgICAgICBzZWxmLmVtaXQoT1BfR0VULCB0WzE6XSkKICAgICAgICAgICAgICAgIGV4cGVjdGluZ19jbWQgPSBGYWxzZQogICAgICAgICAgICAgICAgY29udGludWUKCiAgICAgICAgICAgIGlmIGV4cGVjdGluZ19jbWQ6CiAgICAgICAgICAgICAgICBzZWxmLmVtaXQoT1BfTE9BRCwgdCkKICAgICAgICAgICAgICAgIGV4cGVjdGluZ19jbWQgPSBGYWxzZQogICAgICAgICAgICBlbHNlOgogICAgICAgICAg",
-    "ICAgICAgc2VsZi5lbWl0KE9QX0FSRywgdCkKCmRlZiBjb21waWxlX2xpbmUobGluZSk6CiAgICB0b2tzID0gdG9rZW5pemUobGluZS5zdHJpcCgpKQogICAgYmcgPSBGYWxzZQogICAgaWYgdG9rcyBhbmQgdG9rc1stMV0gPT0gIiYiOgogICAgICAgIGJnID0gVHJ1ZQogICAgICAgIHRva3MgPSB0b2tzWzotMV0KICAgIGMgPSBDb21waWxlcih0b2tzKQogICAgcmV0dXJuIGMuY29tcGlsZSgpLCBiZwoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQojIENvb3BlcmF0aXZlIGpvYiBzeXN0ZW0KIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQpjbGFzcyBKb2I6CiAgICBfX3Nsb3RzX18gPSAoImppZCIsICJuYW1lIiwgImdlbiIsICJkb25lIiwgImVycm9yIikKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBqaWQsIG5hbWUsIGdlbik6CiAgICAgICAgc2VsZi5qaWQgPSBqaWQKICAgICAgICBzZWxmLm5hbWUgPSBuYW1lCiAgICAgICAgc2VsZi5nZW4gPSBnZW4KICAgICAgICBzZWxmLmRvbmUgPSBGYWxzZQogICAgICAgIHNlbGYuZXJyb3IgPSBOb25lCgogICAgZGVmIHN0ZXAoc2VsZiwgbj0xKToKICAgICAgICBpZiBzZWxmLmRvbmU6CiAgICAgICAgICAgIHJldHVy",
-    "bgogICAgICAgIHRyeToKICAgICAgICAgICAgZm9yIF8gaW4gcmFuZ2Uobik6CiAgICAgICAgICAgICAgICBuZXh0KHNlbGYuZ2VuKQogICAgICAgIGV4Y2VwdCBTdG9wSXRlcmF0aW9uOgogICAgICAgICAgICBzZWxmLmRvbmUgPSBUcnVlCiAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgICAgICBzZWxmLmRvbmUgPSBUcnVlCiAgICAgICAgICAgIHNlbGYuZXJyb3IgPSBlCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgVk0KIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQpjbGFzcyBWTToKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBjb21tYW5kcz1Ob25lLCBzcG9vbF9wYXRoPSJTVERPVVQiLCBzcG9vbF90aHJlc2hvbGQ9MjA0OCk6CiAgICAgICAgc2VsZi50b2tlbl9zdGFjayA9IFtdCiAgICAgICAgc2VsZi52YWx1ZV9zdGFjayA9IFtdCiAgICAgICAgc2VsZi52YXJzID0ge30KICAgICAgICBzZWxmLnBjID0gMAogICAgICAgIHNlbGYuY29kZSA9IFtdCiAgICAgICAgc2VsZi5jb21tYW5kcyA9IGNvbW1hbmRzIG9yIHt9CgogICAgICAgIHNlbGYubGFzdF9vdXRwdXQgPSAiIgogICAgICAgIHNlbGYubGFzdF90cnV0aCA9IEZhbHNl",
-    "CgogICAgICAgIHNlbGYuc3Bvb2xfcGF0aCA9IHNwb29sX3BhdGgKICAgICAgICBzZWxmLnNwb29sX3RocmVzaG9sZCA9IHNwb29sX3RocmVzaG9sZAoKICAgICAgICBzZWxmLl9mb3JlYWNoX3N0YWNrID0gW10gICMgKHZhcm5hbWUsIGl0ZXJhdG9yKQoKICAgICAgICAjIGpvYnMKICAgICAgICBzZWxmLmpvYnMgPSB7fQogICAgICAgIHNlbGYubmV4dF9qaWQgPSAxCgogICAgICAgICMgc2NoZWR1bGVyLXNhZmUgc2xlZXAgc3RhdGUKICAgICAgICBzZWxmLnNsZWVwX3VudGlsID0gTm9uZQoKICAgIGRlZiBjbG9uZV9mb3Jfam9iKHNlbGYpOgogICAgICAgIGp2bSA9IFZNKGNvbW1hbmRzPXNlbGYuY29tbWFuZHMsIHNwb29sX3BhdGg9c2VsZi5zcG9vbF9wYXRoLCBzcG9vbF90aHJlc2hvbGQ9c2VsZi5zcG9vbF90aHJlc2hvbGQpCiAgICAgICAganZtLnZhcnMgPSBkaWN0KHNlbGYudmFycykKICAgICAgICByZXR1cm4ganZtCgogICAgZGVmIHRydXRoeShzZWxmLCBzKToKICAgICAgICBpZiBzIGlzIE5vbmU6CiAgICAgICAgICAgIHJldHVybiBGYWxzZQogICAgICAgIHR4dCA9IHN0cihzKS5zdHJpcCgpCiAgICAgICAgaWYgdHh0ID09ICIiOgogICAgICAg",
-    "ICAgICByZXR1cm4gRmFsc2UKICAgICAgICBsb3cgPSB0eHQubG93ZXIoKQogICAgICAgIHJldHVybiBsb3cgbm90IGluICgiMCIsICJmYWxzZSIsICJubyIsICJuaWwiKQoKICAgIGRlZiBfbWF5YmVfc3Bvb2woc2VsZiwgb3V0KToKICAgICAgICBpZiBvdXQgaXMgTm9uZToKICAgICAgICAgICAgcyA9ICIiCiAgICAgICAgZWxpZiBpc2luc3RhbmNlKG91dCwgc3RyKToKICAgICAgICAgICAgcyA9IG91dAogICAgICAgIGVsc2U6CiAgICAgICAgICAgIHMgPSBzdHIob3V0KQoKICAgICAgICBpZiBzZWxmLnNwb29sX3RocmVzaG9sZCBhbmQgbGVuKHMpID49IHNlbGYuc3Bvb2xfdGhyZXNob2xkOgogICAgICAgICAgICB3aXRoIG9wZW4oc2VsZi5zcG9vbF9wYXRoLCAidyIpIGFzIGY6CiAgICAgICAgICAgICAgICBmLndyaXRlKHMpCiAgICAgICAgICAgIHJldHVybiBQaXBlRGF0YShwYXRoPXNlbGYuc3Bvb2xfcGF0aCwgaXNfZmlsZT1UcnVlKQoKICAgICAgICByZXR1cm4gUGlwZURhdGEodGV4dD1zLCBpc19maWxlPUZhbHNlKQoKICAgIGRlZiBydW4oc2VsZiwgdHJhY2U9RmFsc2UpOgogICAgICAgIHNlbGYucGMgPSAwCiAgICAgICAgd2hpbGUgc2VsZi5w",
-    "YyA8IGxlbihzZWxmLmNvZGUpOgogICAgICAgICAgICAjIEZvcmVncm91bmQgc2xlZXA6IGJsb2NrLCBidXQga2VlcCBiYWNrZ3JvdW5kIGpvYnMgYWxpdmUuCiAgICAgICAgICAgIGlmIHNlbGYuc2xlZXBfdW50aWwgaXMgbm90IE5vbmU6CiAgICAgICAgICAgICAgICB3aGlsZSBfdGlja3NfZGlmZihzZWxmLnNsZWVwX3VudGlsLCBfdGlja3NfbXMoKSkgPiAwOgogICAgICAgICAgICAgICAgICAgIHNlbGYucG9sbF9qb2JzKHN0ZXBzPTgwKQogICAgICAgICAgICAgICAgICAgIF9zbGVlcF9tcygyMCkKICAgICAgICAgICAgICAgIHNlbGYuc2xlZXBfdW50aWwgPSBOb25lCgogICAgICAgICAgICBvcCwgYXJnID0gc2VsZi5jb2RlW3NlbGYucGNdCiAgICAgICAgICAgIHNlbGYucGMgKz0gMQoKICAgICAgICAgICAgaWYgdHJhY2U6CiAgICAgICAgICAgICAgICBwcmludCgiUEMiLCBzZWxmLnBjLTEsICJPUCIsIG9wLCAiQVJHIiwgYXJnKQoKICAgICAgICAgICAgaWYgb3AgPT0gT1BfTE9BRDoKICAgICAgICAgICAgICAgIHNlbGYudG9rZW5fc3RhY2suYXBwZW5kKCgiY21kIiwgYXJnKSkKCiAgICAgICAgICAgIGVsaWYgb3AgPT0gT1BfQVJHOgogICAgICAg",
-    "ICAgICAgICAgc2VsZi50b2tlbl9zdGFjay5hcHBlbmQoKCJhcmciLCBhcmcpKQogICAgICAgICAgICAgICAgc2VsZi52YWx1ZV9zdGFjay5hcHBlbmQoYXJnKQoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9QSVBFOgogICAgICAgICAgICAgICAgc2VsZi50b2tlbl9zdGFjay5hcHBlbmQoKCJwaXBlIiwgTm9uZSkpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX1NFVDoKICAgICAgICAgICAgICAgIHZhbCA9IHNlbGYudmFsdWVfc3RhY2sucG9wKCkgaWYgc2VsZi52YWx1ZV9zdGFjayBlbHNlICIiCiAgICAgICAgICAgICAgICBzZWxmLnZhcnNbYXJnXSA9IHZhbAoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9HRVQ6CiAgICAgICAgICAgICAgICB2YWwgPSBzZWxmLnZhcnMuZ2V0KGFyZywgIiIpCiAgICAgICAgICAgICAgICBzZWxmLnRva2VuX3N0YWNrLmFwcGVuZCgoImFyZyIsIHZhbCkpCiAgICAgICAgICAgICAgICBzZWxmLnZhbHVlX3N0YWNrLmFwcGVuZCh2YWwpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX0VYRUMgb3Igb3AgPT0gT1BfRVhFQ1E6CiAgICAgICAgICAgICAgICBvdXQgPSBzZWxmLmV4ZWNfcGlwZWxpbmUoKQogICAgICAg",
-    "ICAgICAgICAgc2VsZi5sYXN0X291dHB1dCA9IG91dAogICAgICAgICAgICAgICAgc2VsZi5sYXN0X3RydXRoID0gc2VsZi50cnV0aHkob3V0KQogICAgICAgICAgICAgICAgaWYgb3AgPT0gT1BfRVhFQyBhbmQgb3V0IGlzIG5vdCBOb25lIGFuZCBvdXQgIT0gIiI6CiAgICAgICAgICAgICAgICAgICAgcHJpbnQob3V0KQogICAgICAgICAgICAgICAgc2VsZi52YWx1ZV9zdGFjayA9IFtdCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX0pNUDoKICAgICAgICAgICAgICAgIHNlbGYucGMgPSBpbnQoYXJnKQoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9KWjoKICAgICAgICAgICAgICAgIGlmIG5vdCBzZWxmLmxhc3RfdHJ1dGg6CiAgICAgICAgICAgICAgICAgICAgc2VsZi5wYyA9IGludChhcmcpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX1NFVExJU1Q6CiAgICAgICAgICAgICAgICBuYW1lLCBpdGVtcyA9IGFyZwogICAgICAgICAgICAgICAgc2VsZi52YXJzW25hbWVdID0gbGlzdChpdGVtcykKCiAgICAgICAgICAgIGVsaWYgb3AgPT0gT1BfU1BMSVRMOgogICAgICAgICAgICAgICAgcyA9ICIiIGlmIHNlbGYubGFzdF9vdXRwdXQgaXMgTm9uZSBl",
-    "bHNlIHN0cihzZWxmLmxhc3Rfb3V0cHV0KQogICAgICAgICAgICAgICAgc2VsZi52YXJzW2FyZ10gPSBzLnNwbGl0bGluZXMoKQoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9GT1JFX0lOSVQ6CiAgICAgICAgICAgICAgICB2YXJuYW1lLCBsaXN0bmFtZSA9IGFyZwogICAgICAgICAgICAgICAgaXRlbXMgPSBzZWxmLnZhcnMuZ2V0KGxpc3RuYW1lLCBbXSkKICAgICAgICAgICAgICAgIGlmIGl0ZW1zIGlzIE5vbmU6CiAgICAgICAgICAgICAgICAgICAgaXRlbXMgPSBbXQogICAgICAgICAgICAgICAgaWYgaXNpbnN0YW5jZShpdGVtcywgc3RyKToKICAgICAgICAgICAgICAgICAgICBpdGVtcyA9IGl0ZW1zLnNwbGl0bGluZXMoKQogICAgICAgICAgICAgICAgaXQgPSBpdGVyKGl0ZW1zKQogICAgICAgICAgICAgICAgc2VsZi5fZm9yZWFjaF9zdGFjay5hcHBlbmQoKHZhcm5hbWUsIGl0KSkKCiAgICAgICAgICAgIGVsaWYgb3AgPT0gT1BfRk9SRV9ORVhUOgogICAgICAgICAgICAgICAgaWYgbm90IHNlbGYuX2ZvcmVhY2hfc3RhY2s6CiAgICAgICAgICAgICAgICAgICAgc2VsZi5wYyA9IGludChhcmcpCiAgICAgICAgICAgICAgICBlbHNlOgogICAgICAg",
-    "ICAgICAgICAgICAgIHZhcm5hbWUsIGl0ID0gc2VsZi5fZm9yZWFjaF9zdGFja1stMV0KICAgICAgICAgICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICAgICAgICAgIG54dCA9IG5leHQoaXQpCiAgICAgICAgICAgICAgICAgICAgICAgIHNlbGYudmFyc1t2YXJuYW1lXSA9IHN0cihueHQpCiAgICAgICAgICAgICAgICAgICAgZXhjZXB0IFN0b3BJdGVyYXRpb246CiAgICAgICAgICAgICAgICAgICAgICAgIHNlbGYuX2ZvcmVhY2hfc3RhY2sucG9wKCkKICAgICAgICAgICAgICAgICAgICAgICAgc2VsZi5wYyA9IGludChhcmcpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX0VORDoKICAgICAgICAgICAgICAgIGJyZWFrCgogICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgcmFpc2UgRXhjZXB0aW9uKCJVbmtub3duIG9wY29kZTogJXIiICUgb3ApCgogICAgICAgIHJldHVybiBzZWxmLmxhc3Rfb3V0cHV0CgogICAgZGVmIHJ1bl9nZW5lcmF0b3Ioc2VsZik6CiAgICAgICAgIyBDb29wZXJhdGl2ZSBydW5uZXI6IHlpZWxkcyBmcmVxdWVudGx5IHNvIGl0IGNhbiBiZSB1c2VkIGFzIGEgYmFja2dyb3VuZCBqb2IuCiAgICAgICAgc2VsZi5w",
-    "YyA9IDAKICAgICAgICB3aGlsZSBzZWxmLnBjIDwgbGVuKHNlbGYuY29kZSk6CiAgICAgICAgICAgICMgQmFja2dyb3VuZCBzbGVlcDogeWllbGQgcXVpY2tseSB1bnRpbCB3YWtlIHRpbWUgKG5vIHJlLWVudHJhbmN5KS4KICAgICAgICAgICAgaWYgc2VsZi5zbGVlcF91bnRpbCBpcyBub3QgTm9uZToKICAgICAgICAgICAgICAgIGlmIF90aWNrc19kaWZmKHNlbGYuc2xlZXBfdW50aWwsIF90aWNrc19tcygpKSA+IDA6CiAgICAgICAgICAgICAgICAgICAgeWllbGQgTm9uZQogICAgICAgICAgICAgICAgICAgIGNvbnRpbnVlCiAgICAgICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgICAgIHNlbGYuc2xlZXBfdW50aWwgPSBOb25lCgogICAgICAgICAgICBvcCwgYXJnID0gc2VsZi5jb2RlW3NlbGYucGNdCiAgICAgICAgICAgIHNlbGYucGMgKz0gMQoKICAgICAgICAgICAgaWYgb3AgPT0gT1BfTE9BRDoKICAgICAgICAgICAgICAgIHNlbGYudG9rZW5fc3RhY2suYXBwZW5kKCgiY21kIiwgYXJnKSkKCiAgICAgICAgICAgIGVsaWYgb3AgPT0gT1BfQVJHOgogICAgICAgICAgICAgICAgc2VsZi50b2tlbl9zdGFjay5hcHBlbmQoKCJhcmciLCBhcmcp",
-    "KQogICAgICAgICAgICAgICAgc2VsZi52YWx1ZV9zdGFjay5hcHBlbmQoYXJnKQoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9QSVBFOgogICAgICAgICAgICAgICAgc2VsZi50b2tlbl9zdGFjay5hcHBlbmQoKCJwaXBlIiwgTm9uZSkpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX1NFVDoKICAgICAgICAgICAgICAgIHZhbCA9IHNlbGYudmFsdWVfc3RhY2sucG9wKCkgaWYgc2VsZi52YWx1ZV9zdGFjayBlbHNlICIiCiAgICAgICAgICAgICAgICBzZWxmLnZhcnNbYXJnXSA9IHZhbAoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9HRVQ6CiAgICAgICAgICAgICAgICB2YWwgPSBzZWxmLnZhcnMuZ2V0KGFyZywgIiIpCiAgICAgICAgICAgICAgICBzZWxmLnRva2VuX3N0YWNrLmFwcGVuZCgoImFyZyIsIHZhbCkpCiAgICAgICAgICAgICAgICBzZWxmLnZhbHVlX3N0YWNrLmFwcGVuZCh2YWwpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX0VYRUMgb3Igb3AgPT0gT1BfRVhFQ1E6CiAgICAgICAgICAgICAgICBvdXQgPSBzZWxmLmV4ZWNfcGlwZWxpbmUoKQogICAgICAgICAgICAgICAgc2VsZi5sYXN0X291dHB1dCA9IG91dAogICAgICAgICAgICAg",
-    "ICAgc2VsZi5sYXN0X3RydXRoID0gc2VsZi50cnV0aHkob3V0KQogICAgICAgICAgICAgICAgc2VsZi52YWx1ZV9zdGFjayA9IFtdCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX0pNUDoKICAgICAgICAgICAgICAgIHNlbGYucGMgPSBpbnQoYXJnKQoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9KWjoKICAgICAgICAgICAgICAgIGlmIG5vdCBzZWxmLmxhc3RfdHJ1dGg6CiAgICAgICAgICAgICAgICAgICAgc2VsZi5wYyA9IGludChhcmcpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX1NFVExJU1Q6CiAgICAgICAgICAgICAgICBuYW1lLCBpdGVtcyA9IGFyZwogICAgICAgICAgICAgICAgc2VsZi52YXJzW25hbWVdID0gbGlzdChpdGVtcykKCiAgICAgICAgICAgIGVsaWYgb3AgPT0gT1BfU1BMSVRMOgogICAgICAgICAgICAgICAgcyA9ICIiIGlmIHNlbGYubGFzdF9vdXRwdXQgaXMgTm9uZSBlbHNlIHN0cihzZWxmLmxhc3Rfb3V0cHV0KQogICAgICAgICAgICAgICAgc2VsZi52YXJzW2FyZ10gPSBzLnNwbGl0bGluZXMoKQoKICAgICAgICAgICAgZWxpZiBvcCA9PSBPUF9GT1JFX0lOSVQ6CiAgICAgICAgICAgICAgICB2YXJuYW1lLCBsaXN0bmFt",
-    "ZSA9IGFyZwogICAgICAgICAgICAgICAgaXRlbXMgPSBzZWxmLnZhcnMuZ2V0KGxpc3RuYW1lLCBbXSkKICAgICAgICAgICAgICAgIGlmIGl0ZW1zIGlzIE5vbmU6CiAgICAgICAgICAgICAgICAgICAgaXRlbXMgPSBbXQogICAgICAgICAgICAgICAgaWYgaXNpbnN0YW5jZShpdGVtcywgc3RyKToKICAgICAgICAgICAgICAgICAgICBpdGVtcyA9IGl0ZW1zLnNwbGl0bGluZXMoKQogICAgICAgICAgICAgICAgaXQgPSBpdGVyKGl0ZW1zKQogICAgICAgICAgICAgICAgc2VsZi5fZm9yZWFjaF9zdGFjay5hcHBlbmQoKHZhcm5hbWUsIGl0KSkKCiAgICAgICAgICAgIGVsaWYgb3AgPT0gT1BfRk9SRV9ORVhUOgogICAgICAgICAgICAgICAgaWYgbm90IHNlbGYuX2ZvcmVhY2hfc3RhY2s6CiAgICAgICAgICAgICAgICAgICAgc2VsZi5wYyA9IGludChhcmcpCiAgICAgICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgICAgIHZhcm5hbWUsIGl0ID0gc2VsZi5fZm9yZWFjaF9zdGFja1stMV0KICAgICAgICAgICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICAgICAgICAgIG54dCA9IG5leHQoaXQpCiAgICAgICAgICAgICAgICAgICAgICAgIHNlbGYu",
-    "dmFyc1t2YXJuYW1lXSA9IHN0cihueHQpCiAgICAgICAgICAgICAgICAgICAgZXhjZXB0IFN0b3BJdGVyYXRpb246CiAgICAgICAgICAgICAgICAgICAgICAgIHNlbGYuX2ZvcmVhY2hfc3RhY2sucG9wKCkKICAgICAgICAgICAgICAgICAgICAgICAgc2VsZi5wYyA9IGludChhcmcpCgogICAgICAgICAgICBlbGlmIG9wID09IE9QX0VORDoKICAgICAgICAgICAgICAgIGJyZWFrCgogICAgICAgICAgICB5aWVsZCBOb25lICAjIGNvb3BlcmF0ZSBvZnRlbgoKICAgIGRlZiBleGVjX3BpcGVsaW5lKHNlbGYpOgogICAgICAgIGl0ZW1zID0gc2VsZi50b2tlbl9zdGFjawogICAgICAgIHNlbGYudG9rZW5fc3RhY2sgPSBbXQoKICAgICAgICBwaXBlbGluZSA9IFtdCiAgICAgICAgY3VycmVudF9jbWQgPSBOb25lCiAgICAgICAgY3VycmVudF9hcmdzID0gW10KCiAgICAgICAgZGVmIGZsdXNoKCk6CiAgICAgICAgICAgIG5vbmxvY2FsIGN1cnJlbnRfY21kLCBjdXJyZW50X2FyZ3MKICAgICAgICAgICAgaWYgY3VycmVudF9jbWQgaXMgbm90IE5vbmU6CiAgICAgICAgICAgICAgICBwaXBlbGluZS5hcHBlbmQoKGN1cnJlbnRfY21kLCBjdXJyZW50X2FyZ3MpKQogICAg",
-    "ICAgICAgICBjdXJyZW50X2NtZCA9IE5vbmUKICAgICAgICAgICAgY3VycmVudF9hcmdzID0gW10KCiAgICAgICAgZm9yIGtpbmQsIHZhbCBpbiBpdGVtczoKICAgICAgICAgICAgaWYga2luZCA9PSAicGlwZSI6CiAgICAgICAgICAgICAgICBmbHVzaCgpCiAgICAgICAgICAgIGVsaWYga2luZCA9PSAiY21kIjoKICAgICAgICAgICAgICAgIGlmIGN1cnJlbnRfY21kIGlzIG5vdCBOb25lOgogICAgICAgICAgICAgICAgICAgIGZsdXNoKCkKICAgICAgICAgICAgICAgIGN1cnJlbnRfY21kID0gdmFsCiAgICAgICAgICAgIGVsaWYga2luZCA9PSAiYXJnIjoKICAgICAgICAgICAgICAgIGN1cnJlbnRfYXJncy5hcHBlbmQodmFsKQoKICAgICAgICBmbHVzaCgpCgogICAgICAgIG91dCA9IFBpcGVEYXRhKHRleHQ9IiIsIGlzX2ZpbGU9RmFsc2UpCiAgICAgICAgZm9yIGNtZCwgYXJncyBpbiBwaXBlbGluZToKICAgICAgICAgICAgb3V0X3JhdyA9IHNlbGYucnVuX2NvbW1hbmQoY21kLCBhcmdzLCBvdXQpCiAgICAgICAgICAgIG91dCA9IHNlbGYuX21heWJlX3Nwb29sKG91dF9yYXcpCgogICAgICAgIHJldHVybiBvdXQuYXNfdGV4dCgpCgogICAgZGVmIHJ1bl9j",
-    "b21tYW5kKHNlbGYsIGNtZCwgYXJncywgaW5wdXRfZGF0YSk6CiAgICAgICAgZ2xvYmFsIF9DVVJSRU5UX1ZNCiAgICAgICAgZm4gPSBzZWxmLmNvbW1hbmRzLmdldChjbWQpCiAgICAgICAgaWYgZm4gaXMgTm9uZToKICAgICAgICAgICAgIyBBdXRvLXJlc29sdmU6IGlmIC9saWIvPGNtZD4ucHkgZXhpc3RzLCB0cmVhdCBpdCBsaWtlOiBydW4gPGNtZD4gPGFyZ3MuLi4+CiAgICAgICAgICAgICMgVGhpcyBtYWtlcyBpbnN0YWxsZWQgbW9kdWxlcyBmZWVsIGxpa2UgYnVpbHQtaW4gY29tbWFuZHMuCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGxpYl9wYXRoID0gIi9saWIvJXMucHkiICUgY21kCiAgICAgICAgICAgICAgICBvcy5zdGF0KGxpYl9wYXRoKSAgIyBleGlzdHM/CiAgICAgICAgICAgICAgICBydW5mbiA9IHNlbGYuY29tbWFuZHMuZ2V0KCJydW4iKQogICAgICAgICAgICAgICAgaWYgcnVuZm4gaXMgbm90IE5vbmU6CiAgICAgICAgICAgICAgICAgICAgX0NVUlJFTlRfVk0gPSBzZWxmCiAgICAgICAgICAgICAgICAgICAgcmV0dXJuIHJ1bmZuKFtjbWRdICsgbGlzdChhcmdzKSwgaW5wdXRfZGF0YSkKICAgICAgICAgICAgZXhjZXB0",
-    "IEV4Y2VwdGlvbjoKICAgICAgICAgICAgICAgIHBhc3MKICAgICAgICAgICAgcmV0dXJuICJFcnJvcjogY29tbWFuZCBub3QgZm91bmQ6ICVzIiAlIGNtZAogICAgICAgIF9DVVJSRU5UX1ZNID0gc2VsZgogICAgICAgIHJldHVybiBmbihhcmdzLCBpbnB1dF9kYXRhKQoKICAgICMgLS0tLSBqb2JzIC0tLS0KICAgIGRlZiBzdGFydF9qb2Ioc2VsZiwgY29kZSwgbmFtZSk6CiAgICAgICAganZtID0gc2VsZi5jbG9uZV9mb3Jfam9iKCkKICAgICAgICBqdm0uY29kZSA9IGNvZGUKICAgICAgICBqaWQgPSBzZWxmLm5leHRfamlkCiAgICAgICAgc2VsZi5uZXh0X2ppZCArPSAxCiAgICAgICAgc2VsZi5qb2JzW2ppZF0gPSBKb2IoamlkLCBuYW1lLCBqdm0ucnVuX2dlbmVyYXRvcigpKQogICAgICAgIHJldHVybiBqaWQKCiAgICBkZWYgcG9sbF9qb2JzKHNlbGYsIHN0ZXBzPTUwKToKICAgICAgICBkZWFkID0gW10KICAgICAgICBmb3IgamlkLCBqb2IgaW4gc2VsZi5qb2JzLml0ZW1zKCk6CiAgICAgICAgICAgIGpvYi5zdGVwKG49c3RlcHMpCiAgICAgICAgICAgIGlmIGpvYi5kb25lOgogICAgICAgICAgICAgICAgZGVhZC5hcHBlbmQoamlkKQoKICAgICAgICBm",
-    "b3IgamlkIGluIGRlYWQ6CiAgICAgICAgICAgIGpvYiA9IHNlbGYuam9ic1tqaWRdCiAgICAgICAgICAgIGlmIGpvYi5lcnJvcjoKICAgICAgICAgICAgICAgIHByaW50KCJbe31dIHt9IChlcnJvcjoge30pIi5mb3JtYXQoamlkLCBqb2IubmFtZSwgam9iLmVycm9yKSkKICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAgIHByaW50KCJbe31dIHt9IChkb25lKSIuZm9ybWF0KGppZCwgam9iLm5hbWUpKQogICAgICAgICAgICBkZWwgc2VsZi5qb2JzW2ppZF0KCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KIyBzbGVlcCBjb21tYW5kIChzY2hlZHVsZXItc2FmZSwgd29ya3MgZm9yIGJnIGpvYnMpCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KZGVmIGNtZF9zbGVlcChhcmdzLCBpbnB1dF9kYXRhKToKICAgIGdsb2JhbCBfQ1VSUkVOVF9WTQogICAgaWYgbm90IGFyZ3M6CiAgICAgICAgcmV0dXJuICIiCgoKZGVmIGNtZF9ydW4oYXJncywgaW5wdXRfZGF0YSk6CiAgICAjIHJ1biA8bW9kdWxlPiBbYXJncy4uLl0KICAgICMgSW1wb3J0cyBtb2R1bGUgKHR5cGljYWxseSBmcm9tIC9saWIpIGFuZCBjYWxscyBpdHMgbWFpbihhcmd2KSBpZiBwcmVzZW50",
-    "LgogICAgIyBhcmd2IGlzIGEgbGlzdCBvZiBzdHJpbmdzOiBlLmcuIFsiaW5zdGFsbCIsInVwaW5nIl0uCiAgICBpZiBub3QgYXJnczoKICAgICAgICByZXR1cm4gInJ1bjogdXNhZ2UgcnVuIDxtb2R1bGU+IFthcmdzLi4uXVxuIgogICAgbW9kbmFtZSA9IGFyZ3NbMF0KICAgIGFyZ3YgPSBbc3RyKGEpIGZvciBhIGluIGFyZ3NbMTpdXQoKICAgICMgQWxsb3cgImZvby5weSIgYXMgbW9kdWxlIG5hbWUKICAgIGlmIG1vZG5hbWUuZW5kc3dpdGgoIi5weSIpOgogICAgICAgIG1vZG5hbWUgPSBtb2RuYW1lWzotM10KCiAgICAjIEVuc3VyZSAvbGliIGlzIG9uIHBhdGggKE1pY3JvUHl0aG9uIHVzdWFsbHkgaW5jbHVkZXMgaXQsIGJ1dCBtYWtlIGl0IHJvYnVzdCkKICAgIHRyeToKICAgICAgICBpZiAiL2xpYiIgbm90IGluIHN5cy5wYXRoOgogICAgICAgICAgICBzeXMucGF0aC5hcHBlbmQoIi9saWIiKQogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICBwYXNzCgogICAgdHJ5OgogICAgICAgIG1vZCA9IF9faW1wb3J0X18obW9kbmFtZSkKICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICByZXR1cm4gInJ1bjogY291bGRuJ3QgaW1wb3J0ICVz",
-    "ICglcylcbiIgJSAobW9kbmFtZSwgZSkKCiAgICAjIFByZWZlciBtYWluKGFyZ3YpLiBGYWxsYmFjayB0byBydW4oYXJndikuCiAgICBmbiA9IGdldGF0dHIobW9kLCAibWFpbiIsIE5vbmUpCiAgICBpZiBmbiBpcyBOb25lOgogICAgICAgIGZuID0gZ2V0YXR0cihtb2QsICJydW4iLCBOb25lKQoKICAgIGlmIGZuIGlzIE5vbmU6CiAgICAgICAgcmV0dXJuICJydW46ICVzIGhhcyBubyBtYWluKGFyZ3YpXG4iICUgbW9kbmFtZQoKICAgIHRyeToKICAgICAgICByZXMgPSBmbihhcmd2KQogICAgICAgIGlmIHJlcyBpcyBOb25lOgogICAgICAgICAgICByZXR1cm4gIiIKICAgICAgICByZXR1cm4gc3RyKHJlcykKICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICByZXR1cm4gInJ1bjogZXJyb3IgcnVubmluZyAlczogJXNcbiIgJSAobW9kbmFtZSwgZSkKCiAgICB0cnk6CiAgICAgICAgc2VjcyA9IGZsb2F0KGFyZ3NbMF0pCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiIgogICAgbXMgPSBpbnQoc2VjcyAqIDEwMDApCiAgICBpZiBtcyA8PSAwOgogICAgICAgIHJldHVybiAiIgogICAgaWYgX0NVUlJFTlRfVk0gaXMgTm9uZToK",
-    "ICAgICAgICByZXR1cm4gIiIKICAgIF9DVVJSRU5UX1ZNLnNsZWVwX3VudGlsID0gX3RpY2tzX2FkZChfdGlja3NfbXMoKSwgbXMpCiAgICByZXR1cm4gIiIKCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KIyBDb21tYW5kcyAoU2lnbmF0dXJlOiBmbihhcmdzLCBpbnB1dF9kYXRhKS0+c3RyKQojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCmRlZiBjbWRfaGVscChhcmdzLCBpbnB1dF9kYXRhKToKICAgIHJldHVybiAoCiAgICAgICAgIlBVU0ggdmVyOiAiICsgVkVSU0lPTiArICJcblxuIgogICAgICAgICJjb21tYW5kczogZXhpdCwgbHMsIHVuYW1lLCBmcmVlLCBkZiwgcHdkLCBjYXQsIGNwLCBjZCwgbWtkaXIsXG4iCiAgICAgICAgImdyZXAsIHJtZGlyLCBleGVjLCBybSwgZGF0ZSxcbiIKICAgICAgICAic2NhbndpZmksIGNvbm5lY3QsIGlmY29uZmlnLCBlZGl0LCByZW5hbWVcbiIKICAgICAgICAiZXh0cmFzOiBlY2hvLCB1cHBlciwgd2MsIHRlc3QsIHdyaXRlICg+KSwgYXBwZW5kICg+PiksIHNsZWVwXG4iCiAgICAgICAgImZsb3c6IGlmL3doaWxlL2Zvci9mb3JlYWNoLCBicmVhay9jb250aW51ZSwgJiYvfHwsIHZhcnMgeD12YWwgJHgsIGpvYnMg",
-    "JlxuIgogICAgICAgICJqb2JjdGw6IGpvYnMsIGtpbGwgPGlkPiwgZmcgPGlkPlxuIgogICAgKQoKZGVmIGNtZF9scyhhcmdzLCBpbnB1dF9kYXRhKToKICAgIHBhdGggPSBhcmdzWzBdIGlmIGFyZ3MgZWxzZSAiIgogICAgdHJ5OgogICAgICAgIGlmIHBhdGg6CiAgICAgICAgICAgIHJldHVybiAiXG4iLmpvaW4ob3MubGlzdGRpcihwYXRoKSkKICAgICAgICByZXR1cm4gIlxuIi5qb2luKG9zLmxpc3RkaXIoKSkKICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgcmV0dXJuICJTeW50YXggRXJyb3JcbiIKCmRlZiBjbWRfdW5hbWUoYXJncywgaW5wdXRfZGF0YSk6CiAgICB0cnk6CiAgICAgICAgcmV0dXJuICJcbiIuam9pbihvcy51bmFtZSgpKQogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICByZXR1cm4gInVuYW1lIG5vdCBzdXBwb3J0ZWRcbiIKCmRlZiBjbWRfZnJlZShhcmdzLCBpbnB1dF9kYXRhKToKICAgIGlmIGdjIGlzIE5vbmU6CiAgICAgICAgcmV0dXJuICJmcmVlIG5vdCBzdXBwb3J0ZWRcbiIKICAgIHJldHVybiBzdHIoZ2MubWVtX2ZyZWUoKSkKCmRlZiBjbWRfZGYoYXJncywgaW5wdXRfZGF0YSk6CiAgICB0cnk6CiAgICAgICAgc3Qg",
-    "PSBvcy5zdGF0dmZzKCIvIikKICAgICAgICB0b3RhbCA9IGZsb2F0KHN0WzJdKSAqIGZsb2F0KHN0WzBdKQogICAgICAgIHVzZWQgID0gZmxvYXQoc3RbM10pICogZmxvYXQoc3RbMF0pCiAgICAgICAgZnJlZSAgPSB0b3RhbCAtIHVzZWQKICAgICAgICByZXR1cm4gIkZyZWU6ICVzIFVzZWQ6ICVzIFRvdGFsOiAlcyIgJSAoZnJlZSwgdXNlZCwgdG90YWwpCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiZGYgZXJyb3JcbiIKCmRlZiBjbWRfcHdkKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgcmV0dXJuIG9zLmdldGN3ZCgpCgpkZWYgY21kX2NkKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgcGF0aCA9IGFyZ3NbMF0gaWYgYXJncyBlbHNlICIiCiAgICB0cnk6CiAgICAgICAgb3MuY2hkaXIocGF0aCkKICAgICAgICByZXR1cm4gcGF0aAogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICByZXR1cm4gIkVycm9yLiBDb3VsZG4ndCBjZFxuIgoKZGVmIGNtZF9jYXQoYXJncywgaW5wdXRfZGF0YSk6CiAgICBpZiBhcmdzOgogICAgICAgIHRyeToKICAgICAgICAgICAgd2l0aCBvcGVuKGFyZ3NbMF0sICJyIikgYXMgZjoKICAgICAgICAgICAgICAg",
-    "IHJldHVybiBmLnJlYWQoKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIHJldHVybiAiQ291bGRuJ3Qgb3BlbiBmaWxlXG4iCiAgICByZXR1cm4gaW5wdXRfZGF0YS5hc190ZXh0KCkgaWYgaW5wdXRfZGF0YSBpcyBub3QgTm9uZSBlbHNlICIiCgpkZWYgY21kX3djKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgdHJ5OgogICAgICAgIGlmIGFyZ3M6CiAgICAgICAgICAgIHggPSAwCiAgICAgICAgICAgIHdpdGggb3BlbihhcmdzWzBdLCAiciIpIGFzIGY6CiAgICAgICAgICAgICAgICBmb3IgXyBpbiBmOgogICAgICAgICAgICAgICAgICAgIHggKz0gMQogICAgICAgICAgICByZXR1cm4gc3RyKHgpICsgIlxuIgogICAgICAgIHMgPSBpbnB1dF9kYXRhLmFzX3RleHQoKSBpZiBpbnB1dF9kYXRhIGlzIG5vdCBOb25lIGVsc2UgIiIKICAgICAgICByZXR1cm4gc3RyKGxlbihzLnNwbGl0bGluZXMoKSkpICsgIlxuIgogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICByZXR1cm4gIkNvdWxkbid0IG9wZW4gZmlsZVxuIgoKZGVmIGNtZF9ncmVwKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgaW1wb3J0IHJlCiAgICBpZiBub3QgYXJnczoKICAgICAg",
-    "ICByZXR1cm4gIiIKICAgIHJneCA9IGFyZ3NbMF0KICAgIG91dCA9IFtdCiAgICB0cnk6CiAgICAgICAgaWYgbGVuKGFyZ3MpID49IDI6CiAgICAgICAgICAgIHdpdGggb3BlbihhcmdzWzFdLCAiciIpIGFzIGY6CiAgICAgICAgICAgICAgICBmb3IgbGluZSBpbiBmOgogICAgICAgICAgICAgICAgICAgIGlmIHJlLnNlYXJjaChyZ3gsIGxpbmUpOgogICAgICAgICAgICAgICAgICAgICAgICBvdXQuYXBwZW5kKGxpbmUpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgciA9IGlucHV0X2RhdGEub3Blbl9yZWFkZXIoKSBpZiBpbnB1dF9kYXRhIGlzIG5vdCBOb25lIGVsc2UgX1N0cmluZ0xpbmVSZWFkZXIoIiIpCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGZvciBsaW5lIGluIHI6CiAgICAgICAgICAgICAgICAgICAgaWYgcmUuc2VhcmNoKHJneCwgbGluZSk6CiAgICAgICAgICAgICAgICAgICAgICAgIG91dC5hcHBlbmQobGluZSkKICAgICAgICAgICAgZmluYWxseToKICAgICAgICAgICAgICAgIHRyeTogci5jbG9zZSgpCiAgICAgICAgICAgICAgICBleGNlcHQ6IHBhc3MKICAgICAgICByZXR1cm4gIiIuam9pbihvdXQpCiAgICBleGNlcHQg",
-    "RXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiQ291bGRuJ3QgcGVyZm9ybS5cbiIKCmRlZiBjbWRfY3AoYXJncywgaW5wdXRfZGF0YSk6CiAgICBpZiBsZW4oYXJncykgPCAyOgogICAgICAgIHJldHVybiAiQ291bGRuJ3QgY29weS5cbiIKICAgIHNyYywgZHN0ID0gYXJnc1swXSwgYXJnc1sxXQogICAgdHJ5OgogICAgICAgIHdpdGggb3BlbihzcmMsICJyIikgYXMgZjoKICAgICAgICAgICAgZGF0YSA9IGYucmVhZCgpCiAgICAgICAgd2l0aCBvcGVuKGRzdCwgInciKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKGRhdGEpCiAgICAgICAgcmV0dXJuICJGaWxlICIgKyBzcmMgKyAiIGNvcGllZC4iCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiQ291bGRuJ3QgY29weS5cbiIKCmRlZiBjbWRfcmVuYW1lKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgaWYgbGVuKGFyZ3MpIDwgMjoKICAgICAgICByZXR1cm4gIkNvdWxkbid0IHJlbmFtZVxuIgogICAgc3JjLCBkc3QgPSBhcmdzWzBdLCBhcmdzWzFdCiAgICB0cnk6CiAgICAgICAgb3MucmVuYW1lKHNyYywgZHN0KQogICAgICAgIHJldHVybiBzcmMgKyAiIHJlbmFtZWQuLiIKICAgIGV4Y2Vw",
-    "dCBFeGNlcHRpb246CiAgICAgICAgcmV0dXJuICJDb3VsZG4ndCByZW5hbWVcbiIKCmRlZiBjbWRfbWtkaXIoYXJncywgaW5wdXRfZGF0YSk6CiAgICBuYW1lID0gYXJnc1swXSBpZiBhcmdzIGVsc2UgIiIKICAgIHRyeToKICAgICAgICBvcy5ta2RpcihuYW1lKQogICAgICAgIHJldHVybiAiRGlyZWN0b3J5ICIgKyBuYW1lICsgIiBjcmVhdGVkLlxuIgogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICByZXR1cm4gIkNvdWxkbid0IG1ha2UgZGlyZWN0b3J5XG4iCgpkZWYgY21kX3JtZGlyKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgbmFtZSA9IGFyZ3NbMF0gaWYgYXJncyBlbHNlICIiCiAgICB0cnk6CiAgICAgICAgb3Mucm1kaXIobmFtZSkKICAgICAgICByZXR1cm4gIlJlbW92ZWQgIiArIG5hbWUgKyAiLlxuIgogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICByZXR1cm4gIkNvdWxkbid0IHJlbW92ZSBkaXIuXG4iCgpkZWYgY21kX3JtKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgbmFtZSA9IGFyZ3NbMF0gaWYgYXJncyBlbHNlICIiCiAgICB0cnk6CiAgICAgICAgb3MudW5saW5rKG5hbWUpCiAgICAgICAgcmV0dXJuICJSZW1vdmVkIGZpbGUgIiAr",
-    "IG5hbWUgKyAiXG4iCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiQ291bGRuJ3QgcmVtb3ZlIGZpbGVcbiIKCmRlZiBjbWRfZGF0ZShhcmdzLCBpbnB1dF9kYXRhKToKICAgIGRhdGVUaW1lT2JqID0gdGltZS5sb2NhbHRpbWUoKQogICAgeWVhcixtb250aCxkYXksaG91cixtaW51LHNlYyx3ZGF5LHlkYXkgPSAoZGF0ZVRpbWVPYmopCiAgICByZXR1cm4gIiVzLyVzLyVzICVzOiVzOiVzIiAlIChtb250aCwgZGF5LCB5ZWFyLCBob3VyLCBtaW51LCBzZWMpCgpkZWYgY21kX2V4ZWMoYXJncywgaW5wdXRfZGF0YSk6CiAgICAjIGV4ZWMgbW9kdWxlLmZ1bmMoImFyZyIpCiAgICBpbXBvcnQgcmUKICAgIHMgPSAiICIuam9pbihhcmdzKQogICAgaWYgIi4iIG5vdCBpbiBzIG9yICIoIiBub3QgaW4gcyBvciAiKSIgbm90IGluIHM6CiAgICAgICAgcmV0dXJuICJFcnJvcjogQ2hlY2sgU3ludGF4XG4iCiAgICB0cnk6CiAgICAgICAgbW9kdWxlID0gcmUuc2VhcmNoKHIiXiguKj8pXC4iLCBzKS5ncm91cCgxKQogICAgICAgIHJlc3QgPSBzW2xlbihtb2R1bGUpKzE6XQogICAgICAgIGZ1bmMgPSByZS5zZWFyY2gociJeKC4qPylcKCIsIHJlc3Qp",
-    "Lmdyb3VwKDEpCiAgICAgICAgYXJnc3RyID0gcmUuc2VhcmNoKHIiXCgoLio/KVwpIiwgcmVzdCkuZ3JvdXAoMSkKCiAgICAgICAgc2NyaXB0ID0gZ2V0YXR0cihfX2ltcG9ydF9fKG1vZHVsZSksIGZ1bmMpCiAgICAgICAgaWYgbm90IGFyZ3N0cjoKICAgICAgICAgICAgcmV0dXJuIHN0cihzY3JpcHQoKSkKICAgICAgICBhcmdzdHIgPSBhcmdzdHIucmVwbGFjZSgnIicsICIiKQogICAgICAgIHJldHVybiBzdHIoc2NyaXB0KGFyZ3N0cikpCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiRXJyb3I6IENoZWNrIFN5bnRheFxuIgoKZGVmIGNtZF9zY2Fud2lmaShhcmdzLCBpbnB1dF9kYXRhKToKICAgIGlmIG5ldHdvcmsgaXMgTm9uZToKICAgICAgICByZXR1cm4gInNjYW53aWZpOiBuZXR3b3JrIG1vZHVsZSBub3QgYXZhaWxhYmxlXG4iCiAgICB0cnk6CiAgICAgICAgd2xhbiA9IG5ldHdvcmsuV0xBTihuZXR3b3JrLlNUQV9JRikKICAgICAgICB3bGFuLmFjdGl2ZShUcnVlKQogICAgICAgIG5ldHMgPSB3bGFuLnNjYW4oKQogICAgICAgIG91dCA9IFtdCiAgICAgICAgZm9yIGkgaW4gbmV0czoKICAgICAgICAgICAgdHJ5OgogICAgICAg",
-    "ICAgICAgICAgb3V0LmFwcGVuZChpWzBdLmRlY29kZSgpKQogICAgICAgICAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgICAgICAgICAgb3V0LmFwcGVuZChzdHIoaVswXSkpCiAgICAgICAgcmV0dXJuICJcbiIuam9pbihvdXQpICsgKCJcbiIgaWYgb3V0IGVsc2UgIiIpCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiQ291bGRuJ3Qgc2NhbiBuZXR3b3Jrcy5cbiIKCmRlZiBjbWRfY29ubmVjdChhcmdzLCBpbnB1dF9kYXRhKToKICAgIGlmIG5ldHdvcmsgaXMgTm9uZToKICAgICAgICByZXR1cm4gImNvbm5lY3Q6IG5ldHdvcmsgbW9kdWxlIG5vdCBhdmFpbGFibGVcbiIKICAgIHByaW50KCJFbnRlciBTU0lEOiAiKQogICAgc3NpZCA9IGlucHV0KCkKICAgIHByaW50KCJFbnRlciB3aWZpIHB3OiAiKQogICAgd2lmaXB3ID0gaW5wdXQoKQogICAgdHJ5OgogICAgICAgIHByaW50KCJhdHRlbXB0aW5nIHRvIGNvbm5lY3QuLlxuIikKICAgICAgICB3bGFuID0gbmV0d29yay5XTEFOKG5ldHdvcmsuU1RBX0lGKQogICAgICAgIHdsYW4uYWN0aXZlKFRydWUpCiAgICAgICAgd2xhbi5jb25uZWN0KHNzaWQsIHdpZmlwdykKICAgICAgICB0",
-    "aW1lLnNsZWVwKDUpCiAgICAgICAgcmV0dXJuICJDaGVjayBpZmNvbmZpZy4uXG4iCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiRXJyb3I6IGNvdWxkbid0IG9idGFpbiBhZGRyZXNzXG4iCgpkZWYgY21kX2lmY29uZmlnKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgaWYgbmV0d29yayBpcyBOb25lOgogICAgICAgIHJldHVybiAiaWZjb25maWc6IG5ldHdvcmsgbW9kdWxlIG5vdCBhdmFpbGFibGVcbiIKICAgIHRyeToKICAgICAgICB3bGFuID0gbmV0d29yay5XTEFOKG5ldHdvcmsuU1RBX0lGKQogICAgICAgIHN0YXR1cyA9IHdsYW4uaWZjb25maWcoKQogICAgICAgIHJldHVybiAoCiAgICAgICAgICAgICJcbklQLi4uLi4uLi4uLi4gIiArIHN0YXR1c1swXSArCiAgICAgICAgICAgICJcbk5FVE1BU0suLi4uLi4uIiArIHN0YXR1c1sxXSArICJcbiIgKwogICAgICAgICAgICAiR0FURVdBWS4uLi4uLi4iICsgc3RhdHVzWzJdCiAgICAgICAgKQogICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICByZXR1cm4gIkNvdWxkbid0IGdldCBpbnRlcmZhY2Ugb3IgY2hlY2sgc3ludGF4LlxuIgoKZGVmIGNtZF9lZGl0KGFyZ3MsIGlucHV0X2Rh",
-    "dGEpOgogICAgaWYgbm90IGFyZ3M6CiAgICAgICAgcmV0dXJuICJDb3VsZG4ndCB3cml0ZSBmaWxlXG4iCiAgICBwYXRoID0gYXJnc1swXQogICAgcHJpbnQoIkVESVQgTU9ERSBERVRFQ1RFRC4uLlxuIikKICAgIHByaW50KCIoRU5URVIgU1RPUEVESVQgdG8gc3RvcClcbiIpCiAgICB0cnk6CiAgICAgICAgd2l0aCBvcGVuKHBhdGgsICJ3IikgYXMgZjoKICAgICAgICAgICAgd2hpbGUgVHJ1ZToKICAgICAgICAgICAgICAgIGxpbmUgPSBpbnB1dCgpCiAgICAgICAgICAgICAgICBpZiAiU1RPUEVESVQiIGluIGxpbmU6CiAgICAgICAgICAgICAgICAgICAgYnJlYWsKICAgICAgICAgICAgICAgIGYud3JpdGUobGluZSArICJcbiIpCiAgICAgICAgcmV0dXJuICJGaWxlICIgKyBwYXRoICsgIiBjcmVhdGVkLi5cbiIKICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgcmV0dXJuICJDb3VsZG4ndCB3cml0ZSBmaWxlXG4iCgojIGV4dHJhcwpkZWYgY21kX2VjaG8oYXJncywgaW5wdXRfZGF0YSk6CiAgICByZXR1cm4gIiAiLmpvaW4oW3N0cihhKSBmb3IgYSBpbiBhcmdzXSkKCmRlZiBjbWRfdXBwZXIoYXJncywgaW5wdXRfZGF0YSk6CiAgICBzID0gaW5wdXRf",
-    "ZGF0YS5hc190ZXh0KCkgaWYgaW5wdXRfZGF0YSBpcyBub3QgTm9uZSBlbHNlICIiCiAgICByZXR1cm4gcy51cHBlcigpCgpkZWYgY21kX3dyaXRlKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgaWYgbm90IGFyZ3M6CiAgICAgICAgcmV0dXJuICJ3cml0ZTogbWlzc2luZyBmaWxlbmFtZVxuIgogICAgcGF0aCA9IGFyZ3NbMF0KICAgIHMgPSBpbnB1dF9kYXRhLmFzX3RleHQoKSBpZiBpbnB1dF9kYXRhIGlzIG5vdCBOb25lIGVsc2UgIiIKICAgIHRyeToKICAgICAgICB3aXRoIG9wZW4ocGF0aCwgInciKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKHMpCiAgICAgICAgcmV0dXJuICIiCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiAiQ291bGRuJ3Qgd3JpdGUgZmlsZVxuIgoKZGVmIGNtZF9hcHBlbmQoYXJncywgaW5wdXRfZGF0YSk6CiAgICBpZiBub3QgYXJnczoKICAgICAgICByZXR1cm4gImFwcGVuZDogbWlzc2luZyBmaWxlbmFtZVxuIgogICAgcGF0aCA9IGFyZ3NbMF0KICAgIHMgPSBpbnB1dF9kYXRhLmFzX3RleHQoKSBpZiBpbnB1dF9kYXRhIGlzIG5vdCBOb25lIGVsc2UgIiIKICAgIHRyeToKICAgICAgICB3aXRoIG9wZW4ocGF0",
-    "aCwgImEiKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKHMpCiAgICAgICAgcmV0dXJuICIiCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgICMgZmFsbGJhY2sgaWYgYXBwZW5kIG5vdCBzdXBwb3J0ZWQKICAgICAgICB0cnk6CiAgICAgICAgICAgIG9sZCA9ICIiCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIHdpdGggb3BlbihwYXRoLCAiciIpIGFzIHI6CiAgICAgICAgICAgICAgICAgICAgb2xkID0gci5yZWFkKCkKICAgICAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICAgICAgICAgIG9sZCA9ICIiCiAgICAgICAgICAgIHdpdGggb3BlbihwYXRoLCAidyIpIGFzIHc6CiAgICAgICAgICAgICAgICB3LndyaXRlKG9sZCArIHMpCiAgICAgICAgICAgIHJldHVybiAiIgogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIHJldHVybiAiQ291bGRuJ3QgYXBwZW5kIGZpbGVcbiIKCmRlZiBjbWRfdGVzdChhcmdzLCBpbnB1dF9kYXRhKToKICAgICMgc3VwcG9ydCBbIC4uLiBdIGJ5IGlnbm9yaW5nIHRyYWlsaW5nIF0KICAgIGlmIGFyZ3MgYW5kIGFyZ3NbLTFdID09ICJdIjoKICAgICAgICBhcmdzID0gYXJnc1s6",
-    "LTFdCiAgICBpZiBub3QgYXJnczoKICAgICAgICByZXR1cm4gIiIKCiAgICBpZiBsZW4oYXJncykgPT0gMjoKICAgICAgICBvcCwgYSA9IGFyZ3NbMF0sIGFyZ3NbMV0KICAgICAgICBpZiBvcCA9PSAiLWYiOgogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICBvcy5zdGF0KGEpCiAgICAgICAgICAgICAgICByZXR1cm4gIjEiCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgICAgICByZXR1cm4gIiIKICAgICAgICBpZiBvcCA9PSAiLWQiOgogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICBvcy5saXN0ZGlyKGEpCiAgICAgICAgICAgICAgICByZXR1cm4gIjEiCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgICAgICByZXR1cm4gIiIKICAgICAgICBpZiBvcCA9PSAiLXoiOgogICAgICAgICAgICByZXR1cm4gIjEiIGlmIHN0cihhKSA9PSAiIiBlbHNlICIiCiAgICAgICAgaWYgb3AgPT0gIi1uIjoKICAgICAgICAgICAgcmV0dXJuICIxIiBpZiBzdHIoYSkgIT0gIiIgZWxzZSAiIgoKICAgIGlmIGxlbihhcmdzKSA+PSAzOgogICAgICAgIGEsIG9wLCBiID0gYXJnc1swXSwgYXJnc1sxXSwg",
-    "YXJnc1syXQogICAgICAgIGlmIG9wID09ICI9IjoKICAgICAgICAgICAgcmV0dXJuICIxIiBpZiBzdHIoYSkgPT0gc3RyKGIpIGVsc2UgIiIKICAgICAgICBpZiBvcCA9PSAiIT0iOgogICAgICAgICAgICByZXR1cm4gIjEiIGlmIHN0cihhKSAhPSBzdHIoYikgZWxzZSAiIgogICAgICAgIGlmIG9wIGluICgiLWVxIiwgIi1uZSIsICItbHQiLCAiLWxlIiwgIi1ndCIsICItZ2UiKToKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgYWkgPSBpbnQoc3RyKGEpLnN0cmlwKCkpCiAgICAgICAgICAgICAgICBiaSA9IGludChzdHIoYikuc3RyaXAoKSkKICAgICAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICAgICAgICAgIHJldHVybiAiIgogICAgICAgICAgICBpZiBvcCA9PSAiLWVxIjogcmV0dXJuICIxIiBpZiBhaSA9PSBiaSBlbHNlICIiCiAgICAgICAgICAgIGlmIG9wID09ICItbmUiOiByZXR1cm4gIjEiIGlmIGFpICE9IGJpIGVsc2UgIiIKICAgICAgICAgICAgaWYgb3AgPT0gIi1sdCI6IHJldHVybiAiMSIgaWYgYWkgPCAgYmkgZWxzZSAiIgogICAgICAgICAgICBpZiBvcCA9PSAiLWxlIjogcmV0dXJuICIxIiBpZiBhaSA8PSBiaSBl",
-    "bHNlICIiCiAgICAgICAgICAgIGlmIG9wID09ICItZ3QiOiByZXR1cm4gIjEiIGlmIGFpID4gIGJpIGVsc2UgIiIKICAgICAgICAgICAgaWYgb3AgPT0gIi1nZSI6IHJldHVybiAiMSIgaWYgYWkgPj0gYmkgZWxzZSAiIgogICAgcmV0dXJuICIiCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgVk0gY29uc3RydWN0aW9uIChjb21tYW5kcyArIGpvYiBjb250cm9sKQojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCmRlZiBtYWtlX3ZtKCk6CiAgICAjIElmIHlvdSdyZSB0aWdodCBvbiBSQU0sIGxvd2VyIHRoaXMgdG8gNTEyIG9yIDI1Ni4KICAgIHZtID0gVk0oY29tbWFuZHM9e30sIHNwb29sX3BhdGg9IlNURE9VVCIsIHNwb29sX3RocmVzaG9sZD0yMDQ4KQoKICAgIGRlZiBjbWRfYWRkdihhcmdzLCBpbnB1dF9kYXRhKToKICAgICAgICAjIGFkZHYgdmFyIGRlbHRhIChxdWlldCkKICAgICAgICBpZiBsZW4oYXJncykgPCAyOgogICAgICAgICAgICByZXR1cm4gIiIKICAgICAgICBuYW1lLCBkZWx0YV9zID0gYXJnc1swXSwgYXJnc1sxXQogICAgICAgIHYgPSB2bS52YXJzLmdldChuYW1lLCAiMCIpCiAgICAgICAgdHJ5OgogICAgICAgICAgICBuID0gaW50",
-    "KHN0cih2KS5zdHJpcCgpKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIG4gPSAwCiAgICAgICAgdHJ5OgogICAgICAgICAgICBkID0gaW50KHN0cihkZWx0YV9zKS5zdHJpcCgpKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIGQgPSAwCiAgICAgICAgdm0udmFyc1tuYW1lXSA9IHN0cihuICsgZCkKICAgICAgICByZXR1cm4gIiIKCiAgICBkZWYgY21kX2pvYnMoYXJncywgaW5wdXRfZGF0YSk6CiAgICAgICAgaWYgbm90IHZtLmpvYnM6CiAgICAgICAgICAgIHJldHVybiAiKG5vIGpvYnMpXG4iCiAgICAgICAgbGluZXMgPSBbXQogICAgICAgIGZvciBqaWQsIGpvYiBpbiB2bS5qb2JzLml0ZW1zKCk6CiAgICAgICAgICAgIHN0YXRlID0gImRvbmUiIGlmIGpvYi5kb25lIGVsc2UgInJ1bm5pbmciCiAgICAgICAgICAgIGxpbmVzLmFwcGVuZCgiW3t9XSB7fSAtIHt9Ii5mb3JtYXQoamlkLCBzdGF0ZSwgam9iLm5hbWUpKQogICAgICAgIHJldHVybiAiXG4iLmpvaW4obGluZXMpICsgIlxuIgoKICAgIGRlZiBjbWRfa2lsbChhcmdzLCBpbnB1dF9kYXRhKToKICAgICAgICBpZiBub3QgYXJnczoKICAgICAgICAgICAg",
-    "cmV0dXJuICJraWxsOiB1c2FnZSBraWxsIDxqb2JpZD5cbiIKICAgICAgICB0cnk6CiAgICAgICAgICAgIGppZCA9IGludChhcmdzWzBdKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIHJldHVybiAia2lsbDogYmFkIGpvYmlkXG4iCiAgICAgICAgam9iID0gdm0uam9icy5nZXQoamlkKQogICAgICAgIGlmIG5vdCBqb2I6CiAgICAgICAgICAgIHJldHVybiAia2lsbDogbm8gc3VjaCBqb2JcbiIKICAgICAgICBqb2IuZG9uZSA9IFRydWUKICAgICAgICByZXR1cm4gIiIKCiAgICBkZWYgY21kX2ZnKGFyZ3MsIGlucHV0X2RhdGEpOgogICAgICAgIGlmIG5vdCBhcmdzOgogICAgICAgICAgICByZXR1cm4gImZnOiB1c2FnZSBmZyA8am9iaWQ+XG4iCiAgICAgICAgdHJ5OgogICAgICAgICAgICBqaWQgPSBpbnQoYXJnc1swXSkKICAgICAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgICAgICByZXR1cm4gImZnOiBiYWQgam9iaWRcbiIKICAgICAgICBqb2IgPSB2bS5qb2JzLmdldChqaWQpCiAgICAgICAgaWYgbm90IGpvYjoKICAgICAgICAgICAgcmV0dXJuICJmZzogbm8gc3VjaCBqb2JcbiIKICAgICAgICB3aGlsZSBub3Qgam9iLmRv",
-    "bmU6CiAgICAgICAgICAgIGpvYi5zdGVwKG49MjAwKQogICAgICAgIGVyciA9IGpvYi5lcnJvcgogICAgICAgIGRlbCB2bS5qb2JzW2ppZF0KICAgICAgICBpZiBlcnI6CiAgICAgICAgICAgIHJldHVybiAiZmc6IGpvYiBlcnJvcjogJXNcbiIgJSBlcnIKICAgICAgICByZXR1cm4gIiIKCiAgICB2bS5jb21tYW5kcy51cGRhdGUoewogICAgICAgICMgeW91ciBjb21tYW5kcwogICAgICAgICJoZWxwIjogY21kX2hlbHAsCiAgICAgICAgImxzIjogY21kX2xzLAogICAgICAgICJ1bmFtZSI6IGNtZF91bmFtZSwKICAgICAgICAiZnJlZSI6IGNtZF9mcmVlLAogICAgICAgICJkZiI6IGNtZF9kZiwKICAgICAgICAicHdkIjogY21kX3B3ZCwKICAgICAgICAiY2F0IjogY21kX2NhdCwKICAgICAgICAid2MiOiBjbWRfd2MsCiAgICAgICAgImdyZXAiOiBjbWRfZ3JlcCwKICAgICAgICAiY3AiOiBjbWRfY3AsCiAgICAgICAgImNkIjogY21kX2NkLAogICAgICAgICJyZW5hbWUiOiBjbWRfcmVuYW1lLAogICAgICAgICJta2RpciI6IGNtZF9ta2RpciwKICAgICAgICAicm1kaXIiOiBjbWRfcm1kaXIsCiAgICAgICAgImV4ZWMiOiBjbWRfZXhlYywKICAgICAgICAicm0i",
-    "OiBjbWRfcm0sCiAgICAgICAgImRhdGUiOiBjbWRfZGF0ZSwKICAgICAgICAic2NhbndpZmkiOiBjbWRfc2NhbndpZmksCiAgICAgICAgImNvbm5lY3QiOiBjbWRfY29ubmVjdCwKICAgICAgICAiaWZjb25maWciOiBjbWRfaWZjb25maWcsCiAgICAgICAgImVkaXQiOiBjbWRfZWRpdCwKCiAgICAgICAgIyBleHRyYXMKICAgICAgICAiZWNobyI6IGNtZF9lY2hvLAogICAgICAgICJ1cHBlciI6IGNtZF91cHBlciwKCiAgICAgICAgIyByZWRpcmVjdGlvbgogICAgICAgICJ3cml0ZSI6IGNtZF93cml0ZSwKICAgICAgICAiYXBwZW5kIjogY21kX2FwcGVuZCwKCiAgICAgICAgIyB0ZXN0ICsgaGVscGVycyB1c2VkIGJ5IGxvb3BzL2NoYWlucwogICAgICAgICJ0ZXN0IjogY21kX3Rlc3QsCiAgICAgICAgIlsiOiBjbWRfdGVzdCwKICAgICAgICAiYWRkdiI6IGNtZF9hZGR2LAoKICAgICAgICAjIHNsZWVwCiAgICAgICAgInNsZWVwIjogY21kX3NsZWVwLAogICAgICAgICJydW4iOiBjbWRfcnVuLAoKICAgICAgICAjIGpvYiBjb250cm9sCiAgICAgICAgImpvYnMiOiBjbWRfam9icywKICAgICAgICAia2lsbCI6IGNtZF9raWxsLAogICAgICAgICJmZyI6IGNtZF9m",
-    "ZywKICAgIH0pCgogICAgcmV0dXJuIHZtCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgUkVQTCAoYXV0bzogbGl2ZSBvbiBNaWNyb1B5dGhvbiB3aGVuIHBvbGxhYmxlLCBiYXNpYyBvdGhlcndpc2UpCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KZGVmIHN0ZGluX2lzX3BvbGxhYmxlKCk6CiAgICBpZiBzZWxlY3QgaXMgTm9uZToKICAgICAgICByZXR1cm4gRmFsc2UKICAgIHRyeToKICAgICAgICBwID0gc2VsZWN0LnBvbGwoKQogICAgICAgIHAucmVnaXN0ZXIoc3lzLnN0ZGluLCBzZWxlY3QuUE9MTElOKQogICAgICAgIHAucG9sbCgwKQogICAgICAgIHJldHVybiBUcnVlCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHJldHVybiBGYWxzZQoKZGVmIHJ1bl9saW5lKHZtLCBsaW5lKToKICAgIGNvZGUsIGJnID0gY29tcGlsZV9saW5lKGxpbmUpCiAgICBpZiBiZzoKICAgICAgICBqaWQgPSB2bS5zdGFydF9qb2IoY29kZSwgbmFtZT1saW5lKQogICAgICAgIHByaW50KCJbe31dIHN0YXJ0ZWQge30iLmZvcm1hdChqaWQsIGxpbmUpKQogICAgZWxzZToKICAgICAgICB2bS5jb2RlID0gY29kZQogICAgICAgIHZtLnJ1bih0cmFjZT1GYWxzZSkK",
-    "CmRlZiByZXBsX2Jsb2NraW5nKHZtKToKICAgIHdoaWxlIFRydWU6CiAgICAgICAgdm0ucG9sbF9qb2JzKHN0ZXBzPTIwMCkKICAgICAgICB0cnk6CiAgICAgICAgICAgIGxpbmUgPSBpbnB1dCgicHVzaD4gIikKICAgICAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgICAgICBicmVhawogICAgICAgIGlmIG5vdCBsaW5lOgogICAgICAgICAgICBjb250aW51ZQogICAgICAgIGxpbmUgPSBsaW5lLnN0cmlwKCkKICAgICAgICBpZiBub3QgbGluZToKICAgICAgICAgICAgY29udGludWUKICAgICAgICBpZiBsaW5lID09ICJleGl0IjoKICAgICAgICAgICAgYnJlYWsKICAgICAgICB0cnk6CiAgICAgICAgICAgIHJ1bl9saW5lKHZtLCBsaW5lKQogICAgICAgIGV4Y2VwdCBDb21waWxlRXJyb3IgYXMgY2U6CiAgICAgICAgICAgIHByaW50KCJDb21waWxlIGVycm9yOiIsIGNlKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgcHJpbnQoIkVycm9yOiIsIGUpCgpkZWYgcmVwbF9ub25ibG9ja2luZyh2bSk6CiAgICBwID0gc2VsZWN0LnBvbGwoKQogICAgcC5yZWdpc3RlcihzeXMuc3RkaW4sIHNlbGVjdC5QT0xMSU4pCgogICAgYnVm",
-    "ID0gIiIKICAgIHN5cy5zdGRvdXQud3JpdGUoInB1c2g+ICIpCiAgICB0cnk6CiAgICAgICAgc3lzLnN0ZG91dC5mbHVzaCgpCiAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgIHBhc3MKCiAgICB3aGlsZSBUcnVlOgogICAgICAgIHZtLnBvbGxfam9icyhzdGVwcz04MCkKCiAgICAgICAgdHJ5OgogICAgICAgICAgICBldiA9IHAucG9sbCgwKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIHByaW50KCJcbihsaXZlIGlucHV0IHVuYXZhaWxhYmxlOyBzd2l0Y2hpbmcgdG8gYmFzaWMgbW9kZSkiKQogICAgICAgICAgICByZXBsX2Jsb2NraW5nKHZtKQogICAgICAgICAgICByZXR1cm4KCiAgICAgICAgaWYgbm90IGV2OgogICAgICAgICAgICBfc2xlZXBfbXMoMTApCiAgICAgICAgICAgIGNvbnRpbnVlCgogICAgICAgIHRyeToKICAgICAgICAgICAgY2ggPSBzeXMuc3RkaW4ucmVhZCgxKQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgIF9zbGVlcF9tcygxMCkKICAgICAgICAgICAgY29udGludWUKCiAgICAgICAgaWYgbm90IGNoOgogICAgICAgICAgICBfc2xlZXBfbXMoMTApCiAgICAgICAgICAgIGNvbnRpbnVl",
-    "CgogICAgICAgIGlmIGNoID09ICJcciI6CiAgICAgICAgICAgIGNvbnRpbnVlCgogICAgICAgIGlmIGNoID09ICJcbiI6CiAgICAgICAgICAgIGxpbmUgPSBidWYuc3RyaXAoKQogICAgICAgICAgICBidWYgPSAiIgogICAgICAgICAgICBzeXMuc3Rkb3V0LndyaXRlKCJcbiIpCiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIHN5cy5zdGRvdXQuZmx1c2goKQogICAgICAgICAgICBleGNlcHQgRXhjZXB0aW9uOgogICAgICAgICAgICAgICAgcGFzcwoKICAgICAgICAgICAgaWYgbGluZSA9PSAiZXhpdCI6CiAgICAgICAgICAgICAgICByZXR1cm4KICAgICAgICAgICAgaWYgbGluZToKICAgICAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgICAgICBydW5fbGluZSh2bSwgbGluZSkKICAgICAgICAgICAgICAgIGV4Y2VwdCBDb21waWxlRXJyb3IgYXMgY2U6CiAgICAgICAgICAgICAgICAgICAgcHJpbnQoIkNvbXBpbGUgZXJyb3I6IiwgY2UpCiAgICAgICAgICAgICAgICBleGNlcHQgRXhjZXB0aW9uIGFzIGU6CiAgICAgICAgICAgICAgICAgICAgcHJpbnQoIkVycm9yOiIsIGUpCgogICAgICAgICAgICBzeXMuc3Rkb3V0LndyaXRlKCJwdXNo",
-    "PiAiKQogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICBzeXMuc3Rkb3V0LmZsdXNoKCkKICAgICAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICAgICAgICAgIHBhc3MKICAgICAgICAgICAgY29udGludWUKCiAgICAgICAgaWYgY2ggPT0gIlx4MDgiIG9yIGNoID09ICJceDdmIjoKICAgICAgICAgICAgaWYgYnVmOgogICAgICAgICAgICAgICAgYnVmID0gYnVmWzotMV0KICAgICAgICAgICAgICAgIHN5cy5zdGRvdXQud3JpdGUoIlxiIFxiIikKICAgICAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgICAgICBzeXMuc3Rkb3V0LmZsdXNoKCkKICAgICAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgICAgICAgICAgcGFzcwogICAgICAgICAgICBjb250aW51ZQoKICAgICAgICBidWYgKz0gY2gKICAgICAgICBzeXMuc3Rkb3V0LndyaXRlKGNoKQogICAgICAgIHRyeToKICAgICAgICAgICAgc3lzLnN0ZG91dC5mbHVzaCgpCiAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbjoKICAgICAgICAgICAgcGFzcwoKZGVmIHJlcGxfYXV0byh2bSk6CiAgICAjIEF2b2lkICJkb3VibGUtZWNobyIgaXNzdWVzIG9uIGRlc2t0",
-    "b3AgdGVybWluYWxzOiBvbmx5IGRvIGxpdmUgbW9kZSBvbiBNaWNyb1B5dGhvbi4KICAgIGlmIGlzX21pY3JvcHl0aG9uKCkgYW5kIHN0ZGluX2lzX3BvbGxhYmxlKCk6CiAgICAgICAgcHJpbnQoIkludGVyYWN0aXZlIG1vZGU6IGxpdmUgKGJhY2tncm91bmQgam9icyBydW4gd2hpbGUgeW91IHR5cGUpIikKICAgICAgICByZXBsX25vbmJsb2NraW5nKHZtKQogICAgZWxzZToKICAgICAgICBwcmludCgiSW50ZXJhY3RpdmUgbW9kZTogYmFzaWMgKGJhY2tncm91bmQgam9icyBydW4gYmV0d2VlbiBjb21tYW5kcykiKQogICAgICAgIHJlcGxfYmxvY2tpbmcodm0pCgpkZWYgcmVwbCgpOgogICAgdm0gPSBtYWtlX3ZtKCkKICAgIHByaW50KCJQVVNIIFZNIiwgVkVSU0lPTikKICAgIHByaW50KCJUeXBlICdoZWxwJy4gVXNlICdleGl0JyB0byBxdWl0LiIpCiAgICBwcmludCgiQmFja2dyb3VuZDogYWRkICcmJyBhdCBlbmQuIEpvYiBjb250cm9sOiBqb2JzL2tpbGwvZmcuIikKICAgIHJlcGxfYXV0byh2bSkKCmlmIF9fbmFtZV9fID09ICJfX21haW5fXyI6CiAgICByZXBsKCkK",
+    "eNrtff172zaS8O/6K1A6H2QjyXa63d1TIt+TTd02e03iS9K8e+v61UNRlM1YIhWSkq02vb/95gMAARKk5LZ777537bMbUyQwAAaDwcxgZnAgVuviarMcrra9A3H2/dtvxfuXwj99e/bF48E8yYtSRNlytYjLWGzivEiyNICCX8dhuc7jYgTPA/E8Wy7DdFaMxFW8WPXFouiLeZLO+mKdhssYfuQx/Dub98XqBt5GYdmHoiE8lmGy6IubqC8u83jVB3DGf0WMhQFgBH9n677IY4a3vJ4lOfxc0p/4No7wB5QJS/haRGF6k8yTGrQoS9M4gpaTOTzOk0to9zLGnpTlqiixT/EswX+jqwy6vlrFALyMAQX+eVADdpMngBH/JOiLEAqmM3jGH8UihmFAz/MN9CRfQccAEfEt4eksWcWLJAW0iU/04g00mEOfAKsjcSIAh+LkRPiI8WQRz0SZiU+yqUN44pYCqvo+zJNwukBYt+MvqOq9W0DFKkxxkuS8pGWeLcR8kd2MZP+TuXi6kv04EeVVnIqnRbksixNxHi+KWP26gBmUVW6uoDNmrVmm68yyNJbF5lkuEnEsjo/EeVHGq4v2cnEYXYkNYEaEYiqifQq2Nw8l/aKEostCZOtytS7FdCsIz4GENIWv14BCmPcySde6gXVKuBdIVS6wUbhYjPgrdnRwIu4di3uPxb2DJ0CLsALSwFwAolhPizIp1zyh93yhOi0CERYwSSLML9fLOC0FIOt2fM+PlnI+n8EsXy3jMomwoo8zmYsgEDfwWjyCAp9D/+/TYoSZ",
+    "L7K0EA8eiE+fxGfCT9KyQBxtwrxgaG+vsrwcREkerZNyhCWxe5+Y6v4SRteXebaGNx+yKRBQmcMqTNJL8UD4+ObwOlksDueXwRMssMxmMRAKoHAm8jW0C0SzFIA1flcQzG+30zyZ0XhFscoyBDcSb569BBZQJgsqW1xlixmTXAH0vUDyfvvuq9ffvwNaW8QE5/UKcRcuJPB4plFYCB8fC/klGAlYs5fwGz5eQzmY8ymOCR4/ruN1XFisCdHDnG4yLw7L+LY8TOPyEIYXlYvD23mcAweE2YlFslwB7gAKjJAZ4Lrgvn2NywBwlRZQfAQEEG0OixjZ3DwHEoEuhEX8xz/wlD1/85xwfgPLP7uBj4B02aXvXowqrisGkfBwfB4s8CLKk1U5xI99MfggXgHIElYAdP4my6/jXKzyLIqLQo7uzenZdyMRrgGRRbwARoLY2MSCpsxPs3QwXWTRNcxFgMN5mUR5drYtr+D5BqdhlS0WyERM5pbBBOU3CXACGHeBY0oi6AAsKz8Q/jQuS+gGrvVZXFyX2Yo4JLbQOwAor7JS7QpfxUVymcLIsTBtKIf/J55il4Ge30Ef0u0TES6KjKkK+vRc9o2hb+JFtsK1MiRwxFkJDQWsghzZ5mKLmJna5IzjFpdxGudhCXDyeAAgYNKibTDs9Xh2RVaopzJZxuq52Ba9XplvRz3ilPzyMurFt1G8KsUp/cGlTd8vIzGG8QK7gv4BLebleiWWcVjAxkhL3C/iWH2YwO4G0ILe5N3kxcuz12/eQWVsewgr/rqYLAvALvDmq7AI",
+    "yzL38VNfeOqjFwhizrDSfVlrGUONz4HbHh0B1G9Pn51VgC+j4TJeToB7ZRHDhc4mhUizknpMlKmauoQ9ytPFVUs8sPenb96+eP0KQHpMsQMlDQyOhscejvwvSGGiSH6Mad6YE+Os42p5cfha+NUen1f7XV8Mh0Po+PNvv3/1bwD/y+PHCG3g/g9lkzgfSC7kRWuYf8Dw+5ce8XRYzgLoKFKLPUJOO59DS8huUKIpr8ISMRBG5RrGicIOig1rpNwhUCN8ugb6IuZWwZklAKG4AraA6zfPiqJGbSJaAJ5wMfohvznULF+yR2bhsDFhWaSNgvkUcj9s7CbPgPO+fznsGP3k+bu/AY5++hnI7kDx4mSGKIA9SQ8EoPR6s3guJvTND5hQS6g6kb3xg56UAggdOMtcCP/jLU0c9Ywf5RBkJAWPoUvsTzZL1YIsi93E4r4qLytMCgAha/mbpayEpc9VyQvo42bZTQHvgOZJwgQ5tKMgt4jcAlfVspDNNReXKuMFFQpocZmV6QuuCFcZKAC7Mi7B4ZEaa7We29qtFnUD9TWOYCK3bembrYazmR+CeFzsaBvKdTdeATK7EALjXhZWi7NkPseS0x0tYrnuJitIdpMDMeUWE8AJbmAr2iQ0cSt2bVQCPj5MkE0hGw6R2wxJhhsDGzNAeDy3TuZuQPsa9qi4mzJfryLYcbuI8vXZ5LvXz75iwGNxjC+evflGqBeP8cXZi7NT9eILfHH6t9Pn6sUf+EHxrRjmYpUDUWC5t6fvNKQv8cU3xos/4ou/vjzTL/5EL/4u9Is/",
+    "q7b+Xb74l3pbH9dJDNutbOu7F2/f8TCOZDmUPM8Rx7iOF0lR+qCzIPVAha9fvzmdvHj1Ajem48eyQpImpRbwoSxt1rr0q9O/UekvZOlwtoENPFYVniCZkYz+Yb1c6Vqnr76iTv1B1prBRDfaEP4ig9fxLbR/KBUD2KKBawU8Jy/efasm6UsJCLc+GOJiHYtsDiSp9TMU1EFGR1kdhDJUuxSIiUTQHyWIRViUkzJfg2Q4NsqLz8biiCQWbKPqAc0oVP+TC79GderUExs6dxQB03R9/5e379SA/izBgcAlYNsqDfFaIAX3eahJqTUp1FoYIgL76vTr718pYP8igSktquoggsLiz599950m8CMTmSQww1pPUG09Hg7vgTyAc4lcLqv0MgXojUHOj48VIJxdhgPoAK1KoLoWExURKagKX37ZvXql7oLa+VdhGQof1JY+azEkxfQFyZEg9MdIhNBBEC+AgEjspRJBB/wIJqfQwJm7HDD08bscZmoZokgbwuY9yG5QXq5aZrEFCS7FAeZQdgvUeg10uIGBMig/HoIIw6YRmDpG4WoR8noR3gmB8kD6pV0XtsasLCYTwIzvoeTkAZNeheUV/gUeS4Vxd8ReeLC/YC3i+BNctJMJiLWLORpGbssxyg9ANFBbPkoAY2KaEon8w2D+CGBIQtuYwNgfEBp8wD/2Bwkbvskn+zOjbcxtVt0Oiwm2Qb02+gAcxARafSCLB2pw2SpOfd0jwEjukRY/t8saO8V8iDKW3LaN956nm6NRS8GLBW0QmH39yUA3Nj8hHTi/U99l",
+    "m67e1/s1eVvCDnL5HSz/N1VDQ4WxwOgNss9JdLVOrws5/yjxj1l8N7p2IP4jiVnLZ8k8JR4y3ZYo96KqUGh5eJGFM1xBoUHxw181QdPWGWIbFq635jeyEAHhyOnDgQXOQtAl1KCmbhAVYp2ft4SXqf5my5RExahm3YFUzLpsfANtGDTdy9g/6osFIifgeQqaPebuFOfJKHmERS6GwNyA3aKQzyyrQR0jBwOZFMgrJgn9m0oSc3CLor78JzjaovYuEWOpfVTvUpQoaCwWK0J6nNQXhpL/4K1ZOAV0NQsrPEOrJ2PVWG0thWgHeVtmqxckPuAOb86WHIl+9wHfDdH07Xs/pF5fNRCYjX5AOXRwbLdEWzBUPpc1Rhc2aWj0yH66ljzC6LUC/PDo+MKB7g8gRx73XJA0AlFvjevYWwGJaEpBGkEMqd3tO7LXkaykd1W96rFjcYorv0Ar6hK2soJEDuYCEUjnaAyiVl171mQG4Ije8nZ6wzINksOXAAL/1L7k8vXQ5Lr/MILLm6r3LmqT05mqnQyAWESF32EFzwpEMxFf4CQw/HM+Ghik4Kic7115f3rZOXibc1pqnTFPQwZejb1dfdNU2pxqMm41ekYEQERoA2n0hcykxZBp1zcq4z5k8+Xu7lULqdPuUTeFi2K9Itukn0lz+UgahXA7rQypfWX2wXdkge0SVCfvvn1z+uyrt8iDaRUfIcHBfrfKsym0vsWzMtqMxniutwkTth3z3oQb/jKbrUEqIz0WdIUz0KSk3nrAhmyUAdZzFKRhJ4zLmzhORXmTVcZ+",
+    "NulLCH959u75t6Q0/plUKGIqK5CC2Sjuz+Mb+EHmx0NlFEMSpnawHNbQBhJl/5LG20U2DRdCjVnZLiocABJG7dSojMcK6dZHA5HNAt0E4SQ12ZgcQuOz0ZyryG4KNADohaEkRIUfaVVDY7ZsxJ8DfYHiXHRaGbUxCPg107FlbUNBvxzyB5/V8LGCOybgRtnhLIQVh/IAynHmB+qX77TV8TfgyDeNfleCzipJn2fpTG1fL2ErWQJ14LuEFFEUr3ASCtbIsnSxhaFtYr3ASLIdunejxj60sFA1JLt7WMYTBOKbWxpIz65dR0IZhtHHdZLHTYWD9iMDzK2xM34OBOGAlceLONScFevdhEnZ1rJdmohIG02Pgx0dReDAV5L5Fo8cdgoWKEGomfmLecKHAgaxQ81b2lnKUHyXZdd4PHYdS1iGbCJN8YqDSvv/E8GHXkptwROz+XqxUHo3HgWQJWadxwEdqfAhT8EmQ6CSKNZwgR3BWhCXdPpyE26HrZILLNOrscFDzfXSXGMVmqMNLSZNtLUDJViA+pM65NGU3wD2EWCd1+VF6hpKSvi39g2E3qS4AnyPpcHU/hxOAT9Z2vY9zhvbsmkkaH6QRoLmh8pI4GhGmQikSZfncTDAHW62jmCKimQWwws9N0gAPC1EY8ZUkAaqEF9TTknXXCjldPIxqBQMRiHSCu6sNdw0WbNqYEiL0RYttNzSUd8yYTcBfxyyS4nPo+s5mzaWauBSO4gZa4wxHUikwbSSXWg/vBmUAP86OmPQmLUDtHfXYma6fp3l7JzLaq4UiN1T",
+    "VVGXtt7VqUtO3B2601xMLYiord89MDRBu2K9KwekcTDxS+Ev5DNVcnnK4wEpLXxsqlbRwwLnLzMUlDsg+GNtceg5/23XzMf94bG0OdZLZpWt/KOgvdnW9WKsGYLZ0ECQ9uun9Du7yFqjql+XBPgYX8+x3Cmb04xqFW59JZ6E+yDthGrXmq6TBUo8oKLDrhHmIPnInshZh020XVDusrvZiCXyayIMcCN9YFxa4w67m7S5WcgGgkIHAMe6UsvRXBSkdDTRhbNDigd7Amil5AkZMlhTASmCTHZhcnkFCJzPCV14ONaOLpQztcsP40VNmcOGh6VJAEokRY06LI+WdehuSNht/BhKRO1nv+6u6DQftPWtxbqvDe/DD1mS+ufqYRowih3ovfgF1u79p4vnQHeDtlvD4kpoVt4xxQSPcCbsc6V0/kCJwHjWx0ItLgk83fFA/fVO6AE5Bh5OwTJNcMOhYngwVAhWCKLljLUfPGGRoM+VRQfWGnwnlgPj8T3yPEVLG0sJIDXCePErAmg5JyeyJkUOZdVwWvhY+Pzogpc2YqzqAzrlqU6gXcnGbEgOolZTSk0nuAFq6dxWq+Sjt0f7MJ/wjUDIYqNdF/AXK4zSFHbo8FnQB1PW6o1ucDfOCvR/gWeljO5yLtDAXK0PreaNc7Hzx9I+LKFAg8McWE2yoi6LRwL+oIMAQufBzuN4NkFk+9kadAF80iR1hkeyoVJ76DR1UZJTbb/SkTSvkQfpAR80hgSqLyGZhhvmgnR+iW4eqGShixXzTWCL83kSwY+boRo/WodbfJJU",
+    "kQQ2KcAQKFY8DOiiOUFIco0zLSioLAMOCGp8NTDwrWYLbtoWZLmeuZdJmcsiDZNN5zalUjUlhLO5qkbqqEYwu0AlwsDvqNdyPIXzMUTWUVdZ9tgwa8MwN+CaYdVupOfcVBALos1kO9rH8pldxylw3lz4H9foWQo0XaziKIFVPBKfxBNxgg7z7Aj9AI2b3nA49AQ66K0KdBadFU/EQ3j3kD1N2cfvHkwHUvECXTRn4uG92UP2+ofH24fBcJdz2RLHPFmFOap4fZHohVScJxfkZeR7o8pvaxbfig9r4NorZN0oIBAAFLe8wCNpiw+4lHmEtWw+CDOOvyp5KhFPRWrb1o2WrYliaI/GxiEPrQNdIXBWGJgVZBuyY5ZltMbOEus0Kanald9T5kalnFfEHkxFYSqJB/RmJJRpG/ZVWKbAVVncZHRmcxFv4nzLkFi/COVEw7zwmkR+okl5up7T8SpzkpQUpFfs5n9AgHG1C6IyEV2FLEhDTyxDQuKalkr1XQAfNTf+NEvRsrfAxmmg1qKCDn2GPWrsbtgq8mHEg6kPNLGOJYboq4ddQT5nsw9kYkrBX8/tbxY+6mNtJzUW2IF2euZY/Ijo4qH3ELcJ/uE99NgoRshGeYI9RBosyZwMZND4k6xThtCupBMF2YkKlzac2KQv44A4CKRXY5zYsg34wArFgG1jW5Doz1TnF6swioGEn3LkDgAgDT8pg5aO32MJjVYJ4pV+ATYfHbsXrzpTbnAcBNDUlXBOH9H0jD5cNLcHPO1tvG1iQ3d5mBQ0QqfqwbTuaKSB7/ZW",
+    "DtBSO8DVBquvaMHZgx04e+C19u6JuQK8Bw88eEMdfPyk6pG71U87Wv20b6ufPt2h1ZMdrZ7s2+rJibPVGvaBlBn7ak91dIsUgU+oBDzBf07wnwdesF8/YK3LXhy7eiHp1bSEMPn06iSmnJpA2uoUGJ6zZ2bOOwJ6eqLIACN5hEw9oaCpQ5AVHpmhCDud9yTUUzRq+VqWlzgwzytkwRepipLwzap6g2M7ALtBxDPFNkI+aCBv0HlySP6t27gEDIYyMIhMMsiBevsdHEv31NAILdOuq5l0ZXxz9gpkH/TwDNEdNA3LZBMvthhOxaETXSfG7Kt69ub0OUYnUK+Q4EfiGKkEVqZ4zJqBNx7Djy/g7Wf8wG+fwvMf4OXTsXw4UX/5BZd6BM9fwssB/eV3n8PzH/uo5vDf+/SXv6XxJfz6EzZGf3s/awdyQoVf2mELpaV0AdLkxlUaPhFB4AUaCoX57YLiAiLf0WZTdUapo/hzQltL4Re5OqSzpBiHAAIFd23XeYQb9l68vWu/1GL9TaagjpJHjy3I+I1YBkwpz2OfJp9nnqmiT0RSa9jgGgAjaHbqcXenNLfyHg0+P7z/9MQPPvNam6gfduwzbNyIk55rU7eb+WDD4nn5oNk5ztj5hwuYgHCxugp9Mqrod7PkEo3W1TtqYlLHVq0N5VWWYD3fFjbkBxQYXIZji7d5RIMjsU5B5gHmiMrR/eKhh4GnBsYMRDIVfLgwnJG0mGEybTLscVOS7isKPxBvrzBKNL0cbMN8hiFN5RrYJ0r5vodudElaBuIQfmzgB5qz",
+    "+Fe2gp/ZKmiuE+T7+scqjzda2j+gv4dYFxui441HhwOUs9dpmG+1lYpsYG2LUsdQuaQ2aFyTsk1msifYuK2NlU5VjEkHx4ITCX/RUkdKg0tQNGZFo6ag04ogaAikyILgs0OR66KKabhAywlQRfDQCxqDpracA4b9pTFiRG+1gTS0IKr6mazrNHYw0gae28KB1EBbQeOrgfFHLZWdcppRF/v1WUvdDgwugeuSi9YqznFKpzGGp+g11tQbysoYi0OhLc0he61QR6hweV5etDhAu2mJXpn15ecLNDmt3KPcn9ruuhzqbtGKFsattLAvxjH8ZzfKz48MRtxszOmi1cCI5Fow4qCpJO12ydoxqmkIQsR6OQVBt2UgTTQ2uoi8tDw/Hl2oUatdg/35gh0rWRNU1UyGdNhkBGjaXTk55Z7MxjeZjYvwnJYzZOLXlIXkFlcQ1LN4N34i+gcY+5nMbncvRofxTBvOnoqazzcFn/WsMtAfo1AXXYcLGB/GWRvRYIoWtExYoWDSigJaVp4zhoR24cp+7gq1lKSOCoTc18mqTva8oB/Q0XJGBvdyBN1ZoPB7s9/RiNF6U3zgLVnL4AcC5fbw0THI6TAv927x31sPxSHv+Ih2elB0qlOEmiJgHqVYQkp5/sVo8PjCUkJrJbT4Tsd2/qY6TTKOGjYswzRa27QiFmFhvMcmGPLBTrDnidKRcnjNJlxfO+WHP25xMmQan5EotyugHwruK9ilcRqrQ2v0zsezG3UmRCHrMOK4GLqHVzuJMYfXKOvjIXifJzhwnNoKdWyrBnHL",
+    "x7a0jjf2bPAYecwGFeartM/5UBh8YQiHNcYARd2rIq2tikIzntvA5gytC6mqoukD+kQx8rd9cWRuDpLFjKXU0gZnAI+8y7pqftZa74hOCWRdZvHHQceuiwFRqrj1IWz7oDuB+nrVMAaNT+ubky47qJUddJT9vFb2846yh7T2+fm+W3ycthxlVJxXLzLNdmfJJiFWO92KH+M885qbO9qy5fH04SE9TZ1eLTCAp0AByPL9KT26u4LwBh+b7kYaER+FOWqaWcIj4OdjK36eWrg8RhDYnynXP2qvN3ZWHO+ueeKqeLJHPWeLJ3u0OHbWHO9R8zNnzc/2qElGr1pNmGliocGuymQ6a1ZGqdWuq3kfuW7Yxkd5wuyK2CUttl8FbMuYXTqB84NGgC76S49lLfsTnUyN+YCKo/ln8S1HfPEZHFcagXoNuw1nJZvFs5qnbjPYD91hHI7HaMfF2IPomj5Skz95ZG4DhGGONY9kqcmH5arwRufQhYufaw7I5XI1iWATw+xFjXYRIxzPV/oaO2RLCQL2giQXGm08DQshw9ur079VHF93OTohOjkYL7moglthzWlHYSxhZd/RoIHX1iCXym+Omg1so0RHgJXLY9oWdZX0ZTUPgsJEnpk3neHQTswnYnzKTcXFDSAJVa9FPKBT1VlDdJStD2Aj0v5TSFJVy2yFcoSQVsOvaxplV2xd0z7vnZqGLjFdl+IShPyHCIFl6Rp0YALFbiWmBaqUz/EIrzSjq+NlokaZrcg3qu42rZeH1n1kwaAR/KHpCYsHiF5jKvEcUbaUzEAE",
+    "wbgYhGIqcagtjKsWz6HgRbMj9BoDMrGCAlO1RAE3y5VsC1SUeXI79ib4zmsElJiL00WM3v3i/owwx4D6zXqmAyFPhdOFUAnvlOjPh3rLJEW7QDHGtR/UwiBoXjidhNRpnEub0lTUm5dNqGQJuiHT0bvFObZtcddJXCgzpQG+zTWj13Naz554LQ7UTfmu87SYoSXzNnAKKcncd2x/XJvQsQsAFWqHAbL9LghQpLM+povZAwYWa4dD+9EuKFTIb3El17SHeXkk9VEgJWti27aW1RTtalyVu0v7rViTe+ZOtMly7XhjYr0bUVrdfXP6zt1Zlz3MRggeEIPODbIGiy9jc9X2nHEEvED3WUk6HGQwwNqHcvEfkjZ6qNMU0blqnZNEGKElN0HonrX5JvNDhhSp4K4RiKqYlU4d/wKzqM530eOWUsP4VaaioG/AC9NtSa5pJIdQZkbKAaRjjz+sZ5ecbrNKE7SPWOKXjdgGww7Dng4sEEgrWyUP1NFqlGVHiZoIpb8bMheWJAtnDYMdtGXRlcRVv8VAFHQFs1tkphBpUdpP+OPntt3HXIEN4gCO6tropOiELDnotTGAme9hOlajxIcfJ7Cvq1lUPfjr363mG43UgOzYaX/ykLbQQjdPvJ+DXq9jVVHJ2tknbPoYfVTv48sz18K3+knQHN9ZLOKx92sClKN419B4SK09gM/t7fPA2jvgSBmzN+yWsTXIiffXLoribbpqSWlnealcEjT8XhflzTKb7igl2x0Jz4IRlUi4lWJYdaymIIIO+XObhqk9BMrbtu67ph29",
+    "dbzGAta9TGOvMQSTbquuGsUobFvHUtQw655jrNI3KwaWF/oHXNvAWmFw5yZGLkatdENU4wRYR5yxz5kEheJWQ2V05goHtZ3Tf7upOzMzWG3CvFUFxP0Dvu/W0gBkdUK4kQnVSde3ZkuStqMxgw01esHVDEk9ph1vl25qdi2N41khAeGeRjE4ZsfiVVsyE8lC8XwL1kjdKEz1Wrq9q3ZrbyuXkVn20OwnHgGxbscetCGdbqiE5U9gviiH9GE4m22MdN8YVGfnb6FMDvkqpRSDzcMguX6MyekoTIn0TYx0Ao5XAc8pYM6UYkhIkmdgx0HfGHS0XNFxKFpMe7V4DtUcbXHHLK7IV+dHF+okNvUaX0CCeVo3WeuGTqChXofs8hYlYzx/6FeYDIwed/HxbpFIHiYDaDzye6Qx/0ioI1rqJHz8bRi+RVmsxYjlmsLiMK08ZrfkUIGIM3H/oh2iz6rUP8mW0eDeVd92Me82aeKgQhCxU5Dokdb2JKH6nOslVE2698jDKf9fvPGRjcC1+TkuwGjsfgddF2Co0gIvv1hh8INW0Bp3YLRtp2To+O23VATbvq26lZTUpPUoWyx4J7GOAn6ttWyH35BpFG6MQm5pTqNXY4e0fTsao9KukxrTtgqEsQdIqqp8PSSFAzBjHXxvTvoi/DFZbPsyLc7WDvrmGL280AhD2zuuLt1UTX1Y4yGwOlaqSskTo/NrqM7w6ETd0tnpIB1P6ajARQNwtzpcs8XaBvD4tiT0EZBZl7o3y7wOjV7npVYsjZ1WOrQtdFuYGMtE2bi9iVrs",
+    "EyrS1apMny2dICbUcIX/324wCvpdd3gcCOUvrO/MOjG3YYskVsn3FCGn7P0vUcWaeHEcEBh7icbpP9sOpcyxzS2q+2Yk3wojIatkzjZBlSS8bddRhuLqO2fm79h3qAAmHqD81uh9B0uhL3gqKS5pD8d21XDF0rv2I2utVSfEFGrJ7udoKV0sshu8BWhN/lRGWFM225qMU5si+wasfsUrA6vmUGd5Tez3tSPsxgmYXfouK4QqdBjQ9XE996/zZL3R1V+wDomCgJHxZW9yOG5zVaQyyLFpXG4gZgxuK3nBmoksV4Df7DjO6Il+53P8XFv4i1tmUH7yMgKPgu8wtG8/F+j7xajy9cA7cR6CVMgyw4xT2nMIXExHq0TX7g1mQj6ClsBimeMRkdaxrTWb6CYhozbsE28DLJ6HN3PF1hwPXFb7Sj/5pm/6QMtcDw4/T7dqs9uuryDawV/uPR7vXKggqho1WLWAMRkbtiCvVnFSdxa2GvgG1yj5bu82DtcQ5DhcIg/PzkVUswspQY8Y2ajdPs6L04D46w5JjOfhOsV966dqPRnL4+eg5SjCiPmcJPMJ+k3ztUatxy6tpy58dNtlJucT4MZuVtuad+9cfEXJGhNVgJBPkaKUWBthmAZ017FN80ik1jz6j9nihhK6EJ6TWuSpcdfQ9RH0rx+9tu/sRACLnI7xWbpVZTaRwlbNmFYzrVi6WhOte68+qkLAWSK+sA+EHzzA+z0/qRhlKzq55UiYD6s71iwIKAVewEf2HUx7iveE7u0/Zp3T+t6Y0CWPaX382OBe8hvH",
+    "RjX2N97KgeFTjlKyWCDUfj2NQctRrMnMAUhgp8br3icYGXjZJh6Hj6qUbJS/CE3QfHlbdYlO0EebtOJB3f4GpmGMB2lvJNBbtZXs7ZFgbI442O4OUNPNzZtHvV7hlbjm/UDyJie6q5LygvPlPp1N4M1VwFoxQ463ozfftPdmt1dJyyJq7FTmjrJTestW3eIbfNdhPV3SmSNjUt29oxnw9MCVnaK4TlaT/Kpot33vcNxxoMHtecLefrK57oNtNznm6/SOPW0bm/t0vtZV2Vx3T/+BCGmw2RaJ4S7OuJq4WqT3Gl1lLUdz8049mb/ufbpobi9KH8asyU6dWM4gZh5zShM1LiFzBRqLAMbMB2UyoWDrcRJIqHNDT5CbY3Ui6NwJK1GxYzNkyQSGOcEEh7U8Qf84va/NL6zTJfPTr/B+c03SXjjodvDsYHR7bsANSsG6do+IRByqXFv/m0mtOz1UTWcz9D5o0+Rkcas1d2RO+x7JF17k6II3HAba/a5AQykax917bpfG+ms0124Wf3ft9TeakLvpv3vpwL9Rz3bMvWPefxG57pAALa2dZ2Xy+gxv6ajaVUX00leIqahDzWgtitYmfoqfNW6r96wkHOr9AHNB8x0zq4Ks1gq4ypangmgYHZFpBdU5/8rzx5jrVYW18mmS/DOu7KHR3kdEmIpFmyZc6fJcWyAMF3QBino1nFvxhmg06+IhlxmxoeDrBrGRiMSGfZqJl6tyq2JpPSuGi6OcI+UvZ04RjRn/qYds6UnTr0cyQilcYIqoLW6QScruvpzFqU/3Y8PY",
+    "dBQT8iIVxOScPTP+C+eNbomyJ40zK17aORLnXJOSH6H/7UAnaqsWOLnpDsSxko4o5WNlj75s3PGi+1JUF1DVycsMbTM7qOK2FUFh96eX3amzvgu3dEuRPr4uomwV48HHajvI0gFJMnxwo28B77xc6ftXfKVrNv2ANpKgip7KlrASkV7lYUuMZ9By6oAeF9gTWP/PX5+dTl4++5u+WOnPkgYWYVnizSR59iP8oeJ4Fco2wwlACHxdB9XF2dYAvnhcO+xB+uArVXVGs7c4bEVuXyVROUBTwkhmIptjhfIqz9aXV0hPsg+Up7CUXekLwhUOhJJBGjnQiiXW5xSZeKEpVBiKr61x4CbKQYQIBccZXoZJ6roXjuDwZabYPB0R4cg77jDlkioMEus74664h3T/Onpw0S/rYkZ6VT/5IxyMZRv2R52ogtM+U0kLIL+T5R6ZEVwYOs6dZ2sDvAvXi7LRbym71oTcjnyiyNTkCVvBI27uTRu635A+8mW/bXlgZa8Q6AablORPY9s0Lr0shjUk2VDM6YPh483SegZJXag6ulEiO6KJEcRNW9qS0SWXrvRv8Za5t23H0DkNjO4Uju6QmctJQvqCZChgQkFBBA1/baMyY80aA1Mzyj+bQaM7COXXYsyeqYZioGnbvtRCEVpVxmH3sXEmx9cuPAHjbNTrmDzJN+u6vOQ7dhDynRcTQ9HWY+5SsJvwZ8Rl7MzhzG5SGAJm7ohnPgMPmjdHXPfZVYyqDOkGdt+t3bTOp+4IqXvXrbpkqyoxO78mCm+s5Qrz1/G26IqUVjMT",
+    "DKmkfS/Dcs+qcvRV3SINV8VVVjadHb7O4/hH9qeK1jkRrLy6uJC3erGkBt/NTfYJ7a4GHBYRlFbBcVOplP3k9oYGVxBiUahOyqF47R8HKqNLmJr3i0RRWHD6a7W/69vEyPTPCbFncbwatpyxINXoQKjmOnQuY6NsYynzXoQ56GuiSI0OGUNjlhx83lTtueky+NaqGx3qGwML2vbnlj2Yobr3YP5mbLU1nMi6O9LOcn6xZBOTPFhsCyC/nXll/5pNXXcqf0hmKLyQMQ7+Xsap6e5CVytJHUJfcmcK4NIVcFy/+8cWfaARtTNAA/XtCr5iGseklrJB2iDxj/3hkubssoFjvi3UfeFbljf6eJ007wM0Adk6gfOKWOiDunAAFxL6gqNio+4mAFE9XOOFVT7le0ejJ7riZNF1bDri7HGrbMVYyljvtONjx6n57M6X3SIzn1S3eacOJl7dBIzTV++4dYmwA0sufNbHjPwr3rNuY15jpUDw3Z6a0g+Q6GH/hAkCrZTjSzOeouwmVbe4+pQJ2biKsUDHs4d07w1pHOoOx+IqXiyCoTjLk7TkA+IV3yJSORFXFzOyi9r8UhzSBdPs7gsjHe5ehJtlcw3CA7fXXI32nXjtS2+z/LUrb7PE3Xb5i9ad9UWzDUPw2Syr10Yhk/bx4tXairWviWUnsSXsWX3hm2cs9K5xlOJc1NAPoJSOW5/baLUix8oB2nHz1eT5u7+RwDNJZuQR0hpJahL/bg6AjEJyoUJGTFs3hbfyOxhwhNnSFguDnLp2oO483e9fTt6e/jvO7ZFO",
+    "F/T+ZWuiILXopGJMt2ZO8C6hsff23Vevv3/nqZc4xyBULWbjx0d/+LMjg1CcGol7amNEI3jHV5LCWQyoe9VGe6cO0vxjXLESoAiQFGoiBJ6Qa1o3rsWovvL5uXVFhi5QoQhXiv7hKqRRpkvqN736narSqdxMfXRA/t3MPfRVTNXS45nGELKmQ96GWItRhHko34mjYk34ilTAeoISLN6lQoF4QF+GeAo7aF43PqLFmBKhGMFZlT1phKazGfQZszUV4QZvM8+KhK94QcOdbJ7EMIfvLfswNkU8hs4Tb7QMQlgtZRW+cdTHbXTCPPe4Z8nyVzFeZp4PinAOqh5ebozcrqzfKEu3HmP26oUlzTAUlD6qS9vpImLSAPgGX8yAFAsPCxSeIs86qcNHdeNvk/a4BbSs0vAaoOHtErDeBpwLTyRqHLuFyYP4TmPCTUzRRci8sMlQ7doo+R5yIEDNLQx4C+JuXRhpuCUUuksUAwFlF1s2JXlVDw+a9Bexwj3/CQU6jNR2L/yqL/XIpzzL1D4m7ORVJEWgOMKXe9/Imy1xPCUaf+ssJS2yhdoFtBKJ6Bmh3xAI/8OinIH0dhXnMc5EvsELOilHa2FfdJhSmBjOQH0b+EAb+/uXvmbGFj+zuHKNBTWZs4v9BGZTNrvVDHiolebALm4uSXuNWsVq1NugaKuwMT/0bH2skG7OQV1Xg5LGrhxuHZnDUFljULQoKdM7Gsnfv3xYEF+ThIUnQHiXkRYjYT6HtWwnSsCvpM6mZk3A/GKnkxPD0BYjg0xo33ENBZvvzPVmr+iS",
+    "Y3rKHKCrcxzLVeWW/Q+8PWBh5MMYawzxsCxv3kCPBbTnyxHl+ghl0o+UojfSZGEZ5iV1UiCLHGu4yZKZNXXPFrDjpejRxtsUqW94shXKqy6BYeEI43CJevtSXkscb5JsbVlqsDDMN0ORN2dIFaSazGmMGgiViWeWmYV6Rslk7JXXblQxBIRHwvtPr9ddyJKSt9OY0aNSxGGGZepC3Zjbdb8hOz3YHyd4TeJZdRWk4TsqDxIRwwO86B5WgB8PL4eA4lJ2GrETUgl4MQdeB3CdN4Rn9prJ2tZKYYtezvsa7TzDqpbZAlVT195THW9C0VeTidv3SkpbjH2UqfwKw53rVi4nTlFdZwp1aU+dfRbVbfC1InUjQ1ldjmytjlrHyCCN1x2hRcPnDcC7QXcKkOoc9zQN6TzOd3rja3IhOGMGlhQTnOQxbndyb6FnY9D12ngn77ioqhL3aC53QrbMRli6FvxbWsuGIUAuz5F48+ylYLGL0k8qHPbxJ9tq4U1pgLrMkFUo398y451fsxErZHZoXVFlaRWppXrM66q0nDXrndO8oy4ETUqngX7effGfOZHNa0MbDi6NSKP1vP3SUR7lI44QdX/uovF0P/L+RWRuor1G7Z0o0vcur+eBuyTPszVtTkvB7qmZN+477a7zixZe57ozR9u+BNGgIkOv8jBS30e7NW1T5dKDVtZ07VFrK6/BrhviVWtPaz65o1ba07qJm644mM7hEv819OuSr20n5W3E1671KUsrXVCM250sQapRuEg2BktoLAJDBdy5aHm0kzKJrovJLJlz",
+    "8jYTRl99xeMrdIQ7soMddozbcNdcLEi1o3QzxfjPR0FrhQm3Dy0+bim1U9mt/JcpLa2VQFZO7kWLW2tkXPpX9xFE0mxhHCRYe2fPvb6CM8Br516feZxF13v25huPc+Q6YbN3snSl6/CLNKxY1cUj0XLmqfy77kuCNHjoxl2hA1yvnt23aRSt7Gc6J75zrHZ30E/wrv1Bnc3TMU87Gmg9U5Y8Hln7Hv0k90U3IA4jMm57AHj9ymwY/CJso9PG3bBNsTn7jGLShRDLttg+JgyrOtqvtdYJYKsh57kC8Pvhlm7S2Ae3+NnycNlvyNjgPmMjP9MuepDkRX6tRGD/PFTwzenunuuLQWjiPe+fqf8YrYX6o/Xi31uvwdLBP7dxVHnvBjsIQtv6TGWum3YYG2wf0dcUdbF6GohUIxpeSfjOcSN3cxsMO1pzH23swO9fX551cAgSwnCz24dt/vXvozYsVM4hGoe7ZIi7tCwz23SxHnLK6WA+TT6C1l2fqu1sX6fA6dp9KBULHnbtNSSd82YnSDqO3xvk6auvdkLEtbkTGmXK6ML4XJ6LdWJcG2812udVSvv2xtGZuGsYFP6/D07edEsMObmk72JRbShtUQTaPdgad/98n16nZBlckb+/uJ9jSADeO9qtK3Lv1+lNAlM5r51smaYng/1Z+tnkMk75hK/ptGa6HEHRFA3X2yReoFd2Hn9cxylG+RYYb0RW0akMoadk3raGM/yfovO5wuoYW3+pBiyVPsIVRkNH14An1mluwutYlMkypju483gASMyhyW3wG2l/yfyO",
+    "ql87f+b+WwaLvc0/3fT//1Dd+10l+10l+10l+10l+10l+5+tkh00bKyzHL3iqbknIKDIY3c8+Hn/UnooJeXd1Dvt/F6d6Hbvzi1n8b+rer+rer+rev8fq3qVqMwZ41lxwsj20ghY2F+FM06xaWdTTrOW6nIg3qzRNy6NC/QeqhI1Y0RJXFwJYhnFE+VvwlcjJKk82F7EhemwgkpcnhUYuFAdW1fnrpTeK0y3IoOvuW7MUOzI43Is/Ppm1W9wseA38eF1nnkrZYGyW8/i0T9UBfhv1QB+a3n+F8ouuzrvlmr2QFar3L+rxXbpeWerHdLlXuM05M5aW3vIQ+3coHPxIFhcar2mB9QwZ5877wed7F4mOKqcKa0ER2Zu21pAsGL1NkvXIbxWjtuikmZ1N+/iiN/KANCtgfrRkXbKsKJVKaVBNpH5KUbiftHMPatuSakMT+QyVUtgsKM5TH5L/udspcKAkXjmynQLsije3n7veDi8l5LQeO+A8+Lh3TTKeZBT9hTkVGTkun5jRCQrHvuTd4DXOFtLDV7puOqfm4EO5/D9QlrScMoMXAjTjR+ZaEi3RkAhGwHX0hktqQWtYKc4JNfu0XUzztvuEtUJbecXO6jA0SQb9qqrABDSCHF8hWk7cT7i/GEBs1HmoRkAsLvPFI4cdHWnpUsGGWk2oW1V2nVABiX0W42ZzZyytALnVsiDaT+t1nEeN0KkTBFdBkj03CJ57TZfShiyGiziTbyQzGVEecf2SK3rGq424pposhON8Zy24UWcSBg0zVXM7BJogHK1yuK9TtnX",
+    "JHCmHuyejZONYq5AGnWfrM549k4i6kjCVC0DM+eDFAaZL0uR0PJRlvcPhSXNC+bajsN8sRU+BaNxxv5+YxYDwDAMrnCHz7BSSxGrMlCGQg0p0csVdGekGBNHiMt1ZsAy1hrBIh816SbJgCgHKrxIcisGyDB9G1b7VpqVEvxdaae3WzNigdvKfmKmsTCtNpVBhShZ2+rNjY4TEnq1a8ypBF1dDojKxMd1vFZnJlqCB977BAVyCjJNi/USSmCkR8MD2Nw5zStJ1UtKviwv+0K5pVvYqK1Kt33PEitcV8oaWrF0srcu/9ahZaiMy5hTU5/ErVl9cW77BxWe9CU60iGfczhqt/xaLAV1MCxDp2A2wS++c6dqEV1kZ7Ee+6G6cgKTtx/2BRNG0z0DDzkGoEo5Sd3F5A3oSIrmKIcVim5fu18M5/dnQ3lNeTMiRwbgdWwwDbgNHUrLr8Uwj5fQK3/lyjvXFbpeud0WzXt1CS7OrU944547mpDzVHNZ3cdflaYFhW+KPMAIdWqqy8v+QCUsy0UZL1dZHgJa+H43Gf7IEVsAliaLgq6ytNYkG6PsnUBRch8Ip5lumqq0Xh2lIDZJzghYoEKukAUTAv3ljNhEcr4DW+QnL01jTS6paUjLN0aEqBVxXdmvePFTZN4qahFMbOBtAgraDBWcLiHE6JM+GbAasHK1N2g/pegl6ntStsmsso0LKQVCnTtnRmiOqYY+lQ7ekeihC2GT9oG35Ts36KhfLRgnKWmf8+qCDUux7UiZ42K0w7CYoCt5K0AuV0eDucqMnWuHPlnF",
+    "Tqidw1pWMiWPzKJpHXirT1LLNWFxhqd1cVVPgJRmKaeLMeD2LUj1iTA70HmGoM1uahm2NlFj9h1D3DFMkpcTvDN6w0miaA4aIQtYhMQMsjI5YhYYU72GMUZXRMua0163N3ba2mkioH5QafekKSnVcaTwPymzCbIBPoDr1TvRTFZmRquqcC01qZSSlt6qIm3ZRusLbEIrRyUHqQD22gsX8UejXMWA9EeZvlAWoZDAeiwgBk/JgHOQWed4O1OYkn0Y+D7KhcrwzPGNoEjMlf5A179hzorhXmF7bE6rx6A0Ik9MmqUVQfScVNJWA+okD290RPA61YnedW0aeKttzwqdlOCoBkk2ckgspbE6YOf8MIIXazOg59KeBgv5pyAzbmVUKkaWkJgZFmVLyhs8P0hTjjSebk3jFJ6RwksdqslKSfGkgsiNEFwSfkK+aFpOrHUhiFgX63AxZNIQpJByjs08HpAJjW90wyS44ibLr1ExnIO2UFyZEbCk5MoU8nyLhgwDta6klIkIPAwYnYtP4jIHafsWdT7PtL7dhIiJKpRPNYu9mlH+kZCEu5tsvZiRbl2we1uCBtqqUzKlRv02bJ3Cv5hgT+EfIHrfMWWG5bFa88BwHrelb29fsGZZ2S31EYSckS0yGrueLjQyRSHKD1Ezvaar32TFUUONZbdS8jk2UOPWrtw+uDSJBvvCXJrQSVptq9puR+MxDtdrCgaPDd+3C4PVYCzMXuzFCbrYCTQe7DgEQGSuFBILhxQwDKcANUtrmNtdD1fCRK22mlGsrSbmj8UsR917L1vH",
+    "qaC5Nog2Wyua+NNEzjG2Ftd18klNE+p01EUXxv0Meb4zanYyj+MZSaA7p1DCv0u6KO7B7uhPUyzHgbSF0EtSroiB8w6QlwtMZ57N1hFsyQDxBlk6MDiyEt49LRWOdMhUgxZGO8KzdrubjSbYEUn5dmt/KuMGWQuXlP9i8vz1q7evvzt1yjp04sI8H9n4LN4kEWXDRChPCG64CZMFZdOmi6+txCg/pJRnfTkzbjypvEo56QkdXECR2tUnOnWy2dXvnv39P2r0s8jC2QSdjlZ+LZcKlT6HqjU7wJ27UDddPFuX2SCPAQWbeIRFDxfJ9PApADgZrraofxdlgRG4MWySCd/TNaJNjsqIpyTPDocnNbjvMGXJMryOkZ1TUjzYuZcZZiyCDTuOF+wSgPn6ywEdt8vu93YamKCDKpGVR729X0BX65NjmIwws4+vahGZ87D+1XWbUAtGPfjkOePMuc5OzQItwxOpBLBe2uEhzkB9mnDxiB2PSC2zlkXvbla1hkVNrQvKJT3SCQxwHHMU6tThp4nWjmGooxU+IbR7app9yZ3Osvnylq1yDLGnSsOAzvmGeGasvERBLQ8PHXtZp17a3m2kk9pXUeLUW1YqrqZNRifpapz3YZes3Gtoh/3QZoQFEESfnEsSQ4ur9E8qG4wNPsMb0HUKS9/I3AgtO6xQOPZzKIUWKHiuA+MbT3xn5g1z5KaAGc4Ipb5udmhHhpgGPlXWzPttZ3c9EG/iS6B30ga3QoNxxYUInyJGpsCnMPFLCcxbDObGgVDX5HVMXANTNdRaCU0N7Bip",
+    "zXVou7zzCQPcvzwyxjnDJGB2uApfst2nkanzaQTiTpTNsxWv/HRM4Bv2OSwwc/IjbNu4RjPo1fuAzWOhkYPYbOS4GiWtreXIEkMTvfOffr7Auwr4wHEEj4E3hKaXwKcVBoaSnBS8/S8ntJtADLRAD5wok/lbOmCDJMD5K6riNVA603uFpx2XefyYLLYC93+gZ8WISRIoDMYskxjyNipW6+Jqs5w8pWK4Ww97qPfST+RnyVKmlKW84EkOijiFDtGFYHNS73XGSdTN6QaWdYpLqndQfeLLLUqMPHrz7OVQvJSbeHyL4KnPvuwKdyzAPv6EnR3BZvDzsCvvJ4o16JFC2PMWhTcS3rygbFxJOqt+rW6MH5H5HJbGj5V6Znh8VlR9X16Dpl39zJe1n9XzbG48r22ooK4bbfKNcfqnvFzOqnAFKwnfoBaMZZBPmb9vIvMXWiGq3wxhDVBzsxDMUb1MEYXpTTJP8H0aUylpsTHeJHN4N08ujVc3IN7on7LDZblCoan2GokZX8HfqKSLTDDDov1mfmn+1vUoyaNVkJNKNsrmcbTBt7fzOOeBMjb5txwpiuX4kh9w6laEQvyDg0xn8S3+5od+72eTnsnxgVIw6jyIqBbMaSsBvvf+ZUHZqshDX6kHwpfaQO9A6QPS3kO5WdgudJWR90FOl8GEfBrL6fuUtvGwYKko6ClNhVI5y34TYfUlDtTYjWnEW7bQ6fT0K5lqFZNGEY+o1jos4XmYC58uWQjxFvVZnOO9Px6v0aEH/YzTqgJsq/IL/xH+aguDT8VgKT+A0Kl8",
+    "ESZn//YN2l4muK4mk/ORehrmuF59b+gFmKL+gu+JMhWaSpeh33Izkyf4BPeR6uPEg2cqJdNec2cnE8N3kNJe4m4EcyjVCvYzGBJDMl+rPkrVSXvwEAhLtbxWGQFVZ0f6EJ4SyuIxew6ari1Gq8LsiUNQlQMQwGR2LOHK6TMyUfMLtRkzarr3CjMXKeygqVRnMcSWsgFGeQJ6gEzg1XXjE2X4XM4mCNBv0bllc+fpBTtxWU29fynbD1WrlOVNJlKVIhJJ7erwY7P09QVl8KGhkyqNxJNVa5lZJyHZSKmz50cX5DdDRjaizyNVqZGY2gbdiV3Oo6vRa2fZ7ZPtly+Wm17KFK67EUww2zAsLRq2v6SNB0sLLuIIUTEHMq8Q0evWAG1wfKhP6huA+lwcHx0d6VmBj0/HZlhvfUp+zWza8boylBhUAt+IKu6LpX0rGs6YRiXmBGslVbJK8Ko/EefSMHEhP74gHlIo4ckvt6sE3dC27JSBhgS+35HvoEPpiNK/A5gNEZq8Wnco4eF7uo2PtHMUqNB7OoVZZGXk3JN2D68P2zd88C6GuycchjACXiOPSxyjAdmTJzGbVd5PSAM96U2NTojneKgYBrY3Ll5EeaEU8Wd4hyDs1llGppNQ40Xn70da4DaGuMb5DkwsbKghVSfk0/lo8IVu4zQt1nlMmEVEZSmn0vNfJlGenfEmQ6c9MAdJGi3WMzQWlZznDE1HaG/Ks+m6kLZcax1A/8j64yneiiy/meJUvVUcluvsWjDV/RlWmzBK2v30fiSH7QZXs+FaUxyh7IA6",
+    "PoMS9wvh3y8CtjEqsLDvasvJGSUwNUhyiAlvF6gPY6pIuS42Uved82UnJWUYBWgo+0JNzzTPtpgFHVXR9KVqdlW1RggjugrRqGL0mYcnR+fAb07HSHNZ2pxq/NKVSNhr5quF7udxcfep4RsZ1B6HNuP7hWteuq/bkcKm/za5TGH3ykkXarKuwQn6Xu2xh1zFi9YtRHbf1+Pxzr5/+63YYMYNFKXen755++L1KxSwfkgVA6FylZzDPr/A+M4Hi4s+Hi7MxDmoRxfwgtY4LCJ8BrYJyuSnGZRZEy4sePM8xovc5vD/NRQuPg2ST4PbC4bUF6DF9TE9L/yzgv/DD9LIbBio//TFFR05o6aEronwSMpan5x88EcfffxqrSsNSB9VA66kvgM7N9A0dOk1nQNfiKfrfHEC4GY4bNYTLVhKBYIqEcg+VBsFwQHlWhR0JI+7xVev3sKIIvRpzmBji/PCAoPZOYo5TgQK9eIpsqITHBFU5R/Cv8rwiDzBxC0o/6KmA3w2sIdGJxEwFbCaAJ9PkWmcjMS752cyN7zK3i78NDos4wWobbCVUgb8p8nshIQ3u2sCisaxlB5pUG9Oz75DwVHpA1sxiMQPsu1XP3hPxDQskojL0d6G/NruKKgyI/HXt0BtU7zKXnmH0060LrMlebVx8n8p7EONxnBJcaPDAUATTtgJkj2+ozP680FCdAmIAIwvT2SZEZcBuW+RgSAch3l0ZYGlqA4k9ugqA/pFpRoIA+ipjItSXgMq/BNAHO8W8Iw/SGyxAPGJ9zmbjz8V8ceL0c6rFHAF",
+    "F/JDbSJIJUWNESu8OHzdZxECie6JeH72/YBuAa58fvGCUdz2roBD2YgDsfAGj3EOya/9ENB+KD35+hx8eqhyrvTFgweHnz71KYxI3I7RPevebZ+t8w9soOsUJrUKj6JLYDMB4gj5PzzhN6GYCv/esbj3WNw7CJ5IrmQBWuL2LO75PhqPchEEPM7bMby6/fzxo+MA6gG3x5/iRHwBBShZMrY0T+wFgaFzCMu4E7qChnwIQOE8QxEg008wzTam2OwwovEaC6WPty/xgzRb6GnGuFwtfwWVTEp8sI031/Y33me0ATErhlw72FeEp+J8Bgr0Syo8dkl3BkfeoWpcRu3bNlZtQq5tqZfRcBkvuZnAQAJy47Z28du7ZBm/nn5ABRme+EI8fJIaxBYWa38JpHnVn4Xb/lW2hp9Apn3QUfo3+GoL/6CxxABmqwn3i0P6H27Z9D+5ZSNMgRC4EUGwBQFHZcoYA+4tXYpwHEkpmSIaOZRTylIsxckQC8oSL+QUV9FyKLEOK3EVOa3n134H1e/mBMlzuudXMQh9b7dpGd6qGaqLqWsyjuTxkLmgn3v/1x9+/q/BD0MMPg2GbJM5Nk8xCnKmOEf3ImnHfWR6AuGQ3SB9r0/VHVBx8GVeq/aDz/WCZr1Ky2V7QiWJ2kI39o7v0g7qrgHcpNvZEW+WIMDmbSG6j/wwhA1mEUax/9B7aKdUaULhGnuv3Zb5I5sObkwVIQLf2iHsafpy6noXBlXj3tZO1XKti3Nishd0B9hlmqEmi7mNkwU+aGMWGVtQ7CGFUt2bfmG4u0qf",
+    "J/quncR22Dh6hmcbLZeaVxtF5Veabl+qs1agLwdle4N5zfXW6UGgfALCoM1zzjv27ni63lREjF7N9ulV1TRV1X3ECKwH4uj2D0dHR42osN+gcz+671OR/ZDkRfeuNFo3oKT7QPnMgtKc95Ox+MKgJU6TPXVMvXx47KKB8Z7jwadp0DGmz8Z7jqkTEl0wM4g/oiV/wLczDhYl/+Ffl/zrMq7f/uEkkzBR5jtqX12U0yTlqVlw2lLwl9BObeZhaKMaarCPY+yAi1xNooldVT/bp+qidFV9Kvap6mz16T6tXjpbPdmn1UtnqyeNVvc0VL9/SWdTZb5mqVwfsICajwf1KOfn2WKXbQHtbGTIVRvCi7nYZuuH6GhP95BklPClL+gaJb6JqszEl8ePUV55/OUfh5Vd2LwL7Kef73Ito3HlGOxY4Wy28TucAA/QjWSDigsetJeh8D+uk7hs5GdgnvK07iDdJGh1/zzAmhRdG020zmv2b8QCDJ5v9OML0wodtplQ5B9pWCYIOypWHWqoD8Y990cBnqapArJ/QdsOeiDmxSGeCB+C8n/I+k117Ine6tK/ADP8kDvAuohZFadz+ECfnyjHt/WKxPqfDMxv0TlUFTDMJaDcAnkrS1W/+rKWR/BaU+rb5iL5iSxHpqYeR/ILWXyqL9gj+YUsQOZdg1KMqqCAHKWgoMpvlkWxCJCLvUVnfuVIhIG2xSHdYG4AwsISEJkKqi/n7tdIoPILPlotkznB0GTxpyxLzxYaklKjITEbQJvsSB2J8Puf5TKSZIE3zXUxELLi+GiU",
+    "GbH5B8jCNM3TMTE6MuGBZl+afig85yYpdh4sTooY8+NVfEUfOGfoWoTkMxJk1rDNT2ySkjHMtsGfdaw1A0YLrnwC4Ea/d8jijS1Vgq1gPZfjn0vz+p5XbksAho945SMHH1geJ2+DSVJMFF4VfnRtjbde5bhIQSwtWnt16501shU7akFNumbFcOhbgYLD/nW+9n/oq7Jnr7/77sUrszDVPmrwHH2sulPrkReCKndvCvbcLPvCCG5hd8/pJV+Bi5HUXIwjx8zLHDVWppejmpMfHi9qN9LKgXRsB7xgKe0eRuWBIn/62fYPoypSqbPczFrcS2tHzvZFhPJmaPMKI4kN0DMn6hpxX9+zzQkpEL9Wu/XLch4fHXWkr5bhOhxKRF4VJ8Lb9/J4TlJXU6ub4W+N5M2yUQowddzeuCcUSuCAgMaK/XV0rjHwJonVB/2cKYx0cWQikfM6TE8W49OgEcgtUXynaA0J5lRVt7NH1TwbWp2PZb5ATS5pljYppoV3uFnAXsufSvKFY1JKkmUxHFFeWGYRle2hUJU1w2n3OW3dk/jxpqh2GojxCLzJubqJXs7XD3ih3CbmlYMnXCog5InAI/DoiuwimdwN0TwceHVn6dqydqUcqK+LeFOLBNHXXR3XrrvS66Uj9uxK+kXR5A4pDu54XzzcpWXZ+ejqV4HA7gKd/ZB7o/0L160NkvfgtYF11tOgZQedSpr+oR7i4VTAW+j7joEYjbDODqbnSFZh1Brtn5elgz3ekU3ehV3egW3uwT5/ARttW317cLb/BkrYm+hvj/7s0ZXP",
+    "6vef6tZOlIzWjitVmf7hXztwt2MlTMUPU+8OGX92oOJX5P1pogRH8whksKte6wCiqw7pqKOvOzYJWrh6N0bdqdqGD8QzunTZA8CwYQxI+QSaLNZ8EDyLi2vyoIzzJYZuFlL/mWWs/tBZo62DaYcx0BiW+Jpdc312VGtVJowF9AJdEsKoVA1IVc+vZzfHw2vefEHBF+jkEVgnH03ZwyEet7bJu6Wz0Wlc3sRx5XHbaNZqk1XLqzhcTVBh910Hm7hCkA2oC5YvI/R+ipcT0OeyyGsmmdEK22U0lGndfetoUZ55Un0/UJoc6A7r1QT6COojdM7MbqG8Dems8xC7i/6BZDvjwyv0UGGnQWl/69OMwgzA2l6EP257OrGUEQki8yAUFGs7FN8i3HlyuUbnKNSbTdJ5WGC3e2pvpPB8j3Xdkbg/E0s6Hp28eHn2+s27ycu3F12OnOVR5a65NPM/kdlPmxAtTUAH0Hvyu9msccWM5fpZHkm9i3A2tqZadZA+NbpoN4llRiI9DD0XnTbLkvmHOugrh7xZgGmw8TIljtWzcyZAnb7G3renz876wj4ZD3rNlipvK2hIzWMff+CU99Uss5VOBV9WDaNJ07DOBX3ry3nEWRR0bDHtHOo02ah3YVTUp4jSD53Mmd7AC+yjde2vQOMJ2JHMqzihjxtwYV3QS1fYwzuU5ZkxFPU1E5gZXVY5SBDS6uOiNgel0REMtNFgQL+E4KrqjZWN8Q/pbKyOgtW1ruhi9/4lyCbSvc76+g7d5B6icfHhUHxfwDMKKg9RdcBQ+qENq7r8",
+    "aYSmbfHwwUMRltjqEEMPlS2fnVUO0VflcH6pYFhbUbfJD5bMIDG4M94etRUrmNkSvgrb8cvDyfYqz+NKhKQIMpJXfUxKLA3mQQ0En5FTVEkNSE555+URv08MHp2tocoqTHnN1IENPohXRqdmSY7H1VV/IqCgOMf3SO2vZI4WpKooxqT0TnBz1QcDnM+5S9ERFE33718Cq75Bqw55H9475idn90Ie65T/SICcDmYDKF/I1ji/SZhjSPyiDmcgqc8tEDdXEG4OSFkA5zUFIha4qYTS+Q73C6rIkU0wCeslzDkHBWFc3ikGd7D0PBJHIrvuYwopve1wwp2+eKzscofsmi7zxCKvoPCQV15nkN/3b599w4FOVH0kByzO9XDRmy9ikvpkzMsn+XDR9H/XvnOMHQZI0+A7IAVyinfXllRLRZW8AcP1l8Wly6NLipJQwtQeiPdIp2GsuMv+wVxA1vT6XKcnUzOHs4l0N6H0BdJKiIE2+oL5ADWpeUOwmbPuH3DuRpXXXaWpnRgZd0kfpEU80jFSSZ/9SeIUiCZX7l2BZZihgyxKZ41RX0GVkFt9a6QN14ZgOSaliBZ638BbKVhkgcaJUvvsBUgOkhR6Y8uRQ/GGxltwrBKTswrTeMa0QB6WiC8KIqeQPd/lJXmoTM2BigFUktgCsEXZVVH2wM0Q1hTNAkXXZhhPgd+p5yBwPoFttIhxmZe4gijmpVel8eUuyFXFqbLSQ9AE8JIN9hqVHJbkRjxIvI63wNRkjisdEXXUNNWhrIE9MU4i5jIaDDFKHRzd1Wir4slU",
+    "NuADb4cZV2ucKCyIJ+SHzl0gFZVPvPHFnrZcqNNmyn2RIh4XcRk77bkaHVHc3eU9LR/EDrzIMnioRBmxM3HC47sYjhm8BbYGVU/+ca/VvnUH44gGZ1dosbrXLQwd2JCYb5wdPTZMvdAmLuH9jzp4YHYd2+j4ZWD7rNJgmOvRrjhh2cAvw+LaZDoF5/yxJYeR8OWKxhwMIAtc4e6PAe4+B/73ZQuGvG+VpYjQ4tr0Ek0y81dxtVasQb7BJMLoz86KUEbxVRm5BYAkIpfngUyBjuWszOj/KQ7JE+FQZ9cGPpyEIH4H4jITlAkP9psNsCUVyDYtssUaFg9JOKwvQDHkQLA5Y9wDp6fLcj6rlXtzzhhjdkR9GeueD5fXM3z2V3k8T27HOvY4MNhVkg3fUsTci9dyUBmik9NcVSaavrHH1o4iqnJcCeA648RoImqpw4ohvaWcxTv12XoOl0zGlJFORF+A40sPl2BHy86t9xy7YaR20mvSuVPuE9LE65Kjl0iNZJo0c17U+Egjn5h7Djj1Hc1Tr4FNpFajASLtYb4sUSeWeCLv0njCmR2N5NtyvaIFH2iO0qajgmauX0QGLWFau0VfZWLUq/jrMKXVVlBqOCDiuhrwRMrRmZSVEy6vBGJjES7XizKR9YBGXbuuJPpayeEZpvBTPWvSI10zxXyDFAEoPUyW4cq3uFOfx9HM/pg5U5PUzZ+NpKO668vw1ucf2IPAPfPUKZWw2XpJFN/KYKtIv1HPEC60HKK9uvUblUtT4VS6ocusOIl+b6GQt45EXststKddJFkl",
+    "3Zwnjfw0ITvjRZ4rr1ga64qcxaBx5oB258fN3L+h2/nYGvOvgPvBAbfCnIyIV8CDu0JXSpijEadFpGYPcQg8R6622A/2ilxdB+QvFrQ1yBrjnZtxZQSSBMX4GTUxX0k2kqH6LzCG7JQ13PfIhug56ND5uLsOOadnnu2ZOQAlUZivcOPFzlo7l5xk5/FFe/tO0ZPsdI0+HvWcO6bqsFti1AZlfLjoWfNcjay7rqXYSiXdhuQcu6puJeJszrxedIhRSlBZO4neqxsSES2Rx7zRABZ8W0mH5bHqsxNQUGVGxY5cdPS4giZlSFAaaXMkEDMbhCTV12+1klLf+eMOamwgVup51IXfhtRUDkP3dt1rs+g6ZSMKEerV4DZlot6BinvCa1IoMJGCbmFrl6muCrYe1LlZrzoEqezOTUvx5J0sV1VAuz+atezzITEQ9EUVpxzPxgtzbajEJT0sI9PUEFOeTHAvnUwkT8Z5oDQttMPiL2Jox6MLkOf+Cy1vgD0=",
+)
+
+FSB64 = (
+    "eNq9PGuT2zaS3/UrcJzyRUwkeexsbV3J0Wxl7Umt6xLHFTtXd6eoVJQIjbiiSC5BjUab5L9fPwAQ4EOjsbOXqngkAmg2+t2Nhq5EcVDb+/1yoybFaXAl3v/84W/iv34QmySVQp1UJfdine/3URarqUjVCEayeCSKI/yzxv+jCv4pRqKUWbSXI7HfxUk5AlDlHj/An5GIN/D/YSRknMDsY5lUUgxvwpGIikJmMXy+CSew5Ps8imUsVieNlsgzeF+pKnFQUuQb+E5/kkpZrMRQSannT5bff/u//wOgBsm+yMtK5GoAYBExJVZ5WeZHAL8p872otmYRQColvjOFtw/DwfLd7e2bD2ImhsH7pJBvoioKRiJYvv7bz+/+MwgHg+WH5dvv3rz9CaZcP/zp+vp6MIjlRiz/nifZcBUpIAK+MZwOBPyXbESWVwKfi7zkv7OZCCYBj+N/pawOZUarvPkyhX+CyfNAfEWDA2cyTpgAacqkGAbPgxCmBPVExkhmMCzVsIiq7Uio5J9Szb6LAKjG7UqMb8SQ+ZaoJfELZ4XimFRbolF1KkAQqjJK7rZVTTqYKtdVXp40HOBoGcH3Ca0HYGL8QmxgvzARhAYYRd9QrJQ4ZPCvYnxwqpKVwSfPUmAErE5pTXwQkdohUtlaojS8fn+qtvB3iKM/JOsy1w+Q3Uoct7mSBqU0URW8HgjGg1muNxcxkutcwVMUKVVFlSgk4zcxbNtGKqqqcpjDBgIDLQhrtl25GEwNIZFiQM4sj+WcybkIX4k8jTWOabTe0WMLBykDNINd5Wpi",
+    "XkRMCxEP/MCi4A6HDiIaYTl/sUDZMgLqT8D/TokEPOT8ejESH8sD4Dl+4U2SqZY/Ys55ACRJ3RBSmQ2B0Dfia2KjnH+9EDegLhcBxNkNkEpetBLog6wcsiqy1OOEMJz/mUESdh5j1RowbPL1teGpVQEwNyCsJP/xEp+8EpJfFqIIRyBlUcqCtI7S1MIiRUK8+DWEFNoB0H8QRBD/yt+ZlYXmgOHxhBV1GLaHHapMWBY7edxP0jYAwxK9VfizZAXfaPUludQv8IHiTtiisWCfl+s+sQbbP+vkK5nYsKkCqgJ2i39/VAXOkOectHlEgXeBVLGlTdUyzbM73hyvNvv3TStSo2GXEQtn17ALXuAjwQgEsXj2H0o8U79kgXgGLirQlBj0o69XjmFlXK9EZMxa2sN6H8M2hlF5p9B8FYdqGYPvs64CrPJ8nC7EHLFeTNFEg1+Q0V6JgL0Ebg8BBiJNMqloHVIFOEgkowfEdfB/gSVShDTB19ZoRzADgA+j0CVLRI5znAb+/vQrkIxnqKDfG9HDqjx5BEcQLXOKZnBoRM/VW1/EOhRRu+jgwymrogdxC4FHCWQfdMzxJcfFCR9Mu5YEAGpCmtDUqnBwyVQ9TT6sZVGJW/qTgLEbPIY+i/o+qtZbfB8ItBUOtZVpOlbVCcLGL8nm/0UMXf8MNhcd8Caj5YxBAfxIMIoasKZHJXzR2riPyp0dOm4xHE3EN+RYlK8shX4MGIX0Zvw0L8gTBn8JkGn1AzVPFg2GFeKrmfBNQOI/IqfReo3zli+DptGirRTeQ72j5NzL",
+    "6U20+t+QEk1EZzz2VQNdgtyxiRmNnNEJzehaOZnQl27VQV5DKnCOWarlBROGYZnnIC8kNDv4buXmDcjedkwx/oije0gI6ujSxpUUnaXyXqZTsZd7HNrkaZofFbpoDSxGYJgfkNcuJdo30GH8lh32K4AAY9r22igP0UFqB5vASg969HeETenJO+7CjbknqkiTij7Oxy8Wru9io4sLMDA3yg/sW6MQzDVBrCfAr2G4cJhAU2t4nFckFcvAeofvs4OeOcP/OvzOTGTyoRomleMq2AJ8qPLiLdHZswIW30mRF0Pf067zrEoy194yqB8/kLHoBYJcOmTgNOJolTpZxFSoXVLA9s6/RdvwVqblmoMhMdRhIH2fYToXB7Vz1bnVJgjDR9nOoUaXUyWEHP6e8d9MBU54h9rze4FAGDqOmJSm1xXjqJjDK8AbjynGAgD4mfzw5rcY3DP7ZkHbSMBB4ivYJR9UdIfyECCYqf76OEizR5JpSmCNP4dvSDb6ytSuvyc9Rhz3FnY4fHiMJtp3+xhBBoQVZuKEUtBOfxI0jJhmdMBvWDzaszd47yGAkBat4FLHH4RHGzQT4r6dDN0z/hvEPQ46kNI0u78gDO3Fn1zWy/PqozkXDTr8XDMi8oIfsk5nox4TMrBIPVNTAhDVGs5RJwK6MPhwIQl1WG97YZlIqtPR1CpVHHs1SkOA7d7Jan3EKpBdtu5dZSJKlBigDQoIfNSGJWhTFcCvtzZWa24YH15IGrKxE/E6P6Rx9gUknLGNzghj4FgPyhpHN9X9PvrnCSBvZCmztZyK",
+    "OD9m2nYA7+8gxSOXjE6UioLwYa9kei8BvsodQAG8V/y3+E3clbIQp4DTYgW2B72Z/McBjF0COTJaf06LkbFFnqcgqcVp0u/NAGsjiZrYWhi5/NYff1sK0RYQfddQ9xP6chh6likUEmtnGklywLhgRhmeK2k1YyaRWlbomCklrp8j9VCFyB8ZkapZXJzhsDV/YGpftqWnFhukuo1MyvVIxJRtW/Tpgw4zyLgt4wPVHmAebwerWvB4gxEGPSUJqxjh67YKcDWkwCAe3xeUXATZ+KSn/c/EZoKi4kQe9eoYw8Xg2Ll6M6EC85CIYkcQ9SgGXcaoy8F3THtwsW4nUd+h3GNpFZBGb4+US2SsHeDj+tqmuGUkV83/AGYyoIu5ORIrh58wPRy1uasjJTd716HktbUmVNOe9uuuV7/B9/iabd6wAjMwbBZv/Lnm1c0Yjsswlyl1ESnVaZg1HwzdwseiOaTVPr+XIFBASqBdlpd7Q0f6jFDOVWWsQI7EmMrSnaMrXZBvMt5IIuMdT54ui7XAWGGko5s+WaSY8GnejuH5EbpnR1rBe1S1iZTmd6C1JMLBM/VLdY3On2ncqAGaPb6x6aM5D2GtBXNSAa2MkjyBWPtoJ734w9Hg/R9LNIb3uUQ7bsGfT9apjMpheJakY6TRWXL+JEnSPWJ+ChFLgoNkbNjA/WeQr4c02lhoS0/PH3FNQPpDlibZrkFg13GMO3XREmhj/ISh0qcTycQZlkjxpo9I3i5cc3u/UVSaqI1zXkH8BY41zdEYV/OXi1B8WX+9dlKeg4INuXO/",
+    "7p+7KaXEuQx/TGvbThQmYTwvfoZR+vARp+MnqkdvqF6DS0cM6NIqZbwR0qtQIrnwpPmMV6XkxAuEW4zgU2o33vPjfX5UJlk1DG7fvP0ofvjxza14c/vx9vXH2zeTCcp46E4a3r77ePuT+PDxx/c0v4Lot8qL0M7zRLnOEbwYyx6eXBRkcZWhJ07ifBxD03YAjfV7rFUi6Rr2Q1MwMPsIMLvF+d3HSSswurvWiInR6D2sKGdDNd72k2I1U5qxZv9TTJYvBFzPxCCOwnobLYzEPo/lLDiuAlui+Wuar3cU8EHGVOaHuy2VN0tJirU6bCDhEkPIgI7bPJVjMh0Y7qqQEyGYgWHRqQILXkanIbcf8H73WKzgKuh9Io9DmMsDrfB6pTmfTPuCaMSc5+SXi0eGhiGh8BxEO68R6DhByZ4kF7kWjP39fJotTAmZq2ZLSDs37gnblfiW+0ciYtEXSqwPJcQ1FZU+8C/oWFLhsqlYuQwBAULdgwS10pAwv0Xp4mMxhetEJoFWWHfOgS91Bgy+kllFfSiQLov8UIGiMONSuXFDXkLXBKifyVStzue5qidFZlInWwnJm67z+CZrkRE4e8HJCCz7RjDarIL/Ota3bBK+fDwTmRGKlcK9ugKhT82Q8mWlkCbkAKe9tZb1MWZe2bqPMwsedDbY0GrGgTBeFpD9a7rXzkarlkWsJ7XH2rNTDdAVA68UZ3fqzGODiL0eHWRw1iIOGDph4fIY9FZKTPnmAYTiIZiKKEUBOKFpL9Jo7Zca2+rorkcAHYWU2rrX9rOxHyrbbTXd",
+    "Bh3Lm0Je2y7/9LyT0u02ixW1WTi0r2S5XG8P2U51dVcYn7VyioP85FPiDFo5FftEYYWMDIubwHfEGp8RHoB9wjksrUT6prQyrCd7XlM4PVSeQnS/YtpZaL5ML6hO6PPkSnzAh+BN2fxSvVHLLfYNppHaAoExmgZbjsaMZXniQWkVLHof2koBgmzUcC+rPrSqEC3QVIToVIuwt8jpa9vjGODbkXpycjeBZGxDld+KW/Oo4XMqNlGaihUeVQLRasdZ6/BZu0dx0KAbzc+LvVDl9Anap+gcL/1/VjptLP+lWnf2HR1q9wj/ok/h3xVJDQkNYsyBGXUSHgpsfMSkr5SrQ4JbyiBkA0kriAUjDK0yoY5R0V9HrPbY/mCC+gl8DR7XY8fX8DZhWVM+L1Oa2vVoEBxdHS9UcJfgBKCf3r2bOWd7LtP6Qbe9IYTaMNv25YkHJloGrAZfiTH8J+LD1Gnw0D1xsXygUZgUH8QxSnfKdnGYfuEo0xPXQIQSo+8JZP8HMU4QXsAGQyGEpHw+iQ9J/DClpCvAzX3z8du/3mDorbg9jTpKajyGNGSaR8gYMiQYT0/ckBlOxEccdJrPVzLNjyy/ertqj8bz7znQIkp1I9wVrAfLGsUIv5SIKNofbIZHP4f5BX4vJTioE218P4VFbJEI8Vim4CDBHsWx4M/ozmD0C85AGPthJo+I81TPAXuBUMakNs1eOGrMBUKeKuoP4J2ApzyiN4iO0YnW3oAJIgwQNJ/U10Q7ggroCjRMfr2NMjwv3EexROOkkpiOC5V0mvXlg4TMVK0h",
+    "qq7wBJHO/4jcoFAlJlcVgFJSZq80cwMR3UVA/1UJaLJUsBiwreHiw2SwfPPz8ru3399SawIxPxhwrZPuFMzEr7+jkaIz8PGN+JXIZEn3O801XGtO9ripGS1j3ZVu80KkBrIWMs+BrcFqWIJkCWERTC1mjjgbeYC4lHon2LBTWdaJ7AvMa7B/aGG7JwvqKPWyAKctqdEpRxcPJkErTSC4XUYDHjfaf3QzHLWFUd9UExwv0m668DwW50/w70Q38sJMk+PDFxA8L5vTBn9S0sm+LWU6Sdx8miy49QOSWV0Xfm4KNQegbqkNP3UwTJvLkR7Mj7KVODZ7vRhx29RWu+lHqrDdp/3XXc3KzfOsR4Mlc/MEhA3RHdZ9de8kkBPQiEBCFfbPgcTFWG8qwTwB6nEotqDZKHXGrL6i6gOOGdNoe+TIY1uRbqFhR+bxwm0Rsk1A6LrjQV9VqeXtGu3eEBVp3W70e+vX+G2WfnXhwuNAT0GeNwTah4h7scJaB3Bm/2LWakyh75ZRoBjpaQjmaUTmxDnphW8mVR87KNzlVIul4RfThddfr+2fqhBgO/vXKrAbEZCOnBbchICV851zO8LF48bBA8RlJNAL1LgYQ/NL5QQwT8ILgHaghSjhm74SuzkegNOsBdIWRsge7cKOGwcAL9PYdWLGO9VQ7mSFCFyjYmN9PgtrHtFNMMdkwHydBrA3ocU0bqs7MKOz2GAaPuIHB9Kvvw9Mre26UdlgmdfdoVbsG0UOJDHFMEDlRlVfV+6JBsZ6edV1R9o4+NDsRlN+1VEh6pLZjqqh",
+    "bSSrqTTHXWhy2yHtSu3YPnoYXiPfxtTqgOLid8rAWssXFUH0y7Sp5Yozgy662UyhWUj1YniXrrrEE1yZu4EQgZBxpJC1DiHNJUSMHyh48UhsNQAj0M7eFDrIfhbrqxi7kRZNvXWvzbUhCj3dC428oN/sWZPXG/8/kYHXrtrcaXQdy+bXezxFclToUUlLNh1vv7EyA6z++mX7GLwhMOgZIRQtonXFV7tMYAfR6h3E5XVQdq6C+YiyYkJ3tjGp99DL35zVqPPMxD1lGMdD/p2kdTSqQ26BwaWzL8ssW9Bwr4LyVmAoBE+NOU0j5fKufqIS6Dt2GLdYbx87HtKJYEM3NHBCFlfbqfQHrKZZphuboBvUHCttaiaU6zgNjlWrkEgzpoNzXSXPYlJFePRiYUA673J7fWyTkL3EUGez5dpNijBJg4mvRPR8RdmNIXxINxGi9VZgkjQZ9LdtUI8V7mFF/0baM6/gb8eGeD83tCE+VrfIdlbUEXovmLFuebOIOH1eaPisHzM2z5zcj2jYhIyQyw9ranWGXtZgwrruBqBVi1M7egsbTcsmelmVFxioQMIdz97Vcc+VeJ+rapyXEHro7ngMf3HJlNv5IT2l+xLcx0CGnl5CyozcMvdM6uspeAqXJWor41e06X1UKJPpdXuKSUNoEpjTDMVFTueOFSTUgEwBOf5dzhVs3hbD8Hhgb5bMafv2ZgF9o/5TiHUWZy6YbMrPvVqyKedu0/yn3y6BjU2UrICp0SEluMj8647Lnt4OPLC4iflLsqKw/uWi4/KGhkvDxOc/5IrL",
+    "eSCXXA6Zs1vR6FE3ksPQrkHL30aazv1TM+ub2lccSZxa9pKgY0QIvOs4ImYZ1NjS3HONjkRf5IN3513zeU7LMY5ApmNYbbmNxgdXWOXGy9dL0g8OELB5RscYqLCqVobuAMxLPOrFXneU4gSBP/s5Qp0muangruN0veglXUfy2IFC0UChaKOgRx0tIUX3Dwh4khOfYfmKJ6oDRAflybmq3G+8fVKZ3wdgAFg5odtVre3qW8cQ5Fb2zrF+gXsrIz70X3OC4Hs+Vgu+ljTV9tQr274SXP/li0t0uMBBSl1W1rCGaVThygNdz1d8CyGpwhFBeNAQ4hKbQvQ1NHtPCivW/IUx+m2c/DZ+0HiZw6NNGt25NQ8giHNL6on3nPnCk6LbTgn9+9C8OKTfF/kaH3m9D+Og+5qOf32orbKMe+Tsg+M4lITHbwvhrIsuCyFde68KAZRLGwAPZ+8JGUC98RVTckZEPl+V0nkWm2D2s+3K1GWnJIh0lmt3DyGr0RGDrZ+JkWuhF1JA00kCB5TuIo19kN5Wk+BMMGcaRa8Hvs2vK88XWQ0ThV0U+vHU5hG/jYjMQUvCv9hyxEMmobZRzIcWCAbDLHVY4ZHRU07TmJu73irjE8/W/PJXzcJzVbC2MzLFOScZd5yPTW2JyBih9ksEcO1ZrH+G51msjSi9uf4tCKqxARTLTKvozXTNDjSStM6asONvasFTOum1Prvh2v3igIOKJ76q/etJHa5GYTC8cGDs5Alfqeg8Ws+pR0AiMMuVfE95Db48Bk8NorfBX4gCt5LgMQE6b6xO",
+    "7CBWouzBO+HQRxvzTmx2gMsurEUEX2qaHGnPxb11fq/BTWFvCx4x1T+IRbUHk0/s8/iQylf63ez4TNpf4QVrzhPQTdyl+Qow0EbP/WkW/rkrp9w8xxGMQCD0oJ/JKe7da9Z6o7/aBUEKzNC/HjKqn+KZjX5OPxlWjxRHM4C/IlY/X5vHa+9pVJnHkOw7zwvzuHCecuKtR/RPktWjdCFFD+rfKatX7usx/ukyd8wOOE/jjX4ab9ynB/P04DzFfnT9nH4ErR6hmpAeos/OGIfYepC/8Ojvg/8DWoXc7Q==",
+)
+
+TEXTB64 = (
+    "eNrVG2tv48bxu37FhvcI2aNpy0ALVHc6oLlckCKpc8g1QVtZEFbkSqJNkcwuZdlN8987M7skd/nQ+XJpixqJT9rHzOy8Z3b9hJUHtbvbrypxX0Xlw+QJe/fD+6/Zj39hOHKuKin4nsXFfs/zRM3YTvAkZBVPM+afbYKQHeOQbaUoQ3YoSyFDpkQSAZhvC56IhK0fDAZW5GyTSlWxgxKs2MB3+ietVAOe+UoIsz5affunf/w9iCaTdF8WsmKFmgDYnO+FYutCyuII4Dey2LNqV28CSFIgzgyw+8FkdfX27Zfv2Zz53ru0FF/yinsh81bvK5nm22/TXHwP5xGSBt98/cPVN/gpPkgp8mp1t/fCCWt+vFWVxrdqtVe0XH/hSWJ9S9LNxgsmk0Rs2KrkUolVBkhgmdwqH3+FDOb4Iavm04tgRtCfsMVZzq6W8M8Gfm3STCwZO3vN/DxkmyLLimPISl7tAlqew3EMDPquV8DgVzxTgoZwMQxcAYvpewpfLujTcQfQ4fsrlomcCDJE4A+HZSBwGl6ky6CZSDc4N2feWe4xEBQAeMGmw0BqEtO88ltgL6bLIIKvaekHgbMWQM3ZpTMUF3mV5gcxgH/juZiaw/9VWutFhjsAH5eVOqbVzvfOvIAo54vpbBmlKkm3aeWP0E2LAgucEu5Cw2A+cU4xpa9SVAeZs47stE7E+2SFFmRUIc3LQ7VKQCsbVcDZRh+MKgAfi1IBYJ6A1jK+qYRkV4w0S1NZyYeWQMC8CmsSh7VQ7xL3sSgr9pb+SYu8BWHO4CE1MzBYvhUD",
+    "lF3nHu0oDhVgWiz7pIAYkA6XeRIWFyVoDk6B7UjvFKslyaTmU4QbV5KM1g8QfjvHUsXyoiK1J0CsZ+e+Z+FyKNXKJImpAJNJd8ocBvUdThuw13OW91fgzxqIu+3NwKaIg3/MEx8xtERs0pxnWYcQpIzJKM4KJXzXXLTMZsBWpXri8qKbItUUPlLAb4pDluSfVyQQhlJFoWr/hU5+hUNGUHmjpO+FuGVrHt8euQSvTU747XdfId+0F2XrrAB/yA5gyBmYFakf4+Cb4+JOSIwQhqM5ewW+qU8YONVCoQVXhD1Y/EGrl0r/KVB/huYM0kYV86zxe2WB47hZu0HwCa4OrtE/wFFaSrSrxI2vbQKJiEqUaFv6rKjkuKoZIN2DIddlwJKzOW11lS6CmHfrw7Qr6DUg2ESo6T7u6UzSSaM0V0JW/kXI1u48nBz80TqKC5CAv/ZAqB2vu8E1r4eUuFVgMioAU+uVxlp7HNAO9EZzWhaBZmtPayEDJPWyFo0Biv8sZmfTpQlY4KhrUKrMUofohg4Y0ZTQevBFtZcex/TC7LNdM2FJRFwkYF2h1gpL5UlZfe1jbK3/RoDUizx7oIQj45DK1JpdYIDSuZLW7FtBGmIU8ZSeT3qehxC3KxHUsO8wDgkXBH1Z0r6yKP2LYDLgJGiXY+kUrfy7vY4dIWoshigINnc8g6xn/vuLNmX5Aqx/K0G9EnZTrMEfwW7yH8TOELDppK1m1/qhQg9Ax4C8TaV5LAwotIxqB7C2OwYpnK8KZCZgBVhCKfBbbCsqXCOANvTwCBCSBFVk",
+    "ItD8Tg7oFZoEzThNRKZ1dG0YrY0akwUnSFnpmw+gQhtS0Lf/h1RkSZtejeYtDlWQKfoWWIe1J4LSKYd32sd/DKXAA0L0CqXhgngCNB3ymFcgtnMmiwo/zRglVwy9ec/N1U63GeuJwUb5uo/yMe75Q/7TdeGvCNdIxG49bevRibQz4/5tv95OBIPQ0NZBRdfDuMYzhJp54LDQqNfD0GtWolsbXHADhzGLIgnJRTLk/S1ab9hnc3Y2HacWKjHFH3wDczG7WTauMxjd1Eq83nfzAlLqwfUDKmoNNWkz+qjxtJkK0n4ZNZgc22n5J2fIiLjOkEeIqKNPNzNGNelnxzChCeyLxMV5BhCEgPSLN3lbB85IakwFXJtRp4qSvFF0Vh5o7apTwsXF8r+Urg96xx6dJngjaW6aNZRnfyDXHs23IcEOa8c8kCZ/Uu6tbQ4At10Iv0lyTLmLEoQ1FgMtBed7JIuUBHXEg1KdCtDGQ6QJzINZQ0BaQez2cUc4lgTgKS1DN97AW/z8y1KHAIgKP//iRZDB7CE8AfCQSAicpAMY1lryMR6342MMlpOh+RzxV2wVwabnMbPrXihFQGHQx4N4KBixNQhaPrB4d8hv1UumygKyBKPwyDFURl2xYOcJgesMYpPxLYYuE6G6LRTM0DimZ0j6QMvEbZYMth6oWYLZRMfbaszg0ant8Niug3EgtLld1pwigyoOB3R+OmfHAis1qFp1IlaH6DRf4YzTPaLMto3VHy7oNa9hS91jI0uYawUy7mWOOVcQpZDyrPR6P3D7NcOeYQST7b9G",
+    "QKqxvdYqlOoapaonO90gzarhgKz5errIwr4UbTUlTdCrwY7GGWsh4GfKHRazKfaoVMlj0e1RacBQSU7JXnBfnc1BKIhloZTOj/FEbI0ZOtiDSxfpAtB+dOlpdEETcaY7ZYYK9/RGRWjNp7UatBlz7aB1EYRmgz2lpsbMxZEmVJVClUH8Vo0RmMoCDQyp+swUfC0Bjaimk367CiCAraAKaEuyOzVo2NrZNA7YO55YS3y11sYn1mqyXS/pMauBA27ba3sx2GGvY9s9VFdGKRzbPNG+AmrkPSTKXMY7XUT2lUonXTg5GQyYI4HSCZCNj0d6x738e6qUFYOIEe9ANv5W5ELyqpABg+ov49jgBBe6NYKF6lDQbUIJDkaxmOcGkC5C1mKDbX/U+uOuwP42OfsdFAxrIXRFbRpO+ipBCtuFuh7dLcwdBst70BspwOD3JcZ7am1fLHsFOeWP2A+6HGl80sbp8n/U+/wIUy2FxMAedRoofXXEq5kz+MHbH/oA3/Hj4izFOA4BXMUyBazwuf4YRVGTpz/BSpeGZ2wBiYlchPh7uVTnUsB/ZXa+2C7Zv9zJhPbh5xn8ewXTT+F/3GEO5OPOGXuOAZA0gzQuZNfTKLr+I4xiC6OEZOIJHQ65+O4BnA/qDFMPecXvdcfh3Xfv//w39sX3b2dmCzUz/SiCOv7aZ9eBhkxwMoxI4MugroD8DfRbgBWAWqvza//+Oji/np4jIp4zISXYrH+UsAOm/Xua1NT8dChgkNfMopL4KZq20hkPzYNfQS5//jT5nG2Y7z1NPALN7rhM",
+    "+ToTCOs9Qajbr6S6CSvyWLw0rtFc8tU9GKoRwCxYle4hOdIOCNCsdBRDk8ZbrCzdt+WXuK/YoWRVQVaY01cAHfMScNFautDCdegREnFvrjE0HMsvO42a+qLKvmCKMQfC+ynb7HAQ9l5f9++nlM6+9CUUriKUrqEh6hdm5tfcTmn0A4Db/DfURE06KOPd4B0ST8GEf+TZQbxFHfG9AzaL9uCTMeHGnN4wrpUOqrovG5GgXuAQBO89qCGyH1yXOqydUf85TlxvX128BkWmL88HpDF2gSi7cpGPl4sMBmXgPfcoXDXiwgHyaDA0S19cLj9aQDXkazqnZ9FVgx6RQqd4ITajtyEbaDiNio2jOPaSvJEx7xQYTAE5P+zX2Ev2nnoh2FVjhBLqLnAA7T1tNzylPR3WLHnq9Z02wm5V7MTmc2sz5OghSbdj4AgnxKVBF48V/2AztjEndd8ptTTkpov8ZvDW9ablNjWjXrO0dzK6SQbZ3ywB240tGWQcEtBKpyZNe01XRHAgfgkMLyFg3VOHOgt1MhkMcB+XN4zRQieYITP9dH7pXLFD1Tftt1lqLmhyNCvocy2M0BIGUjeMkuThlpiXiKxfIfU9xxrqXQQmlDLSLPBqoiZjhnZWHwFngKjEttb53D5CTzoNXz18CKElon9fBB2wasA5d6HqWNGSVxPXKOtNR1ktDl2GdjjRNKKMR7bc9JbX1bNBfjNzfJmeRflCFPbxhtLbesFj2K93otemT8FoRokW1Uyir57bvh1+nbgowAT/sPbhfyDMC1Dt35hkBpJsvBi9",
+    "vmJ8y9Nc6RsUk8jshBSjtwnYdH+UhtlB5Rlk9M9U4LFnOgELmd1C6ukNPqdBgyTKL1pOo8psjYM2yj8UF2/z4pjXT4iIyUapLLewA7FrF52H5JJDKhaN8NBXKmQLh6SoduX5gK7nSBPONyaPzn7EISMC21nhWqcEs72FRatOq6GIUm2d94R9Bx6FYkkBNUZR3HJ6jgFZJaBmyALV3kriOl3v8LhK77AduKD2zpL9jqwOgZOCwKHTBF0VUTeltPoSuJxvxUDvBxMCzG0hdLftxnscxYTPTytt+dakcxWkAwNuGO3v0AnnuMbtxJxCohE1YaTTojDoejdg9DaAGNXcXPcbOOsieTDL6K7aXJuTRjaFsuW5BCZndivNLs1vw9MxCL2KgEwBC2GhRTT4BkWHmT7v6p8dycl5D+W+i7p8zP7WbKZkNMgKYzQjYEnVFrfLj6ZqwAQvuwbY/WmwoYghlvDLwaX9knoUCOhje+bLR5xZ/Wb8MwyA1Y+n1R9gl37gdokvDfJgMnIxOYqllzZbG5u8YHhrq/qjAh6+9DQGZkKXtgbNKSsv6xzAIBtrYBFI3TuzzRWHf4O+Fkh1rK2l7wAxzRHNm7nhFohzK5jmK4qcjt9QpmRv2pT/uRedaUemFj0Dbyr1HvGoV6DmEHbXs30MOvAIdOriQlkbECfh8l/7UNPFgYWY3xy+bsXTc4teaCfh9gMk+mwUWacSCcj9q5iaNxrZcM+8k2zVhR3p0zOFCv2Mif+jR5afcgVqhFMLpLd1IFWq7xLO0lnd0gKvWBBzomoPIRcy",
+    "JBDBkZeYy6S6iQwT+EwB9QS8Bq4b6Py2D1IIjnccfI5iN+BHUzn37Qq1/jrPunqZfaEiKfbFnb5hDh759Me9sUYQeC+rD9DC+YAOnqAFAP0qUk6oddt71+kw/UVB3Wf+yCuP9jojIjDGtX+a+9eQRgJAz07cHMu9WKjV2D7imAWaSob+pqG8a0qCN3AQ08m1/syCVBWvtrEq2hfJIRMvDTZzMWgqpQr7w7pMwIc626xYQ/yp2QSMpZcEqMr0RxTtQbYLnMFEZCsqXoFbL+/Mpb99tJ+bDfSM3Js1r9/bP6qgVwpmBj9aM8fYjB9jaxQvHsw4/dFJO0OMNFP6L1HaOVA1MwOf9Pgvk38DU/rjtA==",
+)
+
+NETB64 = (
+    "eNq1W3tz28YR/x+f4gqPJkBNQZKdtBm6Ske1ldpT+TGW0rRlOBiQOIqwQADFgaI1mXz3/nbvDi8CtNKmnLFM4O729va9e8snotiq9f0mzGQVFA/OE/Hhh+vX4u9vBV7s8vJOLPPNJspiNRVqGWW7ZJVM8C7L5LKaiGSFr6vkdiJ2txLP66oqVBVVAQBd5VEsY7F4MFuIPBOrpFSV2Cop8hWe+b+kUvUmwlNSmvlBeHXxr3/6E4BSuajWskZpk8fbVIpEAUT6IJJNkZcVttqtZQZwNBAtq22UYjCTElgEjqNniSrZSMepyoepI/Axbw1kR35eyqISl/xfkmd6kt33XLwDzvurVb68k5Vd/IZfXpZlXnZmbfU0ESm7ACfLoo1UYpFj9g4nWJX5ho9qSLbMS0kUTEFLz3fCd5eXr66Bh+eGL1//8O5v7kS4YZUs71S4Ua2HOFmt+FHJFIzSI+tSRrFyfccJf/zr5U348fLVm4+XL28I4HPz7ubN28v3P9zgzdmpEKC8KGRp8BU5vkdEFseJ5UosN3FoZcKLylsFeciKbRXGURX55uyrmnrgCpFPv6dPKattmQnXwpj2GZzloNZ9lKTRIpU/ZS6vrIlPn10aZcDVrAt+vLp459mH65uL8M33fmduALlI7qV3U25lM4IVClB4AiHjNUP5tsLIbF6/WOWlSHBOXtQgsodZC0AQFYXMYi+Znc6DWC7zWHq+35k5LHcjcFRVMqwWDEtKECn4lCeZh+m+eAo5wRtiAp1DptA719Wrxne0sF7m2zTOvqpY7y2JVUB8",
+    "qNlvDMH/wn0D4nHML8okqzz3MqsgldfXb15NhTmPUkkMTjEKhn+dySRgotjV8+m52PVWdDholkdVJTcgUXYrqtxavoDI4P/GYsgjlqJ0nonBsplC1itQqZSF980+91+u5fKutsmM4yN5ra0VTmdYni+qCDIexXEpleqw3IL/X3huYfyfNZ480bbW7BrxPcJ5HW2Dyrz5EDQf4UKRNCgonXjan/zu8ubtxfXfzOzW5DNMZpXsr/nrxc3ljxf/3F/xrLEzv1pL4X/BDIj6KlrCr5ZiydKgHrIq+qy19ok4xoddNX9jnobbMg1VkSaVh2+GiU/Yk8/UfHpyss5VNZuSC5vPToqoWs/F8XfCY1f/Z7h8DE8EDeMvRn0rBYAW4FxlpXZJtfZcXgB4rt+cokohQhAxMrKkDBNaNft2qukg0xEwB6B8H8HKaTB/rMGotgxGCczg36N0K1nqPZeDCANWIAoRFlOCooyaJ4BNWwSrBCbYPTGvzelxbvLKNAGuFoNEACw5F8dn2u7y2GyazDWms2Q6N1aKYoNz8fXXz2kNjqLnf3tq6ehOXfI3tFNzCrMvFtK3oNQMxNSJOGvk28AmO1bot0ZsmGJ9zmkdD3dlVISY4JkpfjfWUalFbB0pGMcSpirFoZeILioZAkS0TSvyDJX8XIFNJE0vPzxUa8QNPenFymB4necHjIeOPAgVJct7WYaEEQVN54ya0wP2qDVWD17f3HwQyzSRGbzPHWzqcZTCKoMieQqdfPXuWiwjaJHWFUTGeZqSG0jzvECkulsnsFgVpFbEuVYq",
+    "I0Tr7eJEa/QLwcZafPMCczLpA1cEv4BFsS/tf3IWnFmnAv3maIuwBM9UhXCNAuQIYaFUaztNeCSjQOJuC6Y+ERJHfNCeQVy0Yd3mFFpGMAKVjp/5YCzteQYbQYH3Io8fiJFiIWUGYBQi2umINV5AH8A5OrWWYkkqMxEyKgFlmeaka1kuUpndQvX1GwXIlAB8SApoMA4KWtziLaGtg1DxKV8g6IclL7eZJl1U8Z4KbOKzTGzQT0hTDkDfG5ZoWJI8Ftk8AEegzEer8i0mUDJA7FnnaUzYhymEApTTR0wFPzIVdGgtSK2VQQ+Sw6eNcLTjvPADJyRehW9eXV1SrHyKj9BmckPHEkmcakSxb4sB8H93sNtm9YfLj+Hr99cUWz8zq3lds0BPZxnwFA5BVGiU1Ddw3l78w2Ly9UE4OQQDOZATgmzhzc2VRV3jbpAna5Sn90DcOHvCmmkcI09giTkXP//C872e2fDJEcw80jewqwLpNhPGJVQJSIuUxJ87YZwpC4Jg9JZ7tO2kxiKMKlrmhKRKISkRL7ZRonKn4hTGhtWoeajKpH5iEYz5oR9Eu0AlXCc1FHrcJMpA+sVxlmkEAoTv8iscSZs9NomhJCELQ2Sn6crfc8L0tj35c1KZuRPxe7jw/RXspUBfFsNzuyMiE22CWao9MllmKbk+LcMNqBaJZjQV0QayNgPB0LNNbb3yTj6Qp2qLFadAOcXCdSrp+aPbgn40E7QLoLce4DX+hpyCzr8pkKPYjxW1lZR62GhCkxAd+eJPwspmN+FpH61hmjlge6IhJ8E7",
+    "nTujyw2TWwBI6nAM7SroIPQiyVZ5mzKAOTtGFEdiSwfaZjFUk8wOkWScREScGQgzJ0pr+caxO86K3lpmk8CSt7KS1Yl3QdKVJWgv31wFemkr4O28GQ8eC4i52R1USrF7HfddGGvW8ocm+6/WsNEFfKBiL0EReu05tOGPhZeXBo4q8ju8r3Kf6hds2tkZT4UExSghix6oVgMn8BX9LeHDYG/lDsD/vaVAS6d1XL8ggdPfvDq8NCNjOYbWsCFy1mELA4AZoDO1w0mmEAkHTwho2Oum60VQytsEDrrUUQbP+/D+6urNO39IPhcwo16hIZ3up+08bKCYYyL0noiZ+XdKkvjIhICiaMNaMt6h1dFxO0KmlYwsz9/X6WHLwMDYw/LyLvFIlkEW8gFYyhNw9qJHRLBizzDwGrYLjcMlC0LS3xPVATLTvuN2xDiGASvSVsE+PXXFr6EnFQtAn4loKeygDbCz+b2MW4t64PYnTA+Y5CoHFfBepwdUjbqj7CCFNHoMskWeJyIu8wIyUyQllBNOjPyk4dtOcswEVZT1AlL6/XLXkjZg2LO7+fSLPFwije2ycJ9htJEtZy17pbBOtvYrOdni5hI6Q8iczTv+iXbuORtzMhycBrslPaY2tkGA69FoA2sfz1imNTBnVLNIpWsjRmB5li++Oxe9OBGk1/vXQzb0Gw4CRuhyQLobLC0zPK275K70ZHMg7cx4alt8lykyAe+AGhwW0H0JYztx5//WAmDDKl1b64exejfVxAMmgxwoCioY6Irykxx2oFMy73hhs9FQGNaRRmDS",
+    "M50kLnsZ+BdMv9oLBIZYYSMTJnEbowkbOZ8zguhhIdlb22xggywi7hZPtFzoGLUJzPXmKyJisInu5ApGxnPLha6F1E4X/taOYoTTLOX0bbgNxP+C7NQGJh8lQooM0zllpQiEgomXVC7IquMrTkDB7vU2gzGdkPIAvyTVkUlggNCyJKtyzzf7KXFqU0+d7orVlq6NOEttxUAmT0aOaCDp5LNO9fpp9kQYliA8WtElDkdPZI51dtxkC0nWyhZqHzAxKXXrRGx+WkzHgkBH8/jbfc2i3H1FjFl1X+kdxLnZqj+4quohY6r4Wyu2Z+4dn3UXGnzJWuhvfYzZxfB/5Nk9Ox8M29/C7y6mGoqt8TkNDTP5uQoZTj9B4/LDuaFAQEylN15HB1vHhVvV5aqPV9+LaFWZaL8o5X2Sb5U+0VdKULm7o1df3KdNUyrH0XCgi3YL94VLAV6ADDpBkDQRZ384hGBnY+3LKehjxCsoaErlkG1hpXGRRtkdI7hnKNcHUW5hQOxYE4fWZKiB8U/lT5k7EQuqbg8Ya/osAPKuYVKteVrQF9s2m+wh404k37IKp3tTrdiQDDUE+tMegXisLSF7Qegh8jYQVtBTtR4gzyiGIyAPgDsM6jsyVd3TcvzQJSVHjl2+Mtk3cpOXD/eJ3PGC2bQGMz8U0wyBovVOTzqy6ThZvxulqjEGTa62N6Pv2LpV/PfXpoTfssQmEz2izoMK0S6XKl1x1CDk/2b8GOAsDx2fi8wZ0KFmhk1q2rL8aNEzeGWNdsWgR9Y3fuATiEtUQHYdPXi6ZaCf",
+    "v/EeHd72MmGuFdS21iDT2+pLCjxoxjlV7UMYic8577Iub2K8nPl/dUiAbfTbW1AfqBnuHqdmzv6RRs9waD9TlePShjd4/VKXYKgqSk0CmMJRDvxNQoUKDod8KvLvl5qbAguFWk6T/RWYl+jxjYwyCl3JweqaaaxL4Fhv7xjoVB6iWq6l+0G7ZNiPmk3U9m9uR6ElR6q+0iD/8JourPCSvv8A3I4vbvmmRbe2sAdpU859WZ+mfRtD83guNNgjMpmQ2A9kpjspnJ4fbAobNvUK94oaXD/mGKUdbTjtAoYeXNmpHOuMZhDOaA9IL/ZViDKj/XKTTS140ANRH5MTq2BXJpXk6cTut8myzPVFm7i5urZdRp0l9kZ81ONb0eeJ019td11/eD/9xUQ8ROuJeNadCtGlxrJY1rM5f6Ngqb5P765Yx6W+WRiLiAYDnv9frLNX5IDKTsQ93dHWbT9BEZVVQgSjy9p9BOhMszsbCgZpvpPIryn3vrcvncc1DQ2m/eaMWqYHkmyT1NkblX386Ho2yXo2r8kKD8BvYPPVjd+pPxKNcHKukbSEivrW3JoK/TIVL/zdubny4TYnsn8IuRauNUSuVly9B6Y2hqUxPnUe1EGB00o91Ea2zm5c81VfztcrEYFnagVrx+YpyW5HzlBvytmAuT4dTrNsrGD35hN17JUJCIzTAC7GWXhfzCeNY+LiCuHfbgGBH2IoMHGKRZbCbZ0rPzs9pSs7Tsi/0rfI2CRPcUq6bS1lnJRUFQjqKmVIZAJtbqXX7z58Ks76zRx930iWvNun0hKf",
+    "5tCcpZ9/yc82PMiX3M7YYb196XZiXDZMZA+en55NxPPTZ/TnOf35I/351hf6Ul6v7Uo+YRXoCI3tNBFe9QsIRCPd4/oZ9icv+iprQXd6YU6GDFLrVO4RtbHgz1F8pNiD6i4ct9Nqwu/cLqEskK4FAOGpJmDGnIOGwRINCgppGaeIc8C9cIfGUUyYE6yBi5NYVz5666o8F5soe2gE0bWSTs0GIVl/5dHqWtiv+fqahLdICiTTLEosbqShOSfQECbSxwXf2nKFCOoQ6dYL50sR94YcQS8L0w1A8Pq0L5mtoYa3EX9G/GU6Dudl47nZsMOyWDzV+Ctvcz+bZj2P+wl7molByY1Q2iv2d/1EXD8+29+XpJxrJUlmAc2mn56eNX2xJkRgsLPp8dl82OM+JDKNNSjdY7c3qyGr3Qj7TOdt+TQD3R00ZHtKi5a2Y0lGPeWtDIvob1PUukOSRGysO/KJ7naZHb8XVAKdk0pNTe8EVWzoJfWKkRYqzYkT5VM4Euc7HcaTfDpNb3LtCLRy1o9JfUmkJSgx5QJCrGU1Ig63Sn49S7p3JRG7zOP3Lhu3hAz1MJAGmwbU0364lpBsPTtsNPQZmtpa0lT4dSvgeE8p0XUqtiq6lQM0rntJT4fu1MoeT2lOxyUOFuCpk38UkWW7LxOZkXekfJPFAOBEyPoOiAg3dqo9c+X893ame3PYtTF0XZBD5qlvHPHKjqr2ON1u+ujQ+hHm6LBJGo+jdybPGbJInUu67NezCZzRdV5bLzI8QkjBYB+j+OZc/G4kfNMo/u68PWkMJbWm",
+    "Pkt2L0fc/9dDjWFN2pAM4ykZ2kSfPQQo7UvZlrTjULb9oE+GaVMxg23G9w3JbCz+clLLLcuG2X2jzFfxe3FGLWUnJ4L6tmojaH8JNG4I7Qwo6nK+34B50ur2s11+L8Tx0vYY2psWS37aR9dHrQk6nfvagC3d/r28ubccvbZ8PLz6Vq0NkkFQF815q3hYX4UyCr0qAU0218z2Crndx14bJL4A3etfr2/hiHE6wdLf9IU/vjZVUd7qKB5ymdQrRb1UvEL3TPFa7gbUa0gOBlVXVbPmLnA+4WeT6tVPOqk0j/YOV3cMTkaBNu1fk/rZ9nNNNMHwyveN7HE7Z3FfS9lLKK6tczU/RWOe00HJqerfHryobwR1ZM4/SBMVtTnp4I5Cids0X0Sp9RvEUeq8Y6byT7Mart6anrxzcgBc/inuJzzbWGP2Q7rdtLEhnd65NjCXBdQleFWgewXbpSUy2vTWXqlWAY5NYbrkdV5H53+u4dY/vXKnnV9zNdywPDUT7A//mnH7qwozof5BYDODLIwZ5R8JNiPWAphR+6hn/OL8B7yZMEc=",
+)
+
+JOBCTLB64 = (
+    "eNrNV22P4zQQ/t5fMcrqUKIt1cIntEeRECxC6DiddBwSlCpyGyf1rWMH22lZLfvfb2by3pflBELQD23il2eemXk8415BVfvdvkzf28026EX1MLuCN+/efg8//wg4BltrgrP6ll78HO6V1nPIizm9lzaTc6hUJf0Ct72yIpMZbB5aTLAGcuV8gNpLsDm+848KHmHLUpjMQ+ylbNcv0ldf//pLspghlhGl9LCxztkDYubOlhB23Urc7iQZ0mgyTmbp67u7b9/CEuJoWzsnTUj3ZTSHKA07J0Xm+dlrKau09FEym2Uyh22ZpUw+Fq5A35Sp6pBmIojkdgb4uWp8g1WD8qeXv69vwdWGx7VCd3wQBa5AT1tLYB37KfIgHQhjkbVjNKS9hIEe0qZRldOE8vAadzVm6eNkqJ2BKOoWEcVhmiKPaD445r66WSf9HC7maWUwHA0rcn8UCWuiZMBq93ShipNTNsesOCy3vcvoJIi9UFpsNAoCY/KgTAEYrhp9VUL/ZqIJFuaaIDqT6MlPrpb9Egzt2AfEYdZ5fkz7FOc7of0YyB95ceRB7TF9Z7LcET5a/sLjBLwY4tqkb0qCjAKTHumsPS2XldYu6Flsra1QbDt7gOiTiE8fKe//pKR/pqHW4b9UEQXijH6aXSnH5Xn5EADRLqQ5o58pzsfKpyffCOhs8o411O+5pKIxlUZETL1VUep3UmtOd6eZH2jlRmqLYQqW66MyWHbENqi9xAo+B/THwmEnDQh/3xVSZbxCtoJ4L55RVMscqTmLyekFRpmi5DYs6Wki9Iv1",
+    "lK2M/DiVLVVPQkeTBHSq4thYPgtJF12qwpS51ZpfcwR4rzJuT5T+Fmihgix9PEo/yiuQ8KMMzXIGKBhZ71WEh82g/qLxaaAlTZZkNhVGA3eNeBA3K5JhJ3NciKqSJouj1ePTGh6f4FP8ihZIuBQhZs4MwtQX1P+SSRYi9Bh9USZmuASueWiIPLXmS5FH7ny8Jke/A6aNnZLpGb5EBir7qgtxcA/DJiSKUUOZTcuF/GMrqwB3/KOsuWRlIzJg9A78rCYoecs+d4Xk+CTPCnDkJW66ZB7V4+vtjpZ0BCjaHLpptEeBzYu/Fda86IKaF/9OSMnCfxZQMn4mnJnUnZ0V2lhTnUL/7cF4vPjhjsNLqCxy4zJX1j6wCTwxFc4zxGGntOwM85EcxQpHfJBVbJaf39wkH3c4qUN3JmPa7Zdf3CTE7B5vhNxhsGhyzWRWQtNjKYVhKhOs/hYZf9aal85hbMk6PtnmrmfrQLWlP7I0i2Mon6Sj2ry2xaZvzghxEmoCu8ZuQV0Dl9hhFxcBSgTll60P3QVfZ1OQRtF8Za72fRP5RmiNjcGarRxd3Q8q7PiijomjXlpr+bKF8txo2gs8BOrWTRMp0OVC2w32nFZ2VI2pklElbu7og3PFimbWtEdi3cP7R7Wf8+rJQXzsN1AD9dFt32Xmwwyd33aG/6AMM3nRjuNflgkSteIBjP/JDPN83Wtn+bmZe5p9AMg47lM=",
+)
+
+XFERB64 = (
+    "eNqtWW1z2kgS/s6v6JPLt9IGk5i8nIszrvLGpDZlB6ccJ3t7Pi81SANMWWiwJMDs3f336+4ZvSFBctnlgw0z0z393k9LB7BYJrPVfPQ0kXFnsWkdwMfPn36GLx9gokIJaSyiBLdAr/BPOpNwM/h4BaGKHnoQS38FpwuRzs7akMgosD86yOVKi0AGMN7YC0BHyDFOUlgmEvQEf/M/lSbg6/lcREECbiKlPd8ZXZ3/81ePWN3irTONlIkKJKiET1h5cZ9EjnWqfR2CS1xT+ZSShMgKZZ7EYi7bMBaJfPMKEl1VApJUbBL429FYpV4PWQEEcqV8CUdn5lI8+/YL/jm/+BVO/dkyejiD07WKAr0+A/q4ZAaPSbc/nwbDCzhN1O8SaViQ5CxnQqRkNEMaiFSUSYlOPtLp2H/ZhZl8wu9WCTTbcgGpBuaENk6RL3MhH5Q/g9K1LAafQoGlIn/azyWcRiSPCENjrgROIcqOBSxmChIpNmA0f95tVnhoOY1FACg4PIepWFCgcHRMYj03FyB3d6qPxsJ/OBo2s7q+zCz3Hxjc3MBpLEWiI6unQi/GJiDoc26JxFjHaaul5gv8DzrJviWbpNVK402vRafs4lhFIvGVasknXy5SeM/LgzjWceXcMjsIIimIUI6ITYVXxnotrXoUXTbifR1LSoAQU8H1WqPhYHDxCfrgOqNEhtJPnTY4KhnNlR/rxSad6cjxWq3RP94NbkZvf/48vMTDr4+7RrUDWIgNsTL+LmLbEvzyfnhx/QtSnEBGYH2pMPNCNZ2hxnJCMpGM5BDk",
+    "sBaUgLgKl5bP7fsPg+vPt8jo+AV+iM88QbejeMsUhEksy2iqViqaYjBa2pvB7c37Aen4OpPB3pOquUT6hLKliIVQYIJdehk7673R25u3o9vzn64GyGiIGd1qBXICI84ElxLFM/6hCOvDVKYiTWM38wwalU+idYnYM66c8GksHpFOed2wAE6HdBlHtG+Yw1/hxdM7+2lZ21MgZEbIburwPT1IxTiUR0GMyYKmxiyiuGbCaajHIoRCo0yYko4oU1Weiv539/k6eUmRN7EmT6Xbff3GK4jYHnheVVaIZFSQnGwRZESuD2dncOzBb6j54OKnk5OX3RdsM7TFMcgQS7Y5UiEvBO2IxQK96vrG2sRzy4QkyZgkIRMXUtDJgs0dCvIbjDMP3OMPI9qJ4Zt5iuXM2ZvoQMe4FJtWRcz4TpIGuNpZxyqVvAfPwPkXJRmdyMvB1vFJiOnrmjO2Mgz4n9JRQbAQSWJvJs4jrE4Y5669/YDaxyRyPSsyZQllXUStKUljheYKOJXagIYZcjOMsizBsjm4ftexnK6jcAMfqEZ85BrxQ4IcArQkBs4yGi8n2AmRmYz0cjqjrrDQWMdjGSoMy43hwks2mVhdrj9ke/MNBUVvV2sRrrHjcyI8Yeka06hiz9KlhqZDv6xVywc6sZyqJEXTWReoqJ2RfLy+uno/LGh2e2NbR94g55Bb3FLUow58rqQBIPTgHywOi1mphFs5Y2Mwtwp9OLb6kGvQoWtpsaQw3kyX0OrXGdo1OtzhcHErCUDsbfBxjccG/diGUmUcI0roF3Vq3BUj",
+    "gx1MhWuVBFKJihAERb50kapN0VnS2DJ686oTSF8HsiqHcwGHARy+OHmCw8SBQzCClCt1m4mtDp4VeiHiRDLkHIl4mrj0p43AUExlnkB3R77BN/f4dW1xxz0QwDQ1hvbadr3N6xTPRfNsQ7kxtktxTNWJv61nhHEVop1QRixFSXVBHsW+Qst36r7iSUGVzHWOfGrhR2vH4yBSWF+Om5nRJ6LyHKVuwZTO33vVpCC3II/jeqWOhcJ0/CLCpWSQ4hqDbVOj3H0g0RpqPePFPkSVHcry+llj2NphlLkP3Wrb0VGqoqUs1Ub2hWhViI6zqOPtWtfbp11W9+suNwHlz4MRoXAbSCpaLNNRKR0OzKiyI6TM0NLL8C4akEcfRiilUaPeNHaEYHN0OyRCzwR5Ic7QiDLMpHAqfaewBkHPOmRxDhNsZ5h3xvaIOkYGpfdhLp7c40w2eP4curbrzRe4y6JiM+zgT8dUjOWEEh2hpYhjsXFNqPwIrzxjPpzagp4xDPfTBKYaqFdhIozVFMah9h8SZjVf0f1yruPNSsm1i6zN3Ugd5rlH2D7/IZ8Wph+Zn5F4GPHM0Yd3AqPTBgFi3/5Wu607hdTQCEZcVA2tvh47X2vlDB0cmjGIzvFqVjae8/UyDKIfUj4FmeXxllbBpDQrUmEMuCZWwsRmu36o6FbRwFSl23i5lZW2y5iWtp31vFlLqrqKFmI4Xu3MGBk/VFbJ/qYFLUKF9ODUrk3vXtxzvblwuARS6Us9WnlVl6KGEHL0JR9tbUzvju+9xjM8IJd6muiOs56W3r3c",
+    "QTTVOmAI8kgi2SgjOcstirbM3d37Nhy/qbPaDzyqWthLnm1h5S2JCtdv135syXSm+YoDfmwy5OGPJ2s74omQomJTGfVmGG9Yy2gUL0OLKjuBY1eAiI/g6ONSyTTctC2RHdQops4vcVtMhYoa2TAwfITTXHmsV6RHlsbNuhRxObSZYqi9nadLZYGyo/FcrRk1EDcbn9ozhW+BkLZ05PL1DM+d8Tkqa82aTezIMV/d9YhoR3BWymElE5eTO9rsZTdiinH8txpZPNvu0Xl5bdzJArTfEKGopd0+LHcTFLJZU+O/yz3+wzGkVCUG21XiZa9JhrwSwF+ymNp3/1b8UFyH9OiOJq5UqDB/AKXS1p8eV7m4XSMuGX6fsFSE6YzTHBT1KvyNEcUdpVH8OsuqU84bkGKdBmtFhHMhTbI8FrrSn+k25jnCNo+qhJpGGgdR2+kjEYblrtzx0SXZ+GDrnH7YMz3qBKeouV5JauTfPAPSVN7cvvnhkgywa9c77p7LCSl91+3Mgp4QGiBS8PkWIGIovw5FzLkdYOQ6y0sKt+rc5hS4mRJjN27mtPkKbuYzFjTT44c/DzIT5wwy55LsgMwlTKlpDBep8d3dm/s6NqQdguTjP4S3/wCkNJo1Q8p8xLXNvY9jNVdzO78d0ZM6RPT8azd49/aD8d1w2gjP7y4YxGY4loRoW6Ha5naLZgmH0aT4VEB4VDRWLLxF+FFQb7/fg4LNOl11mqMfeoCDC0dGkFMbXr2GMppI+eDS2R+hZKRtGDDhBzhY1nVhr1olt49ekFkbqC5H25M8",
+    "c3tq6LRU/nD9rF9RAAtiZqSdAL7kjcwPnNwNkLWwd60p/IFBInPrLvSQ7Z9B5Y3AvoZ4/n91QhNj7GcsTziD0rN2KjvU7Pl9Av6O9DqUwZTfydAbkj3GacaCjd1+O6S/Z0y63AZA3Ybea7KJJnj62i7g0D5oNfx2zsaGu8etveap3np92QAevg+K8BO1c3qghnXT8fZhkq/Ai7zLkelRGMYrtuSWYAC3QH45t1jlDe8tMpY0Mfmy9PKa3vzwq2q9jmCug2Uo/26vSTjy7Cts8yrIPHOf0rspfv+TWLnoHQj3a1TVvA0sNJje0c596X3WYtXm0xWd/p0TMBRwevmzr3axQ5raHfpqdv7b+h/GYHtg",
+)
+
+SERVEB64 = (
+    "eNqlWmtv28gV/a5fMWDglsTKjO3dFoU2DpBmtd10HcewE/fhGMKIHEmMKZLgUHKMNP+9596Z4UOiZCfrAJFEzty5z3Mf5DNRrPRivZxoVa5VWDwMnomLD1e/ieu3YrlKq+RQK62TPBPvX18IvVBpOhK8VtwcZmIpP9+KF0VeVi9D7DzLZaxiMX2wVAX2zZJSV2KllchnIqm0iPLlUmax8LVSdl04OXv13/8EIAEi7xfKnFCKRAuZibyMk0yWD9iZF6qUVYLTP+XTkVBY9CB0pQpR5GmqRYW9aYILWZLNQUvn0Z2qBB0n01RYWTT4ipTwaY+okqXKV5U4CoZiplTMDBapqpRIsgI30iRTGrSqnMgnJVSjDcV4LUFHCyWjhShXGR3Ky4UEqXvSIfGmQ3FOe0slYz0ETyCWVOI+L++IE9CCvqBCcZ9UC/CYqqgKibefsT0veC3duUvA7otPSfzSKGpMx0Z5lmE9WWiuoF3ScH6f8dkLWRJHpBSn9EpOU0UWLCQUqUBljUV0EZzNVhlTwleol1gt8jyFBVPFAhPHRDBOShyZQ/V+rsNogd8wFWgVZQ596MP7JFYkKPRgVf5nqPU+JoPqe1kUcJIkE/cLogzxoDttrS/YJV5aHzv58eRHUf9BEPhTmS9Bd5HraiSySLyY5rIEueIlr2YiV42d0wdnJ3scaYP92LoMKYykHbGPGgfCyZfjizNQ8t8mUZlfPFSLPAvgicSqIWE8VKY5zM3msa5cPIjDSHgN/15ILg1aU6mTiAkLP1b6jmz72pG+l8QIlMJO5wes",
+    "cF1JYtG6uRGK4uy1sSb5u4T24FfMU6zWSUS2znQOSf2yiIZCxUk1xJpoDYuoLB46lwlASJYKt2aQnA1Sm2tE9B5g8FWKcE4RRW2hZ9AD8wTZjdVeGbcHv2VFHsIK8b54HMHin1fvziF9BXedlXKpmIBcVflSsuNGaaKySv/McaHBkAbycBwqbMPZUhsavJu0hLCCzAAUST63LCoEs8ExyAwTwJkGyZKDKtfum37Qg0FVPowG5EzuIiPEQH2OFKi84YvjsszLzqqVAxLtNoDXjJmZ5lh9D/2xY5KWLPZFOZQLKEwBin4wmJyPx79ciVPhe9fjy6s37869ofCu39L/hDjwzQkpkX6/Nr+ZD76/KktoaLJe0q+JgQhvOGhCw5vQMZN5ma8KXnPx+z+8YDCYXI0vr8eTt6/+jZN/soufNUAI9zFYuCRuyR2qHCYH1jXaTwEUZeBIXb0fX5AYJ0eGlAM5AWh2dPk7oyv4yWK39ezN+Rg7/3J8YrYiduYKyaHBWXEHK7jl//r7h1/5oJ/+ZpimgHEwW7tqHdZwteUKLoZPwAnUNRhEqdRaTCwcGItOJjrNKz2ZsCnImqQvo1lAFH2U09WMPu/tJ2cA+jJXGd8vIl6d5hqskJqJcKxmIJ5kSTWZILelsyH7ylCsl0MCv2BU24vuhnQTPNBH9wZ85xSbuhcJPU+JTPcysYrrU8/rXr/fcZ1FwY2bW+cKdbYztwiHSL8UouTM12+7BKACbD8n1LMEYJEJrlJixh7EpMFQLJgqoqQ+q2hVqU3Giwh0fpWpVpYOUWa4",
+    "aCLZgMbIxv1QZLkN9w3dGEM4eo057sukUs4WLf0/E+fX7w2PimAUmapIJQCwUmmGMLeAJGIkropQLSkjCcLbKv4BBgxLhd2R8r2P7B4fS3wGocqiPFZ+yztmKSSboNgghCcaLZaoBDl19g/NmvpmMqP7o1a8CzYQJ4ytOw2HRvyq9HUgfhDEXtBZGauUtt+MbgcDdl+UEHAx3/JVYyX9lapalThNh24R37LAOeaPOshaG8hVLHWuFPxCVgt7AOSiX2R2Wra5d5sJV24YIo8wUCD47cmmJvQJy+3R2oaeqkLzYeXpHKdDjZoKt/MCBjOrr96dTa7evf59/H4o6kuTy/GHq/GrX365HIrjJ/HVc9Y0yWJ3CnQs4xjl2yz3vaOQ/8G3WICbo9ubw+PboLXVyncSdFnnzI3I8DkuHuNLcyApvyFSysR6vTWm0+edetDMqtXmM0Z7VC0IBbBoCvFSzYmtErkxn35Cxtqupijdz9AKuDKIiREq3iRGFcGtc5SF1LIiV2ZM9agozXKvFUF3IRWWVoWhue8HQZv9u4Z9HyzZzc6zp5/onERTeUEFIy0ZIsKqQCiCKbBEmywNrnU4Y/uUiSwtxm76HVoAZ5CxlxhhUdkX/lEQIiyTwuoax2a5yYDtJIEtJoQ9UxO3orcVINhsDjkVnvqcVN4GiQYd35crtYcC/IqJfPHaSLlVvLX6NldtjeqabZ4zkqFOMpjdhjDOmywoUAsgZ3sS3UWvViHjtxbZtBt0ZTPZCIVduMzjFZqYGyp8COsaBr3b0PDiUyImQTeImFS0",
+    "SzmdICVEH4opKbNds/n0HyX6sG6hgrbk03lXRvRwnOJD40RoP3xDmUrK0y6LxqtCLR987+bL11tTZCOmvnz1QiQB1NA+6FnJuvtYvE7W6bm/y8U29GD5ID5Z+lh1LlPApKmK6yTcYyes6xQL3RTSLnrJgaIdsWDXCcVVujjQHzPLuzjApiY+VcGROTT1aY1Ul+jgqHxx9SM3IyjjUaiC/Wy1nCouY+rClpoy21Uj74X9cb6gcvm0yaCm1jTJyoQhKsBth6KGEchJLgBApeNODbdt96lVaPOk6Q1rRNmIn01g2kWJArGbdbe4a9caE9JDKVGx+219bi2FEjL1ufLdUUHvMvAy283EDh+d9RYx1n2u0B28qXg81E5qPW7IFUkPhTolkvepbyPRjtKxc0xyyI1I7rHmjoP2hK0lhPMI78ng1Uo/rs192aBWRWpzkUPGPaT2AccGuHYhYe8RPcJT1PrSJqEF+lMt6hp5Y4jEpGZJJtP0YTMPcgfVDdBWkFIAO+wwdRAF5rBulakSiNVnc8E6P8XFHcWFLYjomFZVxLLSJs75qFrINj0gQAeFq8zVSy0631dJuu2deu4JVEgcABEJZKEtJFwK1zJdIX22pMLlkMaRTf1CG9xGUleXHbqCNmmZrx0oWZCmgZKvy/WQRsk0mBqa4Zyr0nnSQWYz3+x5PFo4bY9KWzfCRo8lz7x40cW7s7M352YVrrPBiK4xXLm2d9xchDrkQW0//Pzy1RVEfDi2icOX9WjBbOasfrRtEOOiFG/bLZxak9aYb5bjqAdX4TmzVM4d",
+    "v75ao1QLhth7c3zbhwzsk07K/gjuxfmmzMm4rirXoYzIX3xqOnqXW7d6d9Uamu0gWSVZD+K4AhTti9N+IF6eOn/YTXGvBE6KkEae/tSWgyNR5TkoZ/U0VZtmfSed3VHT91dH0k52Njusb1ITOdgPp+J4sEfa3p5vO1PButdvfVdcn3LMNbX2XiH5ocCEGvBT7wBAcxBTnvMNiebmkNgNnkKKnoxogvXTNo366i4RXAKoQ7VniRuF15OmZwIJ5znNxJ/TSPw5ucdzOxB3k/CdGY/izwa8b7CKOoo6owSPpkr3ZO1A19XnQdwuX307GjbK6yfYxTiLmdsg18cHw7Drkju14SYsRa20RkcEux2fEfImuru1FfHgm/za6tWkSWjSv+utdUx60Xuqm50nUKnJ6Pmnrpq+AxdjWUlX93OCJR/yT/7y1+APYaMl21tUtuolWrbHDDNDp1UG0oTFie63ZP/tw4X4X1sZ48vLYD+yPaEk+j5MM3NqUwryQJWl6F26K412tEBD79UsnCUM+3uxnYY9NPA4PN4v+7RU8u7701Br9GNDDwzejJLbMFZmQhyWZhjkfSy94NFc9CFLaNsjPrUJPbYpmcq49bhlr3rsEwTwmsAqx6Pb3fBWNmsPW896erZwf/EHffIpvrg9Krf1KU1Km0JjNNhTivCEPxAvRPt5FLXedfNim6kdbLYmEO1nZzvxjc/7DlTKOpCkHbgb9h/pq1vhR99vstEfK/OoAqIsO1vRiyJgW8g5PVihkYB9GLhLeteZdjS8WyXfikgPiUrjBmO3esSn",
+    "Osm3nEsFtKv4uOGJlrHteWQ5510IxQkhXj2e6n25ZtS8ftM6k95FkPTEjB7Tzlm71JkxIVs+c8niHgHbFqms2smm41pJ3cA0gJsgAigkiOMNXXAyrEq+dZPcbo06JM+TDzOPjcowsptYl+skq/yGNO287YHGhOrhk8GTMo4VnAjLDU6bqtr6+TV1vBuuvqk4enhFl3Y8vLKvgNBrJXKu+s0K/G2mic1D/qarxo2d5D23qO6NH2XFttNmVs5BJtcySen1H8dKd5JQrsmB2k/PBk8YmG2cGtFbJPQg1dARXPUK/0AHOJSKXiI8dJMy4+RmWJzn5hmomZeb7kDGMQ/M7Rs2pvswFPaMEzqPgRxj9ZtixBLbkviiCchB3OUNDNgI5rc5inUdrq8lT735JYrmvTd+/8UNjY26f7an6+33scxImWZy8zSfolGxDkCQRE8EuBTn10caHc9v6A7V3PSokB6MFWvz/KAj6pd6gxHaGzUYZHqzr4P/A+YzK2w=",
+)
+
+RPCB64 = (
+    "eNqVWGtv3LgV/T6/glCwrYSdzDrtFkWdusAidbBbpMkiaQNsXUPgSJwZ2pSoJakZG9n57z33Uq952NvVB1sP8j7PPfdyXoim9ZttlbumWDSPsxfix39/+l58/qdYylBsRGGrStal+PjjG7GyTsg22EoGbetLQVuw4Z2VpSrF8rETJWwtVtr5IFqvhF0JHfwgJ/VKdesW+bvv/vNTBhEQ8qFWwqmfW4VtKycrJQrpnFZeSLHbWKOiPXPhrXjfSyOxWG9pr20hPTjdQBgpqq1onK2aIHzhZKPr9UK8JcGQ6JSo1c7oWr0sldGVDrD/H58+vBfpnbf1omyrxmPJVjlIUxU5IIWTu34bmyEF3QpN39jk7JJdEeLl38SXRJfJpfjzXCS0yuP+JilK8Y3Ry4ReevGL2BV0G8jnlyvxgPgnt3jhg22wfiWNV3sWiCuViAAMZzONJrdXbIAXO+vuvQjWZrz4ry+n2jX+X+C/bQPuElbo2rDpFeC5Iute4UY5h7u6NWb/hKRXo6RXf5jKwv9B1F/Oi1osFpwp5VvTJ7lRTsSA6lpYVyqHVWd0l9g5aqlx+8eoxDrfORi9+HbPOXjHgVlbETZAxppx3Gijck4Z4cO1NQE1bAhpxij3e0+oT7fS+bkodiWtgqRVWxcEd0+2eor7UoWdUnUXfJLF0FQ+Wwy5I0OFIoSSAv5OuAz8GIuDLdnpsIEIwZ4sxHfxLTYCrxSS3wkfpGP43dmlkB411UoTawb1J4arksWG9la2VINjMBulc8kVchzwRD3okCDoPcL66/rDWyQp",
+    "tK4mULEgv1HGYJ1Xbqv6dRKP3iM00Wg2lMxmn5IvCVXGBuExKC45FMlspqvGOpTlo5/Ngnu8nJGw7iWV30w9FAp1+wO/uqbIHKxpaRFJ5MWwquaqXlqs3EHXCmXPVnd0VFiUDdjJgKfSbJa/v77++ydxJdLk8/XHTz98eE84nuKDnt/EZ9bO31vnVB3ybZXMZ2Oskjzo4t7nAN98eCj1apVks1mpViJnp1O7vMuiEzGyYuQZ/tYtbgA+lQb1ELrVL4hLUl3OI9rAO8BX9hpcpBF88VmaNtpIKZcAgQFJVxwEijWJGEIctf8Mz1k5hcNHXfy5i/o1/yN+HzeRsomuNFnKkoUkcavTJaS+B8r4kWzE81uil5g49ACvayCkLlQKG+ai1EXv4ygBXxZrFVKq+2z41olbWmvSYQXX2TzqyLIj/4ZVkXqz3ojahhNDiEqz53xVD40qqEHIQ9rtfY/5dJSjGx9cajJulIbKFxpuY85igjkrPt1Wc3GQ5I9MRscdEClFlxQ/aWVAJBRetEKAksENroq8n1Ir6uQ01hjgHPEqQCq6DsoZJVGyFlscb8iYsWTsI1EPrKa6JWqI5LyIwMnjCHAlBpCn2RlIHaGT1k9wPMXWBK4oXzXKeCQX+1rpaJ/8HZn/XyPzX0yZf2xbFHuV7adYoMxERCIGBDCEE92raUO0ioXg9QU/1sPdgX+UTM3JlPVapUbVKXubTVBDFwRDwM3twctBIT7ZTm1/Qf20avorXJyJ+PBxall/FaD8uViusW9KY9HMGw0Ewoyhj2Un+1EZy/Wp",
+    "WLrudBc2ZvccPSiN2ohzr3oF2dm98HchmwbNLE1uvuxvY4dAHr7skwXRlAzp3QAeEnNeDrQb6UPOowasISicLFTggcuntpPJHJxSPbmEGMEYRslIXMcXYSEnLGAHBoh8rWrlZABNZOeVj+A+yXNXE9NGQ1VRnHEjIqXvURG3l+Irn4ivsP6c1IHFjwrtUGIsGYwAQi3yvECUfZ7jjpKb57MjjNAeHXnoVOALGqjyfsp3ijo1DT80HXsRa+A1aKcwGm1U7GSNzxpMZ+R6rcrZuUhbHgrbcD60sIjst1nEpqexI03iuDAcN4jxV3Q0SJ5J0BgMmz25aOmUvD/4Wouvr8SrJ6JEis9HqmOdk72HHHiyLZIiky1P4nqcxP9bJ4s7q+uU+4+P/cd3wbvN5qey+ql9ktI4yFKPPai3c7t50p7MOumErdDYLrKBk/H3cP8+O45XehQwtoOnHMIlbKExNUeKQ+ufD+yYoZWuMdJPmHJKw9wLZk91nRjg06ZTT5tOvJmfwcqvxSa2VOpSceDbOZw9mag7fGIqBp5L4s7xm/iak3ym+U6WrwzG3fTXZrkGNR51F1VJh/5UurWn4xeik5cyyGEowUfEQ8nuaHwwm/hxyu4OGaKtgzb9qeIbOkXMYuiJeYfpOR2GMXw4YZNumEqScSsxrbWhs2mn+PSOEU6D0iMLpxn8VUXLh48EViMD90o1/LtD4+waBtNBhmabqp9QZaCOkHbNgTtkU8RGyf7xbbD3qibsFff8vKX5JT5nz8wVU7Td3JLZdHbrObFqEURCseGK6w6T",
+    "UStv70Ax4DJ6RIPOlk6gluDYnVz22RlMxBnxtHJOq4axddWDSNcLyjaPDidlygbr58vuSCz9W9Bs2ZyKi0uuOrj8P0KftQEYRPaPxgJiwRWx4GTqnlTakfDV8+QyScwqOx7xaOym2cinPqjGX/3p4sThAROnoo/zbez6eVYfZN1m+zMzU6nMuOTm8va3UOJkYPrtNcFNFIU1OyxlZhs+fDfbgVzeSB62LKauyS+H/NMBla3d1fRLRmvU6/G3CCab2NeDXBoVjyk09q6NXWJo63BGgaIRhmIVT/uj2+sb+nJLexRsRWSbbZxmD45zY//tyq9jy8j5+9n/AF/QE6E=",
+)
+
+INDEXB64 = (
+    "eNqlWm1z2zYS/s5fgdLjlqwlxnIyuY5i+aZN3Knn0ibT5Dp3VTUakIQlnimSQ1CWfE3/++0L+AKRstOep41kcLHYfXax+wD0iSi2en2/WSZZrPZB8eCciPf//PCD+OVHUahSJ7pSWSXSJFOCRMRtXoowWQlZFCqLx3mWPojbJFVaeGm+0v6U5QJQ9DaXsYpF+GAWEXkGoqWuxFYrkd+KpNIiyjcbmcXC00oZuWD59ttf/+2DClAizLrhNkljcYlLXQn7JyqVrJR4JsIyyVZGJkjivdgWospFDE87mlalKsR8nCzgn2whLitVbq7MrI5YXOZFMwrjH9eKHBUJGL2tQApUh2ke3Wn0RYY5DC5v3vxr+d3bd6//AW5XCMpuncMcBFD7ASoBVbwAPIhhaoZq9yoe6+S/SpQqyssYsWfdU9IDC9xqVY04EFG+hZggaBKUfZfm+QYtAz/QkArspKlfabFDXVV+pzI9Ert1Eq2FjAB0qS0xkgBVRa4rRDCFsAtZGZ8mzyYva8WV2lcCDQ26YAL+5AmkQkUOshewJvyaCYjsHS5SowWQaFVbvAZb1L0qH9iKdqFygy6CsmitcBaMJiUDGYhvWQBCoZUsQSJGnxhrdBqAZ7eFLtKkAttAkS5kBCFB4IptFlVbWSV55r+idCRHMLlLtVJ7I6a3oa4wqTQn41tc3aQ+LKmTLFJkbioBsXKbCU8Fq0Dskmotrq58IUuzb0Aash9FM4AQVHE+w3q48LQBjzSNRCHLijdWijsIcSODWMHOJBdoJ7BljIhQclZriJtelzK7",
+    "Q+UM9RokAEaZrUAZYFaq2qbbEnJHR6WsojW72Nk9qXzA+HsAYAWqwedEZv6U9giqhOgJ9/0vNxMXUhJCqOLp9vkFh4i+cbzpK8pHZYTfab7Jc5PYJJKZiZBtIeb0nDfTzccP4tkz8c0CZnm4W5q94TtOsinyEsKrHacqH6YOlgMzBoHbRpWj9pEqKnFDg9dlmZeW1JbFMHvMhJ6iMMmkjpLkSVW1ICprJoG3mdxAsMIcZuxqzDGQpioCEAqLZArl0vOd5U/X128+iJmA706nnszExfmLb2C5E96FnAINGE6L1kxMzi9eCBK1qkOIBfdgBip+3tbSExaCmJAgVwYS/OHNzyDqXr7QN/DjNoPLDze/XpN1PPTz9Wv47aU4E3b8+OmH6/do4Jys9+bRwqdNF8EuEaE7m45eef588fsfl1e/uV89+/Rb5S4cJ1a3YgmFYo2b2jeg32LpkFVVejXWI+FCij2/cI2IoDyrtmXWhCMgAVIjvhTn++/Nj9ORbRayJBCaH5OozN8/VOs8m0K6yBB2hYQhrXHva2MoFx4Ps9kYcgKx3alyHEkN8e8UZWocJpJU2r2LM9yopfZpIo3N6CMgFR6PI2Qa6hWA1qDa+gzQmIc4sR0/1AiFJ4WKCJ23GAH4wmXluOchQotmpV2tKqBi6nXg3YHkLsAaWXihG3zx9/Hy5Gujx5iSqszb+eJKTGxLYJmAKyk87uIPDwySmIqdkJ+I8ZWYewjXSGykvvMXTbtAOKGTdRPdi/MtRgjjCSWc11iDwW0q0RBQnAK3G1ZsMXnpi09i",
+    "MgxEgkCUWEY93jsdJEJWcQZCX5NKX5y2O8AZ8NoLccHnIzERl5cCfvtS/M33j0CB9XMJyevdjkTW4HELfqmygA5V1UgwwaKUGmHPzfIqgSYlRZlXwINioEml2pVQ0lVGLYO9C7BJe+fW6ozTbYANxtskmffyBS4OJrJNOL7kRuAlhazWxq6mgFKGYCvMwWEWgT1ahq6PJXJv5wNGZs9rWaWll0xrX8xmwpKxNW3kKolGdU9i0gRgcDeC8TKCpbjaB9sMSMFds+JIrH1LF6xJ6nDJkJudvVgHr0cWpCmmf1zTBzCPVlEhte4i/xP0OQPytkD66nXgPRE3RL120OqROYmd7HASCDnKDnCTV7h9TN+utoWJPEUF8KCPM+Fi53d5XyAfnUFvhf0tK7Zg/pJ3wzoucSP1M8CxY34Q8lurSKESYCOQoeSw4GMArnqJz+bnC6Qw+O35QnwxszcBC/j+QRKRXaQN+yR4HWHSj5rsJ4Jn0p9qOLIHAPEpu4w9kAVooL1o3TfiIS2owRbfI6jdDbELXTvp9gFaCIWZc/QgQ00ajsR5/Z8FzHldQ1ptUQos0LNHTbKaXqDh07DzmThvBFWqD4wfznGYxABxXCbm82LR6cO46bAsybKUD15NFfzHCsXZcKXgqM1qWw73q2GdvV2KTBn1t5uCeXWCB1FQClybTiMlMKbe5D0XSJv0nEHVZv/HYuJD3e971c7HvYJnRg+g6D8HHgy1tVeX3MubHyDSMGU+fbnoTwPb60COUQfsnJYy9iHoogfSg885HcYzkQ0+rh2emSbZ",
+    "GQei2QtxQ/9s28PaCvq0H2VWClJ5zPWgqOla9MDWD2dd6Pwfy63qg2AoEPc1/MUbxBW3P4nmfOqcjydTKkOh+1vmDmMbgso7zLTrd9/jPMkaOLdChWdrU3t605FfACUhStdnkEPSwHc3JH5Ak45EDQ5UyUJ8mol+cgPkZ4fxrHGHB9h0yZYhmFBmXMfzavZk+i2LbbXk05+3b3skK4DPbMTG+o9l36C1bfLC4/Bo9v6JLO1lKzg7LNDPWSxEWR+Cv+7+Y64fc5upjtUewIXD9tClfn+yBYG2Ibpjs9gjQobg2IBAUnMprHFgCI+U36RXc4fsNkWU9CKNBd18rqs7ZT3JIM92xWBTrLqb0OK1xjc6FhlR/wmWZ6aAaax1fjEdT5rjLRyscBRcVypO8TPH8yKS+DvdUD++FwO+195NmUsec6LEG6fuPZg5FrBqnQtpFMF6Is4V05xYIXvEGyq+JDQXTly91sQt6QJPJ3jvyQxQPhycTLloos3EG+hZfVRnn2itBE/YfSC/lzCnFkeXW4m1vMeCbZVFx6qbqNSeUytql7xXR4l7u7YZwMZh4sL3i4bIIvptYLLtJlQlUR0Tn7/CjtDujne4RKAyTihDp2V2cBA1jcJ2GcUCta/wbNn2BFZh8J+RB3XAmmUOI2fZ4DxN37J99chT+zTQnDG6J8HRU6eFof3f5gCineWiWxlNzhzQrubgiJdUDVVkp9skaAlEP2twZIlXuLZyQMBS7vyf3A7iO+MsPNb1MdrTY7wFdeINHDT8L8VmuBHTErbTPSpzuJ3yu74u",
+    "LBwDroFnAMp8+mLh48GJrutq6AjvIfbeIXUAWr8HppmpOVnee8YRYw4MNk2P8oOnuN8B/3uEVPUg6kT8ceJk1vi8qj/I4rFkdFvUUcmHRKVwrnZP4+mpdsWp8FJogNrnXU8ljAMyTG3SAW5o9tvZ4RkB0m5kigH8S6nd2zxYDOtEcNqjmeQTGcUHCwbeveElXqZ2NPagqvpMnvAJjl5hOAdZY5KqRaOSSdoE3GvJqXWrREJ4yqd44G+fFY9uDHCSj7UNzgbOE/ATekdCQE0n2sT8QtaT5QraSJIhSYplJRse0Hkp+gnfIH2i15VBEPCLVATIXPUAATh4x8u+b7VcYTQ8l8anZmDgbeunz3hxajst3GZS5zUqQMNLo1fY0JAJSX4BIDGsOL5wOld9OODDfr7o0QUylq+ptnj1ipJQZxy+TaMbLRpCgtXjbnhBjrNmwkXzDg5zuYZk2UAi2f3KH7rzqbFDNQUcwk81yoKjEGicPbQkYet+zrVKfVdpXQI+Zsaphv/jWslp3OjBr/SWwbz4Ywu9/omPOvChEYebquMM5sSBL4ZJzOrMHuoypdJVHaLJtA6SXcpJBnclfqEekkGyjhNkDuPM9Qe7Xy2LtoHocAFtLOx12OFLr2Ze7dDgPOMTWTCZLpzBvqyroyy0TemDBzYHdSEf/5PDMQaV+X02aiWLdSR594FeWiK1Ur0NZaWQNvnBKyrrNMdmUp2iN5bFfVOUXkt6XZ3jzXP7Vx/E/7CW57tMbPJ4m6pXRhn/GUL9JyD0Qi0gXSsAcpXmISRO55UXvkil",
+    "Gw96Rdq6sJrjkwXOURW9EizuRyRtWf57M4GddadtpR3Rsz+c/wGGc8wN",
 )
 
 XPKGB64 = (
-    "aW1wb3J0IHVyZXF1ZXN0cwppbXBvcnQganNvbgppbXBvcnQgc3lzCmltcG9ydCBvcwoKREVGQVVMVF9SRVBPID0gImh0dHBzOi8vcmF3LmdpdGh1YnVzZXJjb250ZW50LmNvbS9lbGFodHJlYm9yL3hwa2cvbWFpbiIKQ0ZHX1BBVEggPSAiL2xpYi8ueHBrZy9jb25maWcuanNvbiIKCmRlZiBfZW5zdXJlX2RpcnMoKToKICAgIHRyeToKICAgICAgICBvcy5ta2RpcigiL2xpYi8ueHBrZyIpCiAgICBleGNlcHQ6CiAgICAgICAgcGFzcwoKZGVmIGxvYWRfcmVwbygpOgogICAgX2Vuc3VyZV9kaXJzKCkKICAgIHRyeToKICAgICAgICB3aXRoIG9wZW4oQ0ZHX1BBVEgsICJyIikgYXMgZjoKICAgICAgICAgICAgY2ZnID0ganNvbi5sb2FkcyhmLnJlYWQoKSkKICAgICAgICByZXR1cm4gY2ZnLmdldCgicmVwbyIsIERFRkFVTFRfUkVQTykKICAgIGV4Y2VwdDoKICAgICAgICByZXR1cm4gREVGQVVMVF9SRVBPCgpkZWYgc2F2ZV9yZXBvKHVybCk6CiAgICBfZW5zdXJlX2RpcnMoKQogICAgd2l0aCBvcGVuKENGR19QQVRILCAidyIpIGFzIGY6CiAgICAgICAgZi53cml0ZShqc29uLmR1bXBzKHsicmVwbyI6IHVybH0pKQogICAgcmV0dXJuICJyZXBvIHNldCB0byAlc1xu",
-    "IiAlIHVybAoKZGVmIGZldGNoX2luZGV4KHJlcG9fdXJsKToKICAgIHVybCA9IHJlcG9fdXJsLnJzdHJpcCgiLyIpICsgIi9pbmRleC5qc29uIgogICAgciA9IHVyZXF1ZXN0cy5nZXQodXJsKQogICAgdHJ5OgogICAgICAgIGlmIHIuc3RhdHVzX2NvZGUgIT0gMjAwOgogICAgICAgICAgICByYWlzZSBFeGNlcHRpb24oIkhUVFAgJWQiICUgci5zdGF0dXNfY29kZSkKICAgICAgICByZXR1cm4ganNvbi5sb2FkcyhyLnRleHQpCiAgICBmaW5hbGx5OgogICAgICAgIHIuY2xvc2UoKQoKZGVmIGNtZF9saXN0KHJlcG9fdXJsKToKICAgIGlkeCA9IGZldGNoX2luZGV4KHJlcG9fdXJsKQogICAgb3V0ID0gW10KICAgIGZvciBuYW1lLCBtZXRhIGluIGlkeC5pdGVtcygpOgogICAgICAgIGlmIG5hbWUgaW4gKCJyZXBvIiwgInVwZGF0ZWQiKToKICAgICAgICAgICAgY29udGludWUKICAgICAgICBvdXQuYXBwZW5kKCIlLTEwcyAlcyAtICVzIiAlICgKICAgICAgICAgICAgbmFtZSwKICAgICAgICAgICAgbWV0YS5nZXQoInZlcnNpb24iLCAiPyIpLAogICAgICAgICAgICBtZXRhLmdldCgiZGVzYyIsICIiKQogICAgICAgICkpCiAgICByZXR1cm4gIlxuIi5qb2luKG91",
-    "dCkgKyAiXG4iCgpkZWYgX2Rvd25sb2FkX3RvX2ZpbGUodXJsLCBkc3QpOgogICAgIyBTdHJlYW0gdG8gZmlsZSB0byBhdm9pZCBiaWcgUkFNIHVzYWdlCiAgICByID0gdXJlcXVlc3RzLmdldCh1cmwpCiAgICB0cnk6CiAgICAgICAgaWYgci5zdGF0dXNfY29kZSAhPSAyMDA6CiAgICAgICAgICAgIHJldHVybiAiZG93bmxvYWQgZmFpbGVkOiBIVFRQICVkXG4iICUgci5zdGF0dXNfY29kZQogICAgICAgIHdpdGggb3Blbihkc3QsICJ3YiIpIGFzIGY6CiAgICAgICAgICAgIHdoaWxlIFRydWU6CiAgICAgICAgICAgICAgICBjaHVuayA9IHIucmF3LnJlYWQoNTEyKQogICAgICAgICAgICAgICAgaWYgbm90IGNodW5rOgogICAgICAgICAgICAgICAgICAgIGJyZWFrCiAgICAgICAgICAgICAgICBmLndyaXRlKGNodW5rKQogICAgICAgIHJldHVybiBOb25lCiAgICBmaW5hbGx5OgogICAgICAgIHRyeTogci5jbG9zZSgpCiAgICAgICAgZXhjZXB0OiBwYXNzCgpkZWYgY21kX2luc3RhbGwocGtnLCByZXBvX3VybCk6CiAgICBpZHggPSBmZXRjaF9pbmRleChyZXBvX3VybCkKICAgIGlmIHBrZyBub3QgaW4gaWR4OgogICAgICAgIHJldHVybiAieHBrZzogcGFja2Fn",
-    "ZSBub3QgZm91bmQ6ICVzXG4iICUgcGtnCgogICAgbWV0YSA9IGlkeFtwa2ddCiAgICBzcmMgPSByZXBvX3VybC5yc3RyaXAoIi8iKSArICIvcGFja2FnZXMvIiArIG1ldGFbImZpbGUiXQogICAgZHN0ID0gbWV0YS5nZXQoImluc3RhbGwiLCAiL2xpYi8iICsgcGtnICsgIi5weSIpCgogICAgZXJyID0gX2Rvd25sb2FkX3RvX2ZpbGUoc3JjLCBkc3QpCiAgICBpZiBlcnI6CiAgICAgICAgcmV0dXJuIGVycgogICAgcmV0dXJuICJpbnN0YWxsZWQgJXMgLT4gJXNcbiIgJSAocGtnLCBkc3QpCgpkZWYgdXNhZ2UoKToKICAgIHJldHVybiAoCiAgICAgICAgInhwa2cgdXNhZ2U6XG4iCiAgICAgICAgIiAgeHBrZyByZXBvIDx1cmw+XG4iCiAgICAgICAgIiAgeHBrZyBsaXN0XG4iCiAgICAgICAgIiAgeHBrZyBpbnN0YWxsIDxwa2c+XG4iCiAgICApCgpkZWYgbWFpbihhcmd2KToKICAgIGlmIG5vdCBhcmd2OgogICAgICAgIHJldHVybiB1c2FnZSgpCgogICAgcmVwb191cmwgPSBsb2FkX3JlcG8oKQogICAgY21kID0gYXJndlswXQoKICAgIGlmIGNtZCA9PSAicmVwbyI6CiAgICAgICAgaWYgbGVuKGFyZ3YpIDwgMjoKICAgICAgICAgICAgcmV0dXJuICJjdXJyZW50",
-    "IHJlcG86ICVzXG4iICUgcmVwb191cmwKICAgICAgICByZXR1cm4gc2F2ZV9yZXBvKGFyZ3ZbMV0pCgogICAgaWYgY21kID09ICJsaXN0IjoKICAgICAgICByZXR1cm4gY21kX2xpc3QocmVwb191cmwpCgogICAgaWYgY21kID09ICJpbnN0YWxsIjoKICAgICAgICBpZiBsZW4oYXJndikgPCAyOgogICAgICAgICAgICByZXR1cm4gInhwa2c6IGluc3RhbGwgcmVxdWlyZXMgYSBwYWNrYWdlIG5hbWVcbiIKICAgICAgICByZXR1cm4gY21kX2luc3RhbGwoYXJndlsxXSwgcmVwb191cmwpCgogICAgcmV0dXJuIHVzYWdlKCkK",
+    "eNq1Vktv4zYQvutXsCwCSKhXTgL0YiRbBG22e+gj2LqnJBBokbK5lkiVpGIHRf97Z0jKkiNtgT1UB1ueF7+Z+WZo2bTaONIZ8VcnrLOJDILPVqv+3b6exNomyU/3H+7+/GVdfLp/+J3cErpzrrWr5dKwQ76VbtdtOitMqZUTyuWlbpaiZjtnxEab5bHdb5cNk4omP374uXi4W3/EGMtabpa5V4JjJbc5AqBJwkVFCqEsACy4NDbNVgmBx5nX8IKPtnmzB206ikMzrxbHUrRuMG2ZtSFqrRkvjGh1H/L8mOkpB8iN6FaotEe+INTQjDBLqsEMn7LaQlaYQo7H2LTKjWA8zbKTmRGuMwot861wKUUkdEHGxZ3PIDqODUNClr2IkFBn6i/nNJvGYZJGlR+MdCL1SfCuaW36dwC5ArbU/8RUIhqvIVY44jS5sE+Kkgs0C8gq4cpdIRUXxxQNiwEgvEGlemFurDOyhT4Cnu+AFt4ncsEfB8YnrvrCYahpr2RFTG4dc50tSs0F+eaWXF9ennfJMGkFuff1lVql9ON6/UAuOGI/8550bdRZkztxdMGikorV9QiGyctaWwGV93UoG17U0rq3RZD8CHnNVsnrdedA//gcDtGGKNaIBWmEY0QqdM+hVc1pOGIF0Ar1J3LRruXMCU6zN3SFWZWqE8NAdS5nLXCEp/Ti3dWlhZ6Sd/CBpUnPfD2UMwnCCpx+EcZCYfHkH2j2JSsubIkmdCjzG3IBnfLPWqoUcHlePJ1WA9cH5SfZ6aKStUA+LAi3Lqb4LfkDNg9rkJeo",
+    "x2/2oiUnG7kln+5+JZ1lW/E/kCti7wGSisHxfEUiycKInMWZ2TSQCE7nZnbLHHaY0Np04lzuW7rr1B4nK8e17JfP91fX2cQOaaJdMJ9GwWcDzvuJpl8P3nEyH79pJeYnAgs5GoteHJfcaD3jrEgF1anrFNb5gnzlzEBi4OaTCyMy2aAUrwk8stwDA7xlpTsFLeoXGOiTpCcrnAZRHkEW5tCa8r82VwxrlxR+ov8jRf7R4Ax9BedhBmKmOAb+CkMnhA+R8vYVJiNcBQYpOuU8QAmc7zMHw0m6IDsbqnik4H6235+SDtX20Xwj/Hz0myU6DyvAFzHYrJ7ikvZyQrzG3ws3UKD3c1pchnPyiI3cwI+TY8SDfx5SZrYvPRECg1EyyTliTyL20Coo4eju9yogG0gxxOPlc9KH9dJbEm+98fjXIkIgN+R6fu7Lzhj4/+NPHRjVY3gLdLi7PYir52yCAmtFJxlOr5SJY8+tr80gjEffCtyL0ghL2DAxsPrH3RtB6ic3ZjOa3iSZ6c+/vfP9tw==",
 )
 
 DHCPB64 = (
-    "aW1wb3J0IG5ldHdvcmsKIyBOT1RFIEVkaXQgdGhpcyBmaWxlIGFuZCBjaGFuZ2UgaXQgdG8gY2hhbmdlIG5ldHdvcmsgY29ubmVjdGlvbgpzc2lkID0gIlNTSURfVkFSIgp3a2V5ID0gIldLRVlfVkFSIgoKd2xhbiA9IG5ldHdvcmsuV0xBTihuZXR3b3JrLlNUQV9JRikKd2xhbi5hY3RpdmUoVHJ1ZSkKc2Nhbm5lZCA9IHdsYW4uc2NhbigpCndsYW4uY29ubmVjdChzc2lkLCB3a2V5KQoKCg==",
+    "eNo1js8KgkAQxu/zFINdVgjfoIOQgRQGKUknWdYpF2023C3p7XNtPX6/+f6Mfr7M6JDJTWbsYYPFucowa7VD12mLdz0QSm5RdZIfhJ6bVYQUKsNMymnDYK1ucYdRWeb75ppeIph6+npSH7Pbn8A0SJ5RiCf1KS3EKsoqbfJDvHgSOZd+SFTjm2KwSs4zvn25eSmCLzwg/PoW/WIMAD8KH0kK",
 )
-#for line in PUSHB64:
-#  chunk = decode_b64_to_text(line)
-#  append_to_file("/pushvm.py", chunk)
 
-write_b64_chunks_to_file("/pushvm.py", PUSHB64)
-
-del PUSHB64
-gc.collect()
+PUSHVM_FILES = (
+    ("/pushvm.py", "PUSHB64", 79138, "44b70f79ebfb090cab2eadc56a9a4c8e32698b424387b5c3579da9488fc9db86", (
+        "df74b078b89a7105",
+        "0c4c1ca7145c47cf",
+        "8bb0ce2936f30311",
+        "9e79bc74ecbbd29f",
+        "efca1e56c309590f",
+        "ccaeac0d3f268440",
+        "560e9746e4fe2c8b",
+        "b947ccff296b412a",
+        "45c6350ae7d10766",
+        "069518dc47a81e89",
+        "7fbb000599cce1fe",
+        "20009d7721411083",
+        "cb7f71dedbaf7b15",
+        "65e0e5a6be332a93",
+        "1a47773672b89031",
+        "2b9cdc273466373a",
+        "a1e4193ab49ca2a2",
+        "d43e1e7fd121d022",
+        "67b1a362ecae0150",
+        "b4e161bf06e52b2a",
+    )),
+    ("/lib/pushvm_fs.py", "FSB64", 19898, "ad54c0e21659971ae746d08fc77523c1d0428698748cffc27357b24438a1d930", (
+        "cc8929b1ab47a052",
+        "3722b7fff7d9de0c",
+        "ac3f11d9ebeac158",
+        "eea097fe3cefe6be",
+        "ca4efd93e2c16861",
+    )),
+    ("/lib/pushvm_text.py", "TEXTB64", 13051, "c3cdd29e0362547322145fce41e54904cefd7bacab1ea68ebbbe6f4c8b5da883", (
+        "5dfd67548d4c0ef6",
+        "183fed7d5c13acea",
+        "33e2d610523c2af4",
+        "3448b717c5d00873",
+    )),
+    ("/lib/pushvm_net.py", "NETB64", 14492, "1575d1f0f2ef2bb6f45f43906f8e288d5c70836be90594e955399bffab86bb53", (
+        "47963d508862d853",
+        "f90238344415ac3d",
+        "7b6ce03e40a88b35",
+        "fd5729f27dd2fd46",
+    )),
+    ("/lib/pushvm_jobctl.py", "JOBCTLB64", 3375, "dc838ffa4b1fd22ad093a8b4476711ff2d0c7ef15010af2bc6705c8aca1a7ed1", (
+        "dc838ffa4b1fd22a",
+    )),
+    ("/lib/pushvm_xfer.py", "XFERB64", 8172, "130b660efd4a9c21bc2218e9948799fdadaddf81a9789029b5b934513a0de933", (
+        "e1da58db91855be0",
+        "5828538216f6a6a4",
+    )),
+    ("/lib/pushvm_serve.py", "SERVEB64", 10244, "db7da7a373521b88dea241de76052f906306b063b21aa27413544c2b0fff3c75", (
+        "ebcb6ea0a3d9a6e9",
+        "195351205376b3c6",
+        "8fd2b9fb88908d74",
+    )),
+    ("/lib/pushvm_rpc.py", "RPCB64", 5431, "7d332c5554ebbe299f60f75ee4cc8984bf55daaa410312e6496aa01507439464", (
+        "8846313eb20a1140",
+        "a389e3a1a04f0893",
+    )),
+    ("/lib/pushvm_index.py", "INDEXB64", 8977, "a7c1ed51b1a324e82b23dd4a33692f8f32e0814680e1b28f63d0da8f8eae88f9", (
+        "bf8828f6eb93105f",
+        "251289adf4ec85cb",
+        "e0b94af26d4ee898",
+    )),
+    ("/lib/xpkg.py", "XPKGB64", 2694, "d0530e3811147b9b7830181fe4b35c5b21abeb352eda37c54e52693b8bd89ee9", (
+        "d0530e3811147b9b",
+    )),
+)
 
+# --- end payloads ---
 
-print("Installing xpkg...")
+#for line in PUSHB64:
+#  chunk = decode_b64_to_text(line)
+#  append_to_file("/pushvm.py", chunk)
 
-write_b64_chunks_to_file("/lib/xpkg.py", XPKGB64)
-del XPKGB64
+_DONE = {"skip": "up to date", "resume": "resumed", "write": "installed"}
+for path, name, size, digest, chunk_hashes in PUSHVM_FILES:
+    how = install_file(path, globals()[name], size, digest, chunk_hashes)
+    del globals()[name]  # free each payload once written (peak RAM)
+    print("%s: %s" % (path, _DONE[how]))
+    gc.collect()
+del PUSHVM_FILES
 gc.collect()
 
 installNetwork = input("Do you want to setup wireless networking? (y|n)")
@@ -0,0 +1,125 @@
+# make_installer.py
+# Rebuild the payload block of install_pushvm.py from the current sources.
+# Runs on CPython:  python3 make_installer.py [--xpkg xpkg.py] [--dhcp dhcp.py]
+#
+# Every file is zlib-compressed (level 9) and base64 encoded in CHUNK-char
+# pieces; install_pushvm.py inflates them as a stream on the board.
+# PUSHVM_FILES is the manifest: (path, payload name, size, sha256, chunk
+# sha256s) so unchanged files are skipped and an interrupted .tmp can be
+# resumed. It names the payload tuples instead of holding them, so the
+# installer can drop each one as soon as it is written.
+# xpkg and the dhcp template are not kept in this repository, so unless a
+# path is given they are carried over from the installer's current payload.
+
+import ast
+import base64
+import hashlib
+import os
+import sys
+import zlib
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+INSTALLER = os.path.join(HERE, "install_pushvm.py")
+BEGIN = "# --- payloads: generated by make_installer.py, do not edit ---"
+END = "# --- end payloads ---"
+CHUNK = 800  # multiple of 4: each chunk decodes on its own
+HASH_CHUNK = 4096  # must match install_pushvm.py
+CHUNK_HEX = 16     # chunk hashes only steer resume: a prefix is enough
+
+# (name, board path, source file) - installed in this order
+FILES = (
+    ("PUSHB64", "/pushvm.py", "pushvm.py"),
+    ("FSB64", "/lib/pushvm_fs.py", "pushvm_fs.py"),
+    ("TEXTB64", "/lib/pushvm_text.py", "pushvm_text.py"),
+    ("NETB64", "/lib/pushvm_net.py", "pushvm_net.py"),
+    ("JOBCTLB64", "/lib/pushvm_jobctl.py", "pushvm_jobctl.py"),
+    ("XFERB64", "/lib/pushvm_xfer.py", "pushvm_xfer.py"),
+    ("SERVEB64", "/lib/pushvm_serve.py", "pushvm_serve.py"),
+    ("RPCB64", "/lib/pushvm_rpc.py", "pushvm_rpc.py"),
+    ("INDEXB64", "/lib/pushvm_index.py", "pushvm_index.py"),
+    ("XPKGB64", "/lib/xpkg.py", None),  # see --xpkg
+)
+
+def encode(raw):
+    b64 = base64.b64encode(zlib.compress(raw, 9)).decode()
+    return [b64[i:i + CHUNK] for i in range(0, len(b64), CHUNK)]
+
+def decode(chunks):
+    raw = base64.b64decode("".join(chunks))
+    try:
+        return zlib.decompress(raw)
+    except zlib.error:
+        return raw  # payload from an installer before compression
+
+def current_payloads(text):
+    # name -> raw bytes of each payload tuple currently in the installer
+    out = {}
+    for node in ast.parse(text).body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Tuple):
+            name = node.targets[0].id
+            if name.endswith("B64"):
+                out[name] = decode(ast.literal_eval(node.value))
+    return out
+
+def manifest_entry(path, name, raw):
+    hashes = [hashlib.sha256(raw[i:i + HASH_CHUNK]).hexdigest()[:CHUNK_HEX]
+              for i in range(0, len(raw), HASH_CHUNK)]
+    lines = ['    ("%s", "%s", %d, "%s", (' % (
+        path, name, len(raw), hashlib.sha256(raw).hexdigest())]
+    lines += ['        "%s",' % h for h in hashes]
+    lines.append("    )),")
+    return "\n".join(lines)
+
+def tuple_src(name, chunks):
+    lines = ["%s = (" % name]
+    lines += ['    "%s",' % c for c in chunks]
+    lines.append(")")
+    return "\n".join(lines)
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def build(text, xpkg=None, dhcp=None):
+    old = current_payloads(text)
+    raw = {}
+    for name, _, src in FILES:
+        if src:
+            raw[name] = read(os.path.join(HERE, src))
+    raw["XPKGB64"] = read(xpkg) if xpkg else old["XPKGB64"]
+    raw["DHCPB64"] = read(dhcp) if dhcp else old["DHCPB64"]
+
+    parts = [BEGIN]
+    for name, _, _ in FILES:
+        parts.append(tuple_src(name, encode(raw[name])))
+    parts.append(tuple_src("DHCPB64", encode(raw["DHCPB64"])))
+    parts.append("PUSHVM_FILES = (\n%s\n)" % "\n".join(
+        manifest_entry(path, name, raw[name]) for name, path, _ in FILES))
+    parts.append(END)
+
+    i = text.index(BEGIN)
+    j = text.index(END) + len(END)
+    return text[:i] + "\n\n".join(parts) + text[j:], raw
+
+def main(argv):
+    opts = {}
+    i = 0
+    while i < len(argv):
+        if argv[i] in ("--xpkg", "--dhcp") and i + 1 < len(argv):
+            opts[argv[i][2:]] = argv[i + 1]
+            i += 2
+        else:
+            print("usage: make_installer.py [--xpkg xpkg.py] [--dhcp dhcp.py]")
+            return 2
+    with open(INSTALLER) as f:
+        text = f.read()
+    new, raw = build(text, **opts)
+    with open(INSTALLER, "w") as f:
+        f.write(new)
+    total = sum(len(v) for v in raw.values())
+    print("%s: %d bytes of sources -> %d bytes installer" % (
+        os.path.basename(INSTALLER), total, len(new)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
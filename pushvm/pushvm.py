@@ -1,9 +1,10 @@
 # pushvm.py
 # PUSH VM (ESP32-first complete version)
 # Features:
-# - Commands: help, ls, uname, free, df, pwd, cat, wc, grep, cp, cd, rename,
-#            mkdir, rmdir, exec, rm, date, scanwifi, connect, ifconfig, edit,
-#            echo, upper, test ([), write (>), append (>>), sleep
+# - Commands: help, ls, find, uname, free, df, pwd, cat, head, tail, wc, grep,
+#            sed, cp, cd, du, rename, mkdir, rmdir, exec, rm, date, scanwifi,
+#            connect, ifconfig, wget, httpstat, edit, echo, upper, test ([),
+#            write (>), append (>>), sleep, serve, rpc, index
 # - Pipelines: |
 # - Redirection: > and >> (compiled to | write / | append)
 # - Variables: x=3 and $x expansion
@@ -12,11 +13,18 @@
 #     while <pipeline> do <stmts> done
 #     for i 1 10 [step] do <stmts> done
 #     foreach v in a b c do <stmts> done
-#     foreach v in <pipeline> do <stmts> done   (splits output by lines)
+#     foreach v in <pipeline> do <stmts> done   (streams output by lines)
 #     break / continue
+#     function name do <stmts> done   (call: name a b -> $1 $2 $#; return)
+# - Command substitution: $( pipeline ) as an argument or x=$(cmd)
+# - Arithmetic: $(( expr )) with + - * / % comparisons && || ! (ints in vars)
 # - Short-circuit: && and ||
-# - Background jobs: trailing & (jobs/kill/fg)
+# - Background jobs: trailing & (jobs/kill/fg); jobmode thread runs them on threads
 # - Hybrid pipe spooling: RAM until threshold then spill to STDOUT file
+# - Optional threaded pipelines (pipes thread): stages linked by bounded queues
+# - Commands in pushvm_fs/text/net/jobctl/xfer.py are imported on first use
+# - File transfer: recv/send, framed base64 with CRC and windowed acks
+# - CLI: pushvm.py -c "line" | script.push, -j N batch in worker processes
 # - REPL: auto selects live mode (non-blocking) on MicroPython when pollable,
 #         otherwise uses basic input() (better for desktop testing)
 #
@@ -33,26 +41,33 @@ try:
 except Exception:
     gc = None
 
-try:
-    import network
-except Exception:
-    network = None
-
-try:
-    import uselect as select  # MicroPython
-except Exception:
-    try:
-        import select  # CPython fallback
-    except Exception:
-        select = None
+# startup measurement (see startup_report)
+_T_IMPORT = time.ticks_ms() if hasattr(time, "ticks_ms") else int(time.time() * 1000)
+_HEAP_IMPORT = gc.mem_alloc() if gc is not None and hasattr(gc, "mem_alloc") else None
 
 VERSION = "pushvm-complete-0.1"
 
+# Block size for streamed file I/O (tail, wc, redirection, ...)
+_CHUNK = 512
+
 # -----------------------
-# Global "current VM" pointer so commands can affect the VM that is actually executing.
-# This keeps commands dict shared across background job clones without closures bound to the wrong VM.
+# Per-thread "current VM" context so commands can affect the VM that is actually
+# executing. This keeps the commands dict shared across background job clones
+# (and job/pipeline threads) without closures bound to the wrong VM.
 # -----------------------
-_CURRENT_VM = None
+_CTX = {}   # thread ident -> executing VM
+
+def _ident():
+    t = _threads()
+    if t is None:
+        return 0
+    return t.get_ident()
+
+def current_vm():
+    return _CTX.get(_ident())
+
+def _set_current(vm):
+    _CTX[_ident()] = vm
 
 # -----------------------
 # Time helpers
@@ -97,21 +112,31 @@ OP_JMP       = 7
 OP_JZ        = 8
 OP_EXECQ     = 9      # execute quietly
 OP_SETLIST   = 10     # vars[name] = list(items)
-OP_SPLITL    = 11     # vars[name] = last_output.splitlines()
 OP_FORE_INIT = 12     # init foreach iterator
 OP_FORE_NEXT = 13     # advance foreach; if done jump
+OP_FORE_END  = 14     # drop foreach iterator (loop exit / break target)
+OP_ARITH     = 15     # push value of a compiled $(( )) expression
+OP_ARITH_T   = 16     # last_truth = expression != 0 (no push)
+OP_ARITH_SET = 17     # vars[name] = expression value; last_truth = value != 0
+OP_SUBST     = 18     # run nested pipeline code, push its output as a value
+OP_DEFUN     = 19     # functions[name] = code
+OP_CALL      = 20     # push frame, bind $1..$n, jump into function code
+OP_RET       = 21     # pop frame, resume caller
 OP_END       = 255
 
 # -----------------------
-# Hybrid PipeData (RAM or spool file)
+# Hybrid PipeData (RAM, spool file, or reference to an existing file)
 # -----------------------
 class PipeData:
-    __slots__ = ("text", "path", "is_file")
+    # spool=True marks a VM-owned spool file that a consumer may take over
+    # (e.g. rename it into place for "> file").
+    __slots__ = ("text", "path", "is_file", "spool")
 
-    def __init__(self, text=None, path=None, is_file=False):
+    def __init__(self, text=None, path=None, is_file=False, spool=False):
         self.text = text
         self.path = path
         self.is_file = is_file
+        self.spool = spool
 
     def as_text(self):
         if self.is_file:
@@ -124,6 +149,20 @@ class PipeData:
             return open(self.path, "r")
         return _StringLineReader(self.as_text())
 
+    def iter_chunks(self, size=_CHUNK):
+        # Yield the content as bytes blocks without loading a spool file.
+        if self.is_file:
+            with open(self.path, "rb") as f:
+                while True:
+                    b = f.read(size)
+                    if not b:
+                        return
+                    yield b
+        else:
+            s = "" if self.text is None else str(self.text)
+            for i in range(0, len(s), size):
+                yield s[i:i+size].encode()
+
 class _StringLineReader:
     __slots__ = ("_s", "_i", "_n")
     def __init__(self, s):
@@ -150,31 +189,283 @@ class _StringLineReader:
     def close(self):
         pass
 
+class _LineIter:
+    # Lines of a PipeData without line endings; removes its spool copy on close.
+    __slots__ = ("_data", "_r")
+    def __init__(self, data):
+        self._data = data
+        self._r = data.open_reader()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._r is None:
+            raise StopIteration
+        line = next(self._r)
+        if line.endswith("\n"):
+            line = line[:-1]
+        if line.endswith("\r"):
+            line = line[:-1]
+        return line
+
+    def close(self):
+        if self._r is None:
+            return
+        try:
+            self._r.close()
+        except Exception:
+            pass
+        self._r = None
+        if self._data.spool:
+            try:
+                os.remove(self._data.path)
+            except Exception:
+                pass
+
+# -----------------------
+# Threaded pipeline support (optional: threading on CPython, _thread on ESP32)
+# -----------------------
+_THREADS = 0   # 0 = not probed yet, None = unavailable, else the module
+_PIPE_DEPTH = 4    # batches buffered between two threaded stages
+_PIPE_BATCH = 128  # lines per batch (fewer lock / thread switches per line)
+
+def _threads():
+    global _THREADS
+    if _THREADS == 0:
+        try:
+            import threading
+            _THREADS = threading
+        except Exception:
+            try:
+                import _thread
+                _THREADS = _thread
+            except Exception:
+                _THREADS = None
+    return _THREADS
+
+def _start_thread(fn, args):
+    t = _threads()
+    if hasattr(t, "Thread"):
+        th = t.Thread(target=fn, args=args)
+        th.daemon = True
+        th.start()
+    else:
+        t.start_new_thread(fn, args)
+
+class _SpinCond:
+    # Minimal Condition for ports that only have _thread locks.
+    def __init__(self):
+        self._l = _threads().allocate_lock()
+    def __enter__(self):
+        self._l.acquire()
+        return self
+    def __exit__(self, *exc):
+        self._l.release()
+    def wait(self):
+        self._l.release()
+        _sleep_ms(1)
+        self._l.acquire()
+    def notify_all(self):
+        pass
+
+class _LinePipe:
+    # Bounded queue of line batches between two threaded stages. Looks like
+    # a PipeData to the reading command; put() blocks when full
+    # (backpressure) and reports False once the reader has gone away.
+    def __init__(self, depth=_PIPE_DEPTH):
+        t = _threads()
+        self._cv = t.Condition() if hasattr(t, "Condition") else _SpinCond()
+        self._q = []
+        self._depth = depth
+        self._finished = False
+        self._abandoned = False
+        self.err = None
+        self.text = None
+        self.path = None
+        self.is_file = False
+        self.spool = False
+
+    # -- producer side --
+    def put(self, batch):
+        with self._cv:
+            while len(self._q) >= self._depth and not self._abandoned:
+                self._cv.wait()
+            if self._abandoned:
+                return False
+            self._q.append(batch)
+            self._cv.notify_all()
+            return True
+
+    def finish(self, err=None):
+        with self._cv:
+            self.err = err
+            self._finished = True
+            self._cv.notify_all()
+
+    def wait_finished(self):
+        with self._cv:
+            while not self._finished:
+                self._cv.wait()
+
+    # -- consumer side --
+    def abandon(self):
+        with self._cv:
+            self._abandoned = True
+            self._q = []
+            self._cv.notify_all()
+
+    def _take(self):
+        # next batch, None at the end (re-raises the producer's error)
+        with self._cv:
+            while not self._q and not self._finished and not self._abandoned:
+                self._cv.wait()
+            if self._q and not self._abandoned:
+                batch = self._q.pop(0)
+                self._cv.notify_all()
+                return batch
+        if self.err is not None and not self._abandoned:
+            raise self.err
+        return None
+
+    def _batches(self):
+        # closing this (or a reader built on it) early abandons the pipe
+        try:
+            while True:
+                batch = self._take()
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            self.abandon()
+
+    def _lines(self):
+        # one lock round per batch; its lines come straight off the list
+        try:
+            for batch in self._batches():
+                for line in batch:
+                    yield line
+        finally:
+            self.abandon()
+
+    def __iter__(self):
+        return self._lines()
+
+    def open_reader(self):
+        return self._lines()
+
+    def close(self):
+        self.abandon()
+
+    def as_text(self):
+        return "".join(["".join(b) for b in self._batches()])
+
+    def iter_chunks(self, size=_CHUNK):
+        for batch in self._batches():
+            yield "".join(batch).encode()
+
+def _redirects_into_input(pipeline):
+    # last stage is "> f" / ">> f" and an earlier stage names f
+    cmd, args = pipeline[-1]
+    if cmd not in ("write", "append") or not args:
+        return False
+    target = _abs(args[0])
+    for cmd, args in pipeline[:-1]:
+        for a in args:
+            if _abs(a) == target:
+                return True
+    return False
+
+def _abs(path):
+    if path.startswith("/"):
+        return path
+    try:
+        cwd = os.getcwd()
+    except Exception:
+        return path
+    if path.startswith("./"):
+        path = path[2:]
+    return cwd.rstrip("/") + "/" + path
+
+def _feed_pipe(out, pipe):
+    # Push a command result (str, PipeData or line iterator) into a pipe,
+    # _PIPE_BATCH lines at a time to keep lock traffic low.
+    if out is None:
+        return
+    if isinstance(out, str):
+        r = _StringLineReader(out)
+    elif isinstance(out, PipeData):
+        r = out.open_reader()
+    else:
+        r = out
+    batch = []
+    try:
+        for line in r:
+            batch.append(line)
+            if len(batch) >= _PIPE_BATCH:
+                if not pipe.put(batch):
+                    return
+                batch = []
+        if batch:
+            pipe.put(batch)
+    finally:
+        try: r.close()
+        except: pass
+
 # -----------------------
 # Tokenizer (quotes + specials: | ; > >> && || &)
+# "..." groups words; '...' also keeps $ literal (sed '$d', echo '$x').
 # -----------------------
-def tokenize(s):
+def _match_paren(s, i):
+    # s[i] == "(": return index just past its matching ")" (or len(s))
+    depth = 0
+    n = len(s)
+    while i < n:
+        if s[i] == "(":
+            depth += 1
+        elif s[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+def tokenize(s, lits=None):
+    # lits: optional set, gets the index of every token with a '...' part
     out = []
     buf = ""
-    in_q = False
+    in_q = None   # the open quote char
+    lit = False
     i = 0
     n = len(s)
 
     def flush():
-        nonlocal buf
+        nonlocal buf, lit
         if buf != "":
+            if lit and lits is not None:
+                lits.add(len(out))
             out.append(buf)
             buf = ""
+        lit = False
 
     while i < n:
         ch = s[i]
 
-        if ch == '"':
-            in_q = not in_q
+        if (ch == '"' or ch == "'") and in_q in (None, ch):
+            in_q = None if in_q else ch
+            if ch == "'":
+                lit = True
             i += 1
             continue
 
         if not in_q:
+            # $(( expr )) stays one token (spaces, < and > inside it)
+            if ch == "$" and i + 1 < n and s[i+1] == "(":
+                j = _match_paren(s, i + 1)
+                buf += s[i:j]
+                i = j
+                continue
+
             if ch.isspace():
                 flush()
                 i += 1
@@ -204,13 +495,186 @@ def tokenize(s):
 class CompileError(Exception):
     pass
 
+class CompileIncomplete(CompileError):
+    # the line ended inside a block (no fi/done yet); a script reads on
+    pass
+
+# -----------------------
+# $(( )) arithmetic: compiled once to RPN, evaluated natively by the VM
+# -----------------------
+_ARITH_PREC = {
+    "||": 1, "&&": 2,
+    "==": 3, "!=": 3,
+    "<": 4, "<=": 4, ">": 4, ">=": 4,
+    "+": 5, "-": 5,
+    "*": 6, "/": 6, "%": 6,
+    "neg": 7, "!": 7,
+}
+
+def is_arith(t):
+    return t.startswith("$((") and t.endswith("))")
+
+def is_subst(t):
+    return t.startswith("$(") and t.endswith(")") and not is_arith(t)
+
+def _arith_tokens(src):
+    out = []
+    i = 0
+    n = len(src)
+    while i < n:
+        ch = src[i]
+        if ch.isspace():
+            i += 1
+            continue
+        two = src[i:i+2]
+        if two in ("<=", ">=", "==", "!=", "&&", "||"):
+            out.append(two)
+            i += 2
+            continue
+        if ch in "+-*/%<>()!":
+            out.append(ch)
+            i += 1
+            continue
+        j = i
+        if ch == "$":
+            j += 1
+        while j < n and (src[j].isalpha() or src[j].isdigit() or src[j] == "_"):
+            j += 1
+        if j == i or (ch == "$" and j == i + 1):
+            raise CompileError("arith: unexpected '%s'" % ch)
+        out.append(src[i:j])
+        i = j
+    return out
+
+def compile_arith(src):
+    # Shunting-yard -> tuple of ("n", int) / ("v", name) / ("op", op)
+    out = []
+    ops = []
+    prev = None  # None/"op" -> next +/- is unary
+    for t in _arith_tokens(src):
+        if t == "(":
+            ops.append(t)
+            prev = "op"
+        elif t == ")":
+            while ops and ops[-1] != "(":
+                out.append(("op", ops.pop()))
+            if not ops:
+                raise CompileError("arith: unbalanced ')'")
+            ops.pop()
+            prev = "val"
+        elif t in _ARITH_PREC:
+            if prev != "val":
+                if t == "-":
+                    t = "neg"
+                elif t == "+":
+                    continue
+                elif t != "!":
+                    raise CompileError("arith: missing operand before '%s'" % t)
+            if t not in ("neg", "!"):
+                p = _ARITH_PREC[t]
+                while ops and ops[-1] != "(" and _ARITH_PREC[ops[-1]] >= p:
+                    out.append(("op", ops.pop()))
+            ops.append(t)
+            prev = "op"
+        else:
+            if prev == "val":
+                raise CompileError("arith: missing operator before '%s'" % t)
+            if t[0].isdigit():
+                try:
+                    out.append(("n", int(t)))
+                except Exception:
+                    raise CompileError("arith: bad number '%s'" % t)
+            else:
+                out.append(("v", t[1:] if t[0] == "$" else t))
+            prev = "val"
+    while ops:
+        op = ops.pop()
+        if op == "(":
+            raise CompileError("arith: unbalanced '('")
+        out.append(("op", op))
+    depth = 0
+    for kind, x in out:
+        if kind != "op":
+            depth += 1
+        elif x not in ("neg", "!"):
+            depth -= 1
+        if depth < 1:
+            break
+    if depth != 1:
+        raise CompileError("arith: malformed expression '%s'" % src)
+    for kind, _ in out:
+        if kind == "v":
+            return tuple(out)
+    try:
+        return (("n", eval_arith(out, None)),)  # constant: fold now
+    except Exception:
+        return tuple(out)
+
+def compile_arith_token(t):
+    # "$((a+1))", "$x", "x" or "10" -> RPN
+    if is_arith(t):
+        return compile_arith(t[3:-2])
+    return compile_arith(t)
+
+def _as_int(v):
+    if isinstance(v, int):
+        return v
+    try:
+        return int(str(v).strip())
+    except Exception:
+        return 0
+
+def _to_str(v):
+    # Lazy conversion: typed values only become strings at command boundaries.
+    if isinstance(v, str):
+        return v
+    if isinstance(v, (list, tuple)):
+        return " ".join([_to_str(x) for x in v])
+    return str(v)
+
+def eval_arith(rpn, vars):
+    st = []
+    for kind, x in rpn:
+        if kind == "n":
+            st.append(x)
+        elif kind == "v":
+            st.append(_as_int(vars.get(x, 0)))
+        elif x == "neg":
+            st.append(-st.pop())
+        elif x == "!":
+            st.append(0 if st.pop() else 1)
+        else:
+            b = st.pop()
+            a = st.pop()
+            if x == "+": st.append(a + b)
+            elif x == "-": st.append(a - b)
+            elif x == "*": st.append(a * b)
+            elif x == "/" or x == "%":
+                if b == 0:
+                    raise Exception("arith: division by zero")
+                q = abs(a) // abs(b)
+                if (a < 0) != (b < 0):
+                    q = -q
+                st.append(q if x == "/" else a - b * q)
+            elif x == "<": st.append(1 if a < b else 0)
+            elif x == "<=": st.append(1 if a <= b else 0)
+            elif x == ">": st.append(1 if a > b else 0)
+            elif x == ">=": st.append(1 if a >= b else 0)
+            elif x == "==": st.append(1 if a == b else 0)
+            elif x == "!=": st.append(1 if a != b else 0)
+            elif x == "&&": st.append(1 if (a and b) else 0)
+            elif x == "||": st.append(1 if (a or b) else 0)
+    return st[-1]
+
 class Compiler:
-    def __init__(self, tokens):
+    def __init__(self, tokens, functions=None, lits=()):
         self.toks = tokens
+        self.lits = lits   # indexes of '...' tokens: never expanded
         self.i = 0
         self.code = []
         self.loop_stack = []   # {"start": pc, "break_jmps":[...]}
         self._tmp_counter = 0
+        self.funcs = set(functions or ())   # names compiled as OP_CALL
 
     def peek(self):
         return self.toks[self.i] if self.i < len(self.toks) else None
@@ -222,8 +686,14 @@ class Compiler:
         self.i += 1
         return t
 
+    def popped_literal(self):
+        # the token just popped was single-quoted
+        return (self.i - 1) in self.lits
+
     def expect(self, s):
         t = self.pop()
+        if t is None:
+            raise CompileIncomplete("Expected '%s' but got 'None'" % s)
         if t != s:
             raise CompileError("Expected '%s' but got '%s'" % (s, t))
 
@@ -268,6 +738,11 @@ class Compiler:
             elif t == "continue":
                 self.compile_continue()
                 self.emit(OP_EXECQ, None)
+            elif t == "function":
+                self.compile_function()
+            elif t == "return":
+                self.pop()
+                self.emit(OP_RET, None)
             else:
                 self.compile_chain(stop_tokens=terminators)
 
@@ -275,10 +750,21 @@ class Compiler:
                 self.pop()
 
     # ---- if / while / for / foreach ----
+    def compile_cond(self, stop):
+        # if/while condition: a lone $(( )) is evaluated in place (OP_ARITH_T),
+        # anything else runs as a pipeline judged by its output
+        t = self.peek()
+        if (t is not None and is_arith(t) and self.i not in self.lits
+                and self.i + 1 < len(self.toks) and self.toks[self.i + 1] == stop):
+            self.pop()
+            self.emit(OP_ARITH_T, compile_arith(t[3:-2]))
+            return
+        self.compile_pipeline(stop_tokens={stop})
+        self.emit(OP_EXECQ, None)
+
     def compile_if(self):
         self.expect("if")
-        self.compile_pipeline(stop_tokens={"then"})
-        self.emit(OP_EXECQ, None)
+        self.compile_cond("then")
         jz_idx = self.emit(OP_JZ, None)
 
         self.expect("then")
@@ -299,8 +785,7 @@ class Compiler:
         self.expect("while")
         loop_start = len(self.code)
 
-        self.compile_pipeline(stop_tokens={"do"})
-        self.emit(OP_EXECQ, None)
+        self.compile_cond("do")
         jz_exit = self.emit(OP_JZ, None)
 
         self.expect("do")
@@ -336,43 +821,34 @@ class Compiler:
         if self.peek() != "do":
             raise CompileError("for: expected 'do'")
 
-        # init var=start
-        self.emit(OP_ARG, start)
-        self.emit(OP_SET, var)
+        # counter stays an int in vars; no test/addv pipelines per pass
+        start_rpn = compile_arith_token(start)
+        end_rpn = compile_arith_token(end)
+        step_rpn = compile_arith_token(step) if step is not None else (("n", 1),)
 
-        loop_start = len(self.code)
+        cmpop = "<="
+        if len(step_rpn) == 1 and step_rpn[0][0] == "n" and step_rpn[0][1] < 0:
+            cmpop = ">="
 
-        # condition using test:
-        cmpop = "-le"
-        if step is not None:
-            try:
-                if int(str(step).strip()) < 0:
-                    cmpop = "-ge"
-            except Exception:
-                cmpop = "-le"
+        self.emit(OP_ARITH_SET, (var, start_rpn))
 
-        self.emit(OP_LOAD, "test")
-        self.emit(OP_GET, var)
-        self.emit(OP_ARG, cmpop)
-        self.emit(OP_ARG, end)
-        self.emit(OP_EXECQ, None)
+        loop_start = len(self.code)
+        self.emit(OP_ARITH_T, (("v", var),) + end_rpn + (("op", cmpop),))
         jz_exit = self.emit(OP_JZ, None)
 
         self.expect("do")
 
-        ctx = {"start": loop_start, "break_jmps": []}
+        # continue must still run the increment
+        ctx = {"start": loop_start, "break_jmps": [], "cont_jmps": []}
         self.loop_stack.append(ctx)
 
         self.compile_stmts(terminators={"done"})
         self.expect("done")
 
-        if step is None:
-            step = "1"
-        # increment var by step (quiet)
-        self.emit(OP_LOAD, "addv")
-        self.emit(OP_ARG, var)
-        self.emit(OP_ARG, step)
-        self.emit(OP_EXECQ, None)
+        for jidx in ctx["cont_jmps"]:
+            self.patch(jidx, len(self.code))
+        # increment var by step
+        self.emit(OP_ARITH_SET, (var, (("v", var),) + step_rpn + (("op", "+"),)))
 
         self.emit(OP_JMP, loop_start)
 
@@ -391,29 +867,29 @@ class Compiler:
             raise CompileError("foreach: missing variable name")
         self.expect("in")
 
-        list_var = self.new_tmp("__foreach_list_")
-
         collected = []
         while True:
             t = self.peek()
             if t is None:
-                raise CompileError("foreach: missing 'do'")
+                raise CompileIncomplete("foreach: missing 'do'")
             if t == "do":
                 break
             collected.append(self.pop())
 
         if "|" in collected:
-            sub = Compiler(collected)
+            # iterate the pipeline output lazily, line by line
+            first = self.i - len(collected)
+            sub = Compiler(collected, lits=[k - first for k in self.lits if k >= first])
             sub.compile_pipeline(stop_tokens=set())
             self.code.extend(sub.code)
-            self.emit(OP_EXECQ, None)
-            self.emit(OP_SPLITL, list_var)
+            self.expect("do")
+            self.emit(OP_FORE_INIT, (var, None))
         else:
+            list_var = self.new_tmp("__foreach_list_")
             self.emit(OP_SETLIST, (list_var, collected))
+            self.expect("do")
+            self.emit(OP_FORE_INIT, (var, list_var))
 
-        self.expect("do")
-
-        self.emit(OP_FORE_INIT, (var, list_var))
         loop_start = len(self.code)
         fore_next = self.emit(OP_FORE_NEXT, None)  # patched to exit
 
@@ -425,12 +901,65 @@ class Compiler:
 
         self.emit(OP_JMP, loop_start)
 
-        exit_target = len(self.code)
+        exit_target = self.emit(OP_FORE_END, None)
         self.patch(fore_next, exit_target)
         for jidx in ctx["break_jmps"]:
             self.patch(jidx, exit_target)
         self.loop_stack.pop()
 
+    def compile_function(self):
+        # function name do <stmts> done  (compiled once, stored by OP_DEFUN)
+        self.expect("function")
+        name = self.pop()
+        if not name or name in ("do", "done", ";"):
+            raise CompileError("function: missing name")
+        self.expect("do")
+        self.funcs.add(name)  # allow recursion
+
+        body = Compiler(self.toks, self.funcs, self.lits)
+        body.i = self.i
+        body._tmp_counter = self._tmp_counter
+        body.compile_stmts(terminators={"done"})
+        body.emit(OP_RET, None)
+        self.i = body.i
+        self._tmp_counter = body._tmp_counter
+        self.expect("done")
+
+        self.emit(OP_DEFUN, (name, body.code))
+
+    def compile_call(self, stop_tokens):
+        name = self.pop()
+        argc = 0
+        while True:
+            t = self.peek()
+            if t is None or t in stop_tokens or t in (";", "&&", "||"):
+                break
+            if t in ("|", ">", ">>"):
+                raise CompileError("%s: functions can't be piped or redirected" % name)
+            self.emit_value(self.pop())
+            argc += 1
+        self.emit(OP_CALL, name)
+
+    def emit_value(self, t):
+        if self.popped_literal():
+            self.emit(OP_ARG, t)
+        elif is_arith(t):
+            self.emit(OP_ARITH, compile_arith(t[3:-2]))
+        elif is_subst(t):
+            self.emit(OP_SUBST, compile_subst(t))
+        elif t.startswith("$") and len(t) > 1:
+            self.emit(OP_GET, t[1:])
+        else:
+            self.emit(OP_ARG, t)
+
+    def compile_command(self, stop_tokens):
+        if self.peek() in self.funcs:
+            self.compile_call(stop_tokens)
+            return
+        self.compile_pipeline(stop_tokens=stop_tokens.union({"&&", "||", ">", ">>"}))
+        self.compile_redirection_if_present()
+        self.emit(OP_EXEC, None)
+
     def compile_break(self):
         self.expect("break")
         if not self.loop_stack:
@@ -442,7 +971,11 @@ class Compiler:
         self.expect("continue")
         if not self.loop_stack:
             raise CompileError("continue used outside of a loop")
-        self.emit(OP_JMP, self.loop_stack[-1]["start"])
+        ctx = self.loop_stack[-1]
+        if "cont_jmps" in ctx:
+            ctx["cont_jmps"].append(self.emit(OP_JMP, None))
+        else:
+            self.emit(OP_JMP, ctx["start"])
 
     # ---- && / || chains + redirection ----
     def compile_chain(self, stop_tokens):
@@ -451,16 +984,18 @@ class Compiler:
         if t is not None and ("=" in t) and (not t.startswith("$")) and (t != "|"):
             name, val = t.split("=", 1)
             self.pop()
-            self.emit(OP_ARG, val)
-            self.emit(OP_SET, name)
-            # update last_truth quietly based on value
-            self.emit(OP_LOAD, "echo")
-            self.emit(OP_GET, name)
-            self.emit(OP_EXECQ, None)
+            if is_arith(val) and not self.popped_literal():
+                # x=$(( )): straight into vars (and last_truth), no pipeline
+                self.emit(OP_ARITH_SET, (name, compile_arith(val[3:-2])))
+            else:
+                self.emit_value(val)
+                self.emit(OP_SET, name)
+                # update last_truth quietly based on value
+                self.emit(OP_LOAD, "echo")
+                self.emit(OP_GET, name)
+                self.emit(OP_EXECQ, None)
         else:
-            self.compile_pipeline(stop_tokens=stop_tokens.union({"&&", "||", ">", ">>"}))
-            self.compile_redirection_if_present()
-            self.emit(OP_EXEC, None)
+            self.compile_command(stop_tokens)
 
         while True:
             op = self.peek()
@@ -470,17 +1005,13 @@ class Compiler:
 
             if op == "&&":
                 skip_rhs = self.emit(OP_JZ, None)
-                self.compile_pipeline(stop_tokens=stop_tokens.union({"&&", "||", ">", ">>"}))
-                self.compile_redirection_if_present()
-                self.emit(OP_EXEC, None)
+                self.compile_command(stop_tokens)
                 self.patch(skip_rhs, len(self.code))
             else:
                 run_rhs = self.emit(OP_JZ, None)
                 skip_rhs = self.emit(OP_JMP, None)
                 self.patch(run_rhs, len(self.code))
-                self.compile_pipeline(stop_tokens=stop_tokens.union({"&&", "||", ">", ">>"}))
-                self.compile_redirection_if_present()
-                self.emit(OP_EXEC, None)
+                self.compile_command(stop_tokens)
                 self.patch(skip_rhs, len(self.code))
 
     def compile_redirection_if_present(self):
@@ -511,6 +1042,21 @@ class Compiler:
 
             self.pop()
 
+            if self.popped_literal():
+                self.emit(OP_LOAD if expecting_cmd else OP_ARG, t)
+                expecting_cmd = False
+                continue
+
+            if is_arith(t) or is_subst(t):
+                if expecting_cmd:
+                    self.emit(OP_LOAD, "echo")  # bare $(..) evaluates to its value
+                if is_arith(t):
+                    self.emit(OP_ARITH, compile_arith(t[3:-2]))
+                else:
+                    self.emit(OP_SUBST, compile_subst(t))
+                expecting_cmd = False
+                continue
+
             if t.startswith("$") and len(t) > 1:
                 self.emit(OP_GET, t[1:])
                 expecting_cmd = False
@@ -522,20 +1068,122 @@ class Compiler:
             else:
                 self.emit(OP_ARG, t)
 
-def compile_line(line):
-    toks = tokenize(line.strip())
+_SUBST_OPS = (OP_LOAD, OP_ARG, OP_PIPE, OP_GET, OP_ARITH, OP_SUBST)
+
+def compile_subst(t):
+    # "$( pipeline )" -> tuple of pipeline-building ops for OP_SUBST
+    lits = set()
+    c = Compiler(tokenize(t[2:-1].strip(), lits), lits=lits)
+    c.compile_pipeline(stop_tokens=set())
+    if c.peek() is not None:
+        raise CompileError("$( ): only a pipeline is allowed, got '%s'" % c.peek())
+    if not c.code:
+        raise CompileError("$( ): empty command")
+    return tuple(c.code)
+
+def compile_line(line, functions=None):
+    # functions: names already defined in the VM, so calls compile to OP_CALL
+    lits = set()
+    toks = tokenize(line.strip(), lits)
     bg = False
-    if toks and toks[-1] == "&":
+    if toks and toks[-1] == "&" and len(toks) - 1 not in lits:
         bg = True
         toks = toks[:-1]
-    c = Compiler(toks)
+    c = Compiler(toks, functions, lits)
     return c.compile(), bg
 
+# -----------------------
+# Layered variable scope (copy-on-write for job clones)
+# -----------------------
+_UNSET = object()       # tombstone: name deleted in this layer
+_SCOPE_MAX_DEPTH = 8    # flatten frozen layers beyond this depth
+_MAX_CALL_DEPTH = 32    # function call frames
+
+class Scope:
+    # Dict-like: reads fall through to frozen parent layers, writes land in
+    # the small local overlay. Frozen layers are never written again.
+    __slots__ = ("local", "parent", "depth")
+
+    def __init__(self, parent=None, local=None):
+        self.local = {} if local is None else local
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    def get(self, name, default=None):
+        s = self
+        while s is not None:
+            if name in s.local:
+                v = s.local[name]
+                return default if v is _UNSET else v
+            s = s.parent
+        return default
+
+    def __getitem__(self, name):
+        v = self.get(name, _UNSET)
+        if v is _UNSET:
+            raise KeyError(name)
+        return v
+
+    def __setitem__(self, name, val):
+        self.local[name] = val
+
+    def __contains__(self, name):
+        return self.get(name, _UNSET) is not _UNSET
+
+    def pop(self, name, default=None):
+        v = self.get(name, _UNSET)
+        if v is _UNSET:
+            return default
+        if self.parent is not None and name in self.parent:
+            self.local[name] = _UNSET
+        else:
+            del self.local[name]
+        return v
+
+    def flatten(self):
+        layers = []
+        s = self
+        while s is not None:
+            layers.append(s.local)
+            s = s.parent
+        d = {}
+        for local in reversed(layers):
+            for k, v in local.items():
+                if v is _UNSET:
+                    d.pop(k, None)
+                else:
+                    d[k] = v
+        return d
+
+    def keys(self):
+        return self.flatten().keys()
+
+    def items(self):
+        return self.flatten().items()
+
+    def snapshot(self):
+        # Freeze the current contents and return the frozen layer; this
+        # scope continues as an empty overlay on top of it. O(1) except an
+        # occasional flatten once the chain gets deep.
+        if not self.local and self.parent is not None:
+            return self.parent
+        if self.depth >= _SCOPE_MAX_DEPTH:
+            frozen = Scope(local=self.flatten())
+        else:
+            frozen = Scope(self.parent, self.local)
+        self.local = {}
+        self.parent = frozen
+        self.depth = frozen.depth + 1
+        return frozen
+
 # -----------------------
 # Cooperative job system
 # -----------------------
 class Job:
     __slots__ = ("jid", "name", "gen", "done", "error")
+    threaded = False
+    output = None
+
     def __init__(self, jid, name, gen):
         self.jid = jid
         self.name = name
@@ -543,6 +1191,13 @@ class Job:
         self.done = False
         self.error = None
 
+    def kill(self):
+        self.done = True
+        try:
+            self.gen.close()  # run its finally: clauses (open files, sockets)
+        except Exception:
+            pass
+
     def step(self, n=1):
         if self.done:
             return
@@ -555,14 +1210,49 @@ class Job:
             self.done = True
             self.error = e
 
+class ThreadJob:
+    # Job whose VM runs on its own thread (blocking commands don't stall the
+    # shell). Printed output is collected and reported by fg / on completion.
+    __slots__ = ("jid", "name", "vm", "done", "error", "output")
+    threaded = True
+
+    def __init__(self, jid, name, vm):
+        self.jid = jid
+        self.name = name
+        self.vm = vm
+        self.done = False
+        self.error = None
+        self.output = []
+        vm.output = self.output
+
+    def start(self):
+        _start_thread(self._main, ())
+
+    def _main(self):
+        try:
+            self.vm.run()
+        except Exception as e:
+            self.error = e
+        finally:
+            _CTX.pop(_ident(), None)
+            self.done = True
+
+    def step(self, n=1):
+        pass  # runs by itself
+
+    def kill(self):
+        self.vm.cancelled = True
+
 # -----------------------
 # VM
 # -----------------------
+_VM_SEQ = [0]
+
 class VM:
     def __init__(self, commands=None, spool_path="STDOUT", spool_threshold=2048):
         self.token_stack = []
         self.value_stack = []
-        self.vars = {}
+        self.vars = Scope()
         self.pc = 0
         self.code = []
         self.commands = commands or {}
@@ -574,6 +1264,13 @@ class VM:
         self.spool_threshold = spool_threshold
 
         self._foreach_stack = []  # (varname, iterator)
+        _VM_SEQ[0] += 1
+        self.vid = _VM_SEQ[0]     # keeps foreach spool copies apart per VM
+
+        # user functions: name -> code
+        # call frames: (code, pc, saved positionals, foreach depth)
+        self.functions = {}
+        self.frames = []
 
         # jobs
         self.jobs = {}
@@ -582,11 +1279,33 @@ class VM:
         # scheduler-safe sleep state
         self.sleep_until = None
 
+        # run pipeline stages on threads (see "pipes" command)
+        self.pipe_threads = False
+
+        # run "&" jobs on threads (see "jobmode" command)
+        self.thread_jobs = False
+        self.cancelled = False   # set by kill on a thread job / exit
+        self.exit_status = None  # set by the exit command
+        self.output = None       # None: print; list: collect (thread jobs)
+        self.root = self         # the shell VM that owns the job table
+        self.console = True      # False: no sys.stdin here (serve sessions)
+
     def clone_for_job(self):
         jvm = VM(commands=self.commands, spool_path=self.spool_path, spool_threshold=self.spool_threshold)
-        jvm.vars = dict(self.vars)
+        jvm.vars = Scope(self.vars.snapshot())
+        jvm.functions = self.functions
+        jvm.pipe_threads = self.pipe_threads
+        jvm.root = self.root
+        jvm.console = self.console
         return jvm
 
+    def say(self, s):
+        # Console line for this VM's user: printed, or collected in .output
+        if self.output is None:
+            print(s)
+        else:
+            self.output.append(s)
+
     def truthy(self, s):
         if s is None:
             return False
@@ -596,192 +1315,402 @@ class VM:
         low = txt.lower()
         return low not in ("0", "false", "no", "nil")
 
-    def _maybe_spool(self, out):
+    def _spool_target(self, avoid):
+        # Alternate spool files so a stage can stream from the previous
+        # stage's spool while its own output is being spooled.
+        if avoid == self.spool_path:
+            return self.spool_path + "~"
+        return self.spool_path
+
+    def _maybe_spool(self, out, avoid=None):
+        if isinstance(out, PipeData) or isinstance(out, _LinePipe):
+            # already file-backed (e.g. cat returning a file reference)
+            return out
         if out is None:
             s = ""
         elif isinstance(out, str):
             s = out
+        elif hasattr(out, "__next__"):
+            return self._spool_iter(out, avoid)
         else:
             s = str(out)
 
         if self.spool_threshold and len(s) >= self.spool_threshold:
-            with open(self.spool_path, "w") as f:
+            path = self._spool_target(avoid)
+            with open(path, "w") as f:
                 f.write(s)
-            return PipeData(path=self.spool_path, is_file=True)
+            return PipeData(path=path, is_file=True, spool=True)
 
         return PipeData(text=s, is_file=False)
 
+    def _spool_iter(self, it, avoid):
+        # Streaming command output: RAM until the threshold, then the rest
+        # goes straight to the spool file line by line.
+        buf = []
+        n = 0
+        f = None
+        path = None
+        try:
+            for line in it:
+                if f is not None:
+                    f.write(line)
+                    continue
+                buf.append(line)
+                n += len(line)
+                if self.spool_threshold and n >= self.spool_threshold:
+                    path = self._spool_target(avoid)
+                    f = open(path, "w")
+                    f.write("".join(buf))
+                    buf = None
+        finally:
+            if f is not None:
+                f.close()
+        if f is not None:
+            return PipeData(path=path, is_file=True, spool=True)
+        return PipeData(text="".join(buf), is_file=False)
+
     def run(self, trace=False):
         self.pc = 0
-        while self.pc < len(self.code):
-            # Foreground sleep: block, but keep background jobs alive.
-            if self.sleep_until is not None:
-                while _ticks_diff(self.sleep_until, _ticks_ms()) > 0:
-                    self.poll_jobs(steps=80)
-                    _sleep_ms(20)
-                self.sleep_until = None
-
-            op, arg = self.code[self.pc]
-            self.pc += 1
-
-            if trace:
-                print("PC", self.pc-1, "OP", op, "ARG", arg)
-
-            if op == OP_LOAD:
-                self.token_stack.append(("cmd", arg))
-
-            elif op == OP_ARG:
-                self.token_stack.append(("arg", arg))
-                self.value_stack.append(arg)
-
-            elif op == OP_PIPE:
-                self.token_stack.append(("pipe", None))
-
-            elif op == OP_SET:
-                val = self.value_stack.pop() if self.value_stack else ""
-                self.vars[arg] = val
-
-            elif op == OP_GET:
-                val = self.vars.get(arg, "")
-                self.token_stack.append(("arg", val))
-                self.value_stack.append(val)
-
-            elif op == OP_EXEC or op == OP_EXECQ:
-                out = self.exec_pipeline()
-                self.last_output = out
-                self.last_truth = self.truthy(out)
-                if op == OP_EXEC and out is not None and out != "":
-                    print(out)
-                self.value_stack = []
-
-            elif op == OP_JMP:
-                self.pc = int(arg)
-
-            elif op == OP_JZ:
-                if not self.last_truth:
-                    self.pc = int(arg)
+        self.frames = []
+        fdepth = len(self._foreach_stack)
+        try:
+            while self.pc < len(self.code):
+                if self.cancelled:
+                    break
+
+                # Foreground sleep: block, but keep background jobs alive.
+                if self.sleep_until is not None:
+                    while _ticks_diff(self.sleep_until, _ticks_ms()) > 0 and not self.cancelled:
+                        self.poll_jobs(steps=80)
+                        _sleep_ms(20)
+                    self.sleep_until = None
+
+                op, arg = self.code[self.pc]
+                self.pc += 1
+
+                if trace:
+                    print("PC", self.pc-1, "OP", op, "ARG", arg)
+
+                if op == OP_LOAD:
+                    self.token_stack.append(("cmd", arg))
+
+                elif op == OP_ARG:
+                    self.token_stack.append(("arg", arg))
+                    self.value_stack.append(arg)
+
+                elif op == OP_PIPE:
+                    self.token_stack.append(("pipe", None))
+
+                elif op == OP_SET:
+                    self._set(arg)
 
-            elif op == OP_SETLIST:
-                name, items = arg
-                self.vars[name] = list(items)
-
-            elif op == OP_SPLITL:
-                s = "" if self.last_output is None else str(self.last_output)
-                self.vars[arg] = s.splitlines()
-
-            elif op == OP_FORE_INIT:
-                varname, listname = arg
-                items = self.vars.get(listname, [])
-                if items is None:
-                    items = []
-                if isinstance(items, str):
-                    items = items.splitlines()
-                it = iter(items)
-                self._foreach_stack.append((varname, it))
-
-            elif op == OP_FORE_NEXT:
-                if not self._foreach_stack:
+                elif op == OP_ARITH:
+                    val = eval_arith(arg, self.vars)
+                    self.token_stack.append(("arg", val))
+                    self.value_stack.append(val)
+
+                elif op == OP_ARITH_T:
+                    self.last_truth = eval_arith(arg, self.vars) != 0
+
+                elif op == OP_ARITH_SET:
+                    name, rpn = arg
+                    val = eval_arith(rpn, self.vars)
+                    self.vars[name] = val
+                    self.last_truth = val != 0
+
+                elif op == OP_SUBST:
+                    val = self._subst(arg)
+                    self.token_stack.append(("arg", val))
+                    self.value_stack.append(val)
+
+                elif op == OP_GET:
+                    val = self.vars.get(arg, "")
+                    self.token_stack.append(("arg", val))
+                    self.value_stack.append(val)
+
+                elif op == OP_EXEC or op == OP_EXECQ:
+                    out = self.exec_pipeline()
+                    self.last_output = out
+                    self.last_truth = self.truthy(out)
+                    if op == OP_EXEC and out is not None and out != "":
+                        self.say(out)
+                    self.value_stack = []
+
+                elif op == OP_JMP:
                     self.pc = int(arg)
-                else:
-                    varname, it = self._foreach_stack[-1]
-                    try:
-                        nxt = next(it)
-                        self.vars[varname] = str(nxt)
-                    except StopIteration:
-                        self._foreach_stack.pop()
+
+                elif op == OP_JZ:
+                    if not self.last_truth:
                         self.pc = int(arg)
 
-            elif op == OP_END:
-                break
+                elif op == OP_SETLIST:
+                    name, items = arg
+                    self.vars[name] = list(items)
 
-            else:
-                raise Exception("Unknown opcode: %r" % op)
+                elif op == OP_FORE_INIT:
+                    self._fore_init(arg)
+
+                elif op == OP_FORE_NEXT:
+                    self._fore_next(arg)
+
+                elif op == OP_FORE_END:
+                    self._fore_end()
 
+                elif op == OP_DEFUN:
+                    name, fcode = arg
+                    self.functions[name] = fcode
+
+                elif op == OP_CALL:
+                    self._call(arg)
+
+                elif op == OP_RET:
+                    self._ret()
+
+                elif op == OP_END:
+                    break
+
+                else:
+                    raise Exception("Unknown opcode: %r" % op)
+
+        finally:
+            self._unwind(fdepth)
         return self.last_output
 
     def run_generator(self):
         # Cooperative runner: yields frequently so it can be used as a background job.
         self.pc = 0
-        while self.pc < len(self.code):
-            # Background sleep: yield quickly until wake time (no re-entrancy).
-            if self.sleep_until is not None:
-                if _ticks_diff(self.sleep_until, _ticks_ms()) > 0:
-                    yield None
-                    continue
-                else:
-                    self.sleep_until = None
+        self.frames = []
+        fdepth = len(self._foreach_stack)
+        try:
+            while self.pc < len(self.code):
+                if self.cancelled:
+                    return
+
+                # Background sleep: yield quickly until wake time (no re-entrancy).
+                if self.sleep_until is not None:
+                    if _ticks_diff(self.sleep_until, _ticks_ms()) > 0:
+                        yield None
+                        continue
+                    else:
+                        self.sleep_until = None
+
+                op, arg = self.code[self.pc]
+                self.pc += 1
+
+                if op == OP_LOAD:
+                    self.token_stack.append(("cmd", arg))
+
+                elif op == OP_ARG:
+                    self.token_stack.append(("arg", arg))
+                    self.value_stack.append(arg)
+
+                elif op == OP_PIPE:
+                    self.token_stack.append(("pipe", None))
+
+                elif op == OP_SET:
+                    self._set(arg)
+
+                elif op == OP_ARITH:
+                    val = eval_arith(arg, self.vars)
+                    self.token_stack.append(("arg", val))
+                    self.value_stack.append(val)
+
+                elif op == OP_ARITH_T:
+                    self.last_truth = eval_arith(arg, self.vars) != 0
+
+                elif op == OP_ARITH_SET:
+                    name, rpn = arg
+                    val = eval_arith(rpn, self.vars)
+                    self.vars[name] = val
+                    self.last_truth = val != 0
+
+                elif op == OP_SUBST:
+                    val = self._subst(arg)
+                    self.token_stack.append(("arg", val))
+                    self.value_stack.append(val)
+
+                elif op == OP_GET:
+                    val = self.vars.get(arg, "")
+                    self.token_stack.append(("arg", val))
+                    self.value_stack.append(val)
+
+                elif op == OP_EXEC or op == OP_EXECQ:
+                    out = self.exec_pipeline()
+                    self.last_output = out
+                    self.last_truth = self.truthy(out)
+                    # background jobs drop output; a collecting VM keeps it
+                    if op == OP_EXEC and out and self.output is not None:
+                        self.output.append(out)
+                    self.value_stack = []
+
+                elif op == OP_JMP:
+                    self.pc = int(arg)
 
-            op, arg = self.code[self.pc]
-            self.pc += 1
+                elif op == OP_JZ:
+                    if not self.last_truth:
+                        self.pc = int(arg)
 
-            if op == OP_LOAD:
-                self.token_stack.append(("cmd", arg))
+                elif op == OP_SETLIST:
+                    name, items = arg
+                    self.vars[name] = list(items)
 
-            elif op == OP_ARG:
-                self.token_stack.append(("arg", arg))
-                self.value_stack.append(arg)
+                elif op == OP_FORE_INIT:
+                    self._fore_init(arg)
 
-            elif op == OP_PIPE:
-                self.token_stack.append(("pipe", None))
+                elif op == OP_FORE_NEXT:
+                    self._fore_next(arg)
 
-            elif op == OP_SET:
-                val = self.value_stack.pop() if self.value_stack else ""
-                self.vars[arg] = val
+                elif op == OP_FORE_END:
+                    self._fore_end()
 
-            elif op == OP_GET:
-                val = self.vars.get(arg, "")
-                self.token_stack.append(("arg", val))
-                self.value_stack.append(val)
+                elif op == OP_DEFUN:
+                    name, fcode = arg
+                    self.functions[name] = fcode
 
-            elif op == OP_EXEC or op == OP_EXECQ:
-                out = self.exec_pipeline()
-                self.last_output = out
-                self.last_truth = self.truthy(out)
-                self.value_stack = []
+                elif op == OP_CALL:
+                    self._call(arg)
 
-            elif op == OP_JMP:
-                self.pc = int(arg)
+                elif op == OP_RET:
+                    self._ret()
 
-            elif op == OP_JZ:
-                if not self.last_truth:
-                    self.pc = int(arg)
+                elif op == OP_END:
+                    break
 
-            elif op == OP_SETLIST:
-                name, items = arg
-                self.vars[name] = list(items)
-
-            elif op == OP_SPLITL:
-                s = "" if self.last_output is None else str(self.last_output)
-                self.vars[arg] = s.splitlines()
-
-            elif op == OP_FORE_INIT:
-                varname, listname = arg
-                items = self.vars.get(listname, [])
-                if items is None:
-                    items = []
-                if isinstance(items, str):
-                    items = items.splitlines()
-                it = iter(items)
-                self._foreach_stack.append((varname, it))
-
-            elif op == OP_FORE_NEXT:
-                if not self._foreach_stack:
-                    self.pc = int(arg)
-                else:
-                    varname, it = self._foreach_stack[-1]
-                    try:
-                        nxt = next(it)
-                        self.vars[varname] = str(nxt)
-                    except StopIteration:
-                        self._foreach_stack.pop()
-                        self.pc = int(arg)
+                yield None  # cooperate often
+        finally:
+            self._unwind(fdepth)
 
-            elif op == OP_END:
-                break
+    def _subst(self, code):
+        # Run a nested pipeline on fresh stacks; output stays in RAM unless
+        # it crosses the spool threshold like any other pipeline.
+        saved = (self.token_stack, self.value_stack)
+        self.token_stack = []
+        self.value_stack = []
+        try:
+            for op, arg in code:
+                if op == OP_LOAD:
+                    self.token_stack.append(("cmd", arg))
+                elif op == OP_ARG:
+                    self.token_stack.append(("arg", arg))
+                elif op == OP_PIPE:
+                    self.token_stack.append(("pipe", None))
+                elif op == OP_GET:
+                    self.token_stack.append(("arg", self.vars.get(arg, "")))
+                elif op == OP_ARITH:
+                    self.token_stack.append(("arg", eval_arith(arg, self.vars)))
+                elif op == OP_SUBST:
+                    self.token_stack.append(("arg", self._subst(arg)))
+            out = self.exec_pipeline()
+        finally:
+            self.token_stack, self.value_stack = saved
+        return out.rstrip("\n")
+
+    # ---- functions ----
+    def _call(self, name):
+        fcode = self.functions.get(name)
+        args = self.value_stack
+        self.value_stack = []
+        self.token_stack = []
+        if fcode is None:
+            raise Exception("function not defined: %s" % name)
+        if len(self.frames) >= _MAX_CALL_DEPTH:
+            raise Exception("%s: call depth exceeded" % name)
+        # bind $1..$n and $# on vars; previous values restored by OP_RET
+        saved = {"#": self.vars.get("#", _UNSET)}
+        self.vars["#"] = len(args)
+        i = 1
+        for a in args:
+            k = str(i)
+            saved[k] = self.vars.get(k, _UNSET)
+            self.vars[k] = a
+            i += 1
+        k = str(i)
+        while k in self.vars:  # hide caller's extra positionals
+            saved[k] = self.vars.pop(k)
+            i += 1
+            k = str(i)
+        self.frames.append((self.code, self.pc, saved, len(self._foreach_stack)))
+        self.code = fcode
+        self.pc = 0
 
-            yield None  # cooperate often
+    def _ret(self):
+        if not self.frames:
+            self.pc = len(self.code)  # top-level return: stop
+            return
+        self.code, self.pc, saved, fdepth = self.frames.pop()
+        while len(self._foreach_stack) > fdepth:  # return from inside foreach
+            self._fore_end()
+        for k in saved:
+            v = saved[k]
+            if v is _UNSET:
+                self.vars.pop(k)
+            else:
+                self.vars[k] = v
+
+    def _unwind(self, fdepth):
+        # A run that stopped early (error, exit, top-level return) leaves
+        # call frames and open foreach readers behind: restore the caller's
+        # positionals and close the readers (and their spool copies).
+        while self.frames:
+            self._ret()
+        while len(self._foreach_stack) > fdepth:
+            self._fore_end()
+
+    def _set(self, name):
+        val = self.value_stack.pop() if self.value_stack else ""
+        # the value was also queued as a pipeline arg; it is consumed here
+        if self.token_stack and self.token_stack[-1][0] == "arg":
+            self.token_stack.pop()
+        self.vars[name] = val
+
+    # ---- foreach ----
+    def _fore_init(self, arg):
+        varname, listname = arg
+        if listname is None:
+            # pipeline foreach: stream lines from the output
+            data = self.exec_pipeline_data()
+            self.value_stack = []
+            if data.spool:
+                # keep the loop body's own pipelines from overwriting it
+                p = "%s.f%d.%d" % (self.spool_path, self.vid, len(self._foreach_stack))
+                try:
+                    os.remove(p)
+                except Exception:
+                    pass
+                os.rename(data.path, p)
+                data = PipeData(path=p, is_file=True, spool=True)
+            it = _LineIter(data)
+        else:
+            # compiler temporary: the iterator owns it from here on
+            items = self.vars.pop(listname, [])
+            if items is None:
+                items = []
+            if isinstance(items, str):
+                items = items.splitlines()
+            it = iter(items)
+        self._foreach_stack.append((varname, it))
+
+    def _fore_next(self, exit_pc):
+        if not self._foreach_stack:
+            self.pc = int(exit_pc)
+            return
+        varname, it = self._foreach_stack[-1]
+        try:
+            nxt = next(it)
+            self.vars[varname] = str(nxt)
+        except StopIteration:
+            self.pc = int(exit_pc)
+
+    def _fore_end(self):
+        if self._foreach_stack:
+            _, it = self._foreach_stack.pop()
+            if isinstance(it, _LineIter):
+                it.close()
 
     def exec_pipeline(self):
+        return self.exec_pipeline_data().as_text()
+
+    def exec_pipeline_data(self):
         items = self.token_stack
         self.token_stack = []
 
@@ -804,20 +1733,76 @@ class VM:
                     flush()
                 current_cmd = val
             elif kind == "arg":
-                current_args.append(val)
+                current_args.append(_to_str(val))
 
         flush()
 
-        out = PipeData(text="", is_file=False)
+        if self.pipe_threads and len(pipeline) > 1 and _threads() is not None:
+            return self._exec_threaded(pipeline)
+        return self._exec_seq(pipeline)
+
+    def _exec_seq(self, pipeline, out=None):
+        # Stages one after another, each output spooled before the next runs.
+        if out is None:
+            out = PipeData(text="", is_file=False)
         for cmd, args in pipeline:
             out_raw = self.run_command(cmd, args, out)
-            out = self._maybe_spool(out_raw)
-
-        return out.as_text()
+            out = self._maybe_spool(out_raw, out.path if out.spool else None)
+        return out
+
+    def _exec_threaded(self, pipeline):
+        # Every stage but the last runs on its own thread, connected by
+        # bounded _LinePipe queues; the last stage runs here and is spooled
+        # as usual. Stage errors are re-raised once all workers finished.
+        # A redirect into a file the pipeline reads ("cat f | grep x > f")
+        # waits until the workers are done, as it would run sequentially.
+        hold = None
+        if _redirects_into_input(pipeline):
+            if len(pipeline) == 2:
+                return self._exec_seq(pipeline)
+            hold = pipeline[-1:]
+            pipeline = pipeline[:-1]
+        pipes = []
+        inp = PipeData(text="", is_file=False)
+        for cmd, args in pipeline[:-1]:
+            outp = _LinePipe()
+            _start_thread(self._run_stage, (cmd, args, inp, outp))
+            pipes.append(outp)
+            inp = outp
+        try:
+            cmd, args = pipeline[-1]
+            out = self._maybe_spool(self.run_command(cmd, args, inp))
+        finally:
+            for p in pipes:
+                p.abandon()
+            for p in pipes:
+                p.wait_finished()
+        for p in pipes:
+            if p.err is not None:
+                raise p.err
+        if hold is not None:
+            out = self._exec_seq(hold, out)
+        return out
+
+    def _run_stage(self, cmd, args, inp, outp):
+        err = None
+        try:
+            _feed_pipe(self.run_command(cmd, args, inp), outp)
+        except Exception as e:
+            err = e
+        finally:
+            if isinstance(inp, _LinePipe):
+                inp.abandon()  # stop our producer if we quit early
+            _CTX.pop(_ident(), None)
+            outp.finish(err)
 
     def run_command(self, cmd, args, input_data):
-        global _CURRENT_VM
+        if not self.console and cmd in _CONSOLE:
+            return "%s: reads the device console; not available in a serve session\n" % cmd
         fn = self.commands.get(cmd)
+        if fn is None and cmd in _LAZY:
+            _load_group(self.commands, _LAZY[cmd])
+            fn = self.commands.get(cmd)
         if fn is None:
             # Auto-resolve: if /lib/<cmd>.py exists, treat it like: run <cmd> <args...>
             # This makes installed modules feel like built-in commands.
@@ -826,21 +1811,33 @@ class VM:
                 os.stat(lib_path)  # exists?
                 runfn = self.commands.get("run")
                 if runfn is not None:
-                    _CURRENT_VM = self
+                    _set_current(self)
                     return runfn([cmd] + list(args), input_data)
             except Exception:
                 pass
             return "Error: command not found: %s" % cmd
-        _CURRENT_VM = self
+        _set_current(self)
         return fn(args, input_data)
 
     # ---- jobs ----
     def start_job(self, code, name):
         jvm = self.clone_for_job()
         jvm.code = code
+        if self.thread_jobs and _threads() is not None:
+            jid = self.next_jid
+            self.next_jid += 1
+            jvm.spool_path = "%s.j%d" % (self.spool_path, jid)  # don't race the shell's spool
+            job = ThreadJob(jid, name, jvm)
+            self.jobs[jid] = job
+            job.start()
+            return jid
+        return self.add_job(name, jvm.run_generator())
+
+    def add_job(self, name, gen):
+        # Register any generator as a background job (used by e.g. tail -f).
         jid = self.next_jid
         self.next_jid += 1
-        self.jobs[jid] = Job(jid, name, jvm.run_generator())
+        self.jobs[jid] = Job(jid, name, gen)
         return jid
 
     def poll_jobs(self, steps=50):
@@ -853,18 +1850,79 @@ class VM:
         for jid in dead:
             job = self.jobs[jid]
             if job.error:
-                print("[{}] {} (error: {})".format(jid, job.name, job.error))
+                self.say("[{}] {} (error: {})".format(jid, job.name, job.error))
             else:
-                print("[{}] {} (done)".format(jid, job.name))
+                self.say("[{}] {} (done)".format(jid, job.name))
+            if job.output:
+                self.say("\n".join(job.output))
             del self.jobs[jid]
 
+# -----------------------
+# Lazily loaded command groups: command name -> module pushvm_<group>.py.
+# A group is imported the first time one of its commands runs, so unused
+# commands never take RAM. Modules export load(pushvm_module) -> {name: fn}.
+# -----------------------
+_LAZY = {
+    "ls": "fs", "find": "fs", "pwd": "fs", "cd": "fs", "cat": "fs", "cp": "fs",
+    "rename": "fs", "mkdir": "fs", "rmdir": "fs", "rm": "fs", "df": "fs", "du": "fs",
+    "edit": "fs", "write": "fs", "append": "fs",
+    "head": "text", "tail": "text", "wc": "text", "grep": "text",
+    "upper": "text", "sed": "text",
+    "scanwifi": "net", "connect": "net", "ifconfig": "net", "wget": "net",
+    "httpstat": "net",
+    "jobs": "jobctl", "kill": "jobctl", "fg": "jobctl",
+    "jobmode": "jobctl", "pipes": "jobctl",
+    "recv": "xfer", "send": "xfer",
+    "serve": "serve", "rpc": "rpc", "index": "index",
+}
+# commands that read sys.stdin: refused in VMs without a console (a serve
+# session would block the whole server waiting for the device's input)
+_CONSOLE = ("rpc", "edit", "recv", "send", "connect")
+
+_LOADED = []   # groups imported so far (in load order)
+# "pushvm." when imported as pushvm.pushvm (python -m pushvm), else ""
+_PKG = __name__[:__name__.rfind(".") + 1]
+
+def _load_group(commands, group):
+    name = _PKG + "pushvm_" + group
+    __import__(name)
+    table = sys.modules[name].load(sys.modules[__name__])
+    for k in table:
+        if k not in commands:  # keep user overrides
+            commands[k] = table[k]
+    if group not in _LOADED:
+        _LOADED.append(group)
+
+# -----------------------
+# exit command (ends the running script or line)
+# -----------------------
+def cmd_exit(args, input_data):
+    # exit [n]: stop the running VM (ends a script with status n)
+    vm = current_vm()
+    if vm is None:
+        return ""
+    vm.exit_status = _as_int(args[0]) if args else 0
+    vm.cancelled = True
+    return ""
+
 # -----------------------
 # sleep command (scheduler-safe, works for bg jobs)
 # -----------------------
 def cmd_sleep(args, input_data):
-    global _CURRENT_VM
     if not args:
         return ""
+    try:
+        secs = float(args[0])
+    except Exception:
+        return ""
+    ms = int(secs * 1000)
+    if ms <= 0:
+        return ""
+    vm = current_vm()
+    if vm is None:
+        return ""
+    vm.sleep_until = _ticks_add(_ticks_ms(), ms)
+    return ""
 
 
 def cmd_run(args, input_data):
@@ -908,41 +1966,32 @@ def cmd_run(args, input_data):
     except Exception as e:
         return "run: error running %s: %s\n" % (modname, e)
 
-    try:
-        secs = float(args[0])
-    except Exception:
-        return ""
-    ms = int(secs * 1000)
-    if ms <= 0:
-        return ""
-    if _CURRENT_VM is None:
-        return ""
-    _CURRENT_VM.sleep_until = _ticks_add(_ticks_ms(), ms)
-    return ""
-
 # -----------------------
 # Commands (Signature: fn(args, input_data)->str)
 # -----------------------
 def cmd_help(args, input_data):
     return (
         "PUSH ver: " + VERSION + "\n\n"
-        "commands: exit, ls, uname, free, df, pwd, cat, cp, cd, mkdir,\n"
-        "grep, rmdir, exec, rm, date,\n"
-        "scanwifi, connect, ifconfig, edit, rename\n"
+        "commands: exit, ls [-l], find [dir] [-name pat] [-type f|d], uname,\n"
+        "free, df, du [-s|-i|-x] [dir], pwd, cat, cp, cd, mkdir,\n"
+        "grep, head, tail, sed, rmdir, exec, rm, date,\n"
+        "scanwifi, connect, ifconfig, wget [-O file] <url>, edit, rename\n"
+        "httpstat [-c]: wget keep-alive pool and DNS cache counters\n"
+        "transfer: recv <path>, send <path> (host side: pushxfer.py)\n"
+        "serve [-n max] <port>: TCP shell sessions (nc/telnet), kill <id> stops\n"
+        "  (needs the live REPL or pushvm.py -c \"serve N\"; basic REPL stalls it)\n"
+        "rpc: JSON batch frames for automation (see pushvm_rpc.py)\n"
+        "index build <file>, index grep [-i] [-n] <term> <file>: indexed log search\n"
         "extras: echo, upper, wc, test, write (>), append (>>), sleep\n"
+        "pipes [thread|seq]: run pipeline stages on threads (helps stages\n"
+        "  that wait on I/O, e.g. wget; CPU-only pipelines gain nothing)\n"
         "flow: if/while/for/foreach, break/continue, &&/||, vars x=val $x, jobs &\n"
-        "jobctl: jobs, kill <id>, fg <id>\n"
+        "func: function name do ... done; name a b ($1 $2 $#); return\n"
+        "math: $(( expr )) e.g. x=$((x*2+1)); if $((x > 3)) then ... fi\n"
+        "subst: $( pipeline ) e.g. x=$(free); echo $(ls | wc)\n"
+        "jobctl: jobs, kill <id>, fg <id>, jobmode [thread|coop]\n"
     )
 
-def cmd_ls(args, input_data):
-    path = args[0] if args else ""
-    try:
-        if path:
-            return "\n".join(os.listdir(path))
-        return "\n".join(os.listdir())
-    except Exception:
-        return "Syntax Error\n"
-
 def cmd_uname(args, input_data):
     try:
         return "\n".join(os.uname())
@@ -954,121 +2003,6 @@ def cmd_free(args, input_data):
         return "free not supported\n"
     return str(gc.mem_free())
 
-def cmd_df(args, input_data):
-    try:
-        st = os.statvfs("/")
-        total = float(st[2]) * float(st[0])
-        used  = float(st[3]) * float(st[0])
-        free  = total - used
-        return "Free: %s Used: %s Total: %s" % (free, used, total)
-    except Exception:
-        return "df error\n"
-
-def cmd_pwd(args, input_data):
-    return os.getcwd()
-
-def cmd_cd(args, input_data):
-    path = args[0] if args else ""
-    try:
-        os.chdir(path)
-        return path
-    except Exception:
-        return "Error. Couldn't cd\n"
-
-def cmd_cat(args, input_data):
-    if args:
-        try:
-            with open(args[0], "r") as f:
-                return f.read()
-        except Exception:
-            return "Couldn't open file\n"
-    return input_data.as_text() if input_data is not None else ""
-
-def cmd_wc(args, input_data):
-    try:
-        if args:
-            x = 0
-            with open(args[0], "r") as f:
-                for _ in f:
-                    x += 1
-            return str(x) + "\n"
-        s = input_data.as_text() if input_data is not None else ""
-        return str(len(s.splitlines())) + "\n"
-    except Exception:
-        return "Couldn't open file\n"
-
-def cmd_grep(args, input_data):
-    import re
-    if not args:
-        return ""
-    rgx = args[0]
-    out = []
-    try:
-        if len(args) >= 2:
-            with open(args[1], "r") as f:
-                for line in f:
-                    if re.search(rgx, line):
-                        out.append(line)
-        else:
-            r = input_data.open_reader() if input_data is not None else _StringLineReader("")
-            try:
-                for line in r:
-                    if re.search(rgx, line):
-                        out.append(line)
-            finally:
-                try: r.close()
-                except: pass
-        return "".join(out)
-    except Exception:
-        return "Couldn't perform.\n"
-
-def cmd_cp(args, input_data):
-    if len(args) < 2:
-        return "Couldn't copy.\n"
-    src, dst = args[0], args[1]
-    try:
-        with open(src, "r") as f:
-            data = f.read()
-        with open(dst, "w") as f:
-            f.write(data)
-        return "File " + src + " copied."
-    except Exception:
-        return "Couldn't copy.\n"
-
-def cmd_rename(args, input_data):
-    if len(args) < 2:
-        return "Couldn't rename\n"
-    src, dst = args[0], args[1]
-    try:
-        os.rename(src, dst)
-        return src + " renamed.."
-    except Exception:
-        return "Couldn't rename\n"
-
-def cmd_mkdir(args, input_data):
-    name = args[0] if args else ""
-    try:
-        os.mkdir(name)
-        return "Directory " + name + " created.\n"
-    except Exception:
-        return "Couldn't make directory\n"
-
-def cmd_rmdir(args, input_data):
-    name = args[0] if args else ""
-    try:
-        os.rmdir(name)
-        return "Removed " + name + ".\n"
-    except Exception:
-        return "Couldn't remove dir.\n"
-
-def cmd_rm(args, input_data):
-    name = args[0] if args else ""
-    try:
-        os.unlink(name)
-        return "Removed file " + name + "\n"
-    except Exception:
-        return "Couldn't remove file\n"
-
 def cmd_date(args, input_data):
     dateTimeObj = time.localtime()
     year,month,day,hour,minu,sec,wday,yday = (dateTimeObj)
@@ -1094,115 +2028,10 @@ def cmd_exec(args, input_data):
     except Exception:
         return "Error: Check Syntax\n"
 
-def cmd_scanwifi(args, input_data):
-    if network is None:
-        return "scanwifi: network module not available\n"
-    try:
-        wlan = network.WLAN(network.STA_IF)
-        wlan.active(True)
-        nets = wlan.scan()
-        out = []
-        for i in nets:
-            try:
-                out.append(i[0].decode())
-            except Exception:
-                out.append(str(i[0]))
-        return "\n".join(out) + ("\n" if out else "")
-    except Exception:
-        return "Couldn't scan networks.\n"
-
-def cmd_connect(args, input_data):
-    if network is None:
-        return "connect: network module not available\n"
-    print("Enter SSID: ")
-    ssid = input()
-    print("Enter wifi pw: ")
-    wifipw = input()
-    try:
-        print("attempting to connect..\n")
-        wlan = network.WLAN(network.STA_IF)
-        wlan.active(True)
-        wlan.connect(ssid, wifipw)
-        time.sleep(5)
-        return "Check ifconfig..\n"
-    except Exception:
-        return "Error: couldn't obtain address\n"
-
-def cmd_ifconfig(args, input_data):
-    if network is None:
-        return "ifconfig: network module not available\n"
-    try:
-        wlan = network.WLAN(network.STA_IF)
-        status = wlan.ifconfig()
-        return (
-            "\nIP........... " + status[0] +
-            "\nNETMASK......." + status[1] + "\n" +
-            "GATEWAY......." + status[2]
-        )
-    except Exception:
-        return "Couldn't get interface or check syntax.\n"
-
-def cmd_edit(args, input_data):
-    if not args:
-        return "Couldn't write file\n"
-    path = args[0]
-    print("EDIT MODE DETECTED...\n")
-    print("(ENTER STOPEDIT to stop)\n")
-    try:
-        with open(path, "w") as f:
-            while True:
-                line = input()
-                if "STOPEDIT" in line:
-                    break
-                f.write(line + "\n")
-        return "File " + path + " created..\n"
-    except Exception:
-        return "Couldn't write file\n"
-
 # extras
 def cmd_echo(args, input_data):
     return " ".join([str(a) for a in args])
 
-def cmd_upper(args, input_data):
-    s = input_data.as_text() if input_data is not None else ""
-    return s.upper()
-
-def cmd_write(args, input_data):
-    if not args:
-        return "write: missing filename\n"
-    path = args[0]
-    s = input_data.as_text() if input_data is not None else ""
-    try:
-        with open(path, "w") as f:
-            f.write(s)
-        return ""
-    except Exception:
-        return "Couldn't write file\n"
-
-def cmd_append(args, input_data):
-    if not args:
-        return "append: missing filename\n"
-    path = args[0]
-    s = input_data.as_text() if input_data is not None else ""
-    try:
-        with open(path, "a") as f:
-            f.write(s)
-        return ""
-    except Exception:
-        # fallback if append not supported
-        try:
-            old = ""
-            try:
-                with open(path, "r") as r:
-                    old = r.read()
-            except Exception:
-                old = ""
-            with open(path, "w") as w:
-                w.write(old + s)
-            return ""
-        except Exception:
-            return "Couldn't append file\n"
-
 def cmd_test(args, input_data):
     # support [ ... ] by ignoring trailing ]
     if args and args[-1] == "]":
@@ -1220,8 +2049,7 @@ def cmd_test(args, input_data):
                 return ""
         if op == "-d":
             try:
-                os.listdir(a)
-                return "1"
+                return "1" if os.stat(a)[0] & 0x4000 else ""
             except Exception:
                 return ""
         if op == "-z":
@@ -1261,89 +2089,21 @@ def make_vm():
         if len(args) < 2:
             return ""
         name, delta_s = args[0], args[1]
-        v = vm.vars.get(name, "0")
-        try:
-            n = int(str(v).strip())
-        except Exception:
-            n = 0
-        try:
-            d = int(str(delta_s).strip())
-        except Exception:
-            d = 0
-        vm.vars[name] = str(n + d)
-        return ""
-
-    def cmd_jobs(args, input_data):
-        if not vm.jobs:
-            return "(no jobs)\n"
-        lines = []
-        for jid, job in vm.jobs.items():
-            state = "done" if job.done else "running"
-            lines.append("[{}] {} - {}".format(jid, state, job.name))
-        return "\n".join(lines) + "\n"
-
-    def cmd_kill(args, input_data):
-        if not args:
-            return "kill: usage kill <jobid>\n"
-        try:
-            jid = int(args[0])
-        except Exception:
-            return "kill: bad jobid\n"
-        job = vm.jobs.get(jid)
-        if not job:
-            return "kill: no such job\n"
-        job.done = True
-        return ""
-
-    def cmd_fg(args, input_data):
-        if not args:
-            return "fg: usage fg <jobid>\n"
-        try:
-            jid = int(args[0])
-        except Exception:
-            return "fg: bad jobid\n"
-        job = vm.jobs.get(jid)
-        if not job:
-            return "fg: no such job\n"
-        while not job.done:
-            job.step(n=200)
-        err = job.error
-        del vm.jobs[jid]
-        if err:
-            return "fg: job error: %s\n" % err
+        cur = current_vm() or vm  # job clones keep their own vars
+        cur.vars[name] = _as_int(cur.vars.get(name, 0)) + _as_int(delta_s)
         return ""
 
+    # fs/text/net/jobctl commands are loaded on first use (see _LAZY)
     vm.commands.update({
         # your commands
         "help": cmd_help,
-        "ls": cmd_ls,
         "uname": cmd_uname,
         "free": cmd_free,
-        "df": cmd_df,
-        "pwd": cmd_pwd,
-        "cat": cmd_cat,
-        "wc": cmd_wc,
-        "grep": cmd_grep,
-        "cp": cmd_cp,
-        "cd": cmd_cd,
-        "rename": cmd_rename,
-        "mkdir": cmd_mkdir,
-        "rmdir": cmd_rmdir,
         "exec": cmd_exec,
-        "rm": cmd_rm,
         "date": cmd_date,
-        "scanwifi": cmd_scanwifi,
-        "connect": cmd_connect,
-        "ifconfig": cmd_ifconfig,
-        "edit": cmd_edit,
 
         # extras
         "echo": cmd_echo,
-        "upper": cmd_upper,
-
-        # redirection
-        "write": cmd_write,
-        "append": cmd_append,
 
         # test + helpers used by loops/chains
         "test": cmd_test,
@@ -1352,12 +2112,8 @@ def make_vm():
 
         # sleep
         "sleep": cmd_sleep,
+        "exit": cmd_exit,
         "run": cmd_run,
-
-        # job control
-        "jobs": cmd_jobs,
-        "kill": cmd_kill,
-        "fg": cmd_fg,
     })
 
     return vm
@@ -1365,7 +2121,19 @@ def make_vm():
 # -----------------------
 # REPL (auto: live on MicroPython when pollable, basic otherwise)
 # -----------------------
+def _select():
+    # imported on demand: only the live REPL needs it
+    try:
+        import uselect as select  # MicroPython
+    except Exception:
+        try:
+            import select  # CPython fallback
+        except Exception:
+            select = None
+    return select
+
 def stdin_is_pollable():
+    select = _select()
     if select is None:
         return False
     try:
@@ -1377,12 +2145,13 @@ def stdin_is_pollable():
         return False
 
 def run_line(vm, line):
-    code, bg = compile_line(line)
+    code, bg = compile_line(line, vm.functions)
     if bg:
         jid = vm.start_job(code, name=line)
-        print("[{}] started {}".format(jid, line))
+        vm.say("[{}] started {}".format(jid, line))
     else:
         vm.code = code
+        vm.cancelled = False
         vm.run(trace=False)
 
 def repl_blocking(vm):
@@ -1405,8 +2174,11 @@ def repl_blocking(vm):
             print("Compile error:", ce)
         except Exception as e:
             print("Error:", e)
+        if vm.exit_status is not None:
+            break
 
 def repl_nonblocking(vm):
+    select = _select()
     p = select.poll()
     p.register(sys.stdin, select.POLLIN)
 
@@ -1462,6 +2234,8 @@ def repl_nonblocking(vm):
                     print("Compile error:", ce)
                 except Exception as e:
                     print("Error:", e)
+                if vm.exit_status is not None:
+                    return
 
             sys.stdout.write("push> ")
             try:
@@ -1496,12 +2270,225 @@ def repl_auto(vm):
         print("Interactive mode: basic (background jobs run between commands)")
         repl_blocking(vm)
 
-def repl():
+def _heap_used():
+    if gc is None or not hasattr(gc, "mem_alloc"):
+        return None
+    gc.collect()
+    return gc.mem_alloc()
+
+def startup_report(vm=None):
+    # Import time/heap of this module, cost of make_vm, and which lazy
+    # command groups are resident. Heap figures need MicroPython's gc.
+    lines = ["import: %d ms" % _IMPORT_MS]
+    if vm is None:
+        t0 = _ticks_ms()
+        vm = make_vm()
+        lines.append("make_vm: %d ms" % _ticks_diff(_ticks_ms(), t0))
+    heap = _heap_used()
+    if heap is None:
+        lines.append("heap: n/a")
+    else:
+        lines.append("heap used: %d (import %d) free: %d" % (
+            heap, _IMPORT_HEAP, gc.mem_free()))
+    lines.append("commands: %d resident, %d lazy, groups loaded: %s" % (
+        len(vm.commands),
+        len([c for c in _LAZY if c not in vm.commands]),
+        " ".join(_LOADED) or "-"))
+    return "\n".join(lines) + "\n"
+
+def repl(stats=False):
+    # stats=True prints startup_report() before the prompt
+    t0 = _ticks_ms()
     vm = make_vm()
+    if stats:
+        print("make_vm: %d ms" % _ticks_diff(_ticks_ms(), t0))
+        print(startup_report(vm), end="")
     print("PUSH VM", VERSION)
     print("Type 'help'. Use 'exit' to quit.")
     print("Background: add '&' at end. Job control: jobs/kill/fg.")
     repl_auto(vm)
 
+# -----------------------
+# Non-interactive entry point
+#   pushvm.py -c "line" [args...]       run one line ($1.. = args)
+#   pushvm.py script.push [args...]     run a script (blocks may span lines)
+#   pushvm.py -j N -c "line" dir...     run once per dir in N worker processes
+#   pushvm.py -j N -f script dir...     (each run: own VM, cwd = dir, $1 = dir)
+#   pushvm.py -j N a.push b.push ...    run several scripts in parallel
+#   pushvm.py --startup                 print startup_report() and exit
+# Outputs of a batch are printed in argument order.
+# Exit status: 0 ok, 1 a command raised, 2 compile/usage error, or "exit N".
+# -----------------------
+_USAGE = ("usage: pushvm [--startup] [-c line | -f script | script] [args...]\n"
+          "       pushvm -j N (-c line | -f script) dir...\n"
+          "       pushvm -j N script...\n")
+
+def _err(msg):
+    try:
+        sys.stderr.write("pushvm: %s\n" % msg)
+    except Exception:
+        print("pushvm:", msg)
+
+def _read_script(path):
+    with open(path) as f:
+        return f.read().split("\n")
+
+def _set_positionals(vm, args):
+    for i, a in enumerate(args):
+        vm.vars[str(i + 1)] = a
+    vm.vars["#"] = len(args)
+
+def run_script(vm, lines):
+    # Run lines in order, then wait for background jobs. Returns exit status.
+    # A line that opens a block (if/while/for/foreach/function) without
+    # closing it is joined with the following lines, "; "-separated, until
+    # the block compiles; then/do stay on the line of their keyword.
+    status = 0
+    buf = ""
+    pending = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        buf = buf + " ; " + line if buf else line
+        try:
+            run_line(vm, buf)
+        except CompileIncomplete as ce:
+            pending = ce
+            continue
+        except CompileError as ce:
+            _err("compile error: %s" % ce)
+            return 2
+        except Exception as e:
+            _err("error: %s" % e)
+            status = 1
+        buf = ""
+        if vm.exit_status is not None:
+            status = vm.exit_status
+            break
+    if buf:
+        _err("compile error: %s" % pending)
+        return 2
+    while vm.jobs:
+        vm.poll_jobs(steps=200)
+        if vm.jobs:
+            _sleep_ms(5)
+    return status
+
+def _batch_worker(task):
+    # Runs in a worker process: (lines, item, chdir) -> (output, status)
+    lines, item, chdir = task
+    import io
+    import shutil
+    import tempfile
+    home = os.getcwd()
+    # spool files (and their ~ / job / foreach variants) go to a private
+    # absolute dir, not into the target directory the script runs in
+    spool = tempfile.mkdtemp(prefix="pushvm.")
+    buf = io.StringIO()
+    out, err = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = buf
+    try:
+        if chdir:
+            os.chdir(item)
+        vm = make_vm()
+        vm.spool_path = os.path.join(spool, "STDOUT")
+        if chdir:
+            _set_positionals(vm, [item])
+        status = run_script(vm, lines)
+    except Exception as e:
+        _err("%s: %s" % (item, e))
+        status = 1
+    finally:
+        sys.stdout, sys.stderr = out, err
+        os.chdir(home)
+        shutil.rmtree(spool, ignore_errors=True)
+    return buf.getvalue(), status
+
+def run_batch(tasks, workers):
+    # Fan tasks out to worker processes; print outputs in task order.
+    import multiprocessing
+    status = 0
+    pool = multiprocessing.Pool(workers)
+    try:
+        for out, st in pool.imap(_batch_worker, tasks):
+            if out:
+                sys.stdout.write(out)
+            status = max(status, st)
+    finally:
+        pool.close()
+        pool.join()
+    return status
+
+def main(argv):
+    line = None
+    script = None
+    workers = 0
+    rest = []
+    i = 0
+    try:
+        while i < len(argv):
+            a = argv[i]
+            if a == "-c":
+                line = argv[i + 1]
+                i += 2
+            elif a == "-f":
+                script = argv[i + 1]
+                i += 2
+            elif a == "-j":
+                workers = int(argv[i + 1])
+                i += 2
+            elif a == "--startup":
+                print(startup_report(), end="")
+                return 0
+            elif a in ("-h", "--help"):
+                print(_USAGE, end="")
+                return 0
+            else:
+                rest = argv[i:]
+                break
+    except (IndexError, ValueError):
+        sys.stderr.write(_USAGE)
+        return 2
+
+    if line is None and script is None and not rest:
+        if workers:
+            sys.stderr.write(_USAGE)
+            return 2
+        repl()
+        return 0
+
+    try:
+        if line is not None:
+            lines = [line]
+        elif script is not None:
+            lines = _read_script(script)
+        elif workers:
+            lines = None
+        else:
+            script = rest.pop(0)
+            lines = _read_script(script)
+        if lines is None:
+            tasks = [(_read_script(p), p, False) for p in rest]
+        else:
+            tasks = [(lines, d, True) for d in rest]
+    except OSError as e:
+        _err(e)
+        return 2
+
+    if workers:
+        if not tasks:
+            sys.stderr.write(_USAGE)
+            return 2
+        return run_batch(tasks, workers)
+
+    vm = make_vm()
+    _set_positionals(vm, rest)
+    return run_script(vm, lines)
+
+# module body done: record its cost for startup_report()
+_IMPORT_MS = _ticks_diff(_ticks_ms(), _T_IMPORT)
+_IMPORT_HEAP = (gc.mem_alloc() - _HEAP_IMPORT) if _HEAP_IMPORT is not None else 0
+
 if __name__ == "__main__":
-    repl()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,653 @@
+# pushvm_fs.py
+# PUSH VM file system commands: ls, find, pwd, cd, cat, cp, rename, mkdir,
+# rmdir, rm, df, du, edit, write (>), append (>>).
+# Loaded by pushvm on first use of one of its commands (see pushvm._LAZY).
+
+import os
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("PipeData", "_CHUNK")
+
+_S_IFDIR = 0x4000
+
+def _join(base, name):
+    if not base or base == ".":
+        return name if not base else "./" + name
+    return base.rstrip("/") + "/" + name
+
+def _entries(path, sizes=False):
+    # -> (name, is_dir, size) with the type straight from the directory
+    # iterator. size is -1 for dirs, and for files unless sizes is set:
+    # only ls -l and du ask, since on CPython (and MicroPython ports whose
+    # ilistdir reports no size) a size costs one stat per file.
+    if hasattr(os, "ilistdir"):
+        # MicroPython: (name, type, inode[, size]); old ports lack size
+        for e in (os.ilistdir(path) if path else os.ilistdir()):
+            if e[1] == _S_IFDIR:
+                yield e[0], True, -1
+            elif not sizes:
+                yield e[0], False, -1
+            elif len(e) > 3 and e[3] >= 0:
+                yield e[0], False, e[3]
+            else:
+                yield e[0], False, os.stat(_join(path, e[0]))[6]
+    elif hasattr(os, "scandir"):
+        # CPython: the type comes from d_type; e.stat() is a real stat call
+        with os.scandir(path or ".") as it:
+            for e in it:
+                if e.is_dir():
+                    yield e.name, True, -1
+                else:
+                    yield e.name, False, e.stat().st_size if sizes else -1
+    else:
+        for name in (os.listdir(path) if path else os.listdir()):
+            st = os.stat(_join(path, name))
+            if st[0] & _S_IFDIR:
+                yield name, True, -1
+            else:
+                yield name, False, st[6]
+
+def _ls_long(path):
+    for name, is_dir, size in _entries(path, True):
+        if is_dir:
+            yield "d %8s %s\n" % ("", name)
+        else:
+            yield "- %8d %s\n" % (size, name)
+
+def cmd_ls(args, input_data):
+    # ls [-l] [path]: -l streams "type size name" lines
+    long = False
+    path = ""
+    for a in args:
+        a = str(a)
+        if a == "-l":
+            long = True
+        else:
+            path = a
+    try:
+        if long:
+            if not (os.stat(path or ".")[0] & _S_IFDIR):
+                return "Syntax Error\n"
+            return _ls_long(path)
+        if path:
+            return "\n".join(os.listdir(path))
+        return "\n".join(os.listdir())
+    except Exception:
+        return "Syntax Error\n"
+
+def _match(pat, s):
+    # shell-style * and ? (MicroPython has no fnmatch)
+    p = i = 0
+    star = -1
+    mark = 0
+    while i < len(s):
+        if p < len(pat) and (pat[p] == "?" or pat[p] == s[i]):
+            p += 1
+            i += 1
+        elif p < len(pat) and pat[p] == "*":
+            star = p
+            mark = i
+            p += 1
+        elif star != -1:
+            p = star + 1
+            mark += 1
+            i = mark
+        else:
+            return False
+    while p < len(pat) and pat[p] == "*":
+        p += 1
+    return p == len(pat)
+
+def _find(root, pat, kind):
+    # Depth-first, one open directory iterator per level: memory follows the
+    # depth of the tree, not the number of entries.
+    if kind != "f" and (pat is None or _match(pat, root.rstrip("/").split("/")[-1])):
+        yield root + "\n"
+    stack = [(root, _entries(root))]
+    while stack:
+        base, it = stack[-1]
+        try:
+            name, is_dir, size = next(it)
+        except StopIteration:
+            stack.pop()
+            continue
+        except OSError:
+            stack.pop()  # unreadable directory: skip it
+            continue
+        path = _join(base, name)
+        if (kind is None or kind == ("d" if is_dir else "f")) and (pat is None or _match(pat, name)):
+            yield path + "\n"
+        if is_dir:
+            stack.append((path, _entries(path)))
+
+def cmd_find(args, input_data):
+    # find [dir] [-name pat] [-type f|d]: stream matching paths
+    usage = "find: usage find [dir] [-name pat] [-type f|d]\n"
+    root = "."
+    pat = None
+    kind = None
+    i = 0
+    while i < len(args):
+        a = str(args[i])
+        if a in ("-name", "-type"):
+            if i + 1 >= len(args):
+                return usage
+            v = str(args[i + 1])
+            if a == "-name":
+                pat = v
+            elif v in ("f", "d"):
+                kind = v
+            else:
+                return usage
+            i += 2
+            continue
+        root = a
+        i += 1
+    try:
+        if not (os.stat(root)[0] & _S_IFDIR):
+            return "find: %s: not a directory\n" % root
+    except Exception:
+        return "find: %s: no such directory\n" % root
+    return _find(root, pat, kind)
+
+def cmd_pwd(args, input_data):
+    return os.getcwd()
+
+def cmd_cd(args, input_data):
+    path = args[0] if args else ""
+    try:
+        os.chdir(path)
+        return path
+    except Exception:
+        return "Error. Couldn't cd\n"
+
+def cmd_cat(args, input_data):
+    if args:
+        # Lazy reference: downstream stages open the file themselves, so
+        # "cat X | grep y" is a single sequential read with no spool copy.
+        try:
+            if os.stat(args[0])[0] & 0x4000:
+                return "Couldn't open file\n"
+        except Exception:
+            return "Couldn't open file\n"
+        return PipeData(path=args[0], is_file=True)
+    return input_data.as_text() if input_data is not None else ""
+
+def cmd_cp(args, input_data):
+    if len(args) < 2:
+        return "Couldn't copy.\n"
+    src, dst = args[0], args[1]
+    at = _du_dir(dst)
+    old = _fsize(dst) if at else 0
+    try:
+        with open(src, "r") as f:
+            data = f.read()
+        with open(dst, "w") as f:
+            f.write(data)
+        _du_add(at, _fsize(dst) - old if at else 0)
+        return "File " + src + " copied."
+    except Exception:
+        return "Couldn't copy.\n"
+
+def cmd_rename(args, input_data):
+    if len(args) < 2:
+        return "Couldn't rename\n"
+    src, dst = args[0], args[1]
+    a, b = _du_dir(src), _du_dir(dst)
+    is_dir = False
+    size = 0
+    if a or b:
+        try:
+            st = os.stat(src)
+            is_dir = bool(st[0] & _S_IFDIR)
+            size = 0 if is_dir else st[6]
+        except Exception:
+            pass
+    try:
+        os.rename(src, dst)
+        if is_dir:
+            _du_moved(a, b, _norm(src), _norm(dst))
+        else:
+            _du_add(a, -size)
+            _du_add(b, size)
+        return src + " renamed.."
+    except Exception:
+        return "Couldn't rename\n"
+
+def cmd_mkdir(args, input_data):
+    name = args[0] if args else ""
+    try:
+        os.mkdir(name)
+        at = _du_dir(name)
+        if at:
+            _du_log(at[0], "%s\t0" % _norm(name))
+        return "Directory " + name + " created.\n"
+    except Exception:
+        return "Couldn't make directory\n"
+
+def cmd_rmdir(args, input_data):
+    name = args[0] if args else ""
+    try:
+        os.rmdir(name)
+        at = _du_dir(name)
+        if at:
+            _du_where.clear()
+            _du_log(at[0], "-" + _norm(name))
+        return "Removed " + name + ".\n"
+    except Exception:
+        return "Couldn't remove dir.\n"
+
+def cmd_rm(args, input_data):
+    name = args[0] if args else ""
+    at = _du_dir(name)
+    size = _fsize(name) if at else 0
+    try:
+        os.unlink(name)
+        _du_add(at, -size)
+        return "Removed file " + name + "\n"
+    except Exception:
+        return "Couldn't remove file\n"
+
+def cmd_df(args, input_data):
+    try:
+        st = os.statvfs("/")
+        total = float(st[2]) * float(st[0])
+        used  = float(st[3]) * float(st[0])
+        free  = total - used
+        return "Free: %s Used: %s Total: %s" % (free, used, total)
+    except Exception:
+        return "df error\n"
+
+def cmd_edit(args, input_data):
+    if not args:
+        return "Couldn't write file\n"
+    path = args[0]
+    print("EDIT MODE DETECTED...\n")
+    print("(ENTER STOPEDIT to stop)\n")
+    at = _du_dir(path)
+    old = _fsize(path) if at else 0
+    try:
+        with open(path, "w") as f:
+            while True:
+                line = input()
+                if "STOPEDIT" in line:
+                    break
+                f.write(line + "\n")
+        _du_add(at, _fsize(path) - old if at else 0)
+        return "File " + path + " created..\n"
+    except Exception:
+        return "Couldn't write file\n"
+
+def _copy_file(src, dst, mode="wb"):
+    # Block copy through one reused buffer (no whole-file reads).
+    buf = bytearray(_CHUNK)
+    mv = memoryview(buf)
+    with open(src, "rb") as fi:
+        with open(dst, mode) as fo:
+            while True:
+                n = fi.readinto(buf)
+                if not n:
+                    break
+                fo.write(mv[:n])
+
+def _append_self(path):
+    # Append a file's current content to itself: block copy that stops at
+    # the old size, so it neither loads the file nor reads its own output.
+    left = os.stat(path)[6]
+    buf = bytearray(_CHUNK)
+    mv = memoryview(buf)
+    with open(path, "rb") as fi:
+        with open(path, "ab") as fo:
+            while left > 0:
+                n = fi.readinto(mv[:left] if left < _CHUNK else buf)
+                if not n:
+                    break
+                fo.write(mv[:n])
+                left -= n
+
+def _abspath(path):
+    if path.startswith("/"):
+        return path
+    cwd = os.getcwd()
+    return cwd.rstrip("/") + "/" + path
+
+def _write_pipe(path, input_data, mode):
+    if input_data is not None and input_data.is_file:
+        if _abspath(input_data.path) == _abspath(path):
+            if mode[0] == "w":
+                return  # "cat x > x": already in place
+            _append_self(path)  # "cat x >> x"
+            return
+        _copy_file(input_data.path, path, mode)
+        return
+    with open(path, mode) as f:
+        if input_data is not None:
+            for b in input_data.iter_chunks():
+                f.write(b)
+
+def cmd_write(args, input_data):
+    if not args:
+        return "write: missing filename\n"
+    path = args[0]
+    at = _du_dir(path)
+    old = _fsize(path) if at else 0
+    out = _write_file(path, input_data)
+    _du_add(at, _fsize(path) - old if at else 0)
+    return out
+
+def _write_file(path, input_data):
+    try:
+        if input_data is not None and input_data.spool:
+            # Spooled output is already on flash: move it into place.
+            try:
+                try:
+                    os.remove(path)
+                except Exception:
+                    pass
+                os.rename(input_data.path, path)
+                return ""
+            except Exception:
+                pass  # e.g. different filesystem: fall back to block copy
+        _write_pipe(path, input_data, "wb")
+        return ""
+    except Exception:
+        return "Couldn't write file\n"
+
+def cmd_append(args, input_data):
+    if not args:
+        return "append: missing filename\n"
+    path = args[0]
+    at = _du_dir(path)
+    old = _fsize(path) if at else 0
+    out = _append_file(path, input_data)
+    _du_add(at, _fsize(path) - old if at else 0)
+    return out
+
+def _append_file(path, input_data):
+    try:
+        _write_pipe(path, input_data, "ab")
+        return ""
+    except Exception:
+        # fallback if append not supported: rebuild in a temp file, then swap
+        try:
+            tmp = path + ".tmp"
+            try:
+                _copy_file(path, tmp, "wb")
+            except Exception:
+                with open(tmp, "w") as w:
+                    pass
+            _write_pipe(tmp, input_data, "ab")
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+            os.rename(tmp, path)
+            return ""
+        except Exception:
+            return "Couldn't append file\n"
+
+# ---- du: directory size index ----
+# du walks the tree unless an index covers it. "du -i dir" writes
+# dir/.duidx: one "path<TAB>bytes" line per directory (bytes of the files
+# directly in it). The fs commands below then append small journal lines
+# instead of rewriting it, and loading replays them:
+#   path<TAB>delta   add delta to path's own bytes (new dir: delta 0)
+#   -path            path and everything below it went away
+#   >old<TAB>new     a directory was renamed
+# Changes made outside these commands (exec, scripts, spool files) are not
+# seen; "du -i" again brings the index back in line.
+_DU_FILE = ".duidx"
+_du_loaded = {}  # root -> {dir: own bytes}
+_du_journal = {}  # root -> journal lines appended since the file was written
+_du_where = {}   # dir -> root of the index covering it, or None
+
+def _norm(path):
+    parts = []
+    for p in _abspath(path).split("/"):
+        if p == "..":
+            if parts:
+                parts.pop()
+        elif p and p != ".":
+            parts.append(p)
+    return "/" + "/".join(parts)
+
+def _parent(path):
+    i = path.rfind("/")
+    return path[:i] if i > 0 else "/"
+
+def _under(path, root):
+    return path == root or path.startswith(root.rstrip("/") + "/")
+
+def _fsize(path):
+    try:
+        st = os.stat(path)
+        return 0 if st[0] & _S_IFDIR else st[6]
+    except Exception:
+        return 0
+
+def _du_root(d):
+    # Nearest ancestor of d (normalized) holding an index; memoized per dir.
+    if d in _du_where:
+        return _du_where[d]
+    root = None
+    p = d
+    while True:
+        try:
+            os.stat(_join(p, _DU_FILE))
+            root = p
+            break
+        except Exception:
+            pass
+        if p == "/":
+            break
+        p = _parent(p)
+    _du_where[d] = root
+    return root
+
+def _du_apply(idx, line):
+    if line[0] == "-":
+        gone = line[1:]
+        for k in list(idx):
+            if _under(k, gone):
+                del idx[k]
+    elif line[0] == ">":
+        old, new = line[1:].split("\t")
+        for k in list(idx):
+            if _under(k, old):
+                idx[new + k[len(old):]] = idx.pop(k)
+    else:
+        k, n = line.split("\t")
+        idx[k] = idx.get(k, 0) + int(n)
+
+def _du_load(root):
+    idx = _du_loaded.get(root)
+    if idx is not None:
+        return idx
+    idx = {}
+    n = 0
+    with open(_join(root, _DU_FILE)) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line and line[0] != "#":
+                _du_apply(idx, line)
+                n += 1
+    _du_loaded[root] = idx
+    _du_journal[root] = max(0, n - len(idx))
+    return idx
+
+def _du_save(root, idx):
+    tmp = _join(root, _DU_FILE + ".tmp")
+    with open(tmp, "w") as f:
+        f.write("# pushvm du index: dir<TAB>bytes of its own files\n")
+        for k in idx:
+            f.write("%s\t%d\n" % (k, idx[k]))
+    path = _join(root, _DU_FILE)
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+    os.rename(tmp, path)
+    _du_loaded[root] = idx
+    _du_journal[root] = 0
+
+def _du_log(root, line):
+    try:
+        idx = _du_load(root)
+        _du_apply(idx, line)
+        if _du_journal[root] > len(idx) + 32:
+            _du_save(root, idx)  # compact: the journal outgrew the index
+            return
+        with open(_join(root, _DU_FILE), "a") as f:
+            f.write(line + "\n")
+        _du_journal[root] += 1
+    except Exception:
+        pass  # never fail the file command over the index
+
+def _du_dir(path):
+    # -> (root, dir) when an index covers the directory of path, else None
+    d = _parent(_norm(path))
+    root = _du_root(d)
+    return None if root is None else (root, d)
+
+def _du_add(at, delta):
+    if at is not None and delta:
+        _du_log(at[0], "%s\t%d" % (at[1], delta))
+
+def _du_moved(a, b, src, dst):
+    # Directory src was renamed to dst; a/b are _du_dir() of each side.
+    _du_where.clear()
+    if a and b and a[0] == b[0]:
+        _du_log(a[0], ">%s\t%s" % (src, dst))
+        return
+    if a:
+        _du_log(a[0], "-" + src)
+    if b:
+        own = {}
+        for d, total, own in _du_walk(dst):
+            pass
+        for k in own:
+            _du_log(b[0], "%s\t%d" % (k, own[k]))
+
+def _du_walk(top, nested=None):
+    # Post-order streaming walk: yields (dir, total bytes, own) as each
+    # directory is finished; own maps dir -> bytes of its own files.
+    # Directories holding an index other than top's go into nested.
+    own = {}
+    stack = [[top, _entries(top, True), 0]]
+    while stack:
+        fr = stack[-1]
+        try:
+            name, is_dir, size = next(fr[1])
+        except StopIteration:
+            stack.pop()
+            own.setdefault(fr[0], 0)
+            if stack:
+                stack[-1][2] += fr[2]
+            yield fr[0], fr[2], own
+            continue
+        except OSError:
+            stack.pop()
+            continue
+        if is_dir:
+            stack.append([_join(fr[0], name), _entries(_join(fr[0], name), True), 0])
+        elif name == _DU_FILE:
+            if nested is not None and fr[0] != top:
+                nested.append(fr[0])
+        else:
+            fr[2] += size
+            own[fr[0]] = own.get(fr[0], 0) + size
+
+def _du_from_index(idx, top):
+    totals = {}
+    for k in idx:
+        if _under(k, top):
+            totals[k] = totals.get(k, 0) + idx[k]
+            p = k
+            while p != top:
+                p = _parent(p)
+                totals[p] = totals.get(p, 0) + idx[k]
+    totals.setdefault(top, 0)
+    return totals
+
+def _du_lines(top, summary):
+    for d, total, own in _du_walk(top):
+        if not summary or d == top:
+            yield "%d\t%s\n" % (total, d)
+
+def cmd_du(args, input_data):
+    # du [-s] [dir]: bytes per directory; du -i [dir] builds the size index
+    # (later du calls read it), du -x [dir] drops it
+    usage = "du: usage du [-s|-i|-x] [dir]\n"
+    flag = None
+    top = "."
+    for a in args:
+        a = str(a)
+        if a in ("-s", "-i", "-x"):
+            flag = a
+        elif a.startswith("-"):
+            return usage
+        else:
+            top = a
+    top = _norm(top)
+    try:
+        if not (os.stat(top)[0] & _S_IFDIR):
+            return "du: %s: not a directory\n" % top
+    except Exception:
+        return "du: %s: no such directory\n" % top
+    _du_where.clear()
+    if flag == "-x":
+        try:
+            os.remove(_join(top, _DU_FILE))
+        except Exception:
+            return "du: no index at %s\n" % top
+        _du_loaded.pop(top, None)
+        return "du: index at %s removed\n" % top
+    if flag == "-i":
+        own = {}
+        total = 0
+        nested = []
+        for d, total, own in _du_walk(top, nested):
+            pass
+        for k in nested:
+            # an index below this one would shadow it for its subtree
+            try:
+                os.remove(_join(k, _DU_FILE))
+            except Exception:
+                pass
+        for k in list(_du_loaded):
+            if _under(k, top):
+                del _du_loaded[k]
+        _du_save(top, own)
+        return "du: indexed %d dirs, %d bytes under %s\n" % (len(own), total, top)
+    root = _du_root(top)
+    if root is None:
+        return _du_lines(top, flag == "-s")
+    totals = _du_from_index(_du_load(root), top)
+    if flag == "-s":
+        return "%d\t%s\n" % (totals[top], top)
+    keys = sorted(totals)
+    keys.reverse()  # children before their parent, like a walk
+    return "".join(["%d\t%s\n" % (totals[k], k) for k in keys])
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "ls": cmd_ls,
+        "find": cmd_find,
+        "pwd": cmd_pwd,
+        "cd": cmd_cd,
+        "cat": cmd_cat,
+        "cp": cmd_cp,
+        "rename": cmd_rename,
+        "mkdir": cmd_mkdir,
+        "rmdir": cmd_rmdir,
+        "rm": cmd_rm,
+        "df": cmd_df,
+        "du": cmd_du,
+        "edit": cmd_edit,
+        "write": cmd_write,
+        "append": cmd_append,
+    }
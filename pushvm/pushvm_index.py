@@ -0,0 +1,260 @@
+# pushvm_index.py
+# PUSH VM persistent line index for big append-only files (logs): index.
+# Loaded by pushvm on first use of its command (see pushvm._LAZY).
+#
+#   index build <file>               create / bring <file>.idx up to date
+#   index grep [-i] [-n] <term> <file>
+#   index drop <file>
+#
+# The file is cut into blocks of about _IDX_BLOCK bytes (whole lines). The
+# index holds one fixed-size record per block: byte offset, line count and a
+# Bloom filter of the block's word tokens, which acts as the block's token
+# posting list at about 1/16 of the text size. index grep reads only the
+# records, then seeks to blocks whose filter has every token of the term and
+# checks their lines. A term is searched as whole words (tokens split on
+# spaces and punctuation); use grep for regexes and substrings.
+#
+# Lines appended since the last run (e.g. with >>) are indexed on the next
+# build or grep: only the last, partly filled block and the new bytes are
+# read. A file that shrank or whose head changed is reindexed from scratch.
+#
+# <file>.idx layout (little endian):
+#   header  "PVI1" covered:u32 lines:u32 blocks:u32 headcrc:u32
+#   record  offset:u32 nlines:u16 bloom[_IDX_BITS // 8]   (one per block)
+
+import os
+
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+
+try:
+    import binascii
+except ImportError:
+    import ubinascii as binascii
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ()
+
+_IDX_BLOCK = 2048   # text bytes per block
+_IDX_BITS = 1024    # Bloom filter bits per block
+_IDX_K = 3          # bits set per token
+_IDX_HDR = "<4sIIII"
+_IDX_HDR_SIZE = 20
+_IDX_REC = 6 + _IDX_BITS // 8
+_IDX_SEPS = [bytes([c]) for c in b"=:,;()[]{}<>\"'/|\t"]
+
+def _hash(tok):
+    if hasattr(binascii, "crc32"):
+        return binascii.crc32(tok) & 0xFFFFFFFF
+    return hash(tok) & 0xFFFFFFFF  # MicroPython: stable across runs
+
+def _tokens(line):
+    # lower-cased word tokens of a bytes line (2+ chars)
+    line = line.lower()
+    for sep in _IDX_SEPS:
+        if sep in line:
+            line = line.replace(sep, b" ")
+    out = []
+    for w in line.split():
+        w = w.strip(b".!?-_#*")
+        if len(w) > 1:
+            out.append(w)
+    return out
+
+def _bits(tok):
+    # -> [(byte, mask)] of the token's filter bits (double hashing)
+    h = _hash(tok)
+    step = (h >> 16) | 1
+    out = []
+    for i in range(_IDX_K):
+        b = (h + i * step) % _IDX_BITS
+        out.append((b >> 3, 1 << (b & 7)))
+    return out
+
+def _head_crc(f, n):
+    # fingerprint of the first bytes, to notice a rotated / rewritten file
+    f.seek(0)
+    return _hash(f.read(min(64, n)))
+
+def _read_header(ipath):
+    try:
+        with open(ipath, "rb") as x:
+            h = x.read(_IDX_HDR_SIZE)
+        if len(h) == _IDX_HDR_SIZE:
+            magic, covered, lines, blocks, crc = struct.unpack(_IDX_HDR, h)
+            if magic == b"PVI1":
+                return covered, lines, blocks, crc
+    except Exception:
+        pass
+    return None
+
+def _update(path):
+    # Index whatever was appended to path since the last run; -> header tuple
+    ipath = path + ".idx"
+    size = os.stat(path)[6]
+    hdr = _read_header(ipath)
+    with open(path, "rb") as f:
+        if hdr is not None and (size < hdr[0] or hdr[3] != _head_crc(f, hdr[0])):
+            hdr = None  # truncated, rotated or rewritten: start over
+        if hdr is not None and hdr[0] == size:
+            return hdr
+        if hdr is None:
+            x = open(ipath, "wb")
+            x.write(struct.pack(_IDX_HDR, b"PVI1", 0, 0, 0, _head_crc(f, 0)))
+            x.close()
+            covered = lines = blocks = 0
+        else:
+            covered, lines, blocks = hdr[0], hdr[1], hdr[2]
+        rec = bytearray(_IDX_REC)
+        with open(ipath, "r+b") as x:
+            start = covered
+            if blocks:
+                # reopen the last block if it still has room
+                x.seek(_IDX_HDR_SIZE + (blocks - 1) * _IDX_REC)
+                x.readinto(rec)
+                off, n = struct.unpack("<IH", rec[:6])
+                if covered - off < _IDX_BLOCK:
+                    start = off
+                    lines -= n
+                    blocks -= 1
+            bloom = bytearray(_IDX_BITS // 8)
+            bstart = start
+            bn = 0
+            pos = start
+            f.seek(start)
+            while True:
+                line = f.readline()
+                if not line or line[-1:] != b"\n":
+                    break  # EOF or a line still being written
+                for tok in _tokens(line):
+                    for i, m in _bits(tok):
+                        bloom[i] |= m
+                bn += 1
+                pos += len(line)
+                if pos - bstart >= _IDX_BLOCK:
+                    _put_record(x, blocks, bstart, bn, bloom)
+                    blocks += 1
+                    lines += bn
+                    bloom = bytearray(_IDX_BITS // 8)
+                    bstart = pos
+                    bn = 0
+            if bn:
+                _put_record(x, blocks, bstart, bn, bloom)
+                blocks += 1
+                lines += bn
+            crc = _head_crc(f, pos)
+            x.seek(0)
+            x.write(struct.pack(_IDX_HDR, b"PVI1", pos, lines, blocks, crc))
+    return pos, lines, blocks, crc
+
+def _put_record(x, i, off, n, bloom):
+    x.seek(_IDX_HDR_SIZE + i * _IDX_REC)
+    x.write(struct.pack("<IH", off, min(n, 0xFFFF)))
+    x.write(bloom)
+
+def _decode(line):
+    try:
+        return line.decode()
+    except Exception:
+        return str(line)[2:-1]
+
+def _hit(line, needle, nocase, toks):
+    # term as a substring whose tokens are whole words of the line, so a
+    # hit does not depend on which block a line happens to sit in
+    hay = line.lower() if nocase else line
+    if needle not in hay:
+        return False
+    if toks:
+        have = _tokens(line)
+        for t in toks:
+            if t not in have:
+                return False
+    return True
+
+def _search(path, term, nocase, number, hdr):
+    covered, lines, blocks = hdr[0], hdr[1], hdr[2]
+    toks = _tokens(term.encode())
+    want = []
+    for tok in toks:
+        want.extend(_bits(tok))
+    needle = term.lower().encode() if nocase else term.encode()
+    rec = bytearray(_IDX_REC)
+    nxt = bytearray(_IDX_REC)
+    with open(path + ".idx", "rb") as x, open(path, "rb") as f:
+        x.seek(_IDX_HDR_SIZE)
+        lineno = 1
+        have = x.readinto(rec) == _IDX_REC if blocks else False
+        while have:
+            have_next = x.readinto(nxt) == _IDX_REC
+            off, n = struct.unpack("<IH", rec[:6])
+            ok = True
+            for i, m in want:
+                if not rec[6 + i] & m:
+                    ok = False
+                    break
+            if ok:
+                end = struct.unpack("<I", nxt[:4])[0] if have_next else covered
+                f.seek(off)
+                ln = lineno
+                while off < end:
+                    line = f.readline()
+                    if not line:
+                        break
+                    off += len(line)
+                    if _hit(line, needle, nocase, toks):
+                        s = _decode(line)
+                        yield ("%d:%s" % (ln, s)) if number else s
+                    ln += 1
+            lineno += n
+            rec, nxt = nxt, rec
+            have = have_next
+        # a last line without its newline yet is not in the index
+        f.seek(covered)
+        tail = f.read(_IDX_BLOCK)
+        if tail and _hit(tail, needle, nocase, toks):
+            s = _decode(tail) + "\n"
+            yield ("%d:%s" % (lineno, s)) if number else s
+
+def cmd_index(args, input_data):
+    # index build|grep|drop ... (see the header of pushvm_index.py)
+    usage = ("index: usage index build <file> | index grep [-i] [-n] <term> <file>"
+             " | index drop <file>\n")
+    args = [str(a) for a in args]
+    if len(args) < 2:
+        return usage
+    sub = args[0]
+    path = args[-1]
+    try:
+        if sub == "drop":
+            os.remove(path + ".idx")
+            return "index: dropped %s.idx\n" % path
+        if sub == "build":
+            covered, lines, blocks, crc = _update(path)
+            return "index: %s: %d lines, %d blocks, %d bytes indexed\n" % (
+                path, lines, blocks, covered)
+        if sub == "grep":
+            nocase = number = False
+            rest = args[1:-1]
+            while rest and rest[0] in ("-i", "-n"):
+                if rest[0] == "-i":
+                    nocase = True
+                else:
+                    number = True
+                rest = rest[1:]
+            if not rest:
+                return usage
+            return _search(path, " ".join(rest), nocase, number, _update(path))
+    except OSError as e:
+        return "index: %s: %s\n" % (path, e)
+    return usage
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "index": cmd_index,
+    }
@@ -0,0 +1,107 @@
+# pushvm_jobctl.py
+# PUSH VM job control: jobs, kill, fg, jobmode, pipes.
+# Loaded by pushvm on first use of one of its commands (see pushvm._LAZY).
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("current_vm", "_threads", "_sleep_ms")
+
+def cmd_pipes(args, input_data):
+    # pipes [thread|seq]: run pipeline stages on threads or one after another
+    vm = current_vm()
+    if vm is None:
+        return ""
+    if args:
+        mode = str(args[0])
+        if mode in ("thread", "threads", "on"):
+            if _threads() is None:
+                return "pipes: threads not available, staying sequential\n"
+            vm.pipe_threads = True
+        elif mode in ("seq", "off"):
+            vm.pipe_threads = False
+        else:
+            return "pipes: usage pipes [thread|seq]\n"
+    return "pipes: %s\n" % ("thread" if vm.pipe_threads else "seq")
+
+def cmd_jobmode(args, input_data):
+    # jobmode [thread|coop]: how "&" jobs run
+    vm = current_vm()
+    if vm is None:
+        return ""
+    if args:
+        mode = str(args[0])
+        if mode in ("thread", "threads"):
+            if _threads() is None:
+                return "jobmode: threads not available, staying coop\n"
+            vm.thread_jobs = True
+        elif mode in ("coop", "gen"):
+            vm.thread_jobs = False
+        else:
+            return "jobmode: usage jobmode [thread|coop]\n"
+    return "jobmode: %s\n" % ("thread" if vm.thread_jobs else "coop")
+
+def _shell_vm():
+    # Jobs belong to the interactive VM, also when asked from inside a job.
+    vm = current_vm()
+    return vm.root if vm is not None else None
+
+def cmd_jobs(args, input_data):
+    vm = _shell_vm()
+    if vm is None or not vm.jobs:
+        return "(no jobs)\n"
+    lines = []
+    for jid, job in vm.jobs.items():
+        state = "done" if job.done else "running"
+        if job.threaded:
+            state += " (thread)"
+        lines.append("[{}] {} - {}".format(jid, state, job.name))
+    return "\n".join(lines) + "\n"
+
+def cmd_kill(args, input_data):
+    if not args:
+        return "kill: usage kill <jobid>\n"
+    try:
+        jid = int(args[0])
+    except Exception:
+        return "kill: bad jobid\n"
+    vm = _shell_vm()
+    job = vm.jobs.get(jid) if vm is not None else None
+    if not job:
+        return "kill: no such job\n"
+    job.kill()
+    return ""
+
+def cmd_fg(args, input_data):
+    if not args:
+        return "fg: usage fg <jobid>\n"
+    try:
+        jid = int(args[0])
+    except Exception:
+        return "fg: bad jobid\n"
+    vm = _shell_vm()
+    job = vm.jobs.get(jid) if vm is not None else None
+    if not job:
+        return "fg: no such job\n"
+    del vm.jobs[jid]  # fg owns it now; poll_jobs must not reap it
+    while not job.done:
+        job.step(n=200)
+        if job.threaded:
+            vm.poll_jobs(steps=80)  # keep cooperative jobs alive meanwhile
+            _sleep_ms(10)
+    err = job.error
+    out = "\n".join(job.output) if job.output else ""
+    if err:
+        return out + ("\n" if out else "") + "fg: job error: %s\n" % err
+    return out
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "jobs": cmd_jobs,
+        "kill": cmd_kill,
+        "fg": cmd_fg,
+        "jobmode": cmd_jobmode,
+        "pipes": cmd_pipes,
+    }
@@ -0,0 +1,452 @@
+# pushvm_net.py
+# PUSH VM network commands: scanwifi, connect, ifconfig, wget, httpstat.
+# Loaded by pushvm on first use of one of its commands (see pushvm._LAZY),
+# so the network module is only imported when it is actually needed.
+
+import time
+
+try:
+    import network
+except Exception:
+    network = None
+
+try:
+    import socket
+except ImportError:
+    import usocket as socket
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("_CHUNK", "_ticks_ms", "_ticks_diff", "_select", "_threads")
+
+_WGET_REDIRECTS = 3
+_WGET_TIMEOUT = 10  # s per socket operation
+
+def cmd_scanwifi(args, input_data):
+    if network is None:
+        return "scanwifi: network module not available\n"
+    try:
+        wlan = network.WLAN(network.STA_IF)
+        wlan.active(True)
+        nets = wlan.scan()
+        out = []
+        for i in nets:
+            try:
+                out.append(i[0].decode())
+            except Exception:
+                out.append(str(i[0]))
+        return "\n".join(out) + ("\n" if out else "")
+    except Exception:
+        return "Couldn't scan networks.\n"
+
+def cmd_connect(args, input_data):
+    if network is None:
+        return "connect: network module not available\n"
+    print("Enter SSID: ")
+    ssid = input()
+    print("Enter wifi pw: ")
+    wifipw = input()
+    try:
+        print("attempting to connect..\n")
+        wlan = network.WLAN(network.STA_IF)
+        wlan.active(True)
+        wlan.connect(ssid, wifipw)
+        time.sleep(5)
+        return "Check ifconfig..\n"
+    except Exception:
+        return "Error: couldn't obtain address\n"
+
+def cmd_ifconfig(args, input_data):
+    if network is None:
+        return "ifconfig: network module not available\n"
+    try:
+        wlan = network.WLAN(network.STA_IF)
+        status = wlan.ifconfig()
+        return (
+            "\nIP........... " + status[0] +
+            "\nNETMASK......." + status[1] + "\n" +
+            "GATEWAY......." + status[2]
+        )
+    except Exception:
+        return "Couldn't get interface or check syntax.\n"
+
+# ---- wget ----
+def _url_split(url):
+    # http[s]://host[:port][/path] -> (https?, host, port, path)
+    if url.startswith("https://"):
+        tls, rest = True, url[8:]
+    elif url.startswith("http://"):
+        tls, rest = False, url[7:]
+    else:
+        raise ValueError("only http:// and https:// urls")
+    i = rest.find("/")
+    host, path = (rest, "/") if i == -1 else (rest[:i], rest[i:])
+    port = 443 if tls else 80
+    if ":" in host:
+        host, p = host.rsplit(":", 1)
+        port = int(p)
+    return tls, host, port, path
+
+def _wrap_tls(s, host):
+    import ssl
+    if hasattr(ssl, "create_default_context"):  # CPython
+        return ssl.create_default_context().wrap_socket(s, server_hostname=host)
+    return ssl.wrap_socket(s, server_hostname=host)
+
+# ---- HTTP client: keep-alive pool + DNS cache ----
+# Polling loops (while true do wget http://hub/status; sleep 5; done) reuse
+# one HTTP/1.1 connection per host instead of a fresh connect (and lookup)
+# every time. A connection goes back to the pool only once its body has been
+# read to the end; anything else (error, early close, no length) closes it.
+# Pipeline stages and thread jobs can run wget at the same time, so the pool,
+# the DNS cache and the counters are only touched while holding _lock (a
+# real lock once load() finds threads, else a no-op).
+_HTTP_IDLE = 30000     # ms an idle pooled connection is kept
+_HTTP_PER_HOST = 2     # idle connections kept per (scheme, host, port)
+_HTTP_MAX_IDLE = 4     # idle connections kept overall
+_DNS_TTL = 300000      # ms a resolved address is cached
+
+_pool = {}   # (tls, host, port) -> [(sock, stream, idle_since_ms)]
+_dns = {}    # (host, port) -> (addr, resolved_at_ms)
+_http_stats = {"connects": 0, "reuses": 0, "retries": 0, "closed": 0,
+               "dns_hits": 0, "dns_misses": 0}
+
+class _NoLock:
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        return False
+
+_lock = _NoLock()
+
+def _count(name):
+    with _lock:
+        _http_stats[name] += 1
+
+def _resolve(host, port):
+    key = (host, port)
+    now = _ticks_ms()
+    with _lock:
+        hit = _dns.get(key)
+        if hit is not None and _ticks_diff(now, hit[1]) < _DNS_TTL:
+            _http_stats["dns_hits"] += 1
+            return hit[0]
+        _http_stats["dns_misses"] += 1
+    addr = socket.getaddrinfo(host, port)[0][-1]  # (not under the lock)
+    with _lock:
+        _dns[key] = (addr, now)
+    return addr
+
+def _close(s, f):
+    try:
+        if f is not s:
+            f.close()
+        s.close()
+    except Exception:
+        pass
+
+def _stale(s):
+    # An idle keep-alive socket that polls readable has been closed (or
+    # spoken to) by the server: either way it can't carry a new request.
+    select = _select()
+    if select is None:
+        return False
+    try:
+        if hasattr(select, "poll"):
+            p = select.poll()
+            p.register(s, select.POLLIN)
+            return bool(p.poll(0))
+        return bool(select.select([s], [], [], 0)[0])
+    except Exception:
+        return True
+
+def _pool_get(key):
+    with _lock:
+        conns = _pool.get(key)
+        now = _ticks_ms()
+        while conns:
+            s, f, since = conns.pop()
+            if _ticks_diff(now, since) < _HTTP_IDLE and not _stale(s):
+                return s, f
+            _http_stats["closed"] += 1
+            _close(s, f)
+        return None
+
+def _pool_put(key, s, f):
+    with _lock:
+        _pool_put_locked(key, s, f)
+
+def _pool_put_locked(key, s, f):
+    now = _ticks_ms()
+    total = 0
+    for k in list(_pool):
+        # drop expired entries while we are here
+        keep = []
+        for c in _pool[k]:
+            if _ticks_diff(now, c[2]) < _HTTP_IDLE:
+                keep.append(c)
+            else:
+                _http_stats["closed"] += 1
+                _close(c[0], c[1])
+        if keep:
+            _pool[k] = keep
+            total += len(keep)
+        else:
+            del _pool[k]
+    conns = _pool.get(key, [])
+    if len(conns) >= _HTTP_PER_HOST or total >= _HTTP_MAX_IDLE:
+        _http_stats["closed"] += 1
+        _close(s, f)
+        return
+    conns.append((s, f, now))
+    _pool[key] = conns
+
+def _pool_clear():
+    with _lock:
+        for k in list(_pool):
+            for c in _pool.pop(k):
+                _http_stats["closed"] += 1
+                _close(c[0], c[1])
+
+def _connect(tls, host, port):
+    s = socket.socket()
+    try:
+        s.settimeout(_WGET_TIMEOUT)
+        s.connect(_resolve(host, port))
+        if tls:
+            s = _wrap_tls(s, host)
+    except Exception:
+        s.close()
+        with _lock:
+            _dns.pop((host, port), None)  # maybe the address moved
+        raise
+    _count("connects")
+    f = s.makefile("rb") if hasattr(s, "makefile") else s
+    return s, f
+
+class _Body:
+    # Response body reader: Content-Length, chunked, or until close.
+    # readinto() returns 0 at the end; a fully read keep-alive body hands
+    # the connection back to the pool, close() before that drops it.
+    def __init__(self, key, s, f, length, chunked, keep):
+        self.key = key
+        self.s = s
+        self.f = f
+        self.length = length
+        self.left = length if length is not None else -1
+        self.chunked = chunked
+        self.keep = keep and (chunked or length is not None)
+        self.done = False
+
+    def _next_chunk(self):
+        line = self.f.readline()
+        if self.left == 0:  # CRLF after the previous chunk's data
+            line = self.f.readline()
+        self.left = int(line.split(b";")[0].strip(), 16)
+        if self.left == 0:
+            while True:  # trailers up to the blank line
+                h = self.f.readline()
+                if not h or h in (b"\r\n", b"\n"):
+                    break
+
+    def readinto(self, buf):
+        if self.done:
+            return 0
+        if self.chunked and self.left <= 0:
+            self._next_chunk()
+            if self.left == 0:
+                self._finish()
+                return 0
+        if self.left == 0:
+            self._finish()
+            return 0
+        if self.left > 0 and self.left < len(buf):
+            n = self.f.readinto(memoryview(buf)[:self.left])
+        else:
+            n = self.f.readinto(buf)
+        if not n:
+            if self.left > 0:
+                self.keep = False
+                self.close()
+                raise OSError("connection closed %d bytes early" % self.left)
+            self._finish()
+            return 0
+        if self.left > 0:
+            self.left -= n
+            if not self.left and not self.chunked:
+                self._finish()
+        return n
+
+    def drain(self):
+        buf = bytearray(_CHUNK)
+        while self.readinto(buf):
+            pass
+
+    def _finish(self):
+        if self.done:
+            return
+        self.done = True
+        if self.keep:
+            _pool_put(self.key, self.s, self.f)
+        else:
+            _close(self.s, self.f)
+
+    def close(self):
+        if not self.done:
+            self.done = True
+            _close(self.s, self.f)
+
+def _request(tls, host, port, path):
+    # -> (code, headers dict, _Body). A pooled connection the server has
+    # dropped in the meantime is retried once on a fresh one (GET only).
+    key = (tls, host, port)
+    req = ("GET %s HTTP/1.1\r\nHost: %s\r\nUser-Agent: pushvm\r\n"
+           "Connection: keep-alive\r\n\r\n" % (path, host)).encode()
+    while True:
+        c = _pool_get(key)
+        reused = c is not None
+        s, f = c if reused else _connect(tls, host, port)
+        try:
+            if hasattr(s, "sendall"):
+                s.sendall(req)
+            else:
+                s.write(req)  # MicroPython TLS socket
+            status = f.readline()
+            if not status:
+                raise OSError("connection closed")
+            status = status.split(None, 2)
+            ver, code = status[0], int(status[1])
+            hdrs = {}
+            while True:
+                h = f.readline()
+                if not h or h in (b"\r\n", b"\n"):
+                    break
+                k, _, v = h.decode().partition(":")
+                hdrs[k.strip().lower()] = v.strip()
+        except Exception:
+            _close(s, f)
+            if reused:
+                _count("retries")
+                continue
+            raise
+        if reused:
+            _count("reuses")
+        conn = hdrs.get("connection", "").lower()
+        keep = conn != "close" if ver == b"HTTP/1.1" else conn == "keep-alive"
+        length = hdrs.get("content-length")
+        chunked = "chunked" in hdrs.get("transfer-encoding", "").lower()
+        length = int(length) if length is not None and not chunked else None
+        return code, hdrs, _Body(key, s, f, length, chunked, keep)
+
+def _http_get(url):
+    # -> _Body positioned at the 200 response's body, following redirects.
+    for _ in range(_WGET_REDIRECTS + 1):
+        tls, host, port, path = _url_split(url)
+        code, hdrs, body = _request(tls, host, port, path)
+        location = hdrs.get("location")
+        if code in (301, 302, 303, 307, 308) and location:
+            body.drain()  # keeps the connection for the next hop
+            if location.startswith("/"):
+                location = "%s://%s:%d%s" % ("https" if tls else "http", host, port, location)
+            url = location
+            continue
+        if code != 200:
+            body.drain()
+            raise OSError("HTTP %d" % code)
+        return body
+    raise OSError("too many redirects")
+
+def _wget_lines(body):
+    # Streaming pipe: body split into lines, one block read at a time.
+    buf = bytearray(_CHUNK)
+    mv = memoryview(buf)
+    pending = b""
+    try:
+        while True:
+            n = body.readinto(buf)
+            if not n:
+                break
+            pending += bytes(mv[:n])
+            j = pending.rfind(b"\n")
+            if j != -1:
+                for line in pending[:j+1].decode().split("\n")[:-1]:
+                    yield line + "\n"
+                pending = pending[j+1:]
+        if pending:
+            yield pending.decode()
+    finally:
+        body.close()
+
+def cmd_wget(args, input_data):
+    # wget [-O file] url: stream to file (reports bytes/s) or down the pipe
+    out = None
+    url = None
+    i = 0
+    while i < len(args):
+        a = str(args[i])
+        if a == "-O" and i + 1 < len(args):
+            out = str(args[i+1])
+            i += 2
+            continue
+        url = a
+        i += 1
+    if url is None:
+        return "wget: usage wget [-O file] url\n"
+    t0 = _ticks_ms()
+    try:
+        body = _http_get(url)
+    except Exception as e:
+        return "wget: couldn't get %s (%s)\n" % (url, e)
+    if out is None:
+        return _wget_lines(body)
+
+    buf = bytearray(_CHUNK)
+    mv = memoryview(buf)
+    total = 0
+    try:
+        with open(out, "wb") as w:
+            while True:
+                n = body.readinto(buf)
+                if not n:
+                    break
+                w.write(mv[:n])
+                total += n
+    except Exception as e:
+        return "wget: %s after %d bytes\n" % (e, total)
+    finally:
+        body.close()
+    if body.length is not None and total != body.length:
+        return "wget: short read %d of %d bytes\n" % (total, body.length)
+    ms = max(1, _ticks_diff(_ticks_ms(), t0))
+    return "wget: %s: %d bytes in %d ms (%d B/s)\n" % (out, total, ms, total * 1000 // ms)
+
+def cmd_httpstat(args, input_data):
+    # httpstat [-c]: keep-alive pool / DNS cache counters; -c closes the pool
+    if args and str(args[0]) == "-c":
+        _pool_clear()
+    with _lock:
+        if args and str(args[0]) == "-c":
+            _dns.clear()
+        idle = 0
+        for k in _pool:
+            idle += len(_pool[k])
+        st = _http_stats
+        return ("connects %d reuses %d retries %d closed %d idle %d\n"
+                "dns hits %d misses %d cached %d\n" % (
+                    st["connects"], st["reuses"], st["retries"], st["closed"], idle,
+                    st["dns_hits"], st["dns_misses"], len(_dns)))
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    t = _threads()
+    if t is not None:
+        g["_lock"] = t.Lock() if hasattr(t, "Lock") else t.allocate_lock()
+    return {
+        "scanwifi": cmd_scanwifi,
+        "connect": cmd_connect,
+        "ifconfig": cmd_ifconfig,
+        "wget": cmd_wget,
+        "httpstat": cmd_httpstat,
+    }
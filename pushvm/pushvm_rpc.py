@@ -0,0 +1,155 @@
+# pushvm_rpc.py
+# PUSH VM batch command RPC for automation: rpc.
+# Loaded by pushvm on first use of its command (see pushvm._LAZY).
+#
+# One request frame carries a whole batch, so N commands cost one round trip
+# and no prompt scraping. Frames are newline-delimited JSON (json.dumps never
+# emits a raw newline, so a line is a frame):
+#
+#   -> {"id": 7, "lines": ["cd /lib", "ls | wc", "test -f x.py"], "stop": false}
+#      (a bare JSON list of lines works too)
+#   <- {"id": 7, "i": 0, "out": "", "truth": false, "ms": 1, "err": null}
+#   <- {"id": 7, "i": 1, "out": "12", "truth": true, "ms": 9, "err": null}
+#   <- ...one result frame per line, in order...
+#   <- {"id": 7, "done": true, "n": 3, "errors": 0, "ms": 14}
+#
+# Lines go through compile_line and run on the caller's VM (vars, cwd and
+# functions persist between lines and batches). "stop": true ends the batch
+# at the first line with an error. A line ending in & starts a job as usual.
+#
+# rpc          machine mode on the console: one frame per line, "exit" or
+#              EOF returns to the shell
+# serve        a session line starting with "{" is handled as a frame
+
+import sys
+
+try:
+    import json
+except ImportError:
+    import ujson as json
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("VERSION", "compile_line", "CompileError", "current_vm",
+          "_ticks_ms", "_ticks_diff")
+
+def _frame(obj):
+    return json.dumps(obj)
+
+def _parse(text):
+    # -> (id, lines, stop); raises ValueError on a malformed frame
+    try:
+        req = json.loads(text)
+    except Exception:
+        raise ValueError("bad json")
+    rid = None
+    stop = False
+    if isinstance(req, dict):
+        rid = req.get("id")
+        stop = bool(req.get("stop", False))
+        req = req.get("lines")
+    if not isinstance(req, list):
+        raise ValueError("expected a list of lines")
+    return rid, [str(l) for l in req], stop
+
+def frames(vm, text):
+    # Run one request frame on vm. Yields None while the VM works (so a
+    # poll loop can interleave other work) and a JSON frame string per result.
+    t_batch = _ticks_ms()
+    try:
+        rid, lines, stop = _parse(text)
+    except ValueError as e:
+        yield _frame({"id": None, "done": True, "n": 0, "errors": 1, "err": str(e)})
+        return
+    saved = vm.output
+    errors = 0
+    n = 0
+    try:
+        for i in range(len(lines)):
+            out = []
+            vm.output = out
+            err = None
+            t0 = _ticks_ms()
+            try:
+                code, bg = compile_line(lines[i], vm.functions)
+                if bg:
+                    jid = vm.start_job(code, name=lines[i])
+                    out.append("[{}] started {}".format(jid, lines[i]))
+                    vm.last_truth = True
+                else:
+                    vm.code = code
+                    vm.cancelled = False
+                    for _ in vm.run_generator():
+                        yield None
+            except CompileError as ce:
+                err = "compile error: %s" % ce
+            except Exception as e:
+                err = str(e) or e.__class__.__name__
+            if err is None:
+                # run_command reports this as output; a client wants it flagged
+                for o in out:
+                    if str(o).startswith("Error: command not found"):
+                        err = str(o)
+                        break
+            n += 1
+            if err is not None:
+                errors += 1
+            yield _frame({
+                "id": rid, "i": i, "out": "\n".join([str(s) for s in out]),
+                "truth": err is None and bool(vm.last_truth),
+                "ms": _ticks_diff(_ticks_ms(), t0), "err": err,
+            })
+            if (err is not None and stop) or vm.exit_status is not None:
+                break
+    finally:
+        vm.output = saved
+    yield _frame({"id": rid, "done": True, "n": n, "errors": errors,
+                  "ms": _ticks_diff(_ticks_ms(), t_batch)})
+
+def _write(line):
+    sys.stdout.write(line + "\n")
+    try:
+        sys.stdout.flush()
+    except Exception:
+        pass
+
+def cmd_rpc(args, input_data):
+    # rpc: read JSON request frames from the console until "exit" / EOF
+    vm = current_vm()
+    if vm is None:
+        return ""
+    vm = vm.root
+    # we are inside vm.run() executing "rpc": keep its program to resume
+    state = (vm.code, vm.pc, vm.frames, vm.token_stack, vm.value_stack)
+    saved = vm.output
+    vm.output = []  # job reports must not land between frames
+    _write(_frame({"rpc": 1, "version": VERSION}))
+    try:
+        while vm.exit_status is None:
+            line = sys.stdin.readline()
+            if not line:
+                break
+            line = line.strip()
+            if line == "exit":
+                break
+            if not line:
+                continue
+            for f in frames(vm, line):
+                if f is not None:
+                    _write(f)
+            vm.poll_jobs(steps=50)
+            if vm.output:
+                _write(_frame({"log": "\n".join([str(s) for s in vm.output])}))
+                del vm.output[:]
+    finally:
+        vm.output = saved
+        vm.code, vm.pc, vm.frames, vm.token_stack, vm.value_stack = state
+    return ""
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "rpc": cmd_rpc,
+    }
@@ -0,0 +1,304 @@
+# pushvm_serve.py
+# PUSH VM multi-session TCP shell: serve [-n max] <port>.
+# Loaded by pushvm on first use of its command (see pushvm._LAZY).
+#
+# The server is an ordinary cooperative job: every step polls the listening
+# socket and all sessions once (poll timeout 0), feeds complete input lines
+# to their VMs and advances each running line a few VM steps. No threads, so
+# it works on any port with select.poll; stop it with kill <jid>.
+#
+# Each connection gets its own VM sharing the command table: separate
+# variables, functions, jobs, spool file and working directory (os.chdir is
+# process-wide, so a session's cwd is swapped in while it runs).
+#
+#   push> serve 2323          then from a host: nc <board ip> 2323
+#
+# Sessions only advance while the shell polls its jobs: use the live REPL
+# (MicroPython) or run the server alone with pushvm.py -c "serve 2323". The
+# basic REPL (desktop CPython) waits in input() and stalls every session.
+# Commands that read the device console (rpc, edit, recv, send, connect)
+# are refused in a session: they would block the server for everyone.
+#
+# A line starting with "{" is a JSON batch frame for automation clients;
+# its results come back as JSON frames instead of a prompt (pushvm_rpc.py).
+
+import os
+import sys
+
+try:
+    import socket
+except ImportError:
+    import usocket as socket
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("VERSION", "VM", "compile_line", "CompileError", "current_vm", "_select",
+          "_load_group", "_PKG")
+
+_SERVE_MAX = 4       # sessions at once (more are told to come back later)
+_SERVE_STEPS = 20    # VM steps per session per poll round
+_SERVE_LINE = 512    # longest input line kept
+_SERVE_WBUF = 2048   # stop running a session while this much is unsent
+
+class _Session:
+    __slots__ = ("sock", "vm", "cwd", "rbuf", "wbuf", "lines", "gen", "rpc", "closing")
+
+    def __init__(self, sock, vm, cwd):
+        self.sock = sock
+        self.vm = vm
+        self.cwd = cwd
+        self.rbuf = b""
+        self.wbuf = b""
+        self.lines = []      # complete lines waiting for the VM
+        self.gen = None      # run_generator of the line being executed
+        self.rpc = False     # gen is a pushvm_rpc batch: frames, no prompt
+        self.closing = False
+
+    def write(self, s):
+        # NVT line ends so plain telnet clients don't staircase
+        self.wbuf += s.replace("\n", "\r\n").encode()
+
+    def flush_output(self):
+        out = self.vm.output
+        if out:
+            for s in out:
+                self.write(str(s) + "\n")
+            del out[:]
+
+def _getcwd():
+    try:
+        return os.getcwd()
+    except Exception:
+        return None
+
+def _chdir(path):
+    if path is None:
+        return
+    try:
+        os.chdir(path)
+    except Exception:
+        pass
+
+def _listen(port):
+    s = socket.socket()
+    try:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    except Exception:
+        pass
+    try:
+        s.bind(socket.getaddrinfo("0.0.0.0", port)[0][-1])
+        s.listen(2)
+        s.setblocking(False)
+    except Exception:
+        s.close()
+        raise
+    return s
+
+def _keys(sock):
+    # poll() reports the registered object (MicroPython) or its fd (CPython)
+    k = [id(sock)]
+    if hasattr(sock, "fileno"):
+        k.append(sock.fileno())
+    return k
+
+def _key(obj):
+    return obj if isinstance(obj, int) else id(obj)
+
+def _start_line(sess):
+    vm = sess.vm
+    line = sess.lines.pop(0).strip()
+    if not line:
+        sess.write("push> ")
+        return
+    if line == "exit":
+        sess.closing = True
+        return
+    if line[0] == "{":
+        # JSON batch frame (see pushvm_rpc.py): results go out as frames
+        if "rpc" not in vm.commands:
+            _load_group(vm.commands, "rpc")
+        sess.gen = sys.modules[_PKG + "pushvm_rpc"].frames(vm, line)
+        sess.rpc = True
+        return
+    try:
+        code, bg = compile_line(line, vm.functions)
+        if bg:
+            jid = vm.start_job(code, name=line)
+            vm.say("[{}] started {}".format(jid, line))
+            sess.flush_output()
+            sess.write("push> ")
+            return
+        vm.code = code
+        vm.cancelled = False
+        sess.gen = vm.run_generator()
+    except CompileError as ce:
+        sess.write("Compile error: %s\npush> " % ce)
+
+def _step(sess, steps):
+    # Run one session for a bounded number of VM steps in its own cwd.
+    vm = sess.vm
+    home = _getcwd()
+    _chdir(sess.cwd)
+    try:
+        vm.poll_jobs(steps=steps)
+        if sess.gen is None and sess.lines:
+            _start_line(sess)
+        if sess.gen is not None:
+            try:
+                for _ in range(steps):
+                    f = next(sess.gen)
+                    if f is not None:
+                        sess.write(f + "\n")
+            except StopIteration:
+                sess.gen = None
+            except Exception as e:
+                sess.gen = None
+                vm.say("Error: %s" % e)
+            if sess.gen is None:
+                sess.flush_output()
+                if vm.exit_status is not None:
+                    sess.closing = True
+                elif not sess.rpc:
+                    sess.write("push> ")
+                sess.rpc = False
+        if not sess.rpc:
+            sess.flush_output()  # (a batch holds vm.output while it runs)
+    finally:
+        sess.cwd = _getcwd()
+        _chdir(home)
+
+def _close(poll, sessions, index, sess):
+    for k in _keys(sess.sock):
+        index.pop(k, None)
+    try:
+        poll.unregister(sess.sock)
+    except Exception:
+        pass
+    try:
+        sess.sock.close()
+    except Exception:
+        pass
+    for job in sess.vm.jobs.values():
+        job.kill()
+    if sess in sessions:
+        sessions.remove(sess)
+
+def _serve(srv, maxconn, shell):
+    select = _select()
+    poll = select.poll()
+    poll.register(srv, select.POLLIN)
+    srv_keys = _keys(srv)
+    sessions = []
+    index = {}      # poll key -> _Session
+    sid = 0
+    try:
+        while True:
+            for ev in poll.poll(0):
+                k, flags = _key(ev[0]), ev[1]
+                if k in srv_keys:
+                    try:
+                        conn = srv.accept()[0]
+                    except OSError:
+                        continue
+                    if len(sessions) >= maxconn:
+                        try:
+                            conn.send(b"pushvm: too many sessions\r\n")
+                        except Exception:
+                            pass
+                        conn.close()
+                        continue
+                    sid += 1
+                    conn.setblocking(False)
+                    vm = VM(commands=shell.commands,
+                            spool_path="%s.s%d" % (shell.spool_path, sid),
+                            spool_threshold=shell.spool_threshold)
+                    vm.output = []
+                    vm.console = False  # rpc/edit/recv/send/connect refused
+                    sess = _Session(conn, vm, _getcwd())
+                    sess.write("PUSH VM %s session %d\npush> " % (VERSION, sid))
+                    poll.register(conn, select.POLLIN)
+                    sessions.append(sess)
+                    for ck in _keys(conn):
+                        index[ck] = sess
+                    continue
+                sess = index.get(k)
+                if sess is None:
+                    continue
+                if flags & select.POLLIN:
+                    try:
+                        data = sess.sock.recv(256)
+                    except OSError:
+                        data = None
+                    if not data:
+                        if data is not None or flags & (select.POLLHUP | select.POLLERR):
+                            _close(poll, sessions, index, sess)
+                        continue
+                    buf = sess.rbuf + data
+                    while True:
+                        i = buf.find(b"\n")
+                        if i == -1:
+                            break
+                        try:
+                            sess.lines.append(buf[:i].decode().rstrip("\r"))
+                        except UnicodeError:
+                            sess.write("Error: bad input line\n")
+                        buf = buf[i + 1:]
+                    sess.rbuf = buf[-_SERVE_LINE:]
+                elif flags & (select.POLLHUP | select.POLLERR):
+                    _close(poll, sessions, index, sess)
+
+            for sess in list(sessions):
+                if len(sess.wbuf) < _SERVE_WBUF and not sess.closing:
+                    _step(sess, _SERVE_STEPS)
+                if sess.wbuf:
+                    try:
+                        n = sess.sock.send(sess.wbuf)
+                        sess.wbuf = sess.wbuf[n:]
+                    except OSError:
+                        pass  # full: try again next round
+                if sess.closing and not sess.wbuf:
+                    _close(poll, sessions, index, sess)
+            yield None
+    finally:
+        for sess in list(sessions):
+            _close(poll, sessions, index, sess)
+        srv.close()
+
+def cmd_serve(args, input_data):
+    # serve [-n max] <port>: TCP shell sessions, run as a background job
+    maxconn = _SERVE_MAX
+    port = None
+    try:
+        i = 0
+        while i < len(args):
+            a = str(args[i])
+            if a == "-n" and i + 1 < len(args):
+                maxconn = int(str(args[i + 1]))
+                i += 2
+                continue
+            port = int(a)
+            i += 1
+    except ValueError:
+        port = None
+    if port is None:
+        return "serve: usage serve [-n max] <port>\n"
+    vm = current_vm()
+    if vm is None:
+        return ""
+    if _select() is None:
+        return "serve: select module not available\n"
+    try:
+        srv = _listen(port)
+    except Exception as e:
+        return "serve: couldn't listen on %d (%s)\n" % (port, e)
+    shell = vm.root
+    jid = shell.add_job("serve %d" % port, _serve(srv, maxconn, shell))
+    return "serve: listening on port %d (job %d)\n" % (port, jid)
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "serve": cmd_serve,
+    }
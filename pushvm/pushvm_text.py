@@ -0,0 +1,437 @@
+# pushvm_text.py
+# PUSH VM text/stream commands: head, tail (-f), wc, grep, upper, sed.
+# Loaded by pushvm on first use of one of its commands (see pushvm._LAZY).
+
+import os
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("PipeData", "_StringLineReader", "_CHUNK", "current_vm",
+          "_ticks_ms", "_ticks_add", "_ticks_diff")
+
+def _parse_lines_args(args, default=10):
+    # [-n N] [-f] [file]  -> (n, follow, path)
+    n = default
+    follow = False
+    path = None
+    i = 0
+    while i < len(args):
+        a = str(args[i])
+        if a == "-n" and i + 1 < len(args):
+            n = int(str(args[i+1]).strip())
+            i += 2
+            continue
+        if a == "-f":
+            follow = True
+        elif a.startswith("-") and a[1:].isdigit():
+            n = int(a[1:])
+        else:
+            path = a
+        i += 1
+    return n, follow, path
+
+def cmd_head(args, input_data):
+    # head [-n N] [file]  (stops reading after N lines)
+    try:
+        n, _, path = _parse_lines_args(args)
+    except Exception:
+        return "head: usage head [-n N] [file]\n"
+    out = []
+    try:
+        if path:
+            r = open(path, "r")
+        else:
+            r = input_data.open_reader() if input_data is not None else _StringLineReader("")
+        try:
+            for line in r:
+                if len(out) >= n:
+                    break
+                out.append(line)
+        finally:
+            try: r.close()
+            except: pass
+        return "".join(out)
+    except Exception:
+        return "Couldn't open file\n"
+
+def _tail_file(path, n):
+    # Seek backwards from EOF in _CHUNK blocks until n lines are covered.
+    if n <= 0:
+        return "", os.stat(path)[6]
+    size = os.stat(path)[6]
+    blocks = []
+    nl = 0
+    pos = size
+    with open(path, "rb") as f:
+        while pos > 0:
+            step = _CHUNK if pos >= _CHUNK else pos
+            pos -= step
+            f.seek(pos)
+            b = f.read(step)
+            blocks.insert(0, b)
+            nl += b.count(b"\n")
+            if nl > n:
+                break
+    data = b"".join(blocks)
+    trailing = data.endswith(b"\n")
+    if trailing:
+        data = data[:-1]
+    parts = data.split(b"\n")
+    data = b"\n".join(parts[-n:])
+    if trailing:
+        data += b"\n"
+    return data.decode(), size
+
+def _tail_lines(reader, n):
+    # Keep only the last n lines of a stream.
+    keep = []
+    if n <= 0:
+        return ""
+    for line in reader:
+        keep.append(line)
+        if len(keep) > n:
+            keep.pop(0)
+    return "".join(keep)
+
+def _tail_follow(vm, path, pos, interval_ms=500):
+    # Background job: poll file size, report only the bytes appended since
+    # pos through vm (so a serve session gets them, not the console).
+    due = _ticks_ms()
+    pending = b""
+    while True:
+        if _ticks_diff(due, _ticks_ms()) > 0:
+            yield None
+            continue
+        due = _ticks_add(_ticks_ms(), interval_ms)
+        try:
+            size = os.stat(path)[6]
+        except Exception:
+            yield None
+            continue
+        if size < pos:
+            # truncated / rotated: start over
+            pos = 0
+            pending = b""
+        if size > pos:
+            with open(path, "rb") as f:
+                f.seek(pos)
+                while pos < size:
+                    b = f.read(_CHUNK if size - pos > _CHUNK else size - pos)
+                    if not b:
+                        break
+                    pos += len(b)
+                    pending += b
+                    j = pending.rfind(b"\n")
+                    if j != -1:
+                        vm.say(pending[:j].decode())
+                        pending = pending[j+1:]
+                    yield None
+        yield None
+
+def cmd_tail(args, input_data):
+    # tail [-n N] [-f] [file]
+    try:
+        n, follow, path = _parse_lines_args(args)
+    except Exception:
+        return "tail: usage tail [-n N] [-f] [file]\n"
+    try:
+        if not path:
+            if follow:
+                return "tail: -f needs a file\n"
+            if input_data is not None and input_data.is_file:
+                return _tail_file(input_data.path, n)[0]
+            r = input_data.open_reader() if input_data is not None else _StringLineReader("")
+            try:
+                return _tail_lines(r, n)
+            finally:
+                try: r.close()
+                except: pass
+        out, size = _tail_file(path, n)
+    except Exception:
+        return "Couldn't open file\n"
+    vm = current_vm()
+    if follow and vm is not None:
+        name = "tail -f " + path
+        jid = vm.add_job(name, _tail_follow(vm, path, size))
+        vm.say("[{}] started {}".format(jid, name))
+    return out
+
+def cmd_wc(args, input_data):
+    # wc [-l] [-w] [-c] [file]  (default: lines)
+    # Single pass over binary chunks; spooled input is read from its file.
+    flags = ""
+    path = None
+    for a in args:
+        a = str(a)
+        if a.startswith("-") and len(a) > 1:
+            flags += a[1:]
+        else:
+            path = a
+    if not flags:
+        flags = "l"
+
+    lines = words = nbytes = 0
+    in_word = False
+    last = b""
+    try:
+        if path:
+            chunks = PipeData(path=path, is_file=True).iter_chunks()
+        elif input_data is not None:
+            chunks = input_data.iter_chunks()
+        else:
+            chunks = ()
+        for b in chunks:
+            nbytes += len(b)
+            lines += b.count(b"\n")
+            w = len(b.split())
+            if w and in_word and not b[:1].isspace():
+                w -= 1  # word continues across the chunk boundary
+            words += w
+            in_word = not b[-1:].isspace()
+            last = b[-1:]
+    except Exception:
+        return "Couldn't open file\n"
+
+    # a final line without trailing newline still counts
+    if nbytes and last != b"\n":
+        lines += 1
+
+    out = []
+    if "l" in flags: out.append(str(lines))
+    if "w" in flags: out.append(str(words))
+    if "c" in flags: out.append(str(nbytes))
+    return " ".join(out) + "\n"
+
+def _grep_lines(rx, r):
+    try:
+        for line in r:
+            if rx.search(line):
+                yield line
+    finally:
+        try: r.close()
+        except: pass
+
+def cmd_grep(args, input_data):
+    # Streams matches (generator) so later stages and threaded pipes can
+    # start before the whole input has been read.
+    import re
+    if not args:
+        return ""
+    try:
+        rx = re.compile(args[0])
+        if len(args) >= 2:
+            r = open(args[1], "r")
+        else:
+            r = input_data.open_reader() if input_data is not None else _StringLineReader("")
+    except Exception:
+        return "Couldn't perform.\n"
+    return _grep_lines(rx, r)
+
+# ---- sed ----
+# sed [-i] [-e] script [-e script ...] [file]
+#   script: [addr[,addr]]s/re/repl/[g] | [addr[,addr]]d
+#   addr:   N | $ | /re/       (repl: & = whole match, \1..\9 = groups)
+#   re is Python re syntax, not POSIX BRE: groups are (..), \( \) match
+#   literal parentheses, so s/\(x\)/\1/ is an error (write s/(x)/\1/)
+#   quote a script with $ in single quotes: sed '$d' f ("$d" is a variable)
+# Scripts are compiled once; lines stream through one at a time.
+
+def _sed_split(s, i, delim):
+    # text up to the next unescaped delim -> (text, index after delim)
+    out = ""
+    while i < len(s):
+        ch = s[i]
+        if ch == "\\" and i + 1 < len(s) and s[i+1] == delim:
+            out += delim
+            i += 2
+            continue
+        if ch == delim:
+            return out, i + 1
+        out += ch
+        i += 1
+    raise ValueError("unterminated " + delim)
+
+def _sed_repl(r):
+    # sed replacement -> re.sub replacement (& -> \g<0>, \& -> &)
+    out = ""
+    i = 0
+    while i < len(r):
+        ch = r[i]
+        if ch == "\\" and i + 1 < len(r):
+            out += "&" if r[i+1] == "&" else r[i:i+2]
+            i += 2
+            continue
+        out += "\\g<0>" if ch == "&" else ch
+        i += 1
+    return out
+
+def _sed_addr(s, i):
+    # -> (addr, i); addr is an int line number, "$", a compiled re, or None
+    import re
+    if i < len(s) and s[i] == "$":
+        return "$", i + 1
+    if i < len(s) and s[i] == "/":
+        pat, i = _sed_split(s, i + 1, "/")
+        return re.compile(pat), i
+    j = i
+    while j < len(s) and s[j].isdigit():
+        j += 1
+    if j > i:
+        return int(s[i:j]), j
+    return None, i
+
+def _sed_compile(script):
+    # -> (a1, a2, op, rx, repl, count)
+    import re
+    a1, i = _sed_addr(script, 0)
+    a2 = None
+    if a1 is not None and i < len(script) and script[i] == ",":
+        a2, i = _sed_addr(script, i + 1)
+        if a2 is None:
+            raise ValueError("bad address")
+    op = script[i:i+1]
+    if op == "d" and i + 1 == len(script):
+        return (a1, a2, "d", None, None, 0)
+    if op == "s" and i + 1 < len(script):
+        delim = script[i+1]
+        pat, j = _sed_split(script, i + 2, delim)
+        repl, j = _sed_split(script, j, delim)
+        flags = script[j:]
+        if flags not in ("", "g"):
+            raise ValueError("bad flags " + flags)
+        rx = re.compile(pat)
+        sub = _sed_repl(repl)
+        try:
+            rx.sub(sub, "")  # CPython checks \N against the groups here
+        except Exception as e:
+            raise ValueError("bad replacement %s (%s)" % (repl, e))
+        return (a1, a2, "s", rx, sub, 0 if flags == "g" else 1)
+    raise ValueError("unknown command " + script)
+
+def _sed_hit(addr, n, line, last):
+    if isinstance(addr, int):
+        return n == addr
+    if addr == "$":
+        return last
+    return addr.search(line) is not None
+
+def _sed_lines(cmds, r):
+    # One line of lookahead so "$" knows the last line.
+    active = [False] * len(cmds)  # inside an addr1,addr2 range
+    try:
+        it = iter(r)
+        nxt = next(it, None)
+        n = 0
+        while nxt is not None:
+            line = nxt
+            nxt = next(it, None)
+            n += 1
+            last = nxt is None
+            nl = line.endswith("\n")
+            body = line[:-1] if nl else line
+            deleted = False
+            for k, (a1, a2, op, rx, repl, count) in enumerate(cmds):
+                if a1 is None:
+                    hit = True
+                elif a2 is None:
+                    hit = _sed_hit(a1, n, body, last)
+                elif active[k]:
+                    hit = True
+                    if isinstance(a2, int):
+                        active[k] = n < a2
+                    else:
+                        active[k] = not _sed_hit(a2, n, body, last)
+                else:
+                    hit = _sed_hit(a1, n, body, last)
+                    if hit:
+                        active[k] = not (isinstance(a2, int) and a2 <= n)
+                if not hit:
+                    continue
+                if op == "d":
+                    deleted = True
+                    break
+                body = rx.sub(repl, body, count)
+            if not deleted:
+                yield body + "\n" if nl else body
+    finally:
+        try: r.close()
+        except: pass
+
+def cmd_sed(args, input_data):
+    usage = "sed: usage sed [-i] [-e] script [file]\n"
+    in_place = False
+    scripts = []
+    path = None
+    i = 0
+    while i < len(args):
+        a = str(args[i])
+        if a == "-i":
+            in_place = True
+        elif a == "-e" and i + 1 < len(args):
+            scripts.append(str(args[i+1]))
+            i += 1
+        elif not scripts:
+            scripts.append(a)
+        else:
+            path = a
+        i += 1
+    if not scripts or (in_place and not path):
+        return usage
+    try:
+        cmds = [_sed_compile(sc) for sc in scripts]
+    except Exception as e:
+        return "sed: %s\n" % e
+    try:
+        if path:
+            r = open(path, "r")
+        else:
+            r = input_data.open_reader() if input_data is not None else _StringLineReader("")
+    except Exception:
+        return "Couldn't open file\n"
+    if not in_place:
+        return _sed_lines(cmds, r)
+
+    # -i: stream into path.tmp, then swap it in
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            for line in _sed_lines(cmds, r):
+                f.write(line)
+        try:
+            os.remove(path)
+        except Exception:
+            pass
+        os.rename(tmp, path)
+    except Exception as e:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+        return "sed: %s\n" % e
+    return ""
+
+def _upper_lines(r):
+    try:
+        for line in r:
+            yield line.upper()
+    finally:
+        try: r.close()
+        except: pass
+
+def cmd_upper(args, input_data):
+    if input_data is None:
+        return ""
+    return _upper_lines(input_data.open_reader())
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "head": cmd_head,
+        "tail": cmd_tail,
+        "wc": cmd_wc,
+        "grep": cmd_grep,
+        "upper": cmd_upper,
+        "sed": cmd_sed,
+    }
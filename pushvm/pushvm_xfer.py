@@ -0,0 +1,260 @@
+# pushvm_xfer.py
+# PUSH VM file transfer over the REPL link: recv <path>, send <path>.
+# Loaded by pushvm on first use of one of its commands (see pushvm._LAZY).
+# The host side is pushxfer.py.
+#
+# Protocol (one text line per frame, base64 so the REPL link stays 7-bit):
+#   device -> host  RECV READY <chunk> <window>     (recv)
+#                   SEND <size> <frames> <chunk>    (send)
+#   data            D <seq> <crc32 hex> <base64 of up to chunk bytes>
+#   end             E <frames> <size>
+#   receiver        K <n>   all frames < n received (sent every window/2)
+#                   N <n>   bad crc / gap: resend from frame n (go-back-N)
+#                   OK <size> | ERR <reason>
+#   either side     A       abort
+
+import os
+import sys
+
+try:
+    import binascii
+except ImportError:
+    import ubinascii as binascii
+
+# names borrowed from the pushvm core by load()
+_NEEDS = ("_select", "is_micropython")
+
+_XFER_CHUNK = 512      # payload bytes per frame
+_XFER_WINDOW = 8       # frames in flight before the sender waits for K
+_XFER_TIMEOUT = 10000  # ms without a line before giving up
+_XFER_RETRIES = 5      # sender timeouts (resend from last K) before abort
+
+_CRC_TABLE = None
+
+def _crc32(data):
+    crc = getattr(binascii, "crc32", None)
+    if crc is not None:
+        return crc(data) & 0xFFFFFFFF
+    # port without binascii.crc32: table-driven fallback
+    global _CRC_TABLE
+    if _CRC_TABLE is None:
+        _CRC_TABLE = []
+        for i in range(256):
+            c = i
+            for _ in range(8):
+                c = (c >> 1) ^ 0xEDB88320 if c & 1 else c >> 1
+            _CRC_TABLE.append(c)
+    c = 0xFFFFFFFF
+    for b in data:
+        c = _CRC_TABLE[(c ^ b) & 0xFF] ^ (c >> 8)
+    return c ^ 0xFFFFFFFF
+
+def _out(line):
+    sys.stdout.write(line + "\n")
+    try:
+        sys.stdout.flush()
+    except Exception:
+        pass
+
+def _line_reader():
+    # -> fn() returning the next stripped line, or None on timeout / EOF.
+    # Only MicroPython's stdin is unbuffered enough to poll reliably.
+    poll = None
+    select = _select() if is_micropython() else None
+    if select is not None:
+        try:
+            poll = select.poll()
+            poll.register(sys.stdin, select.POLLIN)
+        except Exception:
+            poll = None
+
+    def read():
+        if poll is not None and not poll.poll(_XFER_TIMEOUT):
+            return None
+        line = sys.stdin.readline()
+        if not line:
+            return None
+        return line.strip()
+    return read
+
+def _frame(seq, data):
+    b64 = binascii.b2a_base64(data)
+    if not isinstance(b64, str):
+        b64 = b64.decode()
+    return "D %d %08x %s" % (seq, _crc32(data), b64.strip())
+
+def _parse_xfer_args(args, usage):
+    # [-c chunk] [-w window] path
+    chunk, window, path = _XFER_CHUNK, _XFER_WINDOW, None
+    i = 0
+    while i < len(args):
+        a = str(args[i])
+        if a in ("-c", "-w") and i + 1 < len(args):
+            n = int(str(args[i + 1]))
+            if n < 1:
+                raise ValueError(usage)
+            if a == "-c":
+                chunk = n
+            else:
+                window = n
+            i += 2
+            continue
+        path = a
+        i += 1
+    if path is None:
+        raise ValueError(usage)
+    return chunk, window, path
+
+def cmd_recv(args, input_data):
+    # recv [-c chunk] [-w window] <path>: receive a file from pushxfer.py
+    try:
+        chunk, window, path = _parse_xfer_args(args, "recv: usage recv [-c N] [-w N] <path>")
+    except ValueError as e:
+        return "%s\n" % e
+    ack_every = max(1, window // 2)
+    tmp = path + ".tmp"
+    buf = bytearray(chunk * 4)  # reused: file writes go out in big blocks
+    mv = memoryview(buf)
+    fill = 0
+    size = 0
+    expect = 0
+    nak_sent = False
+    read = _line_reader()
+    try:
+        f = open(tmp, "wb")
+    except Exception:
+        _out("ERR open")
+        return "recv: couldn't open %s\n" % tmp
+    _out("RECV READY %d %d" % (chunk, window))
+    ok = False
+    try:
+        while True:
+            line = read()
+            if line is None:
+                _out("ERR timeout")
+                break
+            t = line.split(" ")
+            if t[0] == "D" and len(t) == 4:
+                try:
+                    seq = int(t[1])
+                    data = binascii.a2b_base64(t[3])
+                    good = seq == expect and _crc32(data) == int(t[2], 16)
+                except Exception:
+                    seq = expect + 1
+                    good = False
+                if not good:
+                    # one N per gap: frames already in flight behind a bad one
+                    # are dropped quietly, a bad resend is NAKed again
+                    if seq <= expect or not nak_sent:
+                        _out("N %d" % expect)
+                        nak_sent = True
+                    continue
+                nak_sent = False
+                n = len(data)
+                if fill + n > len(buf):
+                    f.write(mv[:fill])
+                    fill = 0
+                buf[fill:fill + n] = data
+                fill += n
+                size += n
+                expect += 1
+                if expect % ack_every == 0:
+                    _out("K %d" % expect)
+            elif t[0] == "E" and len(t) == 3:
+                if int(t[1]) != expect:
+                    _out("N %d" % expect)  # lost the tail: resend it
+                    nak_sent = True
+                    continue
+                if int(t[2]) != size:
+                    _out("ERR size")
+                    break
+                f.write(mv[:fill])
+                ok = True
+                break
+            elif t[0] == "A":
+                break
+            # anything else (echo, noise) is ignored
+    finally:
+        f.close()
+    if not ok:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+        return "recv: aborted\n"
+    try:
+        try:
+            os.remove(path)
+        except Exception:
+            pass
+        os.rename(tmp, path)
+    except Exception:
+        _out("ERR rename")
+        return "recv: couldn't rename %s\n" % tmp
+    _out("OK %d" % size)
+    return ""
+
+def cmd_send(args, input_data):
+    # send [-c chunk] [-w window] <path>: send a file to pushxfer.py
+    try:
+        chunk, window, path = _parse_xfer_args(args, "send: usage send [-c N] [-w N] <path>")
+        size = os.stat(path)[6]
+        f = open(path, "rb")
+    except ValueError as e:
+        return "%s\n" % e
+    except Exception:
+        _out("ERR open")
+        return "send: couldn't open %s\n" % path
+    frames = (size + chunk - 1) // chunk
+    buf = bytearray(chunk)
+    mv = memoryview(buf)
+    read = _line_reader()
+    _out("SEND %d %d %d" % (size, frames, chunk))
+    base = nxt = 0
+    retries = 0
+    end_sent = False
+    ok = False
+    try:
+        while True:
+            while nxt < frames and nxt - base < window:
+                f.seek(nxt * chunk)
+                n = f.readinto(buf)
+                _out(_frame(nxt, mv[:n]))
+                nxt += 1
+            if nxt >= frames and not end_sent:
+                _out("E %d %d" % (frames, size))
+                end_sent = True
+            line = read()
+            if line is None:
+                retries += 1
+                if retries > _XFER_RETRIES:
+                    _out("A")
+                    break
+                nxt = base  # go back to the last acknowledged frame
+                end_sent = False
+                continue
+            retries = 0
+            t = line.split(" ")
+            if t[0] == "K" and len(t) == 2:
+                base = max(base, int(t[1]))
+            elif t[0] == "N" and len(t) == 2:
+                base = nxt = int(t[1])
+                end_sent = False
+            elif t[0] == "OK":
+                ok = True
+                break
+            elif t[0] in ("A", "ERR"):
+                break
+    finally:
+        f.close()
+    return "" if ok else "send: aborted\n"
+
+def load(pv):
+    # Called once by pushvm with its own module; returns the command table.
+    g = globals()
+    for name in _NEEDS:
+        g[name] = getattr(pv, name)
+    return {
+        "recv": cmd_recv,
+        "send": cmd_send,
+    }
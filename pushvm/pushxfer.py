@@ -0,0 +1,232 @@
+# pushxfer.py
+# Host side of the pushvm recv/send commands (see pushvm_xfer.py).
+# Runs on CPython; needs pyserial for --port.
+#
+#   python3 pushxfer.py --port /dev/ttyUSB0 put local.bin /remote.bin
+#   python3 pushxfer.py --port /dev/ttyUSB0 get /remote.bin local.bin
+#   python3 pushxfer.py --exec "python3 pushvm.py" put a.txt b.txt
+#
+# The board must be at the "push> " prompt. --exec drives a local pushvm
+# through pipes instead (useful for testing the protocol on a desktop).
+
+import binascii
+import sys
+import time
+
+CHUNK = 512
+WINDOW = 8
+TIMEOUT = 5.0  # s without a line: resend from the last acknowledged frame
+RETRIES = 5
+
+class SerialLink:
+    def __init__(self, port, baud):
+        import serial  # pyserial
+        self.s = serial.Serial(port, baud, timeout=TIMEOUT)
+
+    def write(self, line):
+        self.s.write((line + "\r\n").encode())
+
+    def readline(self, timeout):
+        self.s.timeout = timeout
+        b = self.s.readline()
+        return b.decode("utf-8", "replace").strip() if b else None
+
+    def close(self):
+        self.s.close()
+
+class ProcLink:
+    def __init__(self, cmd):
+        import queue
+        import shlex
+        import subprocess
+        import threading
+        self.p = subprocess.Popen(shlex.split(cmd), stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, bufsize=0)
+        self.q = queue.Queue()
+        t = threading.Thread(target=self._pump)
+        t.daemon = True
+        t.start()
+
+    def _pump(self):
+        for b in iter(self.p.stdout.readline, b""):
+            self.q.put(b)
+        self.q.put(None)
+
+    def write(self, line):
+        self.p.stdin.write((line + "\n").encode())
+        self.p.stdin.flush()
+
+    def readline(self, timeout):
+        import queue
+        try:
+            b = self.q.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if b is None:
+            raise EOFError("pushvm exited")
+        return b.decode("utf-8", "replace").strip()
+
+    def close(self):
+        try:
+            self.write("exit")
+            self.p.stdin.close()
+            self.p.wait(5)
+        except Exception:
+            self.p.kill()
+
+def crc32(data):
+    return binascii.crc32(data) & 0xFFFFFFFF
+
+def frame(seq, data):
+    return "D %d %08x %s" % (seq, crc32(data), binascii.b2a_base64(data).decode().strip())
+
+def wait_for(link, prefix, timeout=TIMEOUT):
+    # Skip the echoed command / prompt until a line starting with prefix.
+    end = time.time() + timeout
+    while time.time() < end:
+        line = link.readline(max(0.05, end - time.time()))
+        if line is None:
+            continue
+        i = line.find(prefix)  # the prompt may share the line
+        if i != -1:
+            return line[i:]
+        if line.startswith("ERR") or "usage" in line or "couldn't" in line:
+            raise IOError(line)
+    raise IOError("no %r from device" % prefix)
+
+def put(link, local, remote, chunk=CHUNK, window=WINDOW):
+    with open(local, "rb") as f:
+        data = f.read()
+    frames = [data[i:i + chunk] for i in range(0, len(data), chunk)]
+    n = len(frames)
+    link.write("recv -c %d -w %d %s" % (chunk, window, remote))
+    wait_for(link, "RECV READY")
+    base = nxt = 0
+    retries = 0
+    end_sent = False
+    while True:
+        while nxt < n and nxt - base < window:
+            link.write(frame(nxt, frames[nxt]))
+            nxt += 1
+        if nxt >= n and not end_sent:
+            link.write("E %d %d" % (n, len(data)))
+            end_sent = True
+        line = link.readline(TIMEOUT)
+        if line is None:
+            retries += 1
+            if retries > RETRIES:
+                link.write("A")
+                raise IOError("put: device stopped answering")
+            nxt = base
+            end_sent = False
+            continue
+        retries = 0
+        t = line.split(" ")
+        if t[0] == "K" and len(t) == 2:
+            base = max(base, int(t[1]))
+        elif t[0] == "N" and len(t) == 2:
+            base = nxt = int(t[1])
+            end_sent = False
+        elif t[0] == "OK":
+            return len(data)
+        elif t[0] == "ERR":
+            raise IOError("put: " + line)
+
+def get(link, remote, local, chunk=CHUNK, window=WINDOW):
+    link.write("send -c %d -w %d %s" % (chunk, window, remote))
+    _, size, frames, _ = wait_for(link, "SEND ").split(" ")
+    size, frames = int(size), int(frames)
+    ack_every = max(1, window // 2)
+    out = []
+    expect = 0
+    nak_sent = False
+    while True:
+        line = link.readline(TIMEOUT * (RETRIES + 1))
+        if line is None:
+            raise IOError("get: device stopped sending")
+        t = line.split(" ")
+        if t[0] == "D" and len(t) == 4:
+            try:
+                seq = int(t[1])
+                data = binascii.a2b_base64(t[3])
+                good = seq == expect and crc32(data) == int(t[2], 16)
+            except (ValueError, binascii.Error):
+                seq = expect + 1
+                good = False
+            if not good:
+                if seq <= expect or not nak_sent:
+                    link.write("N %d" % expect)
+                    nak_sent = True
+                continue
+            nak_sent = False
+            out.append(data)
+            expect += 1
+            if expect % ack_every == 0:
+                link.write("K %d" % expect)
+        elif t[0] == "E" and len(t) == 3:
+            if expect != frames:
+                link.write("N %d" % expect)
+                nak_sent = True
+                continue
+            data = b"".join(out)
+            if len(data) != size:
+                link.write("ERR size")
+                raise IOError("get: size mismatch")
+            link.write("OK %d" % size)
+            with open(local, "wb") as f:
+                f.write(data)
+            return size
+        elif t[0] == "A":
+            raise IOError("get: device aborted")
+
+def main(argv):
+    usage = ("usage: pushxfer.py (--port DEV [--baud N] | --exec CMD) "
+             "[-c chunk] [-w window] (put LOCAL REMOTE | get REMOTE LOCAL)")
+    port = cmd = None
+    baud = 115200
+    chunk, window = CHUNK, WINDOW
+    rest = []
+    i = 0
+    try:
+        while i < len(argv):
+            a = argv[i]
+            if a == "--port":
+                port = argv[i + 1]
+            elif a == "--baud":
+                baud = int(argv[i + 1])
+            elif a == "--exec":
+                cmd = argv[i + 1]
+            elif a == "-c":
+                chunk = int(argv[i + 1])
+            elif a == "-w":
+                window = int(argv[i + 1])
+            else:
+                rest.append(a)
+                i += 1
+                continue
+            i += 2
+    except (IndexError, ValueError):
+        print(usage)
+        return 2
+    if len(rest) != 3 or rest[0] not in ("put", "get") or not (port or cmd):
+        print(usage)
+        return 2
+
+    link = SerialLink(port, baud) if port else ProcLink(cmd)
+    t0 = time.time()
+    try:
+        if rest[0] == "put":
+            n = put(link, rest[1], rest[2], chunk, window)
+        else:
+            n = get(link, rest[1], rest[2], chunk, window)
+    except (IOError, EOFError) as e:
+        print(e)
+        return 1
+    finally:
+        link.close()
+    dt = max(time.time() - t0, 1e-6)
+    print("%s %s: %d bytes in %.2f s (%d B/s)" % (rest[0], rest[1], n, dt, n / dt))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
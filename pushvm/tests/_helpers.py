@@ -0,0 +1,72 @@
+# _helpers.py
+# Shared harness for the CPython checks in this directory: a shell VM that
+# collects its output, a scratch working directory, a local http.server.
+
+import contextlib
+import functools
+import http.server
+import os
+import socket
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pushvm as pv
+
+def new_vm():
+    vm = pv.make_vm()
+    vm.output = []
+    return vm
+
+def run(vm, line):
+    # run one line on vm -> everything it printed, joined
+    del vm.output[:]
+    pv.run_line(vm, line)
+    return "".join(str(s) for s in vm.output)
+
+@contextlib.contextmanager
+def scratch(files=None):
+    # cwd is a fresh temp dir (real path) holding files {name: str or bytes}
+    home = os.getcwd()
+    with tempfile.TemporaryDirectory() as d:
+        d = os.path.realpath(d)
+        for name, data in (files or {}).items():
+            with open(os.path.join(d, name), "wb" if isinstance(data, bytes) else "w") as f:
+                f.write(data)
+        os.chdir(d)
+        try:
+            yield d
+        finally:
+            os.chdir(home)
+
+@contextlib.contextmanager
+def http_server(handler, directory):
+    # serve directory with handler (a SimpleHTTPRequestHandler) -> base url
+    srv = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(handler, directory=directory))
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        yield "http://127.0.0.1:%d" % srv.server_address[1]
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+def same_file(a, b):
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        return fa.read() == fb.read()
+
+def main(namespace):
+    # python3 tests/test_x.py: run its test_* functions without pytest
+    for name, fn in sorted(namespace.items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print("ok", name)
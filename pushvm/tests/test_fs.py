@@ -0,0 +1,67 @@
+# test_fs.py
+# CPython check: find takes the file type from the directory iterator and
+# stats nothing; ls -l and du still report sizes.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_fs.py
+
+import contextlib
+import os
+import sys
+
+from _helpers import main, new_vm, run, scratch
+
+_FILES = {"a.txt": "x" * 10, "b.log": "y" * 300}
+
+class _Entry:
+    # os.DirEntry that counts stat() calls
+    def __init__(self, e, stats):
+        self._e = e
+        self._stats = stats
+        self.name = e.name
+
+    def is_dir(self):
+        return self._e.is_dir()
+
+    def stat(self):
+        self._stats.append(self.name)
+        return self._e.stat()
+
+class _CountingOs:
+    # stands in for the fs module's os: scandir entries count their stats
+    def __init__(self):
+        self.stats = []
+
+    def __getattr__(self, name):
+        return getattr(os, name)
+
+    @contextlib.contextmanager
+    def scandir(self, path):
+        with os.scandir(path) as it:
+            yield (_Entry(e, self.stats) for e in it)
+
+def _counting(vm):
+    run(vm, "pwd")  # loads the fs group
+    fs = sys.modules["pushvm_fs"]
+    shim = _CountingOs()
+    fs.os = shim
+    return fs, shim
+
+def test_find_stats_no_files_ls_l_and_du_do():
+    with scratch(_FILES):
+        os.mkdir("sub")
+        with open("sub/c.txt", "w") as f:
+            f.write("z" * 5)
+        vm = new_vm()
+        fs, shim = _counting(vm)
+        try:
+            out = run(vm, "find . -type f")
+            assert sorted(out.split()) == ["./a.txt", "./b.log", "./sub/c.txt"]
+            assert run(vm, "find . -name *.log") == "./b.log\n"
+            assert shim.stats == []
+            assert "     300 b.log" in run(vm, "ls -l")
+            assert shim.stats
+            assert run(vm, "du -s").split()[0] == "315"
+        finally:
+            fs.os = os
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,118 @@
+# test_http_pool.py
+# CPython check: wget reuses keep-alive connections (httpstat counters and
+# the server's own accept count), against a local HTTP/1.1 http.server.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_http_pool.py
+
+import http.server
+import threading
+import time
+
+from _helpers import http_server, main, new_vm, run, same_file, scratch
+
+class _Handler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive unless told otherwise
+    timeout = 0.5                   # server drops idle connections
+    conns = 0
+
+    def setup(self):
+        _Handler.conns += 1
+        super().setup()
+
+    def do_GET(self):
+        if self.path == "/close":
+            self.send_response(200)
+            self.send_header("Connection", "close")
+            self.send_header("Content-Length", "4")
+            self.end_headers()
+            self.wfile.write(b"bye\n")
+            self.close_connection = True
+            return
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+def _stats(vm):
+    # httpstat -> {"connects": n, "reuses": n, ...}
+    words = run(vm, "httpstat").split()
+    out = {}
+    for i in range(0, len(words) - 1):
+        if words[i + 1].isdigit():
+            out[words[i]] = int(words[i + 1])
+    return out
+
+def _check(fn):
+    # fn(vm, base_url) runs in a scratch dir served over HTTP on localhost
+    files = {"a.txt": "".join("line %d\n" % i for i in range(500))}
+    with scratch(files) as d, http_server(_Handler, d) as url:
+        _Handler.conns = 0
+        vm = new_vm()
+        run(vm, "httpstat -c")  # start with an empty pool
+        try:
+            fn(vm, url)
+        finally:
+            run(vm, "httpstat -c")
+
+def test_back_to_back_gets_share_one_connection():
+    def fn(vm, url):
+        before = _stats(vm)
+        for i in range(3):
+            run(vm, "wget -O got%d.txt %s/a.txt" % (i, url))
+        assert run(vm, "wget %s/a.txt | wc" % url).strip() == "500"
+        after = _stats(vm)
+        assert _Handler.conns == 1
+        assert after["connects"] - before["connects"] == 1
+        assert after["reuses"] - before["reuses"] == 3
+        for i in range(3):
+            assert same_file("got%d.txt" % i, "a.txt")
+    _check(fn)
+
+def test_connection_close_is_not_pooled():
+    def fn(vm, url):
+        before = _stats(vm)
+        assert run(vm, "wget %s/close" % url) == "bye\n"
+        run(vm, "wget -O got.txt %s/a.txt" % url)
+        after = _stats(vm)
+        assert _Handler.conns == 2
+        assert after["connects"] - before["connects"] == 2
+        assert after["reuses"] == before["reuses"]
+    _check(fn)
+
+def test_connection_dropped_by_server_is_replaced():
+    def fn(vm, url):
+        run(vm, "wget -O got.txt %s/a.txt" % url)
+        time.sleep(1.0)  # past the server's idle timeout
+        out = run(vm, "wget -O got.txt %s/a.txt" % url)
+        assert out.startswith("wget: got.txt:"), out
+        assert _Handler.conns == 2
+    _check(fn)
+
+def test_pool_shared_by_threads():
+    def fn(vm, url):
+        before = _stats(vm)
+        errors = []
+
+        def worker(n):
+            try:
+                wvm = new_vm()
+                wvm.spool_path = "STDOUT.w%d" % n  # like a thread job's
+                for i in range(15):
+                    out = run(wvm, "wget %s/a.txt | wc" % url)
+                    assert out.strip() == "500", out
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(30)
+        assert not errors, errors
+        after = _stats(vm)
+        gets = (after["connects"] - before["connects"]) + (after["reuses"] - before["reuses"])
+        assert gets - (after["retries"] - before["retries"]) == 6 * 15
+        assert after["idle"] <= 4
+    _check(fn)
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,39 @@
+# test_pipes.py
+# CPython check: "pipes thread" gives the same results as sequential pipes.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_pipes.py
+
+from _helpers import main, new_vm, run, scratch
+
+_LINES = "".join("line %d text %d\n" % (i, i * 7919 % 1000) for i in range(20000))
+
+def _both(line, files):
+    # -> (sequential output, threaded output) of line, each in a fresh dir
+    outs = []
+    for mode in ("seq", "thread"):
+        with scratch(files):
+            vm = new_vm()
+            run(vm, "pipes " + mode)
+            outs.append(run(vm, line))
+    return outs
+
+def test_threaded_matches_sequential():
+    for line in ("cat m.txt | grep 7 | upper | wc",
+                 "cat m.txt | grep 99 | head",
+                 "cat m.txt | sed 's/line/L/' | grep 'L 1' | wc -c"):
+        seq, thr = _both(line, {"m.txt": _LINES})
+        assert seq == thr, line
+
+def test_threaded_redirect_into_its_own_input():
+    want = sum("1" in l for l in _LINES.splitlines())
+    for line in ("cat m.txt | grep 1 > m.txt",
+                 "cat m.txt | grep 1 | grep . > m.txt",
+                 "cat m.txt > m.txt; cat m.txt | grep 1 > m.txt"):
+        for _ in range(3):
+            with scratch({"m.txt": _LINES}):
+                vm = new_vm()
+                run(vm, "pipes thread")
+                run(vm, line)
+                assert run(vm, "wc m.txt").strip() == str(want), line
+
+if __name__ == "__main__":
+    main(globals())
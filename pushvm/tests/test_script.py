@@ -0,0 +1,47 @@
+# test_script.py
+# CPython check: script files through run_script, blocks spread over lines.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_script.py
+
+from _helpers import main, new_vm, pv, scratch
+
+_SCRIPT = """
+# comments and blank lines inside blocks are skipped
+function count do
+    n=0
+    foreach l in cat $1 | grep $2 do
+
+        n=$((n+1))
+    done
+    echo $n
+done
+argc=$#
+if $((argc > 1)) then
+    count $1 $2
+else
+    echo usage
+fi
+i=0
+while $((i < 3)) do
+    i=$((i+1))
+done
+echo $i
+"""
+
+def _script(text, args=()):
+    # -> (status, output lines) of text run as a script file
+    with scratch({"f.txt": "one\ntwo\nthree\n"}):
+        vm = new_vm()
+        pv._set_positionals(vm, list(args))
+        status = pv.run_script(vm, text.split("\n"))
+        return status, vm.output
+
+def test_blocks_span_lines():
+    assert _script(_SCRIPT, ["f.txt", "o"]) == (0, ["2", "3"])
+    assert _script(_SCRIPT) == (0, ["usage", "3"])
+
+def test_unclosed_block_is_a_compile_error():
+    assert _script("echo a\nif $((1)) then\necho b\n") == (2, ["a"])
+    assert _script("echo a\nfor i\necho b\n") == (2, ["a"])
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,37 @@
+# test_sed.py
+# CPython check: sed scripts typed at the shell, end to end through run_line.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_sed.py
+
+from _helpers import main, new_vm, run, scratch
+
+def _shell(lines):
+    # run lines in a fresh VM inside a scratch dir; -> output of the last one
+    with scratch({"f.txt": "one\ntwo\nthree\n"}):
+        vm = new_vm()
+        for line in lines:
+            out = run(vm, line)
+        return out
+
+def test_last_line_address():
+    assert _shell(["sed '$d' f.txt"]) == "one\ntwo\n"
+    assert _shell(["sed '2,$d' f.txt"]) == "one\n"
+    assert _shell(["cat f.txt | sed '$s/e/E/g'"]) == "one\ntwo\nthrEE\n"
+
+def test_dollar_in_double_quotes_is_a_variable():
+    assert _shell(['a=2d', 'sed "$a" f.txt']) == "one\nthree\n"
+
+def test_single_quotes_keep_words_and_specials():
+    assert _shell(["x=5; echo $x '$x' \"$x\""]) == "5 $x 5"
+    assert _shell(["echo 'a | b' '&'"]) == "a | b &"
+    assert _shell(["sed -e 's/o/0/g' -e '$d' f.txt"]) == "0ne\ntw0\n"
+
+def test_python_re_groups_and_bad_group_reference():
+    assert _shell(["sed 's/(o+)/<\\1>/' f.txt"]) == "<o>ne\ntw<o>\nthree\n"
+    for line in ("sed 's/\\(o\\)/<\\1>/' f.txt", "cat f.txt | sed 's/o/\\1/'",
+                 "sed -i 's/(o)/\\2/' f.txt"):
+        out = _shell([line])
+        assert out.startswith("sed: bad replacement"), (line, out)
+    assert _shell(["sed -i 's/(o)/\\2/' f.txt", "cat f.txt"]) == "one\ntwo\nthree\n"
+
+if __name__ == "__main__":
+    main(globals())
@@ -0,0 +1,134 @@
+# test_serve.py
+# CPython check: two concurrent serve sessions on localhost keep their own
+# variables and cwd, a sleep in one does not hold up the other, and console
+# commands are refused in a session.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_serve.py
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from _helpers import free_port, main, new_vm, pv, scratch
+
+PROMPT = b"push> "
+
+class _Client:
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+        self.buf = b""
+        self.reply()  # banner
+
+    def reply(self, timeout=5):
+        # -> text up to the next prompt (without it), "\r\n" as "\n"
+        end = time.time() + timeout
+        while PROMPT not in self.buf:
+            self.sock.settimeout(max(0.01, end - time.time()))
+            d = self.sock.recv(4096)
+            if not d:
+                raise EOFError("session closed")
+            self.buf += d
+        i = self.buf.index(PROMPT)
+        out, self.buf = self.buf[:i], self.buf[i + len(PROMPT):]
+        return out.decode().replace("\r\n", "\n")
+
+    def send(self, line):
+        self.sock.sendall(line.encode() + b"\n")
+
+    def run(self, line):
+        self.send(line)
+        return self.reply()
+
+    def close(self):
+        self.sock.close()
+
+def _check(fn):
+    # fn(port, scratch_dir) with the server started the shipped way,
+    # pushvm.py -c "serve <port>", in a process of its own
+    with scratch() as d:
+        os.mkdir("sub")
+        port = free_port()
+        proc = subprocess.Popen([sys.executable, pv.__file__, "-c", "serve %d" % port],
+                                stdout=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+        try:
+            end = time.time() + 5
+            while True:  # until it listens
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    if time.time() > end or proc.poll() is not None:
+                        raise
+                    time.sleep(0.05)
+            fn(port, d)
+        finally:
+            proc.kill()
+            proc.wait(5)
+
+def test_sessions_keep_their_own_vars():
+    def fn(port, d):
+        a, b = _Client(port), _Client(port)
+        try:
+            a.run("x=one")
+            b.run("x=two")
+            assert a.run("echo $x") == "one\n"
+            assert b.run("echo $x") == "two\n"
+            a.run("function f do echo from-a done")
+            assert "from-a" in a.run("f")
+            assert "from-a" not in b.run("f")
+        finally:
+            a.close()
+            b.close()
+    _check(fn)
+
+def test_sessions_keep_their_own_cwd():
+    def fn(port, d):
+        a, b = _Client(port), _Client(port)
+        try:
+            a.run("cd sub")
+            assert a.run("pwd").strip() == os.path.join(d, "sub")
+            assert b.run("pwd").strip() == d
+            b.run("echo hello > b.txt")
+            assert os.path.exists(os.path.join(d, "b.txt"))
+            assert a.run("ls").strip() == ""
+        finally:
+            a.close()
+            b.close()
+    _check(fn)
+
+def test_sleep_in_one_session_does_not_block_another():
+    def fn(port, d):
+        a, b = _Client(port), _Client(port)
+        try:
+            t0 = time.time()
+            a.send("sleep 2; echo woke")
+            time.sleep(0.2)  # a is now sleeping
+            assert b.run("echo fast") == "fast\n"
+            assert time.time() - t0 < 1.5
+            assert a.reply() == "woke\n"
+            assert time.time() - t0 > 1.8  # (ms ticks)
+        finally:
+            a.close()
+            b.close()
+    _check(fn)
+
+def test_console_commands_are_refused():
+    def fn(port, d):
+        a, b = _Client(port), _Client(port)
+        try:
+            for line in ("edit x.txt", "rpc", "recv x.txt", "send x.txt", "connect"):
+                cmd = line.split()[0]
+                out = a.run(line)
+                assert out.startswith(cmd + ": reads the device console"), out
+            assert a.run("edit x.txt &").startswith("[1] started")  # a job clone
+            a.run("sleep 0.2")
+            assert b.run("echo still here") == "still here\n"
+            assert not os.path.exists(os.path.join(d, "x.txt"))
+        finally:
+            a.close()
+            b.close()
+    _check(fn)
+
+if __name__ == "__main__":
+    main(globals())
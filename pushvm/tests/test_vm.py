@@ -0,0 +1,69 @@
+# test_vm.py
+# CPython check: VM state after lines that stop early (errors, exit).
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_vm.py
+
+import os
+
+from _helpers import main, new_vm, pv, run, scratch
+
+_NUMBERS = "".join("%d\n" % i for i in range(3000))
+
+def _fails(vm, line):
+    try:
+        run(vm, line)
+    except Exception:
+        return True
+    return False
+
+def test_failed_foreach_closes_its_reader():
+    with scratch({"n.txt": _NUMBERS}):
+        vm = new_vm()
+        for _ in range(3):
+            assert _fails(vm, "foreach l in cat n.txt | grep 1 do echo $((1/0)) done")
+        assert vm._foreach_stack == []
+        assert os.listdir(".") == ["n.txt"]  # no spool copies left
+        run(vm, "foreach l in cat n.txt | grep 1 do exit done")
+        assert vm._foreach_stack == []
+        assert os.listdir(".") == ["n.txt"]
+
+def test_foreach_in_shell_and_job_at_once():
+    # the job steps while the shell sleeps inside its own loop; each keeps
+    # its spool copy (named per VM) to itself
+    # long enough lines that both loops iterate over a spooled copy
+    n = "".join("%d ..................\n" % i for i in range(1000))
+    m = "".join("%d ..................\n" % i for i in range(5000, 5300))
+    with scratch({"n.txt": n, "m.txt": m}):
+        vm = new_vm()
+        run(vm, "j=0; foreach l in cat n.txt | grep 1 do j=$((j+1)) done; echo $j > job.txt &")
+        run(vm, "k=0; foreach l in cat m.txt | grep 2 do k=$((k+1)); sleep 0.001 done; echo $k")
+        assert vm.output[-1] == str(sum("2" in l for l in m.split("\n")))
+        while vm.jobs:
+            vm.poll_jobs()
+        with open("job.txt") as f:
+            assert f.read().strip() == str(sum("1" in l for l in n.split("\n")))
+        assert vm.vid != vm.clone_for_job().vid
+
+def test_failed_call_restores_positionals():
+    vm = new_vm()
+    pv._set_positionals(vm, ["x"])
+    run(vm, "function f do echo $1 $#; echo $((1/0)) done")
+    run(vm, "function g do f $1 $1; done")
+    for line in ("f a b", "g c"):
+        assert _fails(vm, line)
+        assert vm.frames == []
+        assert vm.vars.get("1") == "x" and vm.vars.get("#") == 1
+        assert "2" not in vm.vars
+
+def test_arith_conditions_and_assignments_run_no_pipeline():
+    for line in ("if $((x > 3)) then echo big fi",
+                 "while $((i < 5)) do i=$((i+1)) done"):
+        code, _ = pv.compile_line(line)
+        assert pv.OP_EXECQ not in [op for op, arg in code]
+    vm = new_vm()
+    assert run(vm, "i=0; while $((i < 5)) do i=$((i+1)) done; echo $i") == "5"
+    assert run(vm, "x=7; if $((x > 3)) then echo big else echo small fi") == "big"
+    assert run(vm, "x=$((0)) && echo t || echo f") == "f"
+    assert run(vm, "x=$((x+2)) && echo $x") == "2"
+
+if __name__ == "__main__":
+    main(globals())
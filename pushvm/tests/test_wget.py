@@ -0,0 +1,63 @@
+# test_wget.py
+# CPython check: wget against a local http.server, through run_line.
+# Run from pushvm/:  python3 -m pytest tests   or   python3 tests/test_wget.py
+
+import http.server
+import os
+
+from _helpers import http_server, main, new_vm, run, same_file, scratch
+
+class _Handler(http.server.SimpleHTTPRequestHandler):
+    # files from the scratch dir, plus /moved -> /lines.txt and /loop -> /loop
+    def do_GET(self):
+        if self.path in ("/moved", "/loop"):
+            self.send_response(302)
+            self.send_header("Location", "/lines.txt" if self.path == "/moved" else "/loop")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+def _check(fn):
+    # fn(vm, base_url) runs in a scratch dir served over HTTP on localhost
+    files = {
+        "big.bin": os.urandom(50000),
+        "lines.txt": "".join("line %d\n" % i for i in range(2000)),
+    }
+    with scratch(files) as d, http_server(_Handler, d) as url:
+        fn(new_vm(), url)
+
+def test_wget_to_file_is_byte_identical():
+    def fn(vm, url):
+        out = run(vm, "wget -O got.bin %s/big.bin" % url)
+        assert out.startswith("wget: got.bin: 50000 bytes"), out
+        assert same_file("got.bin", "big.bin")
+    _check(fn)
+
+def test_wget_piped():
+    def fn(vm, url):
+        assert run(vm, "wget %s/lines.txt | wc" % url).strip() == "2000"
+        run(vm, "wget %s/lines.txt > got.txt" % url)
+        assert same_file("got.txt", "lines.txt")
+    _check(fn)
+
+def test_wget_not_found():
+    def fn(vm, url):
+        out = run(vm, "wget -O nope.txt %s/nope.txt" % url)
+        assert "HTTP 404" in out, out
+        assert not os.path.exists("nope.txt")
+        assert "HTTP 404" in run(vm, "wget %s/nope.txt | grep 404" % url)
+    _check(fn)
+
+def test_wget_follows_redirects():
+    def fn(vm, url):
+        run(vm, "wget -O got.txt %s/moved" % url)
+        assert same_file("got.txt", "lines.txt")
+        assert "too many redirects" in run(vm, "wget -O x %s/loop" % url)
+    _check(fn)
+
+if __name__ == "__main__":
+    main(globals())